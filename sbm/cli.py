@@ -7,11 +7,11 @@ Rich-enhanced progress tracking, status displays, and interactive elements.
 
 from __future__ import annotations
 
-import datetime
+import hashlib
+import importlib
 import json
 import logging
 import os
-import re
 import shutil
 import subprocess
 import sys
@@ -61,47 +61,44 @@ try:
     }
 except Exception:
     import click
-from git import Repo
-from rich.table import Table
-
-from sbm.utils.tracker import (
-    _dedupe_runs_for_display,
-    filter_runs,
-    get_global_reporting_data,
-    get_migration_stats,
-    get_pr_completion_state,
-    process_pending_syncs,
-    record_migration,
-    record_run,
-)
 
 from .config import Config, ConfigurationError, get_config, get_settings
-from .core.git import GitOperations
-from .core.migration import (
-    MigrationResult,
-    _attempt_error_fix,
-    _cleanup_snapshot_files,
-    _create_automation_snapshots,
-    _parse_compilation_errors,
-    add_predetermined_styles,
-    create_sb_files,
-    migrate_dealer_theme,
-    migrate_map_components,
-    migrate_styles,
-    reprocess_manual_changes,
-    run_post_migration_workflow,
-)
-from .oem.factory import OEMFactory
-from .scss.classifiers import StyleClassifier
-from .scss.validator import validate_scss_files
 
 # Rich UI imports
 from .ui.console import get_console
-from .ui.prompts import InteractivePrompts
 from .utils.logger import logger
-from .utils.path import get_dealer_theme_dir, get_platform_dir
-from .utils.timer import get_total_automation_time, get_total_duration
 from .utils.version_utils import get_changelog, get_version
+from .worker import refresh_stats
+
+# Commands whose implementations pull in GitPython, the migration core, the SCSS
+# processor or the Firebase tracker. SBMCommandGroup imports each module only when
+# its command is invoked (or listed in --help), so light commands start quickly.
+LAZY_COMMANDS = {
+    "auto": "sbm.commands.migration:auto",
+    "migrate": "sbm.commands.migration:migrate",
+    "post-migrate": "sbm.commands.migration:post_migrate",
+    "reprocess": "sbm.commands.migration:reprocess",
+    "pr": "sbm.commands.pr:pr",
+    "profile": "sbm.commands.profile:profile",
+    "stats": "sbm.commands.stats:stats",
+    "validate": "sbm.commands.validation:validate",
+    "test-compilation": "sbm.commands.validation:test_compilation",
+}
+
+
+def _load_lazy_command(target: str) -> click.Command:
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def __getattr__(name: str) -> click.Command:
+    """Expose lazily registered commands as attributes (e.g. ``from sbm.cli import auto``)."""
+    for target in LAZY_COMMANDS.values():
+        if target.rpartition(":")[2] == name:
+            return _load_lazy_command(target)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 # --- Auto-run setup.sh if .sbm_setup_complete is missing or health check fails ---
 # Use the predictable installation location as the primary root
@@ -128,6 +125,100 @@ REQUIRED_PYTHON_PACKAGES = [
 ]
 
 
+# Import names of REQUIRED_PYTHON_PACKAGES (some differ from the package name)
+REQUIRED_IMPORTS = {
+    "gitpython": "git",
+    "pyyaml": "yaml",
+    "pytest": "pytest",
+    "click": "click",
+    "rich": "rich",
+    "rich-click": "rich_click",
+    "jinja2": "jinja2",
+    "requests": "requests",
+    "colorama": "colorama",
+}
+
+# Fingerprint of the last environment that passed the package import check
+ENV_HEALTH_PATH = Path.home() / ".sbm_env_health.json"
+
+# Imports every module named in argv in one interpreter; prints the ones that fail
+_IMPORT_CHECK_SCRIPT = """
+import importlib, sys
+missing = []
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        missing.append(name)
+print(" ".join(missing))
+sys.exit(1 if missing else 0)
+"""
+
+
+def _installed_distributions() -> list[str]:
+    """
+    Name and mtime of every distribution metadata entry on ``sys.path``.
+
+    ``*.dist-info``/``*.egg-info`` directory names carry the name and version, so
+    listing them tracks installs, upgrades and reinstalls without parsing every
+    METADATA file the way ``importlib.metadata.distributions()`` would (~100ms).
+    ``.pth`` files cover editable installs.
+    """
+    entries = []
+    for location in sys.path:
+        try:
+            with os.scandir(location or ".") as it:
+                for entry in it:
+                    if entry.name.endswith((".dist-info", ".egg-info", ".egg-link", ".pth")):
+                        entries.append(f"{location}/{entry.name}:{entry.stat().st_mtime_ns}")
+        except OSError:
+            continue
+    return sorted(entries)
+
+
+def _env_fingerprint(python_path: Path) -> str | None:
+    """
+    Hash everything the package import check depends on.
+
+    Covers the venv interpreter, the dependency declarations and the installed
+    distributions. Only meaningful when the running interpreter is the venv's,
+    which is the only case ``is_env_healthy`` checks packages in.
+    """
+    digest = hashlib.sha256()
+    try:
+        digest.update(f"{python_path}:{python_path.stat().st_mtime_ns}\n".encode())
+        for name in ("pyproject.toml", "requirements.txt"):
+            path = REPO_ROOT / name
+            if path.is_file():
+                digest.update(name.encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+    except OSError as e:
+        logger.debug(f"Could not fingerprint environment: {e}")
+        return None
+    digest.update("\n".join(_installed_distributions()).encode())
+    digest.update(json.dumps(REQUIRED_IMPORTS, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _load_env_fingerprint() -> str | None:
+    try:
+        data = json.loads(ENV_HEALTH_PATH.read_text())
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("repo_root") != str(REPO_ROOT):
+        return None
+    return data.get("fingerprint")
+
+
+def _save_env_fingerprint(fingerprint: str) -> None:
+    try:
+        tmp_path = ENV_HEALTH_PATH.with_name(f"{ENV_HEALTH_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"repo_root": str(REPO_ROOT), "fingerprint": fingerprint}))
+        tmp_path.replace(ENV_HEALTH_PATH)
+    except OSError as e:
+        logger.debug(f"Could not save environment health fingerprint: {e}")
+
+
 def is_env_healthy() -> bool:
     """
     Check if the environment has all required tools and packages.
@@ -177,30 +268,20 @@ def is_env_healthy() -> bool:
         logger.warning("Python interpreter not found in virtual environment")
         return False
 
-    # Map package names to import names (some differ)
-    import_map = {
-        "gitpython": "git",
-        "pyyaml": "yaml",
-        "pytest": "pytest",
-        "click": "click",
-        "rich": "rich",
-        "rich-click": "rich_click",
-        "jinja2": "jinja2",
-        "requests": "requests",
-        "colorama": "colorama",
-    }
+    # Skip the import check if nothing it depends on changed since it last passed
+    fingerprint = _env_fingerprint(python_path)
+    if fingerprint is not None and _load_env_fingerprint() == fingerprint:
+        logger.debug("Environment unchanged since last health check")
+        return True
 
     try:
-        for pkg, import_name in import_map.items():
-            result = subprocess.run(
-                [str(python_path), "-c", f"import {import_name}"],
-                check=False,
-                capture_output=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                logger.warning(f"Required Python package missing: {pkg}")
-                return False
+        result = subprocess.run(
+            [str(python_path), "-c", _IMPORT_CHECK_SCRIPT, *REQUIRED_IMPORTS.values()],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=15,
+        )
     except subprocess.TimeoutExpired:
         logger.error("Timeout while checking Python packages")
         return False
@@ -208,193 +289,57 @@ def is_env_healthy() -> bool:
         logger.error(f"Error checking Python packages: {type(e).__name__}")
         return False
 
+    if result.returncode != 0:
+        missing = set(result.stdout.split())
+        for pkg, import_name in REQUIRED_IMPORTS.items():
+            if import_name in missing:
+                logger.warning(f"Required Python package missing: {pkg}")
+        if not missing:
+            logger.warning("Required Python packages could not be checked")
+        return False
+
+    if fingerprint is not None:
+        _save_env_fingerprint(fingerprint)
     return True
 
 
 # --- Setup logic deleted from module level to avoid noise during imports ---
 
 
-# --- Auto-update: Enhanced git pull with better error handling ---
-def _read_version_from_text(text: str) -> str | None:
-    match = re.search(r'^version\s*=\s*["\']([^"\']+)["\']', text, re.MULTILINE)
-    if match:
-        return match.group(1)
-    return None
-
-
-def _get_current_branch() -> str | None:
-    if (
-        subprocess.run(
-            ["git", "symbolic-ref", "-q", "HEAD"],
-            check=False,
-            cwd=str(REPO_ROOT),
-            capture_output=True,
-        ).returncode
-        != 0
-    ):
-        return None
-
-    branch_res = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        check=False,
-        cwd=str(REPO_ROOT),
-        capture_output=True,
-        text=True,
-    )
-    if branch_res.returncode != 0:
-        return None
-
-    return branch_res.stdout.strip()
-
-
-def _get_remote_version(branch: str) -> str | None:
-    fetch_res = subprocess.run(
-        ["git", "fetch", "--quiet", "origin", branch],
-        check=False,
-        cwd=str(REPO_ROOT),
-        capture_output=True,
-        timeout=10,
-    )
-    if fetch_res.returncode != 0:
-        return None
-
-    show_res = subprocess.run(
-        ["git", "show", f"origin/{branch}:pyproject.toml"],
-        check=False,
-        cwd=str(REPO_ROOT),
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-    if show_res.returncode != 0:
-        return None
-
-    return _read_version_from_text(show_res.stdout)
-
-
-def _should_auto_update(branch: str) -> bool:
-    remote_version = _get_remote_version(branch)
-    local_version = get_version()
-
-    if not remote_version or not local_version or local_version == "Unknown":
-        return True
-
-    if local_version == remote_version:
-        logger.debug("Auto-update skipped; local version matches remote.")
-        return False
-
-    return True
-
-
-def auto_update_repo() -> None:
+# --- Auto-update: cached, non-blocking check for a newer version ---
+def _notify_if_update_available(ctx: click.Context) -> None:
     """
-    Automatically pull the latest changes from the auto-sbm repository.
-    Runs at the start of every sbm command to ensure users have the latest features.
+    Print a hint if the last background check found a newer auto-sbm version.
+
+    Never touches the network: the result comes from the update-check cache, and a
+    stale cache is refreshed by a background worker for the next command.
     """
-    # Check if auto-update is disabled
-    disable_file = REPO_ROOT / ".sbm-no-auto-update"
-    if disable_file.exists():
-        return  # Auto-update disabled by user
+    if ctx.invoked_subcommand == "update":
+        return
+    if (REPO_ROOT / ".sbm-no-auto-update").exists() or not (REPO_ROOT / ".git").exists():
+        return
 
     try:
-        # Check if we're in a git repository
-        git_dir = REPO_ROOT / ".git"
-        if not git_dir.exists():
-            return  # Not a git repo, skip update
-
-        # Check connectivity
-        if (
-            subprocess.run(
-                ["git", "ls-remote", "--exit-code", "origin", "HEAD"],
-                check=False,
-                cwd=str(REPO_ROOT),
-                capture_output=True,
-                timeout=5,
-            ).returncode
-            != 0
-        ):
-            return
-
-        # Check strictly for detached HEAD and get current branch
-        current_branch = _get_current_branch()
-        if not current_branch:
-            logger.debug("Detached HEAD detected; skipping auto-update.")
-            return
-
-        if current_branch not in ["main", "master"]:
-            return
-
-        if not _should_auto_update(current_branch):
-            return
-
-        # Check for uncommitted changes
-        status_res = subprocess.run(
-            ["git", "status", "--porcelain"],
-            check=False,
-            cwd=str(REPO_ROOT),
-            capture_output=True,
-            text=True,
-            timeout=5,
+        from sbm.utils.update_check import (
+            available_update,
+            load_update_check,
+            request_update_check,
+            update_check_due,
         )
-        has_changes = bool(status_res.stdout.strip())
-        stash_created = False
-
-        if has_changes:
-            stash_res = subprocess.run(
-                ["git", "stash", "push", "-m", "SBM auto-update stash"],
-                check=False,
-                cwd=str(REPO_ROOT),
-                capture_output=True,
-                timeout=10,
-            )
-            stash_created = stash_res.returncode == 0
-
-        try:
-            # Perform pull with rebase to handle divergent branches seamlessly
-            pull_res = subprocess.run(
-                ["git", "pull", "--rebase", "--quiet", "origin", current_branch],
-                check=False,
-                cwd=str(REPO_ROOT),
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
 
-            if pull_res.returncode == 0:
-                if pull_res.stdout.strip() and "Already up to date" not in pull_res.stdout:
-                    logger.debug("Auto-updated to latest version.")
-                _check_and_run_setup_if_needed()
-            else:
-                # Log error but don't block tool execution
-                error_msg = pull_res.stderr.strip() if pull_res.stderr else "Unknown error"
-                if "reconcile divergent branches" in error_msg:
-                    logger.warning(
-                        "⚠️ Auto-update failed: Divergent branches detected. "
-                        "The tool will continue, but you may be on an outdated version. "
-                        "Try running: 'git pull --rebase origin master' manually in ~/auto-sbm"
-                    )
-                else:
-                    logger.debug(f"Auto-update pull failed: {error_msg}")
-        finally:
-            # ALWAYS attempt to restore stash if we created one
-            if stash_created:
-                restore_res = subprocess.run(
-                    ["git", "stash", "pop"],
-                    check=False,
-                    cwd=str(REPO_ROOT),
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                if restore_res.returncode != 0:
-                    logger.warning(
-                        "⚠️ Could not restore local changes due to conflicts. "
-                        "Your changes are saved in stash. Run 'git stash list' and "
-                        "'git stash pop' manually after resolving conflicts."
-                    )
+        data = load_update_check()
+        if update_check_due(data):
+            request_update_check(REPO_ROOT, data)
 
+        remote_version = available_update(data, REPO_ROOT, get_version())
+        if remote_version:
+            click.echo(
+                f"⬆️  auto-sbm {remote_version} is available (you have {get_version()}). "
+                "Run 'sbm update' to upgrade.",
+                err=True,
+            )
     except Exception as e:
-        logger.debug(f"Auto-update failed silently: {e}")
+        logger.debug(f"Update check skipped: {e}")
 
 
 def _regenerate_wrapper_script() -> None:
@@ -475,2352 +420,211 @@ export PATH="$PROJECT_ROOT/.venv/bin:$(echo $PATH | tr ':' '\\n' | grep -v '/\\.
 
         # Write the wrapper script
         with wrapper_path.open("w") as f:
-            f.write(wrapper_content)
-
-        # Make it executable
-        os.chmod(wrapper_path, 0o755)
-
-        logger.debug(f"Regenerated wrapper script at {wrapper_path}")
-
-    except Exception as e:
-        # Don't fail the entire update if wrapper regeneration fails
-        logger.debug(f"Failed to regenerate wrapper script: {e}")
-
-
-def _check_and_run_setup_if_needed() -> None:
-    """
-    Check if setup needs to be run (if >8 hours since last setup) and run it silently.
-    Also regenerates the wrapper script to ensure latest environment isolation fixes.
-    """
-    setup_complete_file = REPO_ROOT / ".sbm_setup_complete"
-
-    try:
-        # Check if setup file exists and when it was last modified
-        if setup_complete_file.exists():
-            file_mtime = setup_complete_file.stat().st_mtime
-            current_time = time.time()
-            hours_since_setup = (current_time - file_mtime) / 3600
-
-            if hours_since_setup <= 8:
-                return  # Setup is still fresh, no need to run
-
-        # Setup is needed - delete old marker and run setup
-        if setup_complete_file.exists():
-            setup_complete_file.unlink()
-
-        # Run pip install requirements silently
-        pip_result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-            check=False,
-            cwd=str(REPO_ROOT),
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        if pip_result.returncode == 0:
-            # Regenerate wrapper script to get latest environment isolation fixes
-            _regenerate_wrapper_script()
-
-            # Install pre-commit hooks (silently, no output during auto-update)
-            try:
-                subprocess.run(
-                    [
-                        sys.executable,
-                        "-m",
-                        "pre_commit",
-                        "install",
-                        "--hook-type",
-                        "pre-commit",
-                        "--hook-type",
-                        "pre-push",
-                    ],
-                    cwd=str(REPO_ROOT),
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=10,
-                )
-            except Exception:
-                # Silently ignore pre-commit installation failures during auto-update
-                pass
-
-            # Create the setup complete marker
-            with setup_complete_file.open("w") as f:
-                f.write(f"Setup completed at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-    except Exception as e:
-        # Silently ignore setup errors during auto-update
-        logger.debug(f"Silent setup check failed: {e}")
-
-
-# Auto-update logic moved to cli() to avoid execution on import
-
-
-class SBMCommandGroup(click.Group):
-    """A custom command group that allows running a default command."""
-
-    def __init__(self, *args: object, **kwargs: object) -> None:
-        self.default_command = kwargs.pop("default_command", None)
-        super().__init__(*args, **kwargs)
-
-    def resolve_command(
-        self, ctx: click.Context, args: list[str]
-    ) -> tuple[str, click.Command, list[str]]:
-        try:
-            # Try to resolve the command as usual
-            return super().resolve_command(ctx, args)
-        except click.UsageError:
-            # If it fails, assume it's an argument for the default command
-            if self.default_command is None:
-                raise
-            # Prepend the default command name to the arguments
-            args.insert(0, self.default_command)
-            return super().resolve_command(ctx, args)
-
-
-def check_and_run_daily_update():
-    """Check if sbm update needs to run (once per calendar day) and run it automatically."""
-    try:
-        # Get current date
-        today = datetime.date.today().isoformat()
-
-        # Store the update marker in the repo root to avoid conflicts
-        update_file = REPO_ROOT / ".sbm_last_update"
-
-        # Read last update date if file exists
-        last_update = None
-        if update_file.exists():
-            try:
-                last_update = update_file.read_text().strip()
-            except Exception:
-                pass
-
-        # If we haven't updated today, run update
-        if last_update != today:
-            current_branch = _get_current_branch()
-            if not current_branch or current_branch not in ["main", "master"]:
-                return
-
-            if not _should_auto_update(current_branch):
-                update_file.write_text(today)
-                return
-
-            click.echo("🔄 Running daily auto-update...")
-
-            # Run sbm update command
-            result = subprocess.run(
-                [sys.executable, "-m", "sbm.cli", "update"],
-                check=False,
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent,
-            )
-
-            if result.returncode == 0:
-                # Update successful - record today's date
-                update_file.write_text(today)
-                click.echo("✅ Auto-update completed successfully")
-            else:
-                # Update failed - continue anyway but warn
-                click.echo(f"⚠️ Auto-update failed: {result.stderr.strip()}")
-
-    except Exception as e:
-        # Auto-update failure shouldn't break the main command
-        click.echo(f"⚠️ Auto-update error (continuing): {e}")
-
-
-@click.group(
-    cls=SBMCommandGroup,
-    default_command="auto",
-    context_settings={"help_option_names": ["-h", "--help"]},
-)
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-@click.option("--yes", "-y", is_flag=True, help="Auto-confirm all prompts (non-interactive mode)")
-@click.option("--config", "config_path", default="config.json", help="Path to config file.")
-@click.pass_context
-def cli(ctx: click.Context, verbose: bool, yes: bool, config_path: str) -> None:
-    """[bold blue]Auto-SBM[/]: Automated Site Builder Migration Tool
-
-    Migrate dealer themes to Site Builder format with automated SCSS
-    transformation, validation, and GitHub PR creation.
-
-    [dim]Run 'sbm COMMAND --help' for command-specific help.[/dim]
-    """
-    from sbm.config import get_settings
-
-    # Set logger level based on verbose flag
-    if verbose:
-        logger.setLevel(logging.DEBUG)
-    else:
-        logger.setLevel(logging.INFO)
-
-    # Set non-interactive mode if --yes is passed
-    if yes:
-        get_settings().non_interactive = True
-        logger.info("Non-interactive mode enabled via --yes flag")
-
-    # Run health check and setup if needed (only when running as CLI)
-    current_dir = os.getcwd()
-    if str(REPO_ROOT) in current_dir:
-        if not SETUP_MARKER.exists() or not is_env_healthy():
-            if os.environ.get("SBM_SKIP_SETUP") != "1" and not os.environ.get("SBM_RUNNING_SETUP"):
-                os.environ["SBM_RUNNING_SETUP"] = "1"
-                logger.info("Initializing environment...")
-                subprocess.run(["bash", str(SETUP_SCRIPT)], check=False)
-
-    # Run auto-update at CLI initialization
-    auto_update_repo()
-
-    # Run daily auto-update check (unless this is the update command itself)
-    if ctx.invoked_subcommand != "update":
-        check_and_run_daily_update()
-
-    # Initialize context object
-    ctx.ensure_object(dict)
-
-    # Try to load config if it exists
-    config = None
-    if Path(config_path).exists():
-        try:
-            config = get_config(config_path)
-        except ConfigurationError as e:
-            logger.warning(f"Configuration warning: {e}")
-            config = Config({})  # Use empty config as fallback
-    else:
-        config = Config({})  # Use empty config as fallback
-
-    # Store config and logger in context
-    ctx.obj["config"] = config
-    ctx.obj["logger"] = logger
-
-
-def _expand_theme_names(theme_names: tuple[str, ...]) -> list[str]:
-    """
-    Expand theme names from arguments and optional file references.
-
-    Args:
-        theme_names: A tuple of theme names or file paths (prefixed with @)
-
-    Returns:
-        A list of expanded theme names (slugs)
-
-    File references can be:
-        - @slugs.txt - A text file with one slug per line
-        - @report.csv - A Salesforce CSV export (auto-processes using devtools search)
-        - @dealers.xlsx - An Excel file (auto-processes using devtools search)
-    """
-    expanded = []
-    for name in theme_names:
-        if name.startswith("@"):
-            file_path_str = name[1:]
-            file_path = Path(file_path_str).expanduser()  # Expand ~ to home directory
-
-            # 1. Try relative to CWD
-            # 2. Try relative to REPO_ROOT (fallback for external execution)
-            if not file_path.exists():
-                fallback_path = REPO_ROOT / file_path_str
-                if fallback_path.exists():
-                    file_path = fallback_path
-                else:
-                    logger.error(
-                        f"Theme list file not found: {file_path_str} (checked CWD and {REPO_ROOT})"
-                    )
-                    continue
-
-            # Check if this is a CSV/Excel file that needs slug extraction
-            file_ext = file_path.suffix.lower()
-            if file_ext in [".csv", ".xlsx", ".xls"]:
-                # Auto-process CSV/Excel to extract slugs using devtools search
-                extracted_slugs = _process_csv_for_slugs(file_path)
-                if extracted_slugs:
-                    expanded.extend(extracted_slugs)
-                else:
-                    logger.error(f"No slugs could be extracted from {file_path}")
-            else:
-                # Regular text file with slugs
-                try:
-                    # Read slugs from file, supporting lines, spaces, or commas as delimiters
-                    with file_path.open("r") as f:
-                        for line in f:
-                            # Ignore comments (anything after #)
-                            clean_line = line.split("#")[0].strip()
-                            if not clean_line:
-                                continue
-
-                            # Treat commas as spaces, then split by whitespace
-                            slugs = clean_line.replace(",", " ").split()
-                            expanded.extend(slugs)
-                except Exception as e:
-                    logger.error(f"Failed to read theme list file {file_path}: {e}")
-        else:
-            expanded.append(name)
-
-    # Remove duplicates while preserving order
-    unique_expanded = []
-    seen = set()
-    for item in expanded:
-        if item not in seen:
-            unique_expanded.append(item)
-            seen.add(item)
-
-    return unique_expanded
-
-
-def _process_csv_for_slugs(file_path: Path) -> list[str]:
-    """
-    Process a CSV/Excel file to extract slugs using devtools search.
-
-    This function:
-    1. Uses the SlugRetriever to search for each dealer website in devtools
-    2. Filters by "Mockup Approved" stage (if Stage column exists)
-    3. Notifies user of any issues (not found, etc.)
-    4. Returns the list of slugs
-
-    Args:
-        file_path: Path to CSV or Excel file
-
-    Returns:
-        List of slugs extracted from the file
-    """
-    click.echo(f"\n📊 Auto-processing {file_path.name} for slug extraction...")
-
-    # Import the SlugRetriever from the scripts directory
-    scripts_dir = REPO_ROOT / "scripts"
-    sys.path.insert(0, str(scripts_dir))
-
-    try:
-        from retrieve_slugs import SlugRetriever
-    except ImportError as e:
-        logger.error(f"Failed to import slug retrieval script: {e}")
-        return []
-
-    # Output files
-    # Output files in data directory
-    data_dir = REPO_ROOT / "data"
-    data_dir.mkdir(exist_ok=True)
-    output_json = data_dir / "slugs.json"
-    output_txt = data_dir / "slugs.txt"
-
-    try:
-        retriever = SlugRetriever(file_path, output_json)
-
-        # Read input file (with stage filtering for CSV)
-        click.echo("📖 Reading input file...")
-        search_terms = retriever.read_input_file()
-        click.echo(f"✅ Found {len(search_terms)} websites to search")
-
-        if not search_terms:
-            logger.error("No websites found in input file")
-            return []
-
-        # Retrieve slugs
-        retriever.retrieve_all_slugs(search_terms)
-
-        # Warn about overwrite and write output files
-        click.echo(f"\n⚠️  Note: {output_txt} will be overwritten with the new slugs")
-        click.echo(f"💾 Writing results to {output_json} and {output_txt}...")
-        retriever.write_output_file()
-
-        # Print summary
-        retriever.print_summary()
-
-        # Check for any failures and notify user
-        not_found = [r for r in retriever.results if r["status"] == "not_found"]
-        if not_found:
-            click.echo("\n⚠️  The following dealers were NOT found and will be skipped:")
-            for r in not_found:
-                click.echo(f"   - {r['search_term']}")
-            click.echo("")
-
-        # Return the extracted slugs
-        extracted_slugs = [
-            r["slug"] for r in retriever.results if r["status"] == "found" and r["slug"]
-        ]
-
-        # Deduplicate while preserving order
-        unique_slugs = []
-        seen = set()
-        for slug in extracted_slugs:
-            if slug not in seen:
-                unique_slugs.append(slug)
-                seen.add(slug)
-
-        click.echo(f"\n✅ Extracted {len(unique_slugs)} unique slugs from {file_path.name}")
-
-        # Open slugs.txt for user review
-        click.echo(f"\n📄 Opening {output_txt} for review...")
-        try:
-            subprocess.run(["open", str(output_txt)], check=False)
-        except Exception:
-            click.echo(f"   (Could not auto-open file. Please review: {output_txt})")
-
-        # Ask user to confirm the slugs before proceeding
-        click.echo("\n" + "=" * 60)
-        click.echo("👆 Please review the slugs above (file opened for editing)")
-        click.echo("=" * 60)
-        if not click.confirm(
-            "\n✅ Confirm these slugs are correct and proceed with migration?", default=True
-        ):
-            click.echo(
-                "❌ Cancelled by user. Edit slugs.txt manually if needed, then run 'sbm @slugs.txt'"
-            )
-            return []
-
-        return unique_slugs
-
-    except Exception as e:
-        logger.error(f"Failed to process {file_path}: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return []
-
-
-def _perform_migration_steps(
-    theme_name: str, force_reset: bool, skip_maps: bool
-) -> tuple[bool, int, int, int]:
-    """Run the core migration steps, returning success status."""
-    oem_handler = OEMFactory.detect_from_theme(theme_name)
-    logger.info(f"Using {oem_handler} for {theme_name}")
-
-    total_steps = 3 if skip_maps else 4
-    from sbm.ui.console import get_console
-
-    console = get_console()
-
-    # Step 1: Create Site Builder files
-    with console.status(f"Step 1/{total_steps}: Creating Site Builder files"):
-        if not create_sb_files(theme_name, force_reset):
-            logger.error(f"Failed to create Site Builder files for {theme_name}")
-            return False, 0, 0, 0
-    console.print_success("Site Builder files created")
-
-    # Step 2: Migrate styles
-    lines_migrated = 0
-    files_created_count = 0
-    scss_line_count = 0
-    with console.status(f"Step 2/{total_steps}: Migrating styles"):
-        # migrate_styles now returns (min success, lines, files_count, source_lines)
-        success, lines, files_count, source_lines = migrate_styles(theme_name)
-        if not success:
-            logger.error(f"Failed to migrate styles for {theme_name}")
-            return False, 0, 0, 0
-        lines_migrated = lines
-        files_created_count = files_count
-        scss_line_count = source_lines
-    console.print_success("Styles migrated")
-
-    # Step 3: Add predetermined styles
-    with console.status(f"Step 3/{total_steps}: Adding predetermined styles"):
-        if not add_predetermined_styles(theme_name):
-            logger.error(f"Failed to add predetermined styles for {theme_name}")
-            return False, 0, 0, 0
-    console.print_success("Predetermined styles added")
-
-    # Step 4: Migrate map components if not skipped
-    if not skip_maps:
-        with console.status(f"Step 4/{total_steps}: Migrating map components"):
-            if not migrate_map_components(theme_name, oem_handler):
-                logger.error(f"Failed to migrate map components for {theme_name}")
-                return False, 0, 0, 0
-        console.print_success("Map components migrated")
-    else:
-        logger.debug(f"Skipping map components migration for {theme_name}")
-
-    return True, lines_migrated, files_created_count, scss_line_count
-
-
-def _generate_migration_report(
-    results: list[MigrationResult | dict], retry_file: Optional[Path] = None
-) -> None:
-    """
-    Generate a comprehensive user-specific migration report.
-
-    Args:
-        results: List of MigrationResult objects or legacy dictionaries
-    """
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    reports_dir = REPO_ROOT / "reports"
-    reports_dir.mkdir(exist_ok=True)
-
-    report_path = reports_dir / f"migration_report_{timestamp}.txt"
-
-    # Calculate summary statistics
-    total = len(results)
-    success_count = sum(1 for r in results if _get_status(r) == "success")
-    failed_count = sum(1 for r in results if _get_status(r) == "failed")
-    error_count = sum(1 for r in results if _get_status(r) == "error")
-
-    try:
-        with report_path.open("w") as f:
-            # Header
-            f.write("=" * 60 + "\n")
-            f.write("           SBM MIGRATION REPORT\n")
-            f.write(f"           Generated: {timestamp}\n")
-            f.write("=" * 60 + "\n\n")
-
-            # Summary Section
-            f.write("SUMMARY\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Slugs Processed: {total}\n")
-            f.write(f"✅ Successful: {success_count}\n")
-            f.write(f"❌ Failed: {failed_count}\n")
-            f.write(f"⚠️  Errors: {error_count}\n")
-            if retry_file:
-                f.write(f"\n🔄 RETRY INFO: {retry_file.name} has been updated with failed slugs.\n")
-            f.write("\n" + "=" * 60 + "\n\n")
-
-            # Salesforce Messages Section (for copy/paste convenience)
-            successful_results = [r for r in results if _get_status(r) == "success"]
-            if successful_results:
-                f.write("SALESFORCE MESSAGES (Copy/Paste Ready)\n")
-                f.write("-" * 40 + "\n\n")
-                for res in successful_results:
-                    slug = _get_field(res, "slug")
-                    salesforce_msg = _get_field(res, "salesforce_message")
-                    pr_url = _get_field(res, "pr_url")
-
-                    if salesforce_msg:
-                        f.write("FED Site Builder Migration Complete:\n\n")
-                        f.write(f"{salesforce_msg}\n\n")
-                        f.write(f"PR: {pr_url or 'N/A'}\n")
-                        f.write("\n" + "-" * 40 + "\n\n")
-
-                f.write("=" * 60 + "\n\n")
-
-            # Detailed Results
-            f.write("DETAILED RESULTS\n")
-            f.write("-" * 40 + "\n\n")
-
-            for res in results:
-                slug = _get_field(res, "slug")
-                status = _get_status(res).upper()
-                pr_url = _get_field(res, "pr_url") or "N/A"
-                branch = _get_field(res, "branch_name") or "N/A"
-                elapsed = _get_field(res, "elapsed_time") or 0
-                step_failed = _get_field(res, "step_failed")
-                error_msg = _get_field(res, "error_message") or _get_field(res, "error")
-                stack_trace = _get_field(res, "stack_trace")
-                scss_errors = _get_field(res, "scss_errors") or []
-
-                f.write(f"Slug: {slug}\n")
-                f.write(f"Status: {status}\n")
-                f.write(f"Branch: {branch}\n")
-                f.write(f"Elapsed Time: {elapsed:.2f}s\n")
-                f.write(f"PR URL: {pr_url}\n")
-
-                if step_failed:
-                    step_name = (
-                        step_failed.value if hasattr(step_failed, "value") else str(step_failed)
-                    )
-                    f.write(f"Failed At Step: {step_name}\n")
-
-                if error_msg:
-                    f.write(f"Error: {error_msg}\n")
-
-                if scss_errors:
-                    f.write("SCSS Compilation Errors:\n")
-                    for err in scss_errors[:10]:  # Limit to first 10
-                        f.write(f"  - {err}\n")
-
-                if stack_trace:
-                    f.write("Stack Trace:\n")
-                    f.write("```\n")
-                    f.write(f"{stack_trace}\n")
-                    f.write("```\n")
-
-                f.write("\n" + "=" * 60 + "\n\n")
-
-        logger.info(f"Detailed migration report generated: {report_path}")
-        click.echo(f"\n📄 Report generated: {report_path}")
-    except Exception as e:
-        logger.error(f"Failed to generate migration report: {e}")
-
-
-def _get_status(result: MigrationResult | dict) -> str:
-    """Extract status from MigrationResult or dict."""
-    if isinstance(result, MigrationResult):
-        return result.status
-    return result.get("status", "unknown")
-
-
-def _get_field(result: MigrationResult | dict, field: str):
-    """Extract a field from MigrationResult or dict."""
-    if isinstance(result, MigrationResult):
-        return getattr(result, field, None)
-    return result.get(field)
-
-
-def _validate_firebase_key_required() -> None:
-    """Validate Firebase API key is present before running commands."""
-    config = get_settings()
-
-    # Check if API key is present and not a placeholder
-    if not config.firebase.api_key or config.firebase.api_key == "your-firebase-web-api-key":
-        logger.error("❌ Firebase API key is required for this operation")
-        logger.error("")
-        logger.error("The Firebase API key is missing or not configured properly.")
-        logger.error("")
-        logger.error("To resolve this:")
-        logger.error("  1. Run: sbm setup")
-        logger.error("  2. Or add it to .env: FIREBASE__API_KEY=<your-key>")
-        sys.exit(1)
-
-
-@cli.command()
-@click.argument("theme_names", nargs=-1, required=True)
-@click.option("--force-reset", is_flag=True, help="Force reset of existing Site Builder files.")
-@click.option("--skip-maps", is_flag=True, help="Skip map components migration.")
-@click.pass_context
-def migrate(
-    ctx: click.Context, theme_names: tuple[str, ...], force_reset: bool, skip_maps: bool
-) -> None:
-    """Migrate dealer theme SCSS files to Site Builder format.
-
-    Transforms SCSS from dealer themes into Site Builder compatible files,
-    processing variables, mixins, and style patterns. Pauses for manual
-    review before finalizing.
-
-    [bold cyan]Examples:[/]
-        sbm migrate mydealer
-        sbm migrate dealer1 dealer2 dealer3
-        sbm migrate @slugs.txt --force-reset
-    """
-    _validate_firebase_key_required()
-    expanded_themes = _expand_theme_names(theme_names)
-    if not expanded_themes:
-        logger.error("No valid theme names provided.")
-        sys.exit(1)
-
-    config = ctx.obj.get("config", Config({}))
-    from sbm.ui.console import get_console
-
-    console = get_console(config)
-
-    for theme_name in expanded_themes:
-        console.print_migration_header(theme_name)
-
-        start_time = time.time()
-        success, lines_migrated, files_created, scss_lines = _perform_migration_steps(
-            theme_name, force_reset, skip_maps
-        )
-        duration_seconds = time.time() - start_time
-        if not success:
-            logger.error(f"Migration failed for {theme_name}. Skipping...")
-            continue
-
-        _create_automation_snapshots(theme_name)
-        console.print_manual_review_prompt(
-            theme_name, ["sb-inside.scss", "sb-vdp.scss", "sb-vrp.scss", "sb-home.scss"]
-        )
-
-        if not click.confirm(f"Continue with migration of {theme_name}?"):
-            continue
-
-        if not reprocess_manual_changes(theme_name):
-            continue
-
-        _cleanup_snapshot_files(theme_name)
-
-        try:
-            record_migration(theme_name)
-            report_path = None
-            try:
-                from sbm.utils.report_generator import (
-                    MigrationReportData,
-                    generate_migration_report,
-                )
-
-                report_data = MigrationReportData(
-                    slug=theme_name,
-                    status="success",
-                    elapsed_time=duration_seconds,
-                    lines_migrated=lines_migrated,
-                )
-                report_path = generate_migration_report(report_data)
-            except Exception as e:
-                logger.warning(f"Failed to generate migration report: {e}")
-
-            record_run(
-                slug=theme_name,
-                command="migrate",
-                status="success",
-                duration=duration_seconds,
-                automation_time=0,
-                lines_migrated=lines_migrated,
-                files_created_count=files_created,
-                scss_line_count=scss_lines,
-                report_path=report_path,
-            )
-
-            # Show updated stats after each migration
-            ctx.invoke(stats)
-        except Exception as e:
-            logger.warning(f"Could not update stats for {theme_name}: {e}")
-
-
-@cli.command()
-@click.argument("theme_names", nargs=-1, required=True)
-@click.option("--yes", "-y", is_flag=True, help="Auto-confirm all prompts.")
-@click.option("--skip-just", is_flag=True, help="Skip running the 'just start' command.")
-@click.option("--force-reset", is_flag=True, help="Force reset of existing Site Builder files.")
-@click.option("--create-pr/--no-create-pr", default=True, help="Create a GitHub PR.")
-@click.option("--skip-post-migration", is_flag=True, help="Skip manual review/PR phase.")
-@click.option("--verbose-docker", is_flag=True, help="Show verbose Docker output.")
-@click.pass_context
-def auto(
-    ctx: click.Context,
-    theme_names: tuple[str, ...],
-    yes: bool,
-    skip_just: bool,
-    force_reset: bool,
-    create_pr: bool,
-    skip_post_migration: bool,
-    verbose_docker: bool,
-) -> None:
-    """Run the full automated migration workflow for one or more themes.
-
-    Handles the complete migration pipeline: SCSS transformation, Docker
-    compilation, error recovery, Git operations, and PR creation.
-
-    [bold cyan]Examples:[/]
-        sbm auto mydealer
-        sbm auto dealer1 dealer2 --skip-post-migration
-        sbm auto @slugs.txt -y
-    """
-    _validate_firebase_key_required()
-    from sbm.config import get_settings
-
-    expanded_themes = _expand_theme_names(theme_names)
-    if not expanded_themes:
-        sys.exit(1)
-
-    # If multiple themes, we interpret "auto" as batch mode (skipping per-site prompts usually)
-    # BUT we want to capture explicit user intent for safety checks like duplicates.
-    explicit_yes = yes
-
-    if len(expanded_themes) > 1:
-        yes = True
-        skip_post_migration = True
-
-    # Use explicit_yes (not yes) to avoid enabling non-interactive mode for batch
-    if explicit_yes:
-        get_settings().non_interactive = True
-
-    config = ctx.obj.get("config", Config({}))
-    console = get_console(config)
-
-    migration_results = []
-
-    # --- Bulk Migration Duplicate Prevention ---
-    from sbm.ui.prompts import DuplicateAction
-    from sbm.utils.tracker import get_all_migrated_slugs, mark_runs_for_remigration
-
-    # 1. Fetch global history (best effort)
-    migrated_map = get_all_migrated_slugs()
-
-    # 2. Identify duplicates
-    duplicates = []
-    for slug in expanded_themes:
-        if slug in migrated_map:
-            duplicates.append((slug, migrated_map[slug]))
-
-    # 3. Warn user if duplicates found
-    if duplicates:
-        rich_console = console.console
-        table = Table(title="⚠️ Warning: Potential Duplicates Found", border_style="yellow")
-        table.add_column("Slug", style="cyan")
-        table.add_column("Migrated By", style="magenta")
-
-        for slug, user_id in duplicates:
-            table.add_row(slug, user_id)
-
-        rich_console.print(table)
-        rich_console.print(
-            "[yellow]These sites have already been migrated by your teammates.[/yellow]"
-        )
-
-        if not explicit_yes:
-            action = InteractivePrompts.confirm_duplicate_migration(duplicates, default="skip")
-
-            if action == DuplicateAction.SKIP:
-                # Filter out duplicates
-                original_count = len(expanded_themes)
-                duplicate_slugs = {d[0] for d in duplicates}
-                expanded_themes = [s for s in expanded_themes if s not in duplicate_slugs]
-                rich_console.print(
-                    f"[green]Removed {original_count - len(expanded_themes)} duplicate(s). Proceeding with {len(expanded_themes)} slugs.[/green]"
-                )
-
-            elif action == DuplicateAction.REMIGRATE:
-                # Mark previous runs as remigrated and proceed with all themes
-                duplicate_slugs = [d[0] for d in duplicates]
-                rich_console.print(
-                    f"[cyan]Marking {len(duplicate_slugs)} previous run(s) as remigrated...[/cyan]"
-                )
-
-                results = mark_runs_for_remigration(duplicate_slugs)
-
-                if results["updated"] > 0:
-                    rich_console.print(
-                        f"[green]✓ Successfully marked {results['updated']} run(s) for remigration[/green]"
-                    )
-                if results["failed"] > 0:
-                    rich_console.print(
-                        f"[yellow]⚠ Failed to mark {results['failed']} run(s)[/yellow]"
-                    )
-                if results["not_found"] > 0:
-                    rich_console.print(
-                        f"[yellow]⚠ {results['not_found']} slug(s) had no completed runs to mark[/yellow]"
-                    )
-
-                rich_console.print(
-                    f"[green]Proceeding with remigration of {len(expanded_themes)} slugs.[/green]"
-                )
-
-            elif action == DuplicateAction.CANCEL:
-                rich_console.print("[red]Operation cancelled by user.[/red]")
-                sys.exit(0)
-
-        else:
-            # In non-interactive mode (yes=True), skip duplicates to be safe
-            logger.warning(
-                f"Duplicates detected in non-interactive mode - skipping: {[d[0] for d in duplicates]}"
-            )
-            original_count = len(expanded_themes)
-            duplicate_slugs = {d[0] for d in duplicates}
-            expanded_themes = [s for s in expanded_themes if s not in duplicate_slugs]
-            if original_count > len(expanded_themes):
-                logger.info(
-                    f"Removed {original_count - len(expanded_themes)} duplicate(s). Proceeding with {len(expanded_themes)} slugs."
-                )
-
-    if not expanded_themes:
-        logger.warning("No themes left to migrate.")
-        sys.exit(0)
-
-    # -------------------------------------------
-
-    # Track the primary source file for potential retry automation
-    source_file: Optional[Path] = None
-    for name in theme_names:
-        if name.startswith("@"):
-            file_path_str = name[1:]
-            file_path = Path(file_path_str).expanduser()
-            if not file_path.exists():
-                fallback_path = REPO_ROOT / file_path_str
-                if fallback_path.exists():
-                    file_path = fallback_path
-
-            if file_path.exists() and file_path.suffix.lower() not in [".csv", ".xlsx", ".xls"]:
-                source_file = file_path
-                break
-
-    for theme_name in expanded_themes:
-        config_dict = {
-            "skip_just": skip_just,
-            "force_reset": force_reset,
-            "create_pr": create_pr,
-            "skip_post_migration": skip_post_migration,
-        }
-
-        if not skip_post_migration:
-            if not InteractivePrompts.confirm_migration_start(theme_name, config_dict):
-                logger.info(f"Skipping {theme_name}")
-                continue
-
-        console.print_header("SBM Migration", f"Starting {theme_name}")
-        from .utils.timer import (
-            clear_timing_summary,
-            init_timing_summary,
-            patch_click_confirm_for_timing,
-            print_timing_summary,
-            restore_click_confirm,
-        )
-
-        init_timing_summary(theme_name)
-        original_confirm = patch_click_confirm_for_timing()
-
-        try:
-            # migrate_dealer_theme now returns a MigrationResult object
-            result = migrate_dealer_theme(
-                theme_name,
-                skip_just=skip_just,
-                force_reset=force_reset,
-                create_pr=create_pr,
-                interactive_review=not skip_post_migration,
-                interactive_git=not skip_post_migration,
-                interactive_pr=not skip_post_migration,
-                verbose_docker=verbose_docker,
-                console=console,
-            )
-
-            # Handle MigrationResult object
-            if isinstance(result, MigrationResult):
-                if result.status == "success":
-                    record_migration(theme_name)
-                    record_run(
-                        slug=theme_name,
-                        command="auto",
-                        status="success",
-                        duration=get_total_duration(),
-                        automation_time=get_total_automation_time(),
-                        lines_migrated=result.lines_migrated,
-                        files_created_count=result.files_created_count,
-                        scss_line_count=result.scss_line_count,
-                        report_path=result.report_path,
-                        pr_url=result.pr_url,
-                        pr_author=result.pr_author,
-                        pr_state=result.pr_state,
-                        created_at=result.created_at,
-                        merged_at=result.merged_at,
-                        closed_at=result.closed_at,
-                    )
-                    # Show updated stats after each migration
-                    ctx.invoke(stats)
-
-                    console.print_migration_complete(
-                        theme_name,
-                        elapsed_time=result.elapsed_time,
-                        files_processed=4,
-                        pr_url=result.pr_url,
-                    )
-
-                    restore_click_confirm(original_confirm)
-                    print_timing_summary()
-
-                    migration_results.append(result)
-                else:
-                    console.print_error(f"Migration failed for {theme_name}")
-                    if result.step_failed:
-                        console.print_error(f"  Failed at step: {result.step_failed.value}")
-                    if result.error_message:
-                        console.print_error(f"  Error: {result.error_message}")
-                    migration_results.append(result)
-            else:
-                # Legacy dict handling (fallback)
-                success = result.get("success", False)
-                pr_url = result.get("pr_url")
-                salesforce_msg = result.get("salesforce_message")
-
-                if success:
-                    record_migration(theme_name)
-                    # Prefer GitHub additions over local SCSS count (use None-check, not truthiness)
-                    gh_adds = result.get("github_additions")
-                    lines = gh_adds if gh_adds is not None else result.get("lines_migrated", 0)
-                    record_run(
-                        slug=theme_name,
-                        command="auto",
-                        status="success",
-                        duration=get_total_duration(),
-                        automation_time=get_total_automation_time(),
-                        lines_migrated=lines,
-                        files_created_count=result.get("files_created_count", 0),
-                        scss_line_count=result.get("scss_line_count", 0),
-                        report_path=result.get("report_path"),
-                        pr_url=pr_url,
-                        pr_author=result.get("pr_author"),
-                        pr_state=result.get("pr_state"),
-                        created_at=result.get("created_at"),
-                        merged_at=result.get("merged_at"),
-                        closed_at=result.get("closed_at"),
-                    )
-                    # Show updated stats after each migration
-                    ctx.invoke(stats)
-
-                    console.print_migration_complete(
-                        theme_name,
-                        elapsed_time=get_total_duration(),
-                        files_processed=4,
-                        pr_url=pr_url,
-                    )
-
-                    restore_click_confirm(original_confirm)
-                    print_timing_summary()
-
-                    migration_results.append(
-                        {
-                            "slug": theme_name,
-                            "status": "success",
-                            "pr_url": pr_url,
-                            "salesforce_message": salesforce_msg,
-                        }
-                    )
-                else:
-                    console.print_error(f"Migration failed for {theme_name}")
-                    migration_results.append(
-                        {
-                            "slug": theme_name,
-                            "status": "failed",
-                            "error": "Migration failed (see logs)",
-                        }
-                    )
-
-        except Exception as e:
-            console.print_error(f"Error migrating {theme_name}: {e}")
-            migration_results.append(
-                {
-                    "slug": theme_name,
-                    "status": "error",
-                    "error": str(e),
-                }
-            )
-        finally:
-            if original_confirm:
-                try:
-                    restore_click_confirm(original_confirm)
-                except Exception:
-                    pass
-            # Ensure timing summary is cleared/printed if safe
-            # The print_timing_summary above handles success case
-            clear_timing_summary()
-
-    # Generate Report
-    if migration_results:
-        _generate_migration_report(migration_results)
-
-    # Final summary output
-    if len(expanded_themes) > 1:
-        console.print_header("Batch Migration Summary", "")
-        for res in migration_results:
-            status = _get_status(res)
-            slug = _get_field(res, "slug")
-            pr_url = _get_field(res, "pr_url")
-            error = _get_field(res, "error_message") or _get_field(res, "error")
-
-            status_icon = "✅" if status == "success" else "❌"
-            msg = f"{status_icon} {slug}"
-            if pr_url:
-                msg += f" - PR: {pr_url}"
-            elif error:
-                msg += f" - Error: {error}"
-            console.print_info(msg)
-
-    # Automated Retry Logic
-    if source_file and any(_get_status(r) != "success" for r in migration_results):
-        failed_slugs = [
-            _get_field(r, "slug") for r in migration_results if _get_status(r) != "success"
-        ]
-
-        if failed_slugs:
-            try:
-                # Update the source file with only failed slugs
-                with source_file.open("w") as f:
-                    for slug in failed_slugs:
-                        f.write(f"{slug}\n")
-
-                # Regenerate report with retry info
-                _generate_migration_report(migration_results, retry_file=source_file)
-
-                # Prompt user for rerun
-                if InteractivePrompts.confirm_retry_with_timeout(
-                    len(failed_slugs), str(source_file)
-                ):
-                    click.echo(f"\n🚀 Retrying {len(failed_slugs)} failed migrations...")
-                    # Re-invoke auto command with the updated source file
-                    ctx.invoke(
-                        auto,
-                        theme_names=(f"@{source_file}",),
-                        yes=yes,
-                        skip_just=skip_just,
-                        force_reset=force_reset,
-                        create_pr=create_pr,
-                        skip_post_migration=skip_post_migration,
-                        verbose_docker=verbose_docker,
-                    )
-                else:
-                    click.echo(f"\n📂 Retry file updated: {source_file}")
-                    # Try to open the file automatically
-                    if sys.platform == "darwin":
-                        subprocess.run(["open", str(source_file)], check=False)
-            except Exception as e:
-                logger.error(f"Failed to handle automated retry: {e}")
-                console.print_error(f"Failed to handle automated retry: {e}")
-
-
-@cli.command()
-@click.argument("theme_name")
-def reprocess(theme_name: str) -> None:
-    """
-    Reprocess Site Builder SCSS files to ensure consistency.
-
-    This command applies the same transformations as the initial migration
-    to existing Site Builder files, ensuring variables, mixins, and other
-    SCSS patterns are properly processed after manual changes.
-    """
-    click.echo(f"Reprocessing Site Builder files for {theme_name}...")
-
-    success = reprocess_manual_changes(theme_name)
-
-    if success:
-        click.echo(f"✅ Reprocessing completed successfully for {theme_name}!")
-    else:
-        click.echo(f"❌ Reprocessing failed for {theme_name}.", err=True)
-        sys.exit(1)
-
-
-@cli.command()
-@click.argument("theme_name")
-@click.option(
-    "--check-exclusions",
-    is_flag=True,
-    help="Check for header/footer/navigation styles that should be excluded.",
-)
-@click.option(
-    "--show-excluded",
-    is_flag=True,
-    help="Show excluded rules (use with --check-exclusions).",
-)
-def validate(theme_name: str, check_exclusions: bool, show_excluded: bool) -> None:
-    """
-    Validate theme structure and SCSS syntax.
-
-    Args:
-        theme_name: Name of the dealer theme to validate
-        check_exclusions: Whether to check for header/footer/navigation styles
-        show_excluded: Whether to display excluded rules (requires check_exclusions)
-    """
-    validate_scss_files(theme_name)
-
-    # Style exclusion validation
-    if check_exclusions:
-        theme_dir = get_dealer_theme_dir(theme_name)
-        classifier = StyleClassifier(strict_mode=True)
-
-        sb_files = ["sb-inside.scss", "sb-vdp.scss", "sb-vrp.scss", "sb-home.scss"]
-        total_excluded = 0
-        total_checked = 0
-
-        click.echo(f"\n🔍 Checking style exclusions for {theme_name}...")
-        click.echo("=" * 60)
-
-        for sb_file in sb_files:
-            file_path = Path(theme_dir) / sb_file
-            if file_path.exists():
-                result = classifier.analyze_file(file_path)
-                total_excluded += result.excluded_count
-                total_checked += 1
-
-                if result.excluded_count > 0:
-                    click.echo(f"📄 {sb_file}:")
-                    click.echo(f"  ⚠️  Found {result.excluded_count} excluded rules")
-                    for category, count in result.patterns_matched.items():
-                        click.echo(f"    - {category}: {count} rules")
-
-                    if show_excluded and result.excluded_rules:
-                        click.echo("  📝 Excluded rules:")
-                        for i, rule in enumerate(result.excluded_rules[:3], 1):  # Show first 3
-                            rule_preview = rule.split("\n")[0][:50]
-                            click.echo(f"    {i}. {rule_preview}...")
-                        if len(result.excluded_rules) > 3:
-                            click.echo(f"    ... and {len(result.excluded_rules) - 3} more")
-                else:
-                    click.echo(f"✅ {sb_file}: No excluded styles found")
-            else:
-                click.echo(f"⚪ {sb_file}: File not found")
-
-        click.echo("=" * 60)
-        if total_excluded > 0:
-            click.echo(
-                f"⚠️  SUMMARY: Found {total_excluded} header/footer/nav rules "
-                "that should be excluded"
-            )
-            click.echo("💡 These styles may conflict with Site Builder components")
-            if not show_excluded:
-                click.echo("   Use --show-excluded to see the specific rules")
-        else:
-            click.echo("✅ SUMMARY: No problematic header/footer/navigation styles found")
-
-        click.echo(f"📊 Checked {total_checked} Site Builder files")
-
-
-def _format_duration(seconds: float) -> str:
-    """Format duration in seconds to human-readable string."""
-    if seconds < 1:
-        return "< 1s"
-
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-
-    if minutes > 0:
-        return f"{minutes}m {secs}s"
-    return f"{secs}s"
-
-
-def _calculate_time_saved(lines_migrated: int) -> str:
-    """Calculate time saved from lines migrated (800 lines = 1 hour)."""
-    if lines_migrated == 0:
-        return "-"
-
-    hours_saved = lines_migrated / 800
-
-    if hours_saved < 0.1:
-        return "< 0.1h"
-
-    return f"{hours_saved:.1f}h"
-
-
-@cli.command()
-@click.option("--list", "show_list", is_flag=True, help="List migrated slugs")
-@click.option("--history", is_flag=True, help="Show run history")
-@click.option("--verbose", "-v", is_flag=True, help="Verbose logging")
-@click.option(
-    "--limit",
-    type=int,
-    default=10,
-    help="Max runs to display (default: 10, max: 100)",
-)
-@click.option(
-    "--since",
-    "since_days",
-    type=int,
-    help="Show runs from the last N days (e.g. --since 7)",
-)
-@click.option("--user", "filter_user", type=str, help="Filter by user")
-@click.option("--team", is_flag=True, help="Show team stats")
-@click.option(
-    "--all",
-    "show_all",
-    is_flag=True,
-    help="Show all items for the selected view (ignores --limit)",
-)
-@click.pass_context
-def stats(
-    ctx: click.Context,
-    show_list: bool,
-    history: bool,
-    verbose: bool,
-    limit: int,
-    since_days: int,
-    filter_user: str,
-    team: bool,
-    show_all: bool,
-) -> None:
-    """Display migration statistics and impact metrics.
-
-    Shows your personal migration stats from Firebase, or team-wide
-    statistics with the --team flag.
-
-    [bold cyan]Examples:[/]
-        sbm stats                      Your personal stats
-        sbm stats --history            Show run history table
-        sbm stats --team --since 7     Team stats for last 7 days
-        sbm stats --user johndoe       Stats for specific user
-    """
-    if verbose:
-        logger.setLevel(logging.DEBUG)
-    if show_all:
-        limit = None
-    else:
-        limit = min(limit, 100) if limit else 10
-
-    parts = ["Retrieving"]
-    parts.append("Team Stats" if team else "Stats")
-
-    if filter_user:
-        parts.append(f"for user '[cyan]{filter_user}[/cyan]'")
-
-    if since_days:
-        parts.append(f"last [bold]{since_days}[/bold] days")
-
-    status_msg = " ".join(parts) + "..."
-
-    # Synchronous update to ensure fresh stats
-    with get_console().status(
-        "[bold cyan]Refreshing stats and syncing pending runs...[/bold cyan]"
-    ):
-        try:
-            # 1. Sync any local pending runs to Firebase
-            process_pending_syncs()
-            # 2. Check and update PR statuses for recent runs
-            # Pass limit so that --all triggers full history update
-            _update_recent_pr_statuses(max_to_check=limit)
-        except Exception as e:
-            logger.debug(f"Stats refresh failed: {e}")
-
-    with get_console().status(f"[bold green]{status_msg}[/bold green]"):
-        stats_data = get_migration_stats(
-            limit=limit,
-            since=str(since_days) if since_days else None,
-            until=None,
-            user=filter_user,
-            team=team,
-        )
-
-    # Handle offline/error case
-    if stats_data.get("error"):
-        from rich.panel import Panel
-        from rich.text import Text
-
-        console = get_console(ctx.obj.get("config", Config({})))
-        console.console.print(
-            Panel(
-                Text.from_markup(
-                    f"[red]{stats_data['error']}[/red]\n{stats_data.get('message', '')}"
-                ),
-                border_style="red",
-                title="Firebase Status",
-            )
-        )
-        return
-
-    config = ctx.obj.get("config", Config({}))
-    console = get_console(config)
-    rich_console = console.console
-
-    # Imports for stats display
-    from rich.columns import Columns
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.text import Text
-
-    # 1. Handle Team View (if requested and available)
-    if team and stats_data.get("team_stats"):
-        ts = stats_data["team_stats"]
-        if since_days or filter_user:
-            all_runs, _ = get_global_reporting_data()
-            team_runs = filter_runs(
-                all_runs,
-                limit=None,
-                since=str(since_days) if since_days else None,
-                until=None,
-                user=filter_user,
-            )
-            complete_runs = [
-                r
-                for r in team_runs
-                if r.get("status") == "success" and get_pr_completion_state(r) == "complete"
-            ]
-
-            def run_effective_date(run: dict) -> datetime.datetime:
-                completion_state = get_pr_completion_state(run)
-                if completion_state == "complete":
-                    ts_val = run.get("merged_at") or run.get("timestamp") or ""
-                elif completion_state == "in_review":
-                    ts_val = run.get("created_at") or run.get("timestamp") or ""
-                elif completion_state == "closed":
-                    ts_val = run.get("closed_at") or run.get("timestamp") or ""
-                elif completion_state == "superseded":
-                    ts_val = (
-                        run.get("superseded_at")
-                        or run.get("merged_at")
-                        or run.get("timestamp")
-                        or ""
-                    )
-                else:
-                    ts_val = run.get("merged_at") or run.get("timestamp") or ""
-                if ts_val.endswith("+00:00Z"):
-                    ts_val = ts_val[:-1]
-                elif ts_val.endswith("Z"):
-                    ts_val = ts_val[:-1] + "+00:00"
-                try:
-                    parsed = datetime.datetime.fromisoformat(ts_val)
-                    if parsed.tzinfo is None:
-                        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
-                    return parsed
-                except ValueError:
-                    return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
-
-            unique_complete_by_slug: dict[str, dict] = {}
-            for run in complete_runs:
-                slug = run.get("slug")
-                if not slug:
-                    continue
-                existing = unique_complete_by_slug.get(slug)
-                if not existing or run_effective_date(run) > run_effective_date(existing):
-                    unique_complete_by_slug[slug] = run
-
-            total_lines_migrated = sum(
-                r.get("lines_migrated", 0) for r in unique_complete_by_slug.values()
-            )
-            user_counts: dict[str, set] = {}
-            for run in unique_complete_by_slug.values():
-                author = run.get("pr_author") or run.get("_user") or "unknown"
-                user_counts.setdefault(author, set()).add(run.get("slug"))
-
-            ts = {
-                "total_users": len(user_counts),
-                "total_migrations": len(unique_complete_by_slug),
-                "total_lines_migrated": total_lines_migrated,
-                "total_runs": len(unique_complete_by_slug),
-                "total_time_saved_h": round(total_lines_migrated / 800.0, 1)
-                if total_lines_migrated
-                else 0.0,
-                "top_contributors": sorted(
-                    ((user, len(slugs)) for user, slugs in user_counts.items()),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )[:3],
-                "source": "firebase",
-            }
-
-        # Header
-        rich_console.print(
-            Panel(
-                Text.from_markup(
-                    f"[bold magenta]Team Status[/bold magenta]\n[dim]Live data from {ts.get('total_users', 0)} contributors[/dim]"
-                ),
-                border_style="magenta",
-            )
-        )
-
-        # Metrics
-        def make_team_panel(label: str, value: str, color: str) -> Panel:
-            return Panel(
-                Text.from_markup(f"[bold {color}]{value}[/bold {color}]\n[dim]{label}[/dim]"),
-                expand=True,
-                border_style=color,
-            )
-
-        panels = [
-            make_team_panel("Total Users", str(ts.get("total_users", 0)), "blue"),
-            make_team_panel("Sites Migrated", str(ts.get("total_migrations", 0)), "green"),
-            make_team_panel("Lines Migrated", f"{ts.get('total_lines_migrated', 0):,}", "cyan"),
-            make_team_panel("Time Saved", f"{ts.get('total_time_saved_h', 0.0)}h", "magenta"),
-        ]
-        rich_console.print(Columns(panels, equal=True))
-        if since_days or filter_user:
-            filter_info = []
-            if since_days:
-                filter_info.append(f"last {since_days} days")
-            if filter_user:
-                filter_info.append(f"user: {filter_user}")
-            if filter_info:
-                rich_console.print(f"[dim]Filters applied: {', '.join(filter_info)}[/dim]")
-
-        # Full Contributors (optional)
-        if show_all:
-            all_runs, _ = get_global_reporting_data()
-            merged_runs = [
-                r
-                for r in all_runs
-                if r.get("status") == "success" and get_pr_completion_state(r) == "complete"
-            ]
-
-            # Deduplicate by slug per author
-            by_author: dict[str, set] = {}
-            for run in merged_runs:
-                author = run.get("pr_author") or run.get("_user") or "unknown"
-                slug = run.get("slug")
-                if not slug:
-                    continue
-                by_author.setdefault(author, set()).add(slug)
-
-            table = Table(
-                title="All Contributors (Merged, Unique Slugs)",
-                show_header=True,
-                header_style="bold magenta",
-            )
-            table.add_column("User", style="cyan")
-            table.add_column("Sites Migrated", style="green", justify="right")
-
-            for user, slugs in sorted(by_author.items(), key=lambda x: len(x[1]), reverse=True):
-                table.add_row(user, str(len(slugs)))
-
-            rich_console.print(table)
-
-            total_unique_slugs = len({r.get("slug") for r in merged_runs if r.get("slug")})
-            total_user_slugs = sum(len(slugs) for slugs in by_author.values())
-            if total_unique_slugs != total_user_slugs:
-                rich_console.print(
-                    f"[yellow]⚠️ Sum of user counts ({total_user_slugs}) != unique slugs "
-                    f"({total_unique_slugs}).[/yellow]"
-                )
-            else:
-                rich_console.print(f"[dim]Total unique slugs: {total_unique_slugs}[/dim]")
-            # Continue for optional team history below
-
-        # Team History (optional)
-        if history:
-            all_runs, _ = get_global_reporting_data()
-            team_runs = filter_runs(
-                all_runs,
-                limit=limit,
-                since=str(since_days) if since_days else None,
-                until=None,
-                user=filter_user,
-            )
-            team_runs = _dedupe_runs_for_display(team_runs)
-
-            if team_runs:
-                table = Table(
-                    title="All Team Runs",
-                    title_style="bold cyan",
-                    show_header=True,
-                    header_style="bold magenta",
-                )
-                table.add_column("PR Date", style="dim")
-                table.add_column("Theme Slug", style="cyan")
-                table.add_column("Status", style="bold")
-                table.add_column("User", style="magenta")
-                table.add_column("Lines", style="cyan")
-                table.add_column("PR", style="blue")
-
-                for run in team_runs:
-                    completion_state = get_pr_completion_state(run)
-                    if completion_state == "complete":
-                        status_display = "[green]Complete[/green]"
-                    elif completion_state == "in_review":
-                        status_display = "[yellow]In Review[/yellow]"
-                    elif completion_state == "closed":
-                        status_display = "[red]Closed[/red]"
-                    elif completion_state == "superseded":
-                        status_display = "[dim]Superseded[/dim]"
-                    else:
-                        status = run.get("status", "unknown")
-                        status_color = "green" if status == "success" else "red"
-                        status_display = f"[{status_color}]{status}[/{status_color}]"
-
-                    lines = run.get("lines_migrated", 0)
-                    lines_str = f"{lines:,}" if lines else "N/A"
-
-                    pr_link = "N/A"
-                    if run.get("pr_url"):
-                        url = run.get("pr_url")
-                        if completion_state == "complete":
-                            link_text = "[green]Merged[/green]"
-                        elif completion_state == "in_review":
-                            link_text = "[yellow]Open[/yellow]"
-                        elif completion_state == "closed":
-                            link_text = "[red]Closed[/red]"
-                        elif completion_state == "superseded":
-                            link_text = "[dim]Superseded[/dim]"
-                        else:
-                            link_text = "View"
-                        pr_link = f"[link={url}]{link_text}[/link]"
-
-                    user_display = run.get("pr_author") or run.get("_user") or "unknown"
-
-                    if completion_state == "complete":
-                        effective_date = run.get("merged_at") or run.get("timestamp", "")
-                    elif completion_state == "in_review":
-                        effective_date = run.get("created_at") or run.get("timestamp", "")
-                    elif completion_state == "closed":
-                        effective_date = run.get("closed_at") or run.get("timestamp", "")
-                    elif completion_state == "superseded":
-                        effective_date = (
-                            run.get("superseded_at")
-                            or run.get("merged_at")
-                            or run.get("timestamp", "")
-                        )
-                    else:
-                        effective_date = run.get("merged_at") or run.get("timestamp", "")
-
-                    if effective_date and len(effective_date) >= 19:
-                        date_display = effective_date[:19].replace("T", " ")
-                    else:
-                        date_display = "N/A"
-
-                    table.add_row(
-                        date_display,
-                        run.get("slug", "unknown"),
-                        status_display,
-                        f"@{user_display}",
-                        lines_str,
-                        pr_link,
-                    )
-
-                rich_console.print(table)
-            return
-
-        # Top Contributors
-        contributors = ts.get("top_contributors", [])
-        if contributors:
-            rich_console.print("\n[bold magenta]🏆 Top Contributors[/bold magenta]")
-            table = Table(show_header=True, header_style="bold magenta", box=None, padding=(0, 2))
-            table.add_column("Rank", style="dim", width=4)
-            table.add_column("User", style="bold white")
-            table.add_column("Sites Migrated", style="green", justify="right")
-
-            for i, (user, count) in enumerate(contributors, 1):
-                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"#{i}"
-                table.add_row(medal, user, str(count))
-
-            rich_console.print(table)
-
-        return
-
-    # 2. Fallback to Standard View (Local + optional Git global)
-    if team:
-        rich_console.print(
-            "[yellow]⚠️  Could not fetch live team stats. Showing local data.[/yellow]"
-        )
-
-    # Header Panel
-    header = Panel(
-        Text.from_markup("[bold cyan]Global Auto-SBM Stats[/bold cyan]"),
-        border_style="bright_blue",
-    )
-    rich_console.print(header)
-
-    # Personal Impact
-    current_user_id = stats_data.get("user_id", "unknown")
-    current_user_name = stats_data.get("display_name", current_user_id)
-
-    rich_console.print(
-        Text.assemble(
-            Text("Auto-SBM Stats: ", style="bold cyan"),
-            Text(f"{current_user_name}", style="bold purple"),
-        )
-    )
-
-    # Metrics Grid
-    metrics_local = stats_data.get("metrics", {})
-
-    def make_metric_panel(label: str, value: str, color: str) -> Panel:
-        return Panel(
-            Text.from_markup(f"[bold {color}]{value}[/bold {color}]\n[dim]{label}[/dim]"),
-            expand=True,
-            border_style=color,
-        )
-
-    # Calculate local time saved
-    local_lines = metrics_local.get("total_lines_migrated", 0)
-    local_hours = round(local_lines / 800.0, 1) if local_lines else 0.0
-
-    metric_panels = [
-        make_metric_panel("Sites Migrated", str(stats_data["count"]), "green"),
-        make_metric_panel(
-            "Lines Migrated",
-            f"{local_lines:,}",
-            "cyan",
-        ),
-        make_metric_panel(
-            "Time Saved",
-            f"{local_hours}h",
-            "magenta",
-        ),
-    ]
-
-    rich_console.print(Columns(metric_panels, equal=True))
-
-    # Global Team Impact
-    global_metrics = stats_data.get("global_metrics", {})
-    if global_metrics:
-        rich_console.print("\n[bold cyan]Global Auto-SBM Stats[/bold cyan]")
-
-        # Calculate global time saved (fallback if missing from payload)
-        global_lines = global_metrics.get("total_lines_migrated", 0)
-        global_hours = global_metrics.get("total_time_saved_h")
-        if global_hours is None:
-            global_hours = round(global_lines / 800.0, 1) if global_lines else 0.0
-
-        global_panels = [
-            make_metric_panel("Total Users", str(global_metrics.get("total_users", 0)), "blue"),
-            make_metric_panel(
-                "Sites Migrated",
-                str(global_metrics.get("total_migrations", 0)),
-                "green",
-            ),
-            make_metric_panel(
-                "Lines Migrated",
-                f"{global_lines:,}",
-                "cyan",
-            ),
-            make_metric_panel(
-                "Time Saved",
-                f"{global_hours}h",
-                "magenta",
-            ),
-        ]
-        rich_console.print(Columns(global_panels, equal=True))
-
-        # Top Contributors
-        top_contributors = global_metrics.get("top_contributors", [])
-        if top_contributors:
-            rich_console.print("\n[bold cyan]Top Contributors:[/bold cyan]")
-            contrib_table = Table(show_header=False, box=None, padding=(0, 2))
-            contrib_table.add_column("Rank", style="dim", width=4)
-            contrib_table.add_column("User", style="bold cyan")
-            contrib_table.add_column("Migrations", style="green")
-
-            for i, (user, count) in enumerate(top_contributors, 1):
-                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"#{i}"
-                contrib_table.add_row(f"  {medal}", f"{user}", f"{count} sites")
-            rich_console.print(contrib_table)
-
-    current_user_id = stats_data.get("user_id", "unknown")
-    current_user_name = stats_data.get("display_name", current_user_id)
-
-    last_updated_str = "Never"
-    if stats_data.get("last_updated"):
-        # Simple robust formatting for YYYY-MM-DD HH:MM:SS
-        ts = stats_data["last_updated"]
-        if len(ts) >= 19:
-            last_updated_str = ts[:19].replace("T", " ")
-        else:
-            last_updated_str = ts
-
-    rich_console.print(
-        f"\n[dim]Contributing as: {current_user_name} | Last updated: {last_updated_str}[/dim]"
-    )
-
-    # Check for incomplete timestamp data and warn user
-    runs = stats_data.get("runs", [])
-    if runs:
-        unknown_count = sum(1 for r in runs if get_pr_completion_state(r) == "unknown")
-        if unknown_count > 0:
-            from rich.panel import Panel
-
-            warning_panel = Panel(
-                f"[yellow]⚠️  {unknown_count} run(s) missing PR timestamp data.[/yellow]\n"
-                f"[dim]Stats may be incomplete. Run:[/dim] [cyan]python scripts/migrate_pr_timestamps.py[/cyan]",
-                border_style="yellow",
-                title="Data Migration Needed",
-            )
-            rich_console.print()
-            rich_console.print(warning_panel)
-
-        missing_author_count = sum(
-            1 for r in runs if not r.get("pr_author") and not r.get("user_id")
-        )
-        if missing_author_count > 0:
-            from rich.panel import Panel
-
-            author_panel = Panel(
-                f"[yellow]⚠️  {missing_author_count} run(s) missing PR author data.[/yellow]\n"
-                f"[dim]Tip: ensure `gh auth status` is OK on user machines and run:[/dim] "
-                f"[cyan]python scripts/refresh_run_metadata.py[/cyan]",
-                border_style="yellow",
-                title="Author Data Missing",
-            )
-            rich_console.print()
-            rich_console.print(author_panel)
-
-    if history:
-        runs = stats_data.get("runs", [])
-        if runs:
-            table = Table(
-                title="Recent Migration Runs",
-                title_style="bold cyan",
-                show_header=True,
-                header_style="bold magenta",
-            )
-            table.add_column("PR Date", style="dim")
-            table.add_column("Theme Slug", style="cyan")
-            table.add_column("Status", style="bold")
-            table.add_column("User", style="magenta")
-            table.add_column("Lines", justify="right", style="cyan")
-            table.add_column("PR", style="blue")
-            table.add_column("Time Saved", style="green")
-
-            for run in runs:
-                # Determine PR completion state
-                completion_state = get_pr_completion_state(run)
-
-                # Status display based on completion state
-                if completion_state == "complete":
-                    status_display = "[green]Complete[/green]"
-                    status_color = "green"
-                elif completion_state == "in_review":
-                    status_display = "[yellow]In Review[/yellow]"
-                    status_color = "yellow"
-                elif completion_state == "closed":
-                    status_display = "[red]Closed[/red]"
-                    status_color = "red"
-                elif completion_state == "superseded":
-                    status_display = "[dim]Superseded[/dim]"
-                    status_color = "dim"
-                else:
-                    # Fallback to old behavior for backwards compat
-                    status = run.get("status", "unknown")
-                    status_color = "green" if status == "success" else "red"
-                    status_display = f"[{status_color}]{status}[/{status_color}]"
-
-                # Extract data with graceful fallbacks
-                lines_migrated = run.get("lines_migrated", 0)
-                report_path = run.get("report_path", "")
-
-                # Calculate Time Saved (Align with Slack/Summary: 800 lines = 1 hour)
-                lines_migrated = run.get("lines_migrated", 0)
-                time_saved_str = "N/A"
-
-                # Prefer calculated metric for consistency
-                if lines_migrated > 0:
-                    hours_float = lines_migrated / 800.0
-                    if hours_float < 0.1:
-                        time_saved_str = "< 0.1h"
-                    else:
-                        time_saved_str = f"{hours_float:.1f}h"
-
-                # Fallback to manual estimate if no lines recorded but time exists
-                elif run.get("manual_estimate_seconds", 0):
-                    manual_seconds = run.get("manual_estimate_seconds", 0)
-                    h = int(manual_seconds // 3600)
-                    m = int((manual_seconds % 3600) // 60)
-                    time_saved_str = f"{h}h {m}m"
-
-                # Format values
-                lines_str = f"{lines_migrated:,}" if lines_migrated else "N/A"
-                report_str = report_path if report_path else "N/A"
-
-                # PR Link logic
-                pr_url = run.get("pr_url")
-                pr_state = run.get("pr_state", "UNKNOWN")
-
-                if pr_url:
-                    pr_display = f"[link={pr_url}]{pr_state}[/link]"
-                else:
-                    pr_display = pr_state
-
-                # Use PR Author if available, else User ID
-                user_display = run.get("pr_author")
-                if not user_display:
-                    user_display = run.get("user_id", "Unknown")
-
-                # Format user display (e.g. @username)
-                if user_display and not user_display.startswith("@"):
-                    user_display = f"@{user_display}"
-
-                # Robust timestamp formatting
-                ts_raw = run.get("timestamp", "")
-                if ts_raw and len(ts_raw) >= 19:
-                    ts_display = ts_raw[:19].replace("T", " ")
-                else:
-                    ts_display = ts_raw or "N/A"
-
-                table.add_row(
-                    ts_display,
-                    run.get("slug", "unknown"),
-                    status_display,
-                    user_display,
-                    lines_str,
-                    pr_display,
-                    time_saved_str,
-                )
-
-                pr_link = "N/A"
-                if run.get("pr_url"):
-                    url = run.get("pr_url")
-
-                    # Use completion state for link text
-                    if completion_state == "complete":
-                        link_text = "[green]Merged[/green]"
-                    elif completion_state == "in_review":
-                        link_text = "[yellow]Open[/yellow]"
-                    elif completion_state == "closed":
-                        link_text = "[red]Closed[/red]"
-                    elif completion_state == "superseded":
-                        link_text = "[dim]Superseded[/dim]"
-                    else:
-                        # Fallback to pr_state if no completion state
-                        state = run.get("pr_state", "").upper()
-                        if state == "MERGED":
-                            link_text = "[green]Merged[/green]"
-                        elif state == "OPEN":
-                            link_text = "[yellow]Open[/yellow]"
-                        elif state == "CLOSED":
-                            link_text = "[red]Closed[/red]"
-                        elif state == "DRAFT":
-                            link_text = "[dim]Draft[/dim]"
-                        else:
-                            link_text = "View"
-
-                    pr_link = f"[link={url}]{link_text}[/link]"
-
-                # User logic: prefer pr_author, fallback to generic user
-                user_display = run.get("pr_author") or run.get("_user") or "unknown"
-
-                # Date display based on completion state
-                # Priority: merged_at > created_at > closed_at > superseded_at > timestamp
-                if completion_state == "complete":
-                    effective_date = run.get("merged_at") or run.get("timestamp", "")
-                elif completion_state == "in_review":
-                    effective_date = run.get("created_at") or run.get("timestamp", "")
-                elif completion_state == "closed":
-                    effective_date = run.get("closed_at") or run.get("timestamp", "")
-                elif completion_state == "superseded":
-                    effective_date = (
-                        run.get("superseded_at") or run.get("merged_at") or run.get("timestamp", "")
-                    )
-                else:
-                    effective_date = run.get("merged_at") or run.get("timestamp", "")
-
-                # Validate and format timestamp
-                if effective_date and len(effective_date) >= 19:
-                    try:
-                        date_display = effective_date[:19].replace("T", " ")
-                    except (TypeError, AttributeError):
-                        date_display = "Invalid"
-                else:
-                    date_display = "N/A"
-
-                table.add_row(
-                    date_display,
-                    run.get("slug", "unknown"),
-                    status_display,
-                    f"@{user_display}",
-                    lines_str,
-                    pr_link,
-                )
-
-            rich_console.print(table)
-
-            # Show filter info if any filters applied
-            filter_info = []
-            if since_days:
-                filter_info.append(f"last {since_days} days")
-            if filter_user:
-                filter_info.append(f"user: {filter_user}")
-            if filter_info:
-                rich_console.print(f"[dim]Filters applied: {', '.join(filter_info)}[/dim]")
-        elif since_days or filter_user:
-            rich_console.print("[yellow]No runs found matching the specified filters.[/yellow]")
-        else:
-            rich_console.print("[yellow]No run history found.[/yellow]")
-
-    if show_list:
-        migrations = stats_data.get("migrations", [])
-        if migrations:
-            table = Table(title="Migrated Theme Slugs", title_style="bold cyan")
-            table.add_column("Slug", style="cyan")
-            for slug in migrations:
-                table.add_row(slug)
-            rich_console.print(table)
-        else:
-            rich_console.print("[yellow]No migrations have been recorded yet.[/yellow]")
-
-
-@cli.command(name="internal-refresh-stats", hidden=True)
-def internal_refresh_stats() -> None:
-    """
-    Internal command to process pending Firebase syncs and update PR statuses.
-    Running in background to avoid blocking the user.
-
-    This provides near-real-time PR status updates by checking in-progress PRs
-    after each successful migration.
-    """
-    try:
-        # Process pending Firebase syncs (retry offline queue)
-        process_pending_syncs()
-
-        # Update PR statuses for in-progress runs (async, limited to most recent)
-        _update_recent_pr_statuses()
-
-    except Exception:
-        # Silent failure for background tasks
-        pass
+            f.write(wrapper_content)
 
+        # Make it executable
+        os.chmod(wrapper_path, 0o755)
 
-def _update_recent_pr_statuses(max_to_check: int | None = 10) -> None:
-    """
-    Update PR statuses for recent in-progress runs.
+        logger.debug(f"Regenerated wrapper script at {wrapper_path}")
 
-    Called by internal-refresh-stats to provide near-real-time updates.
-    Limits to recent runs to avoid excessive API calls.
+    except Exception as e:
+        # Don't fail the entire update if wrapper regeneration fails
+        logger.debug(f"Failed to regenerate wrapper script: {e}")
 
-    Now supports User Mode by using FirebaseSync abstraction and only updates
-    the current user's runs (distributed update model).
 
-    Args:
-        max_to_check: Maximum number of recent runs to check (default: 10). None = unlimited.
+def _check_and_run_setup_if_needed() -> None:
+    """
+    Check if setup needs to be run (if >8 hours since last setup) and run it silently.
+    Also regenerates the wrapper script to ensure latest environment isolation fixes.
     """
+    setup_complete_file = REPO_ROOT / ".sbm_setup_complete"
+
     try:
-        from sbm.utils.firebase_sync import FirebaseSync, is_firebase_available
-        from sbm.utils.github_pr import GitHubPRManager
-
-        if not is_firebase_available():
-            return
-
-        sync = FirebaseSync()
-
-        # GLOBAL UPDATE STRATEGY
-        # We fetch ALL data so we can update ANY stale run, regardless of who owns it.
-        # This relies on Firebase Rules being set to allow global writes (auth != null).
-        all_data = sync.fetch_all_users_raw()
-
-        if not all_data:
-            return
-
-        # Flatten all runs into a list of (user_id, run_id, run_data)
-        all_runs_flat = []
-        for u_id, u_data in all_data.items():
-            if not isinstance(u_data, dict):
-                continue
-            runs = u_data.get("runs", {})
-            for r_id, r_data in runs.items():
-                # Filter out verification-ping here too so we don't waste time checking it
-                if r_data.get("slug") == "verification-ping":
-                    continue
-                all_runs_flat.append((u_id, r_id, r_data))
-
-        checked = 0
-        # Sort runs by timestamp desc to check most recent first (GLOBAL priority)
-        sorted_runs = sorted(all_runs_flat, key=lambda x: x[2].get("timestamp", ""), reverse=True)
-
-        for user_id, run_id, run_data in sorted_runs:
-            if max_to_check is not None and checked >= max_to_check:
-                break
-
-            if not isinstance(run_data, dict):
-                continue
-
-            # Only check runs that need refresh
-            if GitHubPRManager.should_refresh_pr_data(run_data):
-                # Enrich run with fresh data
-                enriched = GitHubPRManager.enrich_run_with_pr_data(run_data, force_refresh=True)
-
-                # Update Firebase via helper (supports REST/User Mode)
-                update_data = {
-                    "created_at": enriched.get("created_at"),
-                    "merged_at": enriched.get("merged_at"),
-                    "closed_at": enriched.get("closed_at"),
-                    "pr_state": enriched.get("pr_state"),
-                    "pr_author": enriched.get("pr_author"),  # Ensure author is synced
-                }
-                # Remove None values
-                update_data = {k: v for k, v in update_data.items() if v is not None}
-
-                if update_data:
-                    # Pass the specific user_id of the run owner
-                    sync.update_run(user_id=user_id, run_key=run_id, updates=update_data)
-
-                checked += 1
+        # Check if setup file exists and when it was last modified
+        if setup_complete_file.exists():
+            file_mtime = setup_complete_file.stat().st_mtime
+            current_time = time.time()
+            hours_since_setup = (current_time - file_mtime) / 3600
 
-    except Exception:
-        # Silent failure for background task, but log debug
-        pass
+            if hours_since_setup <= 8:
+                return  # Setup is still fresh, no need to run
 
+        # Setup is needed - delete old marker and run setup
+        if setup_complete_file.exists():
+            setup_complete_file.unlink()
 
-@cli.command()
-@click.argument("theme_name")
-@click.option("--skip-git", is_flag=True, help="Skip Git operations (add, commit, push).")
-@click.option(
-    "--create-pr/--no-create-pr",
-    default=True,
-    help="Create a GitHub Pull Request after successful post-migration steps "
-    "(default: True, with defaults: reviewers=etritt-cc,messponential,abond-cc,tcollier-di,ssargent-cc, labels=fe-dev).",
-)
-@click.option(
-    "--skip-review", is_flag=True, help="Skip interactive manual review and re-validation."
-)
-@click.option("--skip-git-prompt", is_flag=True, help="Skip prompt for Git operations.")
-@click.option("--skip-pr-prompt", is_flag=True, help="Skip prompt for PR creation.")
-def post_migrate(
-    theme_name: str,
-    skip_git: bool,
-    create_pr: bool,
-    skip_review: bool,
-    skip_git_prompt: bool,
-    skip_pr_prompt: bool,
-) -> None:
-    """
-    Run post-migration steps for a given theme, including manual review, re-validation,
-    Git operations, and PR creation.
-    This command assumes the initial migration (up to map components) has already been completed.
+        # Run pip install requirements silently
+        pip_result = subprocess.run(
+            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+            check=False,
+            cwd=str(REPO_ROOT),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
 
-    By default, prompts to create a published PR with default reviewers (etritt-cc, messponential, abond-cc, tcollier-di, ssargent-cc)
-    and labels (fe-dev). Use --no-create-pr to skip. For more control over PR creation,
-    use 'sbm pr <theme-name>' separately.
-    """
-    click.echo(f"Starting post-migration workflow for {theme_name}...")
+        if pip_result.returncode == 0:
+            # Regenerate wrapper script to get latest environment isolation fixes
+            _regenerate_wrapper_script()
 
-    # Attempt to get the current branch name for post-migration context
-    try:
-        repo = Repo(get_platform_dir())  # Use the platform root for the repo
-        branch_name = repo.active_branch.name
-    except Exception as e:
-        click.echo(
-            f"Error: Could not determine current Git branch for post-migration: {e}", err=True
-        )
-        click.echo("Please ensure you are in a Git repository and on the correct branch.", err=True)
-        sys.exit(1)
+            # Install pre-commit hooks (silently, no output during auto-update)
+            try:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "pre_commit",
+                        "install",
+                        "--hook-type",
+                        "pre-commit",
+                        "--hook-type",
+                        "pre-push",
+                    ],
+                    cwd=str(REPO_ROOT),
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=10,
+                )
+            except Exception:
+                # Silently ignore pre-commit installation failures during auto-update
+                pass
 
-    interactive_review = not skip_review
-    interactive_git = not skip_git_prompt
-    interactive_pr = not skip_pr_prompt
-
-    start_time = time.time()
-    result = run_post_migration_workflow(
-        theme_name,
-        branch_name,
-        skip_git=skip_git,
-        create_pr=create_pr,
-        interactive_review=interactive_review,
-        interactive_git=interactive_git,
-        interactive_pr=interactive_pr,
-    )
-    duration = time.time() - start_time
-
-    if result.get("success", False):
-        # Record the run so post-migrate recoveries appear in stats.
-        # If 'auto' already recorded a run for this slug, stats deduplication
-        # (_dedupe_runs_for_display) keeps only the most recent per slug.
-        pr_url = result.get("pr_url")
-        gh_adds = result.get("github_additions")
-        lines = gh_adds if gh_adds is not None else 0
-        record_migration(theme_name)
-        record_run(
-            slug=theme_name,
-            command="post-migrate",
-            status="success",
-            duration=duration,
-            automation_time=duration,
-            lines_migrated=lines,
-            pr_url=pr_url,
-            pr_author=result.get("pr_author"),
-            pr_state=result.get("pr_state"),
-            created_at=result.get("created_at"),
-            merged_at=result.get("merged_at"),
-            closed_at=result.get("closed_at"),
-        )
-        click.echo(f"Post-migration workflow completed successfully for {theme_name}!")
-    else:
-        click.echo(f"Post-migration workflow failed for {theme_name}.", err=True)
-        sys.exit(1)
+            # Create the setup complete marker
+            with setup_complete_file.open("w") as f:
+                f.write(f"Setup completed at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
+    except Exception as e:
+        # Silently ignore setup errors during auto-update
+        logger.debug(f"Silent setup check failed: {e}")
 
-@cli.group()
-@click.pass_context
-def pr(ctx: click.Context) -> None:
-    """
-    Manage GitHub Pull Requests.
 
-    Commands for creating and managing PRs for Site Builder migrations.
-    """
+# Auto-update logic moved to cli() to avoid execution on import
 
 
-@pr.command("create")
-@click.argument("theme_name")
-@click.option(
-    "--title", "-t", help="Title for the Pull Request. (Optional: auto-generated if not provided)"
-)
-@click.option(
-    "--body",
-    "-b",
-    help="Body/description for the Pull Request. (Optional: auto-generated if not provided)",
-)
-@click.option("--base", default="main", help="Base branch for the Pull Request (default: main).")
-@click.option("--head", help="Head branch for the Pull Request (default: current branch).")
-@click.option(
-    "--reviewers",
-    "-r",
-    help="Comma-separated list of reviewers (default: etritt-cc,messponential,abond-cc,tcollier-di,ssargent-cc).",
-)
-@click.option("--labels", "-l", help="Comma-separated list of labels (default: fe-dev).")
-@click.option("--draft", "-d", is_flag=True, default=False, help="Create as draft PR.")
-@click.option(
-    "--publish", "-p", is_flag=True, default=True, help="Create as published PR (default: true)."
-)
-@click.pass_context
-def pr_create(
-    ctx: click.Context,
-    theme_name: str,
-    title: str | None,
-    body: str | None,
-    base: str,
-    head: str | None,
-    reviewers: str | None,
-    labels: str | None,
-    draft: bool,
-    publish: bool,
-) -> None:
+class SBMCommandGroup(click.Group):
     """
-    Create a GitHub Pull Request for a given theme.
+    A custom command group that allows running a default command.
 
-    By default, creates a published PR with:
-    - Reviewers: etritt-cc, messponential, abond-cc, tcollier-di, ssargent-cc
-    - Labels: fe-dev
-    - Content: Auto-generated based on Git changes (Stellantis template)
+    Commands listed in ``lazy_commands`` (name -> "module:attribute") are only
+    imported when they are resolved.
     """
-    config = ctx.obj["config"]
-    logger = ctx.obj["logger"]
-
-    git_ops = GitOperations(config)
-
-    # Determine draft status
-    is_draft = draft if draft else not publish
 
-    # Parse reviewers and labels if provided
-    parsed_reviewers = None
-    parsed_labels = None
-    if reviewers:
-        parsed_reviewers = [r.strip() for r in reviewers.split(",")]
-    if labels:
-        parsed_labels = [label.strip() for label in labels.split(",")]
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.default_command = kwargs.pop("default_command", None)
+        self.lazy_commands = dict(kwargs.pop("lazy_commands", None) or {})
+        super().__init__(*args, **kwargs)
 
-    try:
-        # The create_pr method in GitOperations will handle branch detection
-        # and PR content generation.
-        logger.info("Creating GitHub PR for %s...", theme_name)
-        pr_result = git_ops.create_pr(
-            slug=theme_name,
-            branch_name=head,
-            # Pass head directly, GitOperations will handle current branch if head is None
-            title=title,
-            body=body,
-            base=base,
-            head=head,
-            reviewers=parsed_reviewers,
-            labels=parsed_labels,
-            draft=is_draft,
-        )
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
 
-        if pr_result["success"]:
-            click.echo(f"✅ Pull request created: {pr_result['pr_url']}")
-            click.echo(f"Title: {pr_result['title']}")
-            click.echo(f"Branch: {pr_result['branch']}")
-            if is_draft:
-                click.echo("📝 Created as draft - remember to publish when ready")
-            if pr_result.get("existing"):
-                click.echo("ℹ️  PR already existed - retrieved existing PR URL")  # noqa: RUF001
-        else:
-            click.echo(f"❌ PR creation failed: {pr_result['error']}", err=True)
-            sys.exit(1)
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(_load_lazy_command(self.lazy_commands[cmd_name]), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-    except Exception:
-        logger.exception("Unexpected error occurred")
-        sys.exit(1)
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str, click.Command, list[str]]:
+        try:
+            # Try to resolve the command as usual
+            return super().resolve_command(ctx, args)
+        except click.UsageError:
+            # If it fails, assume it's an argument for the default command
+            if self.default_command is None:
+                raise
+            # Prepend the default command name to the arguments
+            args.insert(0, self.default_command)
+            return super().resolve_command(ctx, args)
 
 
-@pr.command("merge")
-@click.option(
-    "--pattern",
-    "-p",
-    default="pcon-864",
-    help="Branch name pattern to match (default: pcon-864)",
-)
-@click.option(
-    "--dry-run",
-    "-n",
-    is_flag=True,
-    default=False,
-    help="Show what would be done without making changes",
+@click.group(
+    cls=SBMCommandGroup,
+    default_command="auto",
+    lazy_commands=LAZY_COMMANDS,
+    context_settings={"help_option_names": ["-h", "--help"]},
 )
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+@click.option("--yes", "-y", is_flag=True, help="Auto-confirm all prompts (non-interactive mode)")
+@click.option("--config", "config_path", default="config.json", help="Path to config file.")
 @click.pass_context
-def pr_merge(ctx: click.Context, pattern: str, dry_run: bool) -> None:
-    """
-    Enable auto-merge on open PRs matching a branch pattern.
+def cli(ctx: click.Context, verbose: bool, yes: bool, config_path: str) -> None:
+    """[bold blue]Auto-SBM[/]: Automated Site Builder Migration Tool
 
-    Finds all open PRs with branch names containing the pattern,
-    updates branches to be current with base, and enables auto-merge.
+    Migrate dealer themes to Site Builder format with automated SCSS
+    transformation, validation, and GitHub PR creation.
 
-    Examples:
-        sbm pr merge                    # Enable auto-merge on all pcon-864* PRs
-        sbm pr merge -p pcon-123        # Enable for specific project PRs
-        sbm pr merge --dry-run          # Preview without making changes
+    [dim]Run 'sbm COMMAND --help' for command-specific help.[/dim]
     """
-    console = get_console()
+    from sbm.config import get_settings
 
-    try:
-        # Get all open PRs matching the pattern
-        result = subprocess.run(
-            [
-                "gh",
-                "pr",
-                "list",
-                "--state",
-                "open",
-                "--json",
-                "number,headRefName,title,url",
-                "--jq",
-                f'.[] | select(.headRefName | contains("{pattern}")) | [.number, .headRefName, .title, .url] | @tsv',
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+    # Set logger level based on verbose flag
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+    else:
+        logger.setLevel(logging.INFO)
 
-        prs = result.stdout.strip().split("\n") if result.stdout.strip() else []
+    # Set non-interactive mode if --yes is passed
+    if yes:
+        get_settings().non_interactive = True
+        logger.info("Non-interactive mode enabled via --yes flag")
 
-        if not prs or (len(prs) == 1 and not prs[0]):
-            console.console.print(f"[yellow]No open PRs found matching pattern: {pattern}[/yellow]")
-            return
+    # Run health check and setup if needed (only when running as CLI)
+    current_dir = os.getcwd()
+    if str(REPO_ROOT) in current_dir:
+        if not SETUP_MARKER.exists() or not is_env_healthy():
+            if os.environ.get("SBM_SKIP_SETUP") != "1" and not os.environ.get("SBM_RUNNING_SETUP"):
+                os.environ["SBM_RUNNING_SETUP"] = "1"
+                logger.info("Initializing environment...")
+                subprocess.run(["bash", str(SETUP_SCRIPT)], check=False)
 
-        console.console.print(f"\n[bold]Found {len(prs)} matching PR(s)[/bold]\n")
+    # Hint about newer versions from the cached background check
+    _notify_if_update_available(ctx)
 
-        if dry_run:
-            console.console.print("[yellow]DRY RUN - No changes will be made[/yellow]\n")
+    # Initialize context object
+    ctx.ensure_object(dict)
 
-        for pr_line in prs:
-            if not pr_line.strip():
-                continue
+    # Try to load config if it exists
+    config = None
+    if Path(config_path).exists():
+        try:
+            config = get_config(config_path)
+        except ConfigurationError as e:
+            logger.warning(f"Configuration warning: {e}")
+            config = Config({})  # Use empty config as fallback
+    else:
+        config = Config({})  # Use empty config as fallback
 
-            parts = pr_line.split("\t")
-            if len(parts) != 4:
-                continue
+    # Store config and logger in context
+    ctx.obj["config"] = config
+    ctx.obj["logger"] = logger
 
-            pr_number, branch_name, title, pr_url = parts
 
-            console.console.print(f"[bold cyan]PR #{pr_number}:[/bold cyan] {title}")
-            console.console.print(f"[dim]Branch: {branch_name}[/dim]")
-            console.console.print(f"[dim]URL: {pr_url}[/dim]\n")
+def _validate_firebase_key_required() -> None:
+    """Validate Firebase API key is present before running commands."""
+    config = get_settings()
 
-            if dry_run:
-                console.console.print("[dim]Would enable auto-merge[/dim]\n")
-                continue
+    # Check if API key is present and not a placeholder
+    if not config.firebase.api_key or config.firebase.api_key == "your-firebase-web-api-key":
+        logger.error("❌ Firebase API key is required for this operation")
+        logger.error("")
+        logger.error("The Firebase API key is missing or not configured properly.")
+        logger.error("")
+        logger.error("To resolve this:")
+        logger.error("  1. Run: sbm setup")
+        logger.error("  2. Or add it to .env: FIREBASE__API_KEY=<your-key>")
+        sys.exit(1)
 
-            # Check current merge status
-            merge_result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "view",
-                    pr_number,
-                    "--json",
-                    "mergeable,mergeStateStatus,autoMergeRequest,statusCheckRollup,reviewDecision",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
 
-            merge_info = json.loads(merge_result.stdout)
-            merge_state = merge_info.get("mergeStateStatus")
-            auto_merge_enabled = merge_info.get("autoMergeRequest") is not None
-
-            # Update branch if needed
-            if merge_state in ["BEHIND", "DIRTY"]:
-                console.console.print("🔄 Updating branch to be current with base...")
-                try:
-                    subprocess.run(
-                        ["gh", "pr", "merge", pr_number, "--update-branch"],
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                    )
-                    console.console.print("[green]✓[/green] Branch updated successfully\n")
-                    time.sleep(2)  # Wait for GitHub to process
-                except subprocess.TimeoutExpired:
-                    console.console.print(
-                        "[yellow]⚠[/yellow] Branch update timed out - may complete in background\n"
-                    )
-                except subprocess.CalledProcessError as e:
-                    error_msg = e.stderr if e.stderr else str(e)
-                    if "already up to date" not in error_msg.lower():
-                        console.console.print(
-                            f"[yellow]⚠[/yellow] Could not update branch: {error_msg}\n"
-                        )
-
-            # Enable auto-merge if not already enabled
-            if auto_merge_enabled:
-                console.console.print("[green]✓[/green] Auto-merge already enabled\n")
-            else:
-                console.console.print("🔄 Enabling auto-merge...")
-                try:
-                    subprocess.run(
-                        ["gh", "pr", "merge", pr_number, "--auto", "--squash"],
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                    )
-                    console.console.print("[green]✓[/green] Auto-merge enabled (squash strategy)\n")
-                except subprocess.CalledProcessError as e:
-                    error_msg = e.stderr if e.stderr else str(e)
-                    console.console.print(
-                        f"[red]✗[/red] Failed to enable auto-merge: {error_msg}\n"
-                    )
-
-        console.console.print(f"[bold green]✓[/bold green] Processed {len(prs)} PR(s)")
+@cli.command(name="internal-refresh-stats", hidden=True)
+def internal_refresh_stats() -> None:
+    """
+    Internal command to process pending Firebase syncs and update PR statuses.
 
-    except subprocess.CalledProcessError as e:
-        console.console.print(f"[red]Error:[/red] {e.stderr if e.stderr else str(e)}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        console.console.print(f"[red]Unexpected error:[/red] {e!s}", err=True)
-        sys.exit(1)
+    Kept for compatibility; background refreshes now run ``python -m sbm.worker
+    refresh-stats`` directly so they don't import the whole CLI.
+    """
+    refresh_stats()
 
 
 def _validate_git_repository() -> None:
@@ -3113,6 +917,9 @@ def update() -> None:
             click.echo("\n🪝 Installing pre-commit hooks...")
             _install_precommit_hooks()
 
+            # Refresh setup and the global wrapper script, as auto-update used to after a pull
+            _check_and_run_setup_if_needed()
+
             # Restore stashed changes
             if has_changes:
                 _restore_stashed_changes()
@@ -3132,270 +939,6 @@ def update() -> None:
         sys.exit(1)
 
 
-@cli.command()
-@click.argument("theme_name")
-@click.option("--no-cleanup", is_flag=True, help="Skip cleanup of test files (for debugging).")
-@click.option("--max-iterations", default=3, help="Maximum error recovery iterations (default: 3).")
-@click.option(
-    "--timeout", default=45, help="Maximum wait time for compilation in seconds (default: 45)."
-)
-def test_compilation(theme_name: str, no_cleanup: bool, max_iterations: int, timeout: int) -> None:
-    """
-    Test SCSS compilation error handling system without running a full migration.
-
-    This command:
-    1. Copies existing SCSS files from the theme to CSS directory for compilation testing
-    2. Monitors Docker Gulp logs for compilation errors
-    3. Applies the full error recovery pipeline with automated fixes
-    4. Reports results and cleans up afterward (unless --no-cleanup is used)
-
-    This allows testing the error handling capabilities on themes with known
-    compilation issues without modifying the original files or running a full migration.
-    """
-    click.echo(f"🧪 Testing SCSS compilation error handling for {theme_name}...")
-    click.echo(f"Max iterations: {max_iterations}, Timeout: {timeout}s")
-
-    theme_dir = Path(get_dealer_theme_dir(theme_name))
-    css_dir = theme_dir / "css"
-    test_files: list[tuple[str, Path]] = []
-    success = False
-
-    try:
-        _validate_test_compilation_dirs(theme_dir, css_dir)
-        existing_files = _find_existing_scss_files(theme_dir)
-        test_files = _prepare_test_files(existing_files, theme_dir, css_dir)
-
-        click.echo("🔄 Starting compilation monitoring with error recovery...")
-        click.echo(f"📊 Monitoring up to {max_iterations} recovery iterations...")
-
-        start_time = time.time()
-        success = _test_compilation_with_monitoring(
-            css_dir, test_files, theme_dir, max_iterations, timeout
-        )
-        total_time = time.time() - start_time
-
-        _report_test_results(theme_name, len(test_files), total_time, success)
-
-    except (ValueError, FileNotFoundError) as e:
-        click.echo(f"❌ Test setup failed: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"❌ Test failed with error: {e}", err=True)
-        logger.error(f"Compilation test error: {e}")
-    finally:
-        if not no_cleanup and test_files:
-            click.echo("\n🧹 Cleaning up test files...")
-            _cleanup_test_files(css_dir, test_files)
-        elif no_cleanup:
-            click.echo(f"\n🔍 Test files preserved for debugging in: {css_dir}")
-            if test_files:
-                click.echo("Test files:")
-                for test_filename, _ in test_files:
-                    click.echo(f"  - {test_filename}")
-
-
-def _validate_test_compilation_dirs(theme_dir: Path, css_dir: Path) -> None:
-    """Check if theme and css directories exist for test compilation."""
-    if not theme_dir.exists():
-        msg = f"Theme directory not found: {theme_dir}"
-        raise FileNotFoundError(msg)
-    if not css_dir.exists():
-        msg = f"CSS directory not found: {css_dir}"
-        raise FileNotFoundError(msg)
-
-
-def _find_existing_scss_files(theme_dir: Path) -> list[str]:
-    """Find existing, non-empty SCSS files in the theme directory."""
-    sb_files = ["sb-inside.scss", "sb-vdp.scss", "sb-vrp.scss", "sb-home.scss"]
-    existing_files = []
-    for sb_file in sb_files:
-        file_path = theme_dir / sb_file
-        if file_path.exists() and file_path.read_text().strip():
-            existing_files.append(sb_file)
-
-    if not existing_files:
-        missing_files_info = []
-        for sb_file in sb_files:
-            file_path = theme_dir / sb_file
-            status = "empty" if file_path.exists() else "missing"
-            missing_files_info.append(f"  - {sb_file} ({status})")
-        raise ValueError(
-            "No Site Builder SCSS files with content found.\n"
-            "Available files to test:\n" + "\n".join(missing_files_info)
-        )
-    return existing_files
-
-
-def _prepare_test_files(
-    existing_files: list[str], theme_dir: Path, css_dir: Path
-) -> list[tuple[str, Path]]:
-    """Copy SCSS files to a test location for compilation."""
-    click.echo(f"📁 Found {len(existing_files)} SCSS files to test: {', '.join(existing_files)}")
-    test_files = []
-    click.echo("📋 Copying SCSS files for compilation testing...")
-    for sb_file in existing_files:
-        src_path = theme_dir / sb_file
-        test_filename = f"test-compilation-{sb_file}"
-        dst_path = css_dir / test_filename
-        shutil.copy2(src_path, dst_path)
-        test_files.append((test_filename, dst_path))
-        click.echo(f"  ✅ {sb_file} → {test_filename}")
-    return test_files
-
-
-def _report_test_results(theme_name: str, num_files: int, total_time: float, success: bool) -> None:
-    """Report the final results of the compilation test."""
-    click.echo(f"\n📈 Compilation Test Results for {theme_name}")
-    click.echo("=" * 60)
-    click.echo(f"Files tested: {num_files}")
-    click.echo(f"Total time: {total_time:.1f}s")
-    click.echo(f"Result: {'✅ SUCCESS' if success else '❌ FAILED'}")
-
-    if success:
-        click.echo("\n🎉 All SCSS files compiled successfully!")
-        click.echo("The error handling system is working correctly for this theme.")
-    else:
-        click.echo("\n⚠️  Compilation failed after all recovery attempts.")
-        click.echo("This theme may have complex errors requiring manual fixes.")
-        click.echo("\n🔧 Debugging tips:")
-        click.echo("- Check Docker logs: docker logs dealerinspire_legacy_assets")
-        click.echo("- Use --no-cleanup to examine test files")
-        click.echo("- Try increasing --max-iterations or --timeout")
-
-
-def _test_compilation_with_monitoring(
-    css_dir: Path,
-    test_files: list[tuple[str, Path]],
-    theme_dir: Path,
-    max_iterations: int,
-    timeout: int,
-) -> bool:
-    """
-    Enhanced compilation monitoring specifically for testing error handling.
-    """
-    iteration = 0
-    start_time = time.time()
-    click.echo("🔄 Starting compilation monitoring...")
-
-    while iteration < max_iterations and (time.time() - start_time) < timeout:
-        iteration += 1
-        click.echo(f"📍 Attempt {iteration}/{max_iterations}")
-        time.sleep(3)
-
-        try:
-            result = subprocess.run(
-                ["docker", "logs", "--tail", "50", "dealerinspire_legacy_assets"],
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0 and result.stdout:
-                logs = result.stdout.lower()
-                if (
-                    "finished 'sass'" in logs
-                    and "finished 'processcss'" in logs
-                    and not any(
-                        error_indicator in logs
-                        for error_indicator in [
-                            "error:",
-                            "failed",
-                            "scss compilation error",
-                            "syntax error",
-                        ]
-                    )
-                ):
-                    click.echo("✅ Compilation completed successfully")
-                    return True
-
-                errors_found = _parse_compilation_errors(logs, test_files)
-                if errors_found:
-                    click.echo(f"🔍 Found {len(errors_found)} compilation errors")
-                    for i, error_info in enumerate(errors_found, 1):
-                        error_type = error_info.get("type", "unknown")
-                        error_msg = error_info.get("line_content", "No details")
-                        click.echo(f"  {i}. {error_type}: {error_msg}")
-
-                    fixes_applied = sum(
-                        _attempt_error_fix(error, css_dir, theme_dir) for error in errors_found
-                    )
-                    if fixes_applied > 0:
-                        click.echo(f"🔧 Applied {fixes_applied} automated fixes, retrying...")
-                        continue
-                    click.echo("⚠️  No automated fixes available for detected errors")
-                    break
-                click.echo("⏳ No specific errors detected, waiting for compilation...")
-        except subprocess.TimeoutExpired:
-            click.echo("⏱️  Docker logs command timed out")
-        except Exception as e:
-            click.echo(f"⚠️  Error checking Docker logs: {e}")
-
-        success_count = sum((css_dir / f.replace(".scss", ".css")).exists() for f, _ in test_files)
-        if success_count == len(test_files):
-            click.echo("✅ All CSS files generated successfully")
-            return True
-        click.echo(f"📊 Compilation status: {success_count}/{len(test_files)} files compiled")
-
-        if (time.time() - start_time) >= timeout:
-            click.echo(f"⏱️  Timeout reached ({timeout}s)")
-            break
-
-    click.echo(f"❌ Compilation failed after {iteration} attempts")
-    if click.confirm("🔧 Comment out problematic SCSS code to allow compilation?", default=False):
-        _comment_out_problematic_code_for_test(test_files)
-        time.sleep(3)
-        success_count = sum((css_dir / f.replace(".scss", ".css")).exists() for f, _ in test_files)
-        if success_count == len(test_files):
-            click.echo("✅ Compilation successful after commenting out problematic code")
-            return True
-    return False
-
-
-def _comment_out_problematic_code_for_test(test_files: list[tuple[str, Path]]) -> None:
-    """Comment out potentially problematic SCSS code in test files."""
-    click.echo("🔧 Commenting out potentially problematic SCSS code...")
-    problematic_patterns = [
-        r"@include\s+[^;]+;",
-        r"lighten\([^)]+\)",
-        r"darken\([^)]+\)",
-        r"\$[a-zA-Z_][a-zA-Z0-9_-]*",
-    ]
-    for test_filename, scss_path in test_files:
-        try:
-            content = scss_path.read_text()
-            lines = content.split("\n")
-            modified = False
-            for i, line in enumerate(lines):
-                if not line.strip().startswith("//") and any(
-                    re.search(p, line) for p in problematic_patterns
-                ):
-                    lines[i] = f"// TEST COMMENTED: {line}"
-                    modified = True
-            if modified:
-                scss_path.write_text("\n".join(lines))
-                click.echo(f"  ✅ Commented problematic code in {test_filename}")
-        except Exception as e:
-            click.echo(f"  ⚠️  Error processing {test_filename}: {e}")
-
-
-def _cleanup_test_files(css_dir: Path, test_files: list[tuple[str, Path]]) -> None:
-    """Clean up test files and wait for Docker Gulp to process the cleanup."""
-    try:
-        for test_filename, scss_path in test_files:
-            try:
-                if scss_path.exists():
-                    scss_path.unlink()
-                css_path = css_dir / test_filename.replace(".scss", ".css")
-                if css_path.exists():
-                    css_path.unlink()
-            except Exception as e:
-                click.echo(f"  ⚠️  Error removing {test_filename}: {e}")
-        time.sleep(3)
-        click.echo("✅ Test files cleaned up successfully")
-    except Exception as e:
-        click.echo(f"⚠️  Error during cleanup: {e}")
-
-
 @cli.command()
 @click.option("--changelog", "-c", is_flag=True, help="Show recent changelog entries")
 def version(changelog: bool) -> None:
@@ -3464,6 +1007,8 @@ def doctor() -> None:
 
     # Check git configuration
     try:
+        from git import Repo
+
         repo = Repo(REPO_ROOT)
         console.console.print(f"✅ Git repository: {repo.active_branch.name}")
     except Exception as e:
@@ -3516,8 +1061,8 @@ def auto_update(action: str) -> None:
     Manage auto-update settings for auto-sbm.
 
     Actions:
-    - enable: Enable automatic updates (default behavior)
-    - disable: Disable automatic updates
+    - enable: Enable background update checks (default behavior)
+    - disable: Disable background update checks
     - status: Show current auto-update status
     """
     disable_file = REPO_ROOT / ".sbm-no-auto-update"
@@ -3525,7 +1070,9 @@ def auto_update(action: str) -> None:
     if action == "enable":
         if disable_file.exists():
             disable_file.unlink()
-            click.echo("✅ Auto-updates enabled. SBM will automatically update at startup.")
+            click.echo(
+                "✅ Auto-updates enabled. SBM will let you know when an update is available."
+            )
         else:
             click.echo("✅ Auto-updates are already enabled.")
 
@@ -3541,11 +1088,11 @@ def auto_update(action: str) -> None:
     elif action == "status":
         if disable_file.exists():
             click.echo("❌ Auto-updates are DISABLED")
-            click.echo("   Run 'sbm auto-update enable' to enable automatic updates")
+            click.echo("   Run 'sbm auto-update enable' to enable update checks")
         else:
             click.echo("✅ Auto-updates are ENABLED")
-            click.echo("   SBM will automatically update to the latest version at startup")
-            click.echo("   Run 'sbm auto-update disable' to disable automatic updates")
+            click.echo("   SBM checks for new versions in the background and suggests 'sbm update'")
+            click.echo("   Run 'sbm auto-update disable' to disable update checks")
 
 
 @cli.command()
@@ -3568,8 +1115,16 @@ def setup() -> None:
     type=click.Path(),
     help="Output file path (default: slugs.json in auto-sbm directory)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Concurrent devtools searches",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def get_slugs(input_file: str, output: str | None, verbose: bool) -> None:
+def get_slugs(input_file: str, output: str | None, workers: int, verbose: bool) -> None:
     """
     Retrieve dealer slugs from account names using devtools search.
 
@@ -3608,25 +1163,12 @@ def get_slugs(input_file: str, output: str | None, verbose: bool) -> None:
     click.echo(f"📂 Input file: {input_path}")
     click.echo(f"📝 Output file: {output_path}")
 
-    # Check if pandas is available for Excel files
-    if input_path.suffix.lower() in [".xlsx", ".xls"]:
-        try:
-            import pandas  # noqa: F401
-        except ImportError:
-            click.echo("❌ Error: pandas is required for Excel files")
-            click.echo("Install with: pip install pandas openpyxl")
-            sys.exit(1)
-
     try:
-        retriever = SlugRetriever(input_path, output_path)
+        retriever = SlugRetriever(input_path, output_path, workers=workers)
 
-        # Read input file
+        # Read the input file and resolve slugs as rows stream in
         click.echo("\n📖 Reading input file...")
-        search_terms = retriever.read_input_file()
-        click.echo(f"✅ Found {len(search_terms)} websites")
-
-        # Retrieve slugs
-        retriever.retrieve_all_slugs(search_terms)
+        retriever.retrieve_all_slugs(retriever.iter_search_terms())
 
         # Write output
         click.echo(f"\n💾 Writing results to {output_path}...")
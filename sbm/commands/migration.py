@@ -0,0 +1,978 @@
+"""
+Migration commands: ``auto``, ``migrate``, ``reprocess`` and ``post-migrate``.
+
+These pull in the migration core (SCSS processor, map migration, OEM handlers),
+GitPython and the Firebase-backed tracker, so ``sbm.cli`` only imports this
+module when one of them is invoked.
+"""
+
+from __future__ import annotations
+
+import datetime
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import rich_click as click  # type: ignore
+except Exception:
+    import click
+from git import Repo
+from rich.table import Table
+
+from sbm.cli import REPO_ROOT, _validate_firebase_key_required
+from sbm.commands.stats import stats
+from sbm.config import Config
+from sbm.core.migration import (
+    MigrationResult,
+    _cleanup_snapshot_files,
+    _create_automation_snapshots,
+    add_predetermined_styles,
+    create_sb_files,
+    migrate_dealer_theme,
+    migrate_map_components,
+    migrate_styles,
+    reprocess_manual_changes,
+    run_post_migration_workflow,
+)
+from sbm.oem.factory import OEMFactory
+from sbm.ui.console import get_console
+from sbm.ui.prompts import InteractivePrompts
+from sbm.utils.logger import logger
+from sbm.utils.path import get_output_dir, get_platform_dir
+from sbm.utils.timer import get_total_automation_time, get_total_duration
+from sbm.utils.tracing import trace_run
+from sbm.utils.tracker import record_migration, record_run
+
+
+def _expand_theme_names(theme_names: tuple[str, ...]) -> list[str]:
+    """
+    Expand theme names from arguments and optional file references.
+
+    Args:
+        theme_names: A tuple of theme names or file paths (prefixed with @)
+
+    Returns:
+        A list of expanded theme names (slugs)
+
+    File references can be:
+        - @slugs.txt - A text file with one slug per line
+        - @report.csv - A Salesforce CSV export (auto-processes using devtools search)
+        - @dealers.xlsx - An Excel file (auto-processes using devtools search)
+    """
+    expanded = []
+    for name in theme_names:
+        if name.startswith("@"):
+            file_path_str = name[1:]
+            file_path = Path(file_path_str).expanduser()  # Expand ~ to home directory
+
+            # 1. Try relative to CWD
+            # 2. Try relative to REPO_ROOT (fallback for external execution)
+            if not file_path.exists():
+                fallback_path = REPO_ROOT / file_path_str
+                if fallback_path.exists():
+                    file_path = fallback_path
+                else:
+                    logger.error(
+                        f"Theme list file not found: {file_path_str} (checked CWD and {REPO_ROOT})"
+                    )
+                    continue
+
+            # Check if this is a CSV/Excel file that needs slug extraction
+            file_ext = file_path.suffix.lower()
+            if file_ext in [".csv", ".xlsx", ".xls"]:
+                # Auto-process CSV/Excel to extract slugs using devtools search
+                extracted_slugs = _process_csv_for_slugs(file_path)
+                if extracted_slugs:
+                    expanded.extend(extracted_slugs)
+                else:
+                    logger.error(f"No slugs could be extracted from {file_path}")
+            else:
+                # Regular text file with slugs
+                try:
+                    # Read slugs from file, supporting lines, spaces, or commas as delimiters
+                    with file_path.open("r") as f:
+                        for line in f:
+                            # Ignore comments (anything after #)
+                            clean_line = line.split("#")[0].strip()
+                            if not clean_line:
+                                continue
+
+                            # Treat commas as spaces, then split by whitespace
+                            slugs = clean_line.replace(",", " ").split()
+                            expanded.extend(slugs)
+                except Exception as e:
+                    logger.error(f"Failed to read theme list file {file_path}: {e}")
+        else:
+            expanded.append(name)
+
+    # Remove duplicates while preserving order
+    unique_expanded = []
+    seen = set()
+    for item in expanded:
+        if item not in seen:
+            unique_expanded.append(item)
+            seen.add(item)
+
+    return unique_expanded
+
+
+def _process_csv_for_slugs(file_path: Path) -> list[str]:
+    """
+    Process a CSV/Excel file to extract slugs using devtools search.
+
+    This function:
+    1. Uses the SlugRetriever to search for each dealer website in devtools
+    2. Filters by "Mockup Approved" stage (if Stage column exists)
+    3. Notifies user of any issues (not found, etc.)
+    4. Returns the list of slugs
+
+    Args:
+        file_path: Path to CSV or Excel file
+
+    Returns:
+        List of slugs extracted from the file
+    """
+    click.echo(f"\n📊 Auto-processing {file_path.name} for slug extraction...")
+
+    # Import the SlugRetriever from the scripts directory
+    scripts_dir = REPO_ROOT / "scripts"
+    sys.path.insert(0, str(scripts_dir))
+
+    try:
+        from retrieve_slugs import SlugRetriever
+    except ImportError as e:
+        logger.error(f"Failed to import slug retrieval script: {e}")
+        return []
+
+    # Output files
+    # Output files in data directory
+    data_dir = REPO_ROOT / "data"
+    data_dir.mkdir(exist_ok=True)
+    output_json = data_dir / "slugs.json"
+    output_txt = data_dir / "slugs.txt"
+
+    try:
+        retriever = SlugRetriever(file_path, output_json)
+
+        # Stream the input file (with stage filtering for CSV) straight into the
+        # resolver so searches start while the rest of the file is parsed
+        click.echo("📖 Reading input file...")
+        unique_slugs = list(retriever.iter_slugs(retriever.iter_search_terms()))
+        click.echo(f"✅ Searched {len(retriever.results)} websites")
+
+        if not retriever.results:
+            logger.error("No websites found in input file")
+            return []
+
+        # Warn about overwrite and write output files
+        click.echo(f"\n⚠️  Note: {output_txt} will be overwritten with the new slugs")
+        click.echo(f"💾 Writing results to {output_json} and {output_txt}...")
+        retriever.write_output_file()
+
+        # Print summary
+        retriever.print_summary()
+
+        # Check for any failures and notify user
+        not_found = [r for r in retriever.results if r["status"] == "not_found"]
+        if not_found:
+            click.echo("\n⚠️  The following dealers were NOT found and will be skipped:")
+            for r in not_found:
+                click.echo(f"   - {r['search_term']}")
+            click.echo("")
+
+        click.echo(f"\n✅ Extracted {len(unique_slugs)} unique slugs from {file_path.name}")
+
+        # Open slugs.txt for user review
+        click.echo(f"\n📄 Opening {output_txt} for review...")
+        try:
+            subprocess.run(["open", str(output_txt)], check=False)
+        except Exception:
+            click.echo(f"   (Could not auto-open file. Please review: {output_txt})")
+
+        # Ask user to confirm the slugs before proceeding
+        click.echo("\n" + "=" * 60)
+        click.echo("👆 Please review the slugs above (file opened for editing)")
+        click.echo("=" * 60)
+        if not click.confirm(
+            "\n✅ Confirm these slugs are correct and proceed with migration?", default=True
+        ):
+            click.echo(
+                "❌ Cancelled by user. Edit slugs.txt manually if needed, then run 'sbm @slugs.txt'"
+            )
+            return []
+
+        return unique_slugs
+
+    except Exception as e:
+        logger.error(f"Failed to process {file_path}: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return []
+
+
+def _perform_migration_steps(
+    theme_name: str, force_reset: bool, skip_maps: bool
+) -> tuple[bool, int, int, int]:
+    """Run the core migration steps, returning success status."""
+    oem_handler = OEMFactory.detect_from_theme(theme_name)
+    logger.info(f"Using {oem_handler} for {theme_name}")
+
+    total_steps = 3 if skip_maps else 4
+    from sbm.ui.console import get_console
+
+    console = get_console()
+
+    # Step 1: Create Site Builder files
+    with console.status(f"Step 1/{total_steps}: Creating Site Builder files"):
+        if not create_sb_files(theme_name, force_reset):
+            logger.error(f"Failed to create Site Builder files for {theme_name}")
+            return False, 0, 0, 0
+    console.print_success("Site Builder files created")
+
+    # Step 2: Migrate styles
+    lines_migrated = 0
+    files_created_count = 0
+    scss_line_count = 0
+    with console.status(f"Step 2/{total_steps}: Migrating styles"):
+        # migrate_styles now returns (min success, lines, files_count, source_lines)
+        success, lines, files_count, source_lines = migrate_styles(theme_name)
+        if not success:
+            logger.error(f"Failed to migrate styles for {theme_name}")
+            return False, 0, 0, 0
+        lines_migrated = lines
+        files_created_count = files_count
+        scss_line_count = source_lines
+    console.print_success("Styles migrated")
+
+    # Step 3: Add predetermined styles
+    with console.status(f"Step 3/{total_steps}: Adding predetermined styles"):
+        if not add_predetermined_styles(theme_name):
+            logger.error(f"Failed to add predetermined styles for {theme_name}")
+            return False, 0, 0, 0
+    console.print_success("Predetermined styles added")
+
+    # Step 4: Migrate map components if not skipped
+    if not skip_maps:
+        with console.status(f"Step 4/{total_steps}: Migrating map components"):
+            if not migrate_map_components(theme_name, oem_handler):
+                logger.error(f"Failed to migrate map components for {theme_name}")
+                return False, 0, 0, 0
+        console.print_success("Map components migrated")
+    else:
+        logger.debug(f"Skipping map components migration for {theme_name}")
+
+    return True, lines_migrated, files_created_count, scss_line_count
+
+
+def _generate_migration_report(
+    results: list[MigrationResult | dict], retry_file: Optional[Path] = None
+) -> None:
+    """
+    Generate a comprehensive user-specific migration report.
+
+    Args:
+        results: List of MigrationResult objects or legacy dictionaries
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    reports_dir = get_output_dir("reports", REPO_ROOT)
+    reports_dir.mkdir(parents=True, exist_ok=True)
+
+    report_path = reports_dir / f"migration_report_{timestamp}.txt"
+
+    # Calculate summary statistics
+    total = len(results)
+    success_count = sum(1 for r in results if _get_status(r) == "success")
+    failed_count = sum(1 for r in results if _get_status(r) == "failed")
+    error_count = sum(1 for r in results if _get_status(r) == "error")
+
+    try:
+        with report_path.open("w") as f:
+            # Header
+            f.write("=" * 60 + "\n")
+            f.write("           SBM MIGRATION REPORT\n")
+            f.write(f"           Generated: {timestamp}\n")
+            f.write("=" * 60 + "\n\n")
+
+            # Summary Section
+            f.write("SUMMARY\n")
+            f.write("-" * 40 + "\n")
+            f.write(f"Total Slugs Processed: {total}\n")
+            f.write(f"✅ Successful: {success_count}\n")
+            f.write(f"❌ Failed: {failed_count}\n")
+            f.write(f"⚠️  Errors: {error_count}\n")
+            if retry_file:
+                f.write(f"\n🔄 RETRY INFO: {retry_file.name} has been updated with failed slugs.\n")
+            f.write("\n" + "=" * 60 + "\n\n")
+
+            # Salesforce Messages Section (for copy/paste convenience)
+            successful_results = [r for r in results if _get_status(r) == "success"]
+            if successful_results:
+                f.write("SALESFORCE MESSAGES (Copy/Paste Ready)\n")
+                f.write("-" * 40 + "\n\n")
+                for res in successful_results:
+                    slug = _get_field(res, "slug")
+                    salesforce_msg = _get_field(res, "salesforce_message")
+                    pr_url = _get_field(res, "pr_url")
+
+                    if salesforce_msg:
+                        f.write("FED Site Builder Migration Complete:\n\n")
+                        f.write(f"{salesforce_msg}\n\n")
+                        f.write(f"PR: {pr_url or 'N/A'}\n")
+                        f.write("\n" + "-" * 40 + "\n\n")
+
+                f.write("=" * 60 + "\n\n")
+
+            # Detailed Results
+            f.write("DETAILED RESULTS\n")
+            f.write("-" * 40 + "\n\n")
+
+            for res in results:
+                slug = _get_field(res, "slug")
+                status = _get_status(res).upper()
+                pr_url = _get_field(res, "pr_url") or "N/A"
+                branch = _get_field(res, "branch_name") or "N/A"
+                elapsed = _get_field(res, "elapsed_time") or 0
+                step_failed = _get_field(res, "step_failed")
+                error_msg = _get_field(res, "error_message") or _get_field(res, "error")
+                stack_trace = _get_field(res, "stack_trace")
+                scss_errors = _get_field(res, "scss_errors") or []
+
+                f.write(f"Slug: {slug}\n")
+                f.write(f"Status: {status}\n")
+                f.write(f"Branch: {branch}\n")
+                f.write(f"Elapsed Time: {elapsed:.2f}s\n")
+                f.write(f"PR URL: {pr_url}\n")
+
+                if step_failed:
+                    step_name = (
+                        step_failed.value if hasattr(step_failed, "value") else str(step_failed)
+                    )
+                    f.write(f"Failed At Step: {step_name}\n")
+
+                if error_msg:
+                    f.write(f"Error: {error_msg}\n")
+
+                if scss_errors:
+                    f.write("SCSS Compilation Errors:\n")
+                    for err in scss_errors[:10]:  # Limit to first 10
+                        f.write(f"  - {err}\n")
+
+                if stack_trace:
+                    f.write("Stack Trace:\n")
+                    f.write("```\n")
+                    f.write(f"{stack_trace}\n")
+                    f.write("```\n")
+
+                f.write("\n" + "=" * 60 + "\n\n")
+
+        logger.info(f"Detailed migration report generated: {report_path}")
+        click.echo(f"\n📄 Report generated: {report_path}")
+    except Exception as e:
+        logger.error(f"Failed to generate migration report: {e}")
+
+
+def _get_status(result: MigrationResult | dict) -> str:
+    """Extract status from MigrationResult or dict."""
+    if isinstance(result, MigrationResult):
+        return result.status
+    return result.get("status", "unknown")
+
+
+def _get_field(result: MigrationResult | dict, field: str):
+    """Extract a field from MigrationResult or dict."""
+    if isinstance(result, MigrationResult):
+        return getattr(result, field, None)
+    return result.get(field)
+
+
+@click.command()
+@click.argument("theme_names", nargs=-1, required=True)
+@click.option("--force-reset", is_flag=True, help="Force reset of existing Site Builder files.")
+@click.option("--skip-maps", is_flag=True, help="Skip map components migration.")
+@click.option("--trace", is_flag=True, help="Write a Chrome trace of each migration.")
+@click.pass_context
+def migrate(
+    ctx: click.Context,
+    theme_names: tuple[str, ...],
+    force_reset: bool,
+    skip_maps: bool,
+    trace: bool,
+) -> None:
+    """Migrate dealer theme SCSS files to Site Builder format.
+
+    Transforms SCSS from dealer themes into Site Builder compatible files,
+    processing variables, mixins, and style patterns. Pauses for manual
+    review before finalizing.
+
+    [bold cyan]Examples:[/]
+        sbm migrate mydealer
+        sbm migrate dealer1 dealer2 dealer3
+        sbm migrate @slugs.txt --force-reset
+    """
+    _validate_firebase_key_required()
+    expanded_themes = _expand_theme_names(theme_names)
+    if not expanded_themes:
+        logger.error("No valid theme names provided.")
+        sys.exit(1)
+
+    config = ctx.obj.get("config", Config({}))
+    from sbm.ui.console import get_console
+
+    console = get_console(config)
+
+    for theme_name in expanded_themes:
+        console.print_migration_header(theme_name)
+
+        start_time = time.time()
+        with trace_run(theme_name, enabled=trace):
+            success, lines_migrated, files_created, scss_lines = _perform_migration_steps(
+                theme_name, force_reset, skip_maps
+            )
+        duration_seconds = time.time() - start_time
+        if not success:
+            logger.error(f"Migration failed for {theme_name}. Skipping...")
+            continue
+
+        _create_automation_snapshots(theme_name)
+        console.print_manual_review_prompt(
+            theme_name, ["sb-inside.scss", "sb-vdp.scss", "sb-vrp.scss", "sb-home.scss"]
+        )
+
+        if not click.confirm(f"Continue with migration of {theme_name}?"):
+            continue
+
+        if not reprocess_manual_changes(theme_name):
+            continue
+
+        _cleanup_snapshot_files(theme_name)
+
+        try:
+            record_migration(theme_name)
+            report_path = None
+            try:
+                from sbm.utils.report_generator import (
+                    MigrationReportData,
+                    generate_migration_report,
+                )
+
+                report_data = MigrationReportData(
+                    slug=theme_name,
+                    status="success",
+                    elapsed_time=duration_seconds,
+                    lines_migrated=lines_migrated,
+                )
+                report_path = generate_migration_report(report_data)
+            except Exception as e:
+                logger.warning(f"Failed to generate migration report: {e}")
+
+            record_run(
+                slug=theme_name,
+                command="migrate",
+                status="success",
+                duration=duration_seconds,
+                automation_time=0,
+                lines_migrated=lines_migrated,
+                files_created_count=files_created,
+                scss_line_count=scss_lines,
+                report_path=report_path,
+            )
+
+            # Show updated stats after each migration
+            ctx.invoke(stats)
+        except Exception as e:
+            logger.warning(f"Could not update stats for {theme_name}: {e}")
+
+
+@click.command()
+@click.argument("theme_names", nargs=-1, required=True)
+@click.option("--yes", "-y", is_flag=True, help="Auto-confirm all prompts.")
+@click.option("--skip-just", is_flag=True, help="Skip running the 'just start' command.")
+@click.option("--force-reset", is_flag=True, help="Force reset of existing Site Builder files.")
+@click.option("--create-pr/--no-create-pr", default=True, help="Create a GitHub PR.")
+@click.option("--skip-post-migration", is_flag=True, help="Skip manual review/PR phase.")
+@click.option("--verbose-docker", is_flag=True, help="Show verbose Docker output.")
+@click.option("--trace", is_flag=True, help="Write a Chrome trace of each migration.")
+@click.pass_context
+def auto(
+    ctx: click.Context,
+    theme_names: tuple[str, ...],
+    yes: bool,
+    skip_just: bool,
+    force_reset: bool,
+    create_pr: bool,
+    skip_post_migration: bool,
+    verbose_docker: bool,
+    trace: bool,
+) -> None:
+    """Run the full automated migration workflow for one or more themes.
+
+    Handles the complete migration pipeline: SCSS transformation, Docker
+    compilation, error recovery, Git operations, and PR creation.
+
+    [bold cyan]Examples:[/]
+        sbm auto mydealer
+        sbm auto dealer1 dealer2 --skip-post-migration
+        sbm auto @slugs.txt -y
+    """
+    _validate_firebase_key_required()
+    from sbm.config import get_settings
+
+    expanded_themes = _expand_theme_names(theme_names)
+    if not expanded_themes:
+        sys.exit(1)
+
+    # If multiple themes, we interpret "auto" as batch mode (skipping per-site prompts usually)
+    # BUT we want to capture explicit user intent for safety checks like duplicates.
+    explicit_yes = yes
+
+    if len(expanded_themes) > 1:
+        yes = True
+        skip_post_migration = True
+
+    # Use explicit_yes (not yes) to avoid enabling non-interactive mode for batch
+    if explicit_yes:
+        get_settings().non_interactive = True
+
+    config = ctx.obj.get("config", Config({}))
+    console = get_console(config)
+
+    migration_results = []
+
+    # --- Bulk Migration Duplicate Prevention ---
+    from sbm.ui.prompts import DuplicateAction
+    from sbm.utils.tracker import get_all_migrated_slugs, mark_runs_for_remigration
+
+    # 1. Fetch global history (best effort)
+    migrated_map = get_all_migrated_slugs()
+
+    # 2. Identify duplicates
+    duplicates = []
+    for slug in expanded_themes:
+        if slug in migrated_map:
+            duplicates.append((slug, migrated_map[slug]))
+
+    # 3. Warn user if duplicates found
+    if duplicates:
+        rich_console = console.console
+        table = Table(title="⚠️ Warning: Potential Duplicates Found", border_style="yellow")
+        table.add_column("Slug", style="cyan")
+        table.add_column("Migrated By", style="magenta")
+
+        for slug, user_id in duplicates:
+            table.add_row(slug, user_id)
+
+        rich_console.print(table)
+        rich_console.print(
+            "[yellow]These sites have already been migrated by your teammates.[/yellow]"
+        )
+
+        if not explicit_yes:
+            action = InteractivePrompts.confirm_duplicate_migration(duplicates, default="skip")
+
+            if action == DuplicateAction.SKIP:
+                # Filter out duplicates
+                original_count = len(expanded_themes)
+                duplicate_slugs = {d[0] for d in duplicates}
+                expanded_themes = [s for s in expanded_themes if s not in duplicate_slugs]
+                rich_console.print(
+                    f"[green]Removed {original_count - len(expanded_themes)} duplicate(s). Proceeding with {len(expanded_themes)} slugs.[/green]"
+                )
+
+            elif action == DuplicateAction.REMIGRATE:
+                # Mark previous runs as remigrated and proceed with all themes
+                duplicate_slugs = [d[0] for d in duplicates]
+                rich_console.print(
+                    f"[cyan]Marking {len(duplicate_slugs)} previous run(s) as remigrated...[/cyan]"
+                )
+
+                results = mark_runs_for_remigration(duplicate_slugs)
+
+                if results["updated"] > 0:
+                    rich_console.print(
+                        f"[green]✓ Successfully marked {results['updated']} run(s) for remigration[/green]"
+                    )
+                if results["failed"] > 0:
+                    rich_console.print(
+                        f"[yellow]⚠ Failed to mark {results['failed']} run(s)[/yellow]"
+                    )
+                if results["not_found"] > 0:
+                    rich_console.print(
+                        f"[yellow]⚠ {results['not_found']} slug(s) had no completed runs to mark[/yellow]"
+                    )
+
+                rich_console.print(
+                    f"[green]Proceeding with remigration of {len(expanded_themes)} slugs.[/green]"
+                )
+
+            elif action == DuplicateAction.CANCEL:
+                rich_console.print("[red]Operation cancelled by user.[/red]")
+                sys.exit(0)
+
+        else:
+            # In non-interactive mode (yes=True), skip duplicates to be safe
+            logger.warning(
+                f"Duplicates detected in non-interactive mode - skipping: {[d[0] for d in duplicates]}"
+            )
+            original_count = len(expanded_themes)
+            duplicate_slugs = {d[0] for d in duplicates}
+            expanded_themes = [s for s in expanded_themes if s not in duplicate_slugs]
+            if original_count > len(expanded_themes):
+                logger.info(
+                    f"Removed {original_count - len(expanded_themes)} duplicate(s). Proceeding with {len(expanded_themes)} slugs."
+                )
+
+    if not expanded_themes:
+        logger.warning("No themes left to migrate.")
+        sys.exit(0)
+
+    # -------------------------------------------
+
+    # Track the primary source file for potential retry automation
+    source_file: Optional[Path] = None
+    for name in theme_names:
+        if name.startswith("@"):
+            file_path_str = name[1:]
+            file_path = Path(file_path_str).expanduser()
+            if not file_path.exists():
+                fallback_path = REPO_ROOT / file_path_str
+                if fallback_path.exists():
+                    file_path = fallback_path
+
+            if file_path.exists() and file_path.suffix.lower() not in [".csv", ".xlsx", ".xls"]:
+                source_file = file_path
+                break
+
+    for theme_name in expanded_themes:
+        config_dict = {
+            "skip_just": skip_just,
+            "force_reset": force_reset,
+            "create_pr": create_pr,
+            "skip_post_migration": skip_post_migration,
+        }
+
+        if not skip_post_migration:
+            if not InteractivePrompts.confirm_migration_start(theme_name, config_dict):
+                logger.info(f"Skipping {theme_name}")
+                continue
+
+        console.print_header("SBM Migration", f"Starting {theme_name}")
+        from sbm.utils.timer import (
+            clear_timing_summary,
+            init_timing_summary,
+            patch_click_confirm_for_timing,
+            print_timing_summary,
+            restore_click_confirm,
+        )
+
+        init_timing_summary(theme_name)
+        original_confirm = patch_click_confirm_for_timing()
+
+        try:
+            # migrate_dealer_theme now returns a MigrationResult object
+            with trace_run(theme_name, enabled=trace):
+                result = migrate_dealer_theme(
+                    theme_name,
+                    skip_just=skip_just,
+                    force_reset=force_reset,
+                    create_pr=create_pr,
+                    interactive_review=not skip_post_migration,
+                    interactive_git=not skip_post_migration,
+                    interactive_pr=not skip_post_migration,
+                    verbose_docker=verbose_docker,
+                    console=console,
+                )
+
+            # Handle MigrationResult object
+            if isinstance(result, MigrationResult):
+                if result.status == "success":
+                    record_migration(theme_name)
+                    record_run(
+                        slug=theme_name,
+                        command="auto",
+                        status="success",
+                        duration=get_total_duration(),
+                        automation_time=get_total_automation_time(),
+                        lines_migrated=result.lines_migrated,
+                        files_created_count=result.files_created_count,
+                        scss_line_count=result.scss_line_count,
+                        report_path=result.report_path,
+                        pr_url=result.pr_url,
+                        pr_author=result.pr_author,
+                        pr_state=result.pr_state,
+                        created_at=result.created_at,
+                        merged_at=result.merged_at,
+                        closed_at=result.closed_at,
+                    )
+                    # Show updated stats after each migration
+                    ctx.invoke(stats)
+
+                    console.print_migration_complete(
+                        theme_name,
+                        elapsed_time=result.elapsed_time,
+                        files_processed=4,
+                        pr_url=result.pr_url,
+                    )
+
+                    restore_click_confirm(original_confirm)
+                    print_timing_summary()
+
+                    migration_results.append(result)
+                else:
+                    console.print_error(f"Migration failed for {theme_name}")
+                    if result.step_failed:
+                        console.print_error(f"  Failed at step: {result.step_failed.value}")
+                    if result.error_message:
+                        console.print_error(f"  Error: {result.error_message}")
+                    migration_results.append(result)
+            else:
+                # Legacy dict handling (fallback)
+                success = result.get("success", False)
+                pr_url = result.get("pr_url")
+                salesforce_msg = result.get("salesforce_message")
+
+                if success:
+                    record_migration(theme_name)
+                    # Prefer GitHub additions over local SCSS count (use None-check, not truthiness)
+                    gh_adds = result.get("github_additions")
+                    lines = gh_adds if gh_adds is not None else result.get("lines_migrated", 0)
+                    record_run(
+                        slug=theme_name,
+                        command="auto",
+                        status="success",
+                        duration=get_total_duration(),
+                        automation_time=get_total_automation_time(),
+                        lines_migrated=lines,
+                        files_created_count=result.get("files_created_count", 0),
+                        scss_line_count=result.get("scss_line_count", 0),
+                        report_path=result.get("report_path"),
+                        pr_url=pr_url,
+                        pr_author=result.get("pr_author"),
+                        pr_state=result.get("pr_state"),
+                        created_at=result.get("created_at"),
+                        merged_at=result.get("merged_at"),
+                        closed_at=result.get("closed_at"),
+                    )
+                    # Show updated stats after each migration
+                    ctx.invoke(stats)
+
+                    console.print_migration_complete(
+                        theme_name,
+                        elapsed_time=get_total_duration(),
+                        files_processed=4,
+                        pr_url=pr_url,
+                    )
+
+                    restore_click_confirm(original_confirm)
+                    print_timing_summary()
+
+                    migration_results.append(
+                        {
+                            "slug": theme_name,
+                            "status": "success",
+                            "pr_url": pr_url,
+                            "salesforce_message": salesforce_msg,
+                        }
+                    )
+                else:
+                    console.print_error(f"Migration failed for {theme_name}")
+                    migration_results.append(
+                        {
+                            "slug": theme_name,
+                            "status": "failed",
+                            "error": "Migration failed (see logs)",
+                        }
+                    )
+
+        except Exception as e:
+            console.print_error(f"Error migrating {theme_name}: {e}")
+            migration_results.append(
+                {
+                    "slug": theme_name,
+                    "status": "error",
+                    "error": str(e),
+                }
+            )
+        finally:
+            if original_confirm:
+                try:
+                    restore_click_confirm(original_confirm)
+                except Exception:
+                    pass
+            # Ensure timing summary is cleared/printed if safe
+            # The print_timing_summary above handles success case
+            clear_timing_summary()
+
+    # Generate Report
+    if migration_results:
+        _generate_migration_report(migration_results)
+
+    # Final summary output
+    if len(expanded_themes) > 1:
+        console.print_header("Batch Migration Summary", "")
+        for res in migration_results:
+            status = _get_status(res)
+            slug = _get_field(res, "slug")
+            pr_url = _get_field(res, "pr_url")
+            error = _get_field(res, "error_message") or _get_field(res, "error")
+
+            status_icon = "✅" if status == "success" else "❌"
+            msg = f"{status_icon} {slug}"
+            if pr_url:
+                msg += f" - PR: {pr_url}"
+            elif error:
+                msg += f" - Error: {error}"
+            console.print_info(msg)
+
+    # Automated Retry Logic
+    if source_file and any(_get_status(r) != "success" for r in migration_results):
+        failed_slugs = [
+            _get_field(r, "slug") for r in migration_results if _get_status(r) != "success"
+        ]
+
+        if failed_slugs:
+            try:
+                # Update the source file with only failed slugs
+                with source_file.open("w") as f:
+                    for slug in failed_slugs:
+                        f.write(f"{slug}\n")
+
+                # Regenerate report with retry info
+                _generate_migration_report(migration_results, retry_file=source_file)
+
+                # Prompt user for rerun
+                if InteractivePrompts.confirm_retry_with_timeout(
+                    len(failed_slugs), str(source_file)
+                ):
+                    click.echo(f"\n🚀 Retrying {len(failed_slugs)} failed migrations...")
+                    # Re-invoke auto command with the updated source file
+                    ctx.invoke(
+                        auto,
+                        theme_names=(f"@{source_file}",),
+                        yes=yes,
+                        skip_just=skip_just,
+                        force_reset=force_reset,
+                        create_pr=create_pr,
+                        skip_post_migration=skip_post_migration,
+                        verbose_docker=verbose_docker,
+                    )
+                else:
+                    click.echo(f"\n📂 Retry file updated: {source_file}")
+                    # Try to open the file automatically
+                    if sys.platform == "darwin":
+                        subprocess.run(["open", str(source_file)], check=False)
+            except Exception as e:
+                logger.error(f"Failed to handle automated retry: {e}")
+                console.print_error(f"Failed to handle automated retry: {e}")
+
+
+@click.command()
+@click.argument("theme_name")
+def reprocess(theme_name: str) -> None:
+    """
+    Reprocess Site Builder SCSS files to ensure consistency.
+
+    This command applies the same transformations as the initial migration
+    to existing Site Builder files, ensuring variables, mixins, and other
+    SCSS patterns are properly processed after manual changes.
+    """
+    click.echo(f"Reprocessing Site Builder files for {theme_name}...")
+
+    success = reprocess_manual_changes(theme_name)
+
+    if success:
+        click.echo(f"✅ Reprocessing completed successfully for {theme_name}!")
+    else:
+        click.echo(f"❌ Reprocessing failed for {theme_name}.", err=True)
+        sys.exit(1)
+
+
+@click.command()
+@click.argument("theme_name")
+@click.option("--skip-git", is_flag=True, help="Skip Git operations (add, commit, push).")
+@click.option(
+    "--create-pr/--no-create-pr",
+    default=True,
+    help="Create a GitHub Pull Request after successful post-migration steps "
+    "(default: True, with defaults: reviewers=etritt-cc,messponential,abond-cc,tcollier-di,ssargent-cc, labels=fe-dev).",
+)
+@click.option(
+    "--skip-review", is_flag=True, help="Skip interactive manual review and re-validation."
+)
+@click.option("--skip-git-prompt", is_flag=True, help="Skip prompt for Git operations.")
+@click.option("--skip-pr-prompt", is_flag=True, help="Skip prompt for PR creation.")
+def post_migrate(
+    theme_name: str,
+    skip_git: bool,
+    create_pr: bool,
+    skip_review: bool,
+    skip_git_prompt: bool,
+    skip_pr_prompt: bool,
+) -> None:
+    """
+    Run post-migration steps for a given theme, including manual review, re-validation,
+    Git operations, and PR creation.
+    This command assumes the initial migration (up to map components) has already been completed.
+
+    By default, prompts to create a published PR with default reviewers (etritt-cc, messponential, abond-cc, tcollier-di, ssargent-cc)
+    and labels (fe-dev). Use --no-create-pr to skip. For more control over PR creation,
+    use 'sbm pr <theme-name>' separately.
+    """
+    click.echo(f"Starting post-migration workflow for {theme_name}...")
+
+    # Attempt to get the current branch name for post-migration context
+    try:
+        repo = Repo(get_platform_dir())  # Use the platform root for the repo
+        branch_name = repo.active_branch.name
+    except Exception as e:
+        click.echo(
+            f"Error: Could not determine current Git branch for post-migration: {e}", err=True
+        )
+        click.echo("Please ensure you are in a Git repository and on the correct branch.", err=True)
+        sys.exit(1)
+
+    interactive_review = not skip_review
+    interactive_git = not skip_git_prompt
+    interactive_pr = not skip_pr_prompt
+
+    start_time = time.time()
+    result = run_post_migration_workflow(
+        theme_name,
+        branch_name,
+        skip_git=skip_git,
+        create_pr=create_pr,
+        interactive_review=interactive_review,
+        interactive_git=interactive_git,
+        interactive_pr=interactive_pr,
+    )
+    duration = time.time() - start_time
+
+    if result.get("success", False):
+        # Record the run so post-migrate recoveries appear in stats.
+        # If 'auto' already recorded a run for this slug, stats deduplication
+        # (_dedupe_runs_for_display) keeps only the most recent per slug.
+        pr_url = result.get("pr_url")
+        gh_adds = result.get("github_additions")
+        lines = gh_adds if gh_adds is not None else 0
+        record_migration(theme_name)
+        record_run(
+            slug=theme_name,
+            command="post-migrate",
+            status="success",
+            duration=duration,
+            automation_time=duration,
+            lines_migrated=lines,
+            pr_url=pr_url,
+            pr_author=result.get("pr_author"),
+            pr_state=result.get("pr_state"),
+            created_at=result.get("created_at"),
+            merged_at=result.get("merged_at"),
+            closed_at=result.get("closed_at"),
+        )
+        click.echo(f"Post-migration workflow completed successfully for {theme_name}!")
+    else:
+        click.echo(f"Post-migration workflow failed for {theme_name}.", err=True)
+        sys.exit(1)
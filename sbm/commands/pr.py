@@ -0,0 +1,270 @@
+"""
+The ``pr`` command group: create and merge Site Builder migration PRs.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+try:
+    import rich_click as click  # type: ignore
+except Exception:
+    import click
+
+from sbm.core.git import GitOperations
+from sbm.ui.console import get_console
+
+
+@click.group()
+@click.pass_context
+def pr(ctx: click.Context) -> None:
+    """
+    Manage GitHub Pull Requests.
+
+    Commands for creating and managing PRs for Site Builder migrations.
+    """
+
+
+@pr.command("create")
+@click.argument("theme_name")
+@click.option(
+    "--title", "-t", help="Title for the Pull Request. (Optional: auto-generated if not provided)"
+)
+@click.option(
+    "--body",
+    "-b",
+    help="Body/description for the Pull Request. (Optional: auto-generated if not provided)",
+)
+@click.option("--base", default="main", help="Base branch for the Pull Request (default: main).")
+@click.option("--head", help="Head branch for the Pull Request (default: current branch).")
+@click.option(
+    "--reviewers",
+    "-r",
+    help="Comma-separated list of reviewers (default: etritt-cc,messponential,abond-cc,tcollier-di,ssargent-cc).",
+)
+@click.option("--labels", "-l", help="Comma-separated list of labels (default: fe-dev).")
+@click.option("--draft", "-d", is_flag=True, default=False, help="Create as draft PR.")
+@click.option(
+    "--publish", "-p", is_flag=True, default=True, help="Create as published PR (default: true)."
+)
+@click.pass_context
+def pr_create(
+    ctx: click.Context,
+    theme_name: str,
+    title: str | None,
+    body: str | None,
+    base: str,
+    head: str | None,
+    reviewers: str | None,
+    labels: str | None,
+    draft: bool,
+    publish: bool,
+) -> None:
+    """
+    Create a GitHub Pull Request for a given theme.
+
+    By default, creates a published PR with:
+    - Reviewers: etritt-cc, messponential, abond-cc, tcollier-di, ssargent-cc
+    - Labels: fe-dev
+    - Content: Auto-generated based on Git changes (Stellantis template)
+    """
+    config = ctx.obj["config"]
+    logger = ctx.obj["logger"]
+
+    git_ops = GitOperations(config)
+
+    # Determine draft status
+    is_draft = draft if draft else not publish
+
+    # Parse reviewers and labels if provided
+    parsed_reviewers = None
+    parsed_labels = None
+    if reviewers:
+        parsed_reviewers = [r.strip() for r in reviewers.split(",")]
+    if labels:
+        parsed_labels = [label.strip() for label in labels.split(",")]
+
+    try:
+        # The create_pr method in GitOperations will handle branch detection
+        # and PR content generation.
+        logger.info("Creating GitHub PR for %s...", theme_name)
+        pr_result = git_ops.create_pr(
+            slug=theme_name,
+            branch_name=head,
+            # Pass head directly, GitOperations will handle current branch if head is None
+            title=title,
+            body=body,
+            base=base,
+            head=head,
+            reviewers=parsed_reviewers,
+            labels=parsed_labels,
+            draft=is_draft,
+        )
+
+        if pr_result["success"]:
+            click.echo(f"✅ Pull request created: {pr_result['pr_url']}")
+            click.echo(f"Title: {pr_result['title']}")
+            click.echo(f"Branch: {pr_result['branch']}")
+            if is_draft:
+                click.echo("📝 Created as draft - remember to publish when ready")
+            if pr_result.get("existing"):
+                click.echo("ℹ️  PR already existed - retrieved existing PR URL")  # noqa: RUF001
+        else:
+            click.echo(f"❌ PR creation failed: {pr_result['error']}", err=True)
+            sys.exit(1)
+
+    except Exception:
+        logger.exception("Unexpected error occurred")
+        sys.exit(1)
+
+
+@pr.command("merge")
+@click.option(
+    "--pattern",
+    "-p",
+    default="pcon-864",
+    help="Branch name pattern to match (default: pcon-864)",
+)
+@click.option(
+    "--dry-run",
+    "-n",
+    is_flag=True,
+    default=False,
+    help="Show what would be done without making changes",
+)
+@click.pass_context
+def pr_merge(ctx: click.Context, pattern: str, dry_run: bool) -> None:
+    """
+    Enable auto-merge on open PRs matching a branch pattern.
+
+    Finds all open PRs with branch names containing the pattern,
+    updates branches to be current with base, and enables auto-merge.
+
+    Examples:
+        sbm pr merge                    # Enable auto-merge on all pcon-864* PRs
+        sbm pr merge -p pcon-123        # Enable for specific project PRs
+        sbm pr merge --dry-run          # Preview without making changes
+    """
+    console = get_console()
+
+    try:
+        # Get all open PRs matching the pattern
+        result = subprocess.run(
+            [
+                "gh",
+                "pr",
+                "list",
+                "--state",
+                "open",
+                "--json",
+                "number,headRefName,title,url",
+                "--jq",
+                f'.[] | select(.headRefName | contains("{pattern}")) | [.number, .headRefName, .title, .url] | @tsv',
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        prs = result.stdout.strip().split("\n") if result.stdout.strip() else []
+
+        if not prs or (len(prs) == 1 and not prs[0]):
+            console.console.print(f"[yellow]No open PRs found matching pattern: {pattern}[/yellow]")
+            return
+
+        console.console.print(f"\n[bold]Found {len(prs)} matching PR(s)[/bold]\n")
+
+        if dry_run:
+            console.console.print("[yellow]DRY RUN - No changes will be made[/yellow]\n")
+
+        for pr_line in prs:
+            if not pr_line.strip():
+                continue
+
+            parts = pr_line.split("\t")
+            if len(parts) != 4:
+                continue
+
+            pr_number, branch_name, title, pr_url = parts
+
+            console.console.print(f"[bold cyan]PR #{pr_number}:[/bold cyan] {title}")
+            console.console.print(f"[dim]Branch: {branch_name}[/dim]")
+            console.console.print(f"[dim]URL: {pr_url}[/dim]\n")
+
+            if dry_run:
+                console.console.print("[dim]Would enable auto-merge[/dim]\n")
+                continue
+
+            # Check current merge status
+            merge_result = subprocess.run(
+                [
+                    "gh",
+                    "pr",
+                    "view",
+                    pr_number,
+                    "--json",
+                    "mergeable,mergeStateStatus,autoMergeRequest,statusCheckRollup,reviewDecision",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+
+            merge_info = json.loads(merge_result.stdout)
+            merge_state = merge_info.get("mergeStateStatus")
+            auto_merge_enabled = merge_info.get("autoMergeRequest") is not None
+
+            # Update branch if needed
+            if merge_state in ["BEHIND", "DIRTY"]:
+                console.console.print("🔄 Updating branch to be current with base...")
+                try:
+                    subprocess.run(
+                        ["gh", "pr", "merge", pr_number, "--update-branch"],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                        timeout=30,
+                    )
+                    console.console.print("[green]✓[/green] Branch updated successfully\n")
+                    time.sleep(2)  # Wait for GitHub to process
+                except subprocess.TimeoutExpired:
+                    console.console.print(
+                        "[yellow]⚠[/yellow] Branch update timed out - may complete in background\n"
+                    )
+                except subprocess.CalledProcessError as e:
+                    error_msg = e.stderr if e.stderr else str(e)
+                    if "already up to date" not in error_msg.lower():
+                        console.console.print(
+                            f"[yellow]⚠[/yellow] Could not update branch: {error_msg}\n"
+                        )
+
+            # Enable auto-merge if not already enabled
+            if auto_merge_enabled:
+                console.console.print("[green]✓[/green] Auto-merge already enabled\n")
+            else:
+                console.console.print("🔄 Enabling auto-merge...")
+                try:
+                    subprocess.run(
+                        ["gh", "pr", "merge", pr_number, "--auto", "--squash"],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    )
+                    console.console.print("[green]✓[/green] Auto-merge enabled (squash strategy)\n")
+                except subprocess.CalledProcessError as e:
+                    error_msg = e.stderr if e.stderr else str(e)
+                    console.console.print(
+                        f"[red]✗[/red] Failed to enable auto-merge: {error_msg}\n"
+                    )
+
+        console.console.print(f"[bold green]✓[/bold green] Processed {len(prs)} PR(s)")
+
+    except subprocess.CalledProcessError as e:
+        console.console.print(f"[red]Error:[/red] {e.stderr if e.stderr else str(e)}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        console.console.print(f"[red]Unexpected error:[/red] {e!s}", err=True)
+        sys.exit(1)
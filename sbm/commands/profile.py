@@ -0,0 +1,123 @@
+"""
+The ``profile`` command: per-rule timing of the SCSS transformation for a theme.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+try:
+    import rich_click as click  # type: ignore
+except Exception:
+    import click
+
+from sbm.config import Config
+from sbm.scss.profiler import SORT_KEYS, ProfileReport, profile_theme
+from sbm.ui.console import get_console
+from sbm.utils.logger import logger
+
+
+def _print_report(report: ProfileReport, sort: str, top: int | None, rich_console) -> None:
+    from rich.table import Table
+
+    table = Table(
+        title=f"SCSS transformation profile for {report.slug}",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Rule", style="cyan")
+    table.add_column("Kind")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time (ms)", style="green", justify="right")
+    table.add_column("% of total", justify="right")
+    table.add_column("Bytes in", justify="right")
+    table.add_column("Bytes out", justify="right")
+    table.add_column("Matches", style="yellow", justify="right")
+
+    rules = report.sorted_rules(sort)
+    for rule in rules[:top] if top else rules:
+        share = rule.seconds / report.total_seconds * 100 if report.total_seconds else 0.0
+        table.add_row(
+            rule.name,
+            rule.kind,
+            str(rule.calls),
+            f"{rule.seconds * 1000:.2f}",
+            f"{share:.1f}%",
+            f"{rule.bytes_in:,}",
+            f"{rule.bytes_out:,}",
+            str(rule.matches),
+        )
+
+    rich_console.print(table)
+    total_bytes = sum(f["bytes"] for f in report.files)
+    rich_console.print(
+        f"{len(report.files)} source file(s), {total_bytes:,} bytes, "
+        f"{report.total_seconds * 1000:.1f} ms total"
+    )
+
+
+@click.command()
+@click.argument("theme_name")
+@click.option(
+    "--sort",
+    type=click.Choice(SORT_KEYS),
+    default="seconds",
+    show_default=True,
+    help="Column to sort rules by.",
+)
+@click.option("--top", type=int, default=None, help="Only show the N most expensive rules.")
+@click.option(
+    "--repeat", type=int, default=1, show_default=True, help="Transform each file N times."
+)
+@click.option(
+    "--json", "as_json", is_flag=True, help="Print the profile as JSON instead of a table."
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also save the JSON profile to this file.",
+)
+@click.pass_context
+def profile(
+    ctx: click.Context,
+    theme_name: str,
+    sort: str,
+    top: int | None,
+    repeat: int,
+    as_json: bool,
+    output: Path | None,
+) -> None:
+    """Profile each SCSS transformation step and mixin handler on a theme.
+
+    Runs the migration's SCSS transformation on the theme's sources without
+    writing any files, and reports time, calls, bytes and matches per rule.
+
+    [bold cyan]Examples:[/]
+        sbm profile mydealer
+        sbm profile mydealer --sort calls --top 10
+        sbm profile mydealer --repeat 5 --json -o profile.json
+    """
+    try:
+        report = profile_theme(theme_name, repeat=repeat)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    if not report.files:
+        logger.error(f"No SCSS sources found for {theme_name}")
+        sys.exit(1)
+
+    data = report.to_dict(sort)
+    if output:
+        output.write_text(json.dumps(data, indent=2))
+        logger.info(f"Profile saved to {output}")
+
+    if as_json:
+        click.echo(json.dumps(data, indent=2))
+        return
+
+    console = get_console(ctx.obj.get("config", Config({})))
+    _print_report(report, sort, top, console.console)
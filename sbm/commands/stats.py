@@ -0,0 +1,773 @@
+"""
+The ``stats`` command: personal and team migration statistics from Firebase.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+
+try:
+    import rich_click as click  # type: ignore
+except Exception:
+    import click
+
+from sbm.config import Config
+from sbm.ui.console import get_console
+from sbm.utils.logger import logger
+from sbm.utils.tracker import (
+    _dedupe_runs_for_display,
+    filter_runs,
+    get_global_reporting_data,
+    get_migration_stats,
+    get_pr_completion_state,
+    process_pending_syncs,
+)
+from sbm.worker import update_recent_pr_statuses as _update_recent_pr_statuses
+
+
+def _format_duration(seconds: float) -> str:
+    """Format duration in seconds to human-readable string."""
+    if seconds < 1:
+        return "< 1s"
+
+    minutes = int(seconds // 60)
+    secs = int(seconds % 60)
+
+    if minutes > 0:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def _calculate_time_saved(lines_migrated: int) -> str:
+    """Calculate time saved from lines migrated (800 lines = 1 hour)."""
+    if lines_migrated == 0:
+        return "-"
+
+    hours_saved = lines_migrated / 800
+
+    if hours_saved < 0.1:
+        return "< 0.1h"
+
+    return f"{hours_saved:.1f}h"
+
+
+@click.command()
+@click.option("--list", "show_list", is_flag=True, help="List migrated slugs")
+@click.option("--history", is_flag=True, help="Show run history")
+@click.option("--verbose", "-v", is_flag=True, help="Verbose logging")
+@click.option(
+    "--limit",
+    type=int,
+    default=10,
+    help="Max runs to display (default: 10, max: 100)",
+)
+@click.option(
+    "--since",
+    "since_days",
+    type=int,
+    help="Show runs from the last N days (e.g. --since 7)",
+)
+@click.option("--user", "filter_user", type=str, help="Filter by user")
+@click.option("--team", is_flag=True, help="Show team stats")
+@click.option(
+    "--all",
+    "show_all",
+    is_flag=True,
+    help="Show all items for the selected view (ignores --limit)",
+)
+@click.pass_context
+def stats(
+    ctx: click.Context,
+    show_list: bool,
+    history: bool,
+    verbose: bool,
+    limit: int,
+    since_days: int,
+    filter_user: str,
+    team: bool,
+    show_all: bool,
+) -> None:
+    """Display migration statistics and impact metrics.
+
+    Shows your personal migration stats from Firebase, or team-wide
+    statistics with the --team flag.
+
+    [bold cyan]Examples:[/]
+        sbm stats                      Your personal stats
+        sbm stats --history            Show run history table
+        sbm stats --team --since 7     Team stats for last 7 days
+        sbm stats --user johndoe       Stats for specific user
+    """
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+    if show_all:
+        limit = None
+    else:
+        limit = min(limit, 100) if limit else 10
+
+    parts = ["Retrieving"]
+    parts.append("Team Stats" if team else "Stats")
+
+    if filter_user:
+        parts.append(f"for user '[cyan]{filter_user}[/cyan]'")
+
+    if since_days:
+        parts.append(f"last [bold]{since_days}[/bold] days")
+
+    status_msg = " ".join(parts) + "..."
+
+    # Synchronous update to ensure fresh stats
+    with get_console().status(
+        "[bold cyan]Refreshing stats and syncing pending runs...[/bold cyan]"
+    ):
+        try:
+            # 1. Sync any local pending runs to Firebase
+            process_pending_syncs()
+            # 2. Check and update PR statuses for recent runs
+            # Pass limit so that --all triggers full history update
+            _update_recent_pr_statuses(max_to_check=limit)
+        except Exception as e:
+            logger.debug(f"Stats refresh failed: {e}")
+
+    with get_console().status(f"[bold green]{status_msg}[/bold green]"):
+        stats_data = get_migration_stats(
+            limit=limit,
+            since=str(since_days) if since_days else None,
+            until=None,
+            user=filter_user,
+            team=team,
+        )
+
+    # Handle offline/error case
+    if stats_data.get("error"):
+        from rich.panel import Panel
+        from rich.text import Text
+
+        console = get_console(ctx.obj.get("config", Config({})))
+        console.console.print(
+            Panel(
+                Text.from_markup(
+                    f"[red]{stats_data['error']}[/red]\n{stats_data.get('message', '')}"
+                ),
+                border_style="red",
+                title="Firebase Status",
+            )
+        )
+        return
+
+    config = ctx.obj.get("config", Config({}))
+    console = get_console(config)
+    rich_console = console.console
+
+    # Imports for stats display
+    from rich.columns import Columns
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    # 1. Handle Team View (if requested and available)
+    if team and stats_data.get("team_stats"):
+        ts = stats_data["team_stats"]
+        if since_days or filter_user:
+            all_runs, _ = get_global_reporting_data()
+            team_runs = filter_runs(
+                all_runs,
+                limit=None,
+                since=str(since_days) if since_days else None,
+                until=None,
+                user=filter_user,
+            )
+            complete_runs = [
+                r
+                for r in team_runs
+                if r.get("status") == "success" and get_pr_completion_state(r) == "complete"
+            ]
+
+            def run_effective_date(run: dict) -> datetime.datetime:
+                completion_state = get_pr_completion_state(run)
+                if completion_state == "complete":
+                    ts_val = run.get("merged_at") or run.get("timestamp") or ""
+                elif completion_state == "in_review":
+                    ts_val = run.get("created_at") or run.get("timestamp") or ""
+                elif completion_state == "closed":
+                    ts_val = run.get("closed_at") or run.get("timestamp") or ""
+                elif completion_state == "superseded":
+                    ts_val = (
+                        run.get("superseded_at")
+                        or run.get("merged_at")
+                        or run.get("timestamp")
+                        or ""
+                    )
+                else:
+                    ts_val = run.get("merged_at") or run.get("timestamp") or ""
+                if ts_val.endswith("+00:00Z"):
+                    ts_val = ts_val[:-1]
+                elif ts_val.endswith("Z"):
+                    ts_val = ts_val[:-1] + "+00:00"
+                try:
+                    parsed = datetime.datetime.fromisoformat(ts_val)
+                    if parsed.tzinfo is None:
+                        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+                    return parsed
+                except ValueError:
+                    return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+            unique_complete_by_slug: dict[str, dict] = {}
+            for run in complete_runs:
+                slug = run.get("slug")
+                if not slug:
+                    continue
+                existing = unique_complete_by_slug.get(slug)
+                if not existing or run_effective_date(run) > run_effective_date(existing):
+                    unique_complete_by_slug[slug] = run
+
+            total_lines_migrated = sum(
+                r.get("lines_migrated", 0) for r in unique_complete_by_slug.values()
+            )
+            user_counts: dict[str, set] = {}
+            for run in unique_complete_by_slug.values():
+                author = run.get("pr_author") or run.get("_user") or "unknown"
+                user_counts.setdefault(author, set()).add(run.get("slug"))
+
+            ts = {
+                "total_users": len(user_counts),
+                "total_migrations": len(unique_complete_by_slug),
+                "total_lines_migrated": total_lines_migrated,
+                "total_runs": len(unique_complete_by_slug),
+                "total_time_saved_h": round(total_lines_migrated / 800.0, 1)
+                if total_lines_migrated
+                else 0.0,
+                "top_contributors": sorted(
+                    ((user, len(slugs)) for user, slugs in user_counts.items()),
+                    key=lambda x: x[1],
+                    reverse=True,
+                )[:3],
+                "source": "firebase",
+            }
+
+        # Header
+        rich_console.print(
+            Panel(
+                Text.from_markup(
+                    f"[bold magenta]Team Status[/bold magenta]\n[dim]Live data from {ts.get('total_users', 0)} contributors[/dim]"
+                ),
+                border_style="magenta",
+            )
+        )
+
+        # Metrics
+        def make_team_panel(label: str, value: str, color: str) -> Panel:
+            return Panel(
+                Text.from_markup(f"[bold {color}]{value}[/bold {color}]\n[dim]{label}[/dim]"),
+                expand=True,
+                border_style=color,
+            )
+
+        panels = [
+            make_team_panel("Total Users", str(ts.get("total_users", 0)), "blue"),
+            make_team_panel("Sites Migrated", str(ts.get("total_migrations", 0)), "green"),
+            make_team_panel("Lines Migrated", f"{ts.get('total_lines_migrated', 0):,}", "cyan"),
+            make_team_panel("Time Saved", f"{ts.get('total_time_saved_h', 0.0)}h", "magenta"),
+        ]
+        rich_console.print(Columns(panels, equal=True))
+        if since_days or filter_user:
+            filter_info = []
+            if since_days:
+                filter_info.append(f"last {since_days} days")
+            if filter_user:
+                filter_info.append(f"user: {filter_user}")
+            if filter_info:
+                rich_console.print(f"[dim]Filters applied: {', '.join(filter_info)}[/dim]")
+
+        # Full Contributors (optional)
+        if show_all:
+            all_runs, _ = get_global_reporting_data()
+            merged_runs = [
+                r
+                for r in all_runs
+                if r.get("status") == "success" and get_pr_completion_state(r) == "complete"
+            ]
+
+            # Deduplicate by slug per author
+            by_author: dict[str, set] = {}
+            for run in merged_runs:
+                author = run.get("pr_author") or run.get("_user") or "unknown"
+                slug = run.get("slug")
+                if not slug:
+                    continue
+                by_author.setdefault(author, set()).add(slug)
+
+            table = Table(
+                title="All Contributors (Merged, Unique Slugs)",
+                show_header=True,
+                header_style="bold magenta",
+            )
+            table.add_column("User", style="cyan")
+            table.add_column("Sites Migrated", style="green", justify="right")
+
+            for user, slugs in sorted(by_author.items(), key=lambda x: len(x[1]), reverse=True):
+                table.add_row(user, str(len(slugs)))
+
+            rich_console.print(table)
+
+            total_unique_slugs = len({r.get("slug") for r in merged_runs if r.get("slug")})
+            total_user_slugs = sum(len(slugs) for slugs in by_author.values())
+            if total_unique_slugs != total_user_slugs:
+                rich_console.print(
+                    f"[yellow]⚠️ Sum of user counts ({total_user_slugs}) != unique slugs "
+                    f"({total_unique_slugs}).[/yellow]"
+                )
+            else:
+                rich_console.print(f"[dim]Total unique slugs: {total_unique_slugs}[/dim]")
+            # Continue for optional team history below
+
+        # Team History (optional)
+        if history:
+            all_runs, _ = get_global_reporting_data()
+            team_runs = filter_runs(
+                all_runs,
+                limit=limit,
+                since=str(since_days) if since_days else None,
+                until=None,
+                user=filter_user,
+            )
+            team_runs = _dedupe_runs_for_display(team_runs)
+
+            if team_runs:
+                table = Table(
+                    title="All Team Runs",
+                    title_style="bold cyan",
+                    show_header=True,
+                    header_style="bold magenta",
+                )
+                table.add_column("PR Date", style="dim")
+                table.add_column("Theme Slug", style="cyan")
+                table.add_column("Status", style="bold")
+                table.add_column("User", style="magenta")
+                table.add_column("Lines", style="cyan")
+                table.add_column("PR", style="blue")
+
+                for run in team_runs:
+                    completion_state = get_pr_completion_state(run)
+                    if completion_state == "complete":
+                        status_display = "[green]Complete[/green]"
+                    elif completion_state == "in_review":
+                        status_display = "[yellow]In Review[/yellow]"
+                    elif completion_state == "closed":
+                        status_display = "[red]Closed[/red]"
+                    elif completion_state == "superseded":
+                        status_display = "[dim]Superseded[/dim]"
+                    else:
+                        status = run.get("status", "unknown")
+                        status_color = "green" if status == "success" else "red"
+                        status_display = f"[{status_color}]{status}[/{status_color}]"
+
+                    lines = run.get("lines_migrated", 0)
+                    lines_str = f"{lines:,}" if lines else "N/A"
+
+                    pr_link = "N/A"
+                    if run.get("pr_url"):
+                        url = run.get("pr_url")
+                        if completion_state == "complete":
+                            link_text = "[green]Merged[/green]"
+                        elif completion_state == "in_review":
+                            link_text = "[yellow]Open[/yellow]"
+                        elif completion_state == "closed":
+                            link_text = "[red]Closed[/red]"
+                        elif completion_state == "superseded":
+                            link_text = "[dim]Superseded[/dim]"
+                        else:
+                            link_text = "View"
+                        pr_link = f"[link={url}]{link_text}[/link]"
+
+                    user_display = run.get("pr_author") or run.get("_user") or "unknown"
+
+                    if completion_state == "complete":
+                        effective_date = run.get("merged_at") or run.get("timestamp", "")
+                    elif completion_state == "in_review":
+                        effective_date = run.get("created_at") or run.get("timestamp", "")
+                    elif completion_state == "closed":
+                        effective_date = run.get("closed_at") or run.get("timestamp", "")
+                    elif completion_state == "superseded":
+                        effective_date = (
+                            run.get("superseded_at")
+                            or run.get("merged_at")
+                            or run.get("timestamp", "")
+                        )
+                    else:
+                        effective_date = run.get("merged_at") or run.get("timestamp", "")
+
+                    if effective_date and len(effective_date) >= 19:
+                        date_display = effective_date[:19].replace("T", " ")
+                    else:
+                        date_display = "N/A"
+
+                    table.add_row(
+                        date_display,
+                        run.get("slug", "unknown"),
+                        status_display,
+                        f"@{user_display}",
+                        lines_str,
+                        pr_link,
+                    )
+
+                rich_console.print(table)
+            return
+
+        # Top Contributors
+        contributors = ts.get("top_contributors", [])
+        if contributors:
+            rich_console.print("\n[bold magenta]🏆 Top Contributors[/bold magenta]")
+            table = Table(show_header=True, header_style="bold magenta", box=None, padding=(0, 2))
+            table.add_column("Rank", style="dim", width=4)
+            table.add_column("User", style="bold white")
+            table.add_column("Sites Migrated", style="green", justify="right")
+
+            for i, (user, count) in enumerate(contributors, 1):
+                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"#{i}"
+                table.add_row(medal, user, str(count))
+
+            rich_console.print(table)
+
+        return
+
+    # 2. Fallback to Standard View (Local + optional Git global)
+    if team:
+        rich_console.print(
+            "[yellow]⚠️  Could not fetch live team stats. Showing local data.[/yellow]"
+        )
+
+    # Header Panel
+    header = Panel(
+        Text.from_markup("[bold cyan]Global Auto-SBM Stats[/bold cyan]"),
+        border_style="bright_blue",
+    )
+    rich_console.print(header)
+
+    # Personal Impact
+    current_user_id = stats_data.get("user_id", "unknown")
+    current_user_name = stats_data.get("display_name", current_user_id)
+
+    rich_console.print(
+        Text.assemble(
+            Text("Auto-SBM Stats: ", style="bold cyan"),
+            Text(f"{current_user_name}", style="bold purple"),
+        )
+    )
+
+    # Metrics Grid
+    metrics_local = stats_data.get("metrics", {})
+
+    def make_metric_panel(label: str, value: str, color: str) -> Panel:
+        return Panel(
+            Text.from_markup(f"[bold {color}]{value}[/bold {color}]\n[dim]{label}[/dim]"),
+            expand=True,
+            border_style=color,
+        )
+
+    # Calculate local time saved
+    local_lines = metrics_local.get("total_lines_migrated", 0)
+    local_hours = round(local_lines / 800.0, 1) if local_lines else 0.0
+
+    metric_panels = [
+        make_metric_panel("Sites Migrated", str(stats_data["count"]), "green"),
+        make_metric_panel(
+            "Lines Migrated",
+            f"{local_lines:,}",
+            "cyan",
+        ),
+        make_metric_panel(
+            "Time Saved",
+            f"{local_hours}h",
+            "magenta",
+        ),
+    ]
+
+    rich_console.print(Columns(metric_panels, equal=True))
+
+    # Global Team Impact
+    global_metrics = stats_data.get("global_metrics", {})
+    if global_metrics:
+        rich_console.print("\n[bold cyan]Global Auto-SBM Stats[/bold cyan]")
+
+        # Calculate global time saved (fallback if missing from payload)
+        global_lines = global_metrics.get("total_lines_migrated", 0)
+        global_hours = global_metrics.get("total_time_saved_h")
+        if global_hours is None:
+            global_hours = round(global_lines / 800.0, 1) if global_lines else 0.0
+
+        global_panels = [
+            make_metric_panel("Total Users", str(global_metrics.get("total_users", 0)), "blue"),
+            make_metric_panel(
+                "Sites Migrated",
+                str(global_metrics.get("total_migrations", 0)),
+                "green",
+            ),
+            make_metric_panel(
+                "Lines Migrated",
+                f"{global_lines:,}",
+                "cyan",
+            ),
+            make_metric_panel(
+                "Time Saved",
+                f"{global_hours}h",
+                "magenta",
+            ),
+        ]
+        rich_console.print(Columns(global_panels, equal=True))
+
+        # Top Contributors
+        top_contributors = global_metrics.get("top_contributors", [])
+        if top_contributors:
+            rich_console.print("\n[bold cyan]Top Contributors:[/bold cyan]")
+            contrib_table = Table(show_header=False, box=None, padding=(0, 2))
+            contrib_table.add_column("Rank", style="dim", width=4)
+            contrib_table.add_column("User", style="bold cyan")
+            contrib_table.add_column("Migrations", style="green")
+
+            for i, (user, count) in enumerate(top_contributors, 1):
+                medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"#{i}"
+                contrib_table.add_row(f"  {medal}", f"{user}", f"{count} sites")
+            rich_console.print(contrib_table)
+
+    current_user_id = stats_data.get("user_id", "unknown")
+    current_user_name = stats_data.get("display_name", current_user_id)
+
+    last_updated_str = "Never"
+    if stats_data.get("last_updated"):
+        # Simple robust formatting for YYYY-MM-DD HH:MM:SS
+        ts = stats_data["last_updated"]
+        if len(ts) >= 19:
+            last_updated_str = ts[:19].replace("T", " ")
+        else:
+            last_updated_str = ts
+
+    rich_console.print(
+        f"\n[dim]Contributing as: {current_user_name} | Last updated: {last_updated_str}[/dim]"
+    )
+
+    # Check for incomplete timestamp data and warn user
+    runs = stats_data.get("runs", [])
+    if runs:
+        unknown_count = sum(1 for r in runs if get_pr_completion_state(r) == "unknown")
+        if unknown_count > 0:
+            from rich.panel import Panel
+
+            warning_panel = Panel(
+                f"[yellow]⚠️  {unknown_count} run(s) missing PR timestamp data.[/yellow]\n"
+                f"[dim]Stats may be incomplete. Run:[/dim] [cyan]python scripts/migrate_pr_timestamps.py[/cyan]",
+                border_style="yellow",
+                title="Data Migration Needed",
+            )
+            rich_console.print()
+            rich_console.print(warning_panel)
+
+        missing_author_count = sum(
+            1 for r in runs if not r.get("pr_author") and not r.get("user_id")
+        )
+        if missing_author_count > 0:
+            from rich.panel import Panel
+
+            author_panel = Panel(
+                f"[yellow]⚠️  {missing_author_count} run(s) missing PR author data.[/yellow]\n"
+                f"[dim]Tip: ensure `gh auth status` is OK on user machines and run:[/dim] "
+                f"[cyan]python scripts/refresh_run_metadata.py[/cyan]",
+                border_style="yellow",
+                title="Author Data Missing",
+            )
+            rich_console.print()
+            rich_console.print(author_panel)
+
+    if history:
+        runs = stats_data.get("runs", [])
+        if runs:
+            table = Table(
+                title="Recent Migration Runs",
+                title_style="bold cyan",
+                show_header=True,
+                header_style="bold magenta",
+            )
+            table.add_column("PR Date", style="dim")
+            table.add_column("Theme Slug", style="cyan")
+            table.add_column("Status", style="bold")
+            table.add_column("User", style="magenta")
+            table.add_column("Lines", justify="right", style="cyan")
+            table.add_column("PR", style="blue")
+            table.add_column("Time Saved", style="green")
+
+            for run in runs:
+                # Determine PR completion state
+                completion_state = get_pr_completion_state(run)
+
+                # Status display based on completion state
+                if completion_state == "complete":
+                    status_display = "[green]Complete[/green]"
+                    status_color = "green"
+                elif completion_state == "in_review":
+                    status_display = "[yellow]In Review[/yellow]"
+                    status_color = "yellow"
+                elif completion_state == "closed":
+                    status_display = "[red]Closed[/red]"
+                    status_color = "red"
+                elif completion_state == "superseded":
+                    status_display = "[dim]Superseded[/dim]"
+                    status_color = "dim"
+                else:
+                    # Fallback to old behavior for backwards compat
+                    status = run.get("status", "unknown")
+                    status_color = "green" if status == "success" else "red"
+                    status_display = f"[{status_color}]{status}[/{status_color}]"
+
+                # Extract data with graceful fallbacks
+                lines_migrated = run.get("lines_migrated", 0)
+                report_path = run.get("report_path", "")
+
+                # Calculate Time Saved (Align with Slack/Summary: 800 lines = 1 hour)
+                lines_migrated = run.get("lines_migrated", 0)
+                time_saved_str = "N/A"
+
+                # Prefer calculated metric for consistency
+                if lines_migrated > 0:
+                    hours_float = lines_migrated / 800.0
+                    if hours_float < 0.1:
+                        time_saved_str = "< 0.1h"
+                    else:
+                        time_saved_str = f"{hours_float:.1f}h"
+
+                # Fallback to manual estimate if no lines recorded but time exists
+                elif run.get("manual_estimate_seconds", 0):
+                    manual_seconds = run.get("manual_estimate_seconds", 0)
+                    h = int(manual_seconds // 3600)
+                    m = int((manual_seconds % 3600) // 60)
+                    time_saved_str = f"{h}h {m}m"
+
+                # Format values
+                lines_str = f"{lines_migrated:,}" if lines_migrated else "N/A"
+                report_str = report_path if report_path else "N/A"
+
+                # PR Link logic
+                pr_url = run.get("pr_url")
+                pr_state = run.get("pr_state", "UNKNOWN")
+
+                if pr_url:
+                    pr_display = f"[link={pr_url}]{pr_state}[/link]"
+                else:
+                    pr_display = pr_state
+
+                # Use PR Author if available, else User ID
+                user_display = run.get("pr_author")
+                if not user_display:
+                    user_display = run.get("user_id", "Unknown")
+
+                # Format user display (e.g. @username)
+                if user_display and not user_display.startswith("@"):
+                    user_display = f"@{user_display}"
+
+                # Robust timestamp formatting
+                ts_raw = run.get("timestamp", "")
+                if ts_raw and len(ts_raw) >= 19:
+                    ts_display = ts_raw[:19].replace("T", " ")
+                else:
+                    ts_display = ts_raw or "N/A"
+
+                table.add_row(
+                    ts_display,
+                    run.get("slug", "unknown"),
+                    status_display,
+                    user_display,
+                    lines_str,
+                    pr_display,
+                    time_saved_str,
+                )
+
+                pr_link = "N/A"
+                if run.get("pr_url"):
+                    url = run.get("pr_url")
+
+                    # Use completion state for link text
+                    if completion_state == "complete":
+                        link_text = "[green]Merged[/green]"
+                    elif completion_state == "in_review":
+                        link_text = "[yellow]Open[/yellow]"
+                    elif completion_state == "closed":
+                        link_text = "[red]Closed[/red]"
+                    elif completion_state == "superseded":
+                        link_text = "[dim]Superseded[/dim]"
+                    else:
+                        # Fallback to pr_state if no completion state
+                        state = run.get("pr_state", "").upper()
+                        if state == "MERGED":
+                            link_text = "[green]Merged[/green]"
+                        elif state == "OPEN":
+                            link_text = "[yellow]Open[/yellow]"
+                        elif state == "CLOSED":
+                            link_text = "[red]Closed[/red]"
+                        elif state == "DRAFT":
+                            link_text = "[dim]Draft[/dim]"
+                        else:
+                            link_text = "View"
+
+                    pr_link = f"[link={url}]{link_text}[/link]"
+
+                # User logic: prefer pr_author, fallback to generic user
+                user_display = run.get("pr_author") or run.get("_user") or "unknown"
+
+                # Date display based on completion state
+                # Priority: merged_at > created_at > closed_at > superseded_at > timestamp
+                if completion_state == "complete":
+                    effective_date = run.get("merged_at") or run.get("timestamp", "")
+                elif completion_state == "in_review":
+                    effective_date = run.get("created_at") or run.get("timestamp", "")
+                elif completion_state == "closed":
+                    effective_date = run.get("closed_at") or run.get("timestamp", "")
+                elif completion_state == "superseded":
+                    effective_date = (
+                        run.get("superseded_at") or run.get("merged_at") or run.get("timestamp", "")
+                    )
+                else:
+                    effective_date = run.get("merged_at") or run.get("timestamp", "")
+
+                # Validate and format timestamp
+                if effective_date and len(effective_date) >= 19:
+                    try:
+                        date_display = effective_date[:19].replace("T", " ")
+                    except (TypeError, AttributeError):
+                        date_display = "Invalid"
+                else:
+                    date_display = "N/A"
+
+                table.add_row(
+                    date_display,
+                    run.get("slug", "unknown"),
+                    status_display,
+                    f"@{user_display}",
+                    lines_str,
+                    pr_link,
+                )
+
+            rich_console.print(table)
+
+            # Show filter info if any filters applied
+            filter_info = []
+            if since_days:
+                filter_info.append(f"last {since_days} days")
+            if filter_user:
+                filter_info.append(f"user: {filter_user}")
+            if filter_info:
+                rich_console.print(f"[dim]Filters applied: {', '.join(filter_info)}[/dim]")
+        elif since_days or filter_user:
+            rich_console.print("[yellow]No runs found matching the specified filters.[/yellow]")
+        else:
+            rich_console.print("[yellow]No run history found.[/yellow]")
+
+    if show_list:
+        migrations = stats_data.get("migrations", [])
+        if migrations:
+            table = Table(title="Migrated Theme Slugs", title_style="bold cyan")
+            table.add_column("Slug", style="cyan")
+            for slug in migrations:
+                table.add_row(slug)
+            rich_console.print(table)
+        else:
+            rich_console.print("[yellow]No migrations have been recorded yet.[/yellow]")
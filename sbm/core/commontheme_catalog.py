@@ -0,0 +1,240 @@
+"""
+Indexed file catalog for DealerInspireCommonTheme.
+
+Map migration looks things up in CommonTheme constantly: every shortcode
+resolves SCSS by walking ``css/``, missing partials are fuzzy-matched by
+globbing a directory, and interactive runs search all of ``partials/`` for
+similar names. ``CommonThemeCatalog`` walks the ``css`` and ``partials``
+subtrees once and answers those questions from memory.
+
+The catalog is persisted to ``~/.sbm_commontheme_catalog.json`` when CommonTheme
+lives in a git checkout. A saved catalog is reused only if the checkout's HEAD
+and every recorded directory mtime are unchanged, so adding, removing or
+renaming a file (which touches its directory) forces a rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path, PurePosixPath
+from typing import Iterable
+
+from sbm.utils.logger import logger
+
+CATALOG_CACHE_PATH = Path.home() / ".sbm_commontheme_catalog.json"
+CATALOG_VERSION = 1
+
+# Subtrees of CommonTheme that map lookups search
+CATALOG_SUBDIRS = ("css", "partials")
+
+
+def _git_head(root: Path) -> str | None:
+    """Return the commit HEAD points to in the checkout containing ``root``, if any."""
+    for parent in (root, *root.parents):
+        git_dir = parent / ".git"
+        if git_dir.is_file():
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            try:
+                pointer = git_dir.read_text().strip()
+            except OSError:
+                return None
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = (parent / pointer[len("gitdir:") :].strip()).resolve()
+        if not git_dir.is_dir():
+            continue
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref:"):
+                return head
+            ref = head[len("ref:") :].strip()
+            ref_file = git_dir / ref
+            if ref_file.exists():
+                return ref_file.read_text().strip()
+            for line in (git_dir / "packed-refs").read_text().splitlines():
+                if line.endswith(f" {ref}"):
+                    return line.split(" ", 1)[0]
+        except OSError:
+            return None
+        return None
+    return None
+
+
+def _walk(root: Path, subdirs: Iterable[str]) -> tuple[dict[str, int], list[str]]:
+    """Collect directory mtimes and file paths (relative, POSIX) under ``subdirs``."""
+    dirs: dict[str, int] = {}
+    files: list[str] = []
+    stack = [sub for sub in subdirs if (root / sub).is_dir()]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            dirs[rel_dir] = os.stat(root / rel_dir).st_mtime_ns
+            with os.scandir(root / rel_dir) as entries:
+                for entry in entries:
+                    rel = f"{rel_dir}/{entry.name}"
+                    # Like Path.rglob, don't descend into symlinked directories
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(rel)
+                    elif entry.is_file():
+                        files.append(rel)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable CommonTheme directory {rel_dir}: {e}")
+    files.sort()
+    return dirs, files
+
+
+class CommonThemeCatalog:
+    """
+    In-memory index of CommonTheme ``css/`` and ``partials/`` files.
+
+    Args:
+        root: CommonTheme directory.
+        dirs: Relative directory -> mtime (ns) recorded when the catalog was built.
+        files: Sorted relative POSIX paths of every file in the catalog.
+        head: Git commit of the checkout when the catalog was built.
+    """
+
+    def __init__(
+        self, root: Path, dirs: dict[str, int], files: list[str], head: str | None = None
+    ) -> None:
+        self.root = root
+        self.dirs = dirs
+        self.files = files
+        self.head = head
+        self._by_dir: dict[str, set[str]] = {rel_dir: set() for rel_dir in dirs}
+        self._by_name: dict[str, list[str]] = {}
+        for rel in files:
+            parent, _, name = rel.rpartition("/")
+            self._by_dir.setdefault(parent, set()).add(name)
+            self._by_name.setdefault(name.lower(), []).append(rel)
+        # keyword -> paths whose lowercase form contains it, filled on first query
+        self._by_keyword: dict[str, list[str]] = {}
+
+    @classmethod
+    def build(cls, root: Path) -> CommonThemeCatalog:
+        dirs, files = _walk(root, CATALOG_SUBDIRS)
+        logger.debug(f"Indexed {len(files)} CommonTheme files in {len(dirs)} directories")
+        return cls(root, dirs, files, _git_head(root))
+
+    def is_current(self, head: str | None) -> bool:
+        """True if HEAD and every recorded directory mtime are unchanged."""
+        if head != self.head:
+            return False
+        for rel_dir, mtime in self.dirs.items():
+            try:
+                if os.stat(self.root / rel_dir).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return all((self.root / sub).is_dir() == (sub in self.dirs) for sub in CATALOG_SUBDIRS)
+
+    # -- Queries -----------------------------------------------------------------
+
+    def covers(self, rel_path: str) -> bool:
+        """True if ``rel_path`` lies in a subtree the catalog indexes."""
+        return rel_path.strip("/").split("/", 1)[0] in CATALOG_SUBDIRS
+
+    def is_dir(self, rel_dir: str) -> bool:
+        return rel_dir.strip("/") in self._by_dir
+
+    def exists(self, rel_path: str) -> bool:
+        parent, _, name = str(PurePosixPath(rel_path)).rpartition("/")
+        return name in self._by_dir.get(parent, ())
+
+    def listdir(self, rel_dir: str) -> set[str]:
+        """Names of the files (not subdirectories) directly inside ``rel_dir``."""
+        return self._by_dir.get(rel_dir.strip("/"), set())
+
+    def find_by_name(self, filename: str) -> list[str]:
+        """Paths whose basename equals ``filename`` (case-insensitive)."""
+        return self._by_name.get(filename.lower(), [])
+
+    def files_under(self, rel_dir: str, suffix: str = "") -> list[str]:
+        """Files anywhere below ``rel_dir`` ending with ``suffix``."""
+        prefix = f"{rel_dir.strip('/')}/"
+        return [rel for rel in self.files if rel.startswith(prefix) and rel.endswith(suffix)]
+
+    def with_keyword(self, keyword: str) -> list[str]:
+        """Paths whose lowercase relative path contains ``keyword``."""
+        keyword = keyword.lower()
+        hits = self._by_keyword.get(keyword)
+        if hits is None:
+            hits = [rel for rel in self.files if keyword in rel.lower()]
+            self._by_keyword[keyword] = hits
+        return hits
+
+    def with_any_keyword(
+        self, keywords: Iterable[str], under: str = "", suffix: str = ""
+    ) -> list[str]:
+        """Paths (in catalog order) containing any of ``keywords``, filtered by prefix/suffix."""
+        matched: set[str] = set()
+        for keyword in keywords:
+            matched.update(self.with_keyword(keyword))
+        prefix = f"{under.strip('/')}/" if under else ""
+        return [rel for rel in sorted(matched) if rel.startswith(prefix) and rel.endswith(suffix)]
+
+    # -- Persistence -------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CATALOG_VERSION,
+            "root": str(self.root),
+            "head": self.head,
+            "dirs": self.dirs,
+            "files": self.files,
+        }
+
+    def save(self, path: Path | None = None) -> None:
+        path = path or CATALOG_CACHE_PATH
+        try:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self.to_dict()))
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.debug(f"Could not save CommonTheme catalog: {e}")
+
+
+def _load_saved(root: Path) -> CommonThemeCatalog | None:
+    try:
+        data = json.loads(CATALOG_CACHE_PATH.read_text())
+    except Exception:
+        return None
+    if data.get("version") != CATALOG_VERSION or data.get("root") != str(root):
+        return None
+    return CommonThemeCatalog(root, data.get("dirs", {}), data.get("files", []), data.get("head"))
+
+
+_CATALOGS: dict[str, CommonThemeCatalog] = {}
+
+
+def get_commontheme_catalog(root: str | Path) -> CommonThemeCatalog:
+    """
+    Return the catalog for ``root``, building it at most once per process.
+
+    A saved catalog is reused across processes while it is still current;
+    catalogs are only persisted for CommonTheme checkouts inside a git repo.
+    """
+    key = str(root)
+    catalog = _CATALOGS.get(key)
+    if catalog is not None:
+        return catalog
+
+    root_path = Path(root)
+    head = _git_head(root_path)
+    if head is not None:
+        catalog = _load_saved(root_path)
+        if catalog is not None and not catalog.is_current(head):
+            catalog = None
+    if catalog is None:
+        catalog = CommonThemeCatalog.build(root_path)
+        if head is not None:
+            catalog.save()
+
+    _CATALOGS[key] = catalog
+    return catalog
+
+
+def clear_commontheme_catalogs() -> None:
+    """Forget in-process catalogs (e.g. after CommonTheme was updated mid-run)."""
+    _CATALOGS.clear()
@@ -5,16 +5,23 @@ This module handles the migration of map components from CommonTheme to DealerTh
 by scanning for CommonTheme @import statements and copying both SCSS and PHP partials.
 """
 
+import functools
+import os
 import re
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 
+from sbm.core.commontheme_catalog import get_commontheme_catalog
 from sbm.ui.console import SBMConsole
+from sbm.utils.keyword_matcher import KeywordMatcher, literal_fragments
 from sbm.utils.logger import logger
-from sbm.utils.path import get_dealer_theme_dir
+from sbm.utils.path import DirectoryListingCache, get_dealer_theme_dir
+from sbm.utils.source_files import findall_in_file, read_text
+from sbm.utils.tracing import annotate, traced
 
 # CommonTheme directory path
 COMMON_THEME_DIR = "/Users/nathanhart/di-websites-platform/app/dealer-inspire/wp-content/themes/DealerInspireCommonTheme"
@@ -60,6 +67,78 @@ LOCATION_MAP_MARKERS = [
     "id=mapRow",  # unquoted edge case
 ]
 
+_MAP_KEYWORD_SET = frozenset(MAP_KEYWORDS)
+_LOCATION_MARKER_MATCHER = KeywordMatcher(LOCATION_MAP_MARKERS)
+
+# @import statements and their (first) quoted path
+_IMPORT_STATEMENT_PATTERN = re.compile(r"@import\s+['\"]([^'\"]*)['\"]", re.IGNORECASE)
+
+# Quoted @import paths, scanned over the raw text of existing theme files
+_QUOTED_IMPORT_PATTERN = re.compile(r"@import\s*['\"]([^'\"]+)['\"]")
+
+_COMMON_THEME_ANCHOR = "dealerinspirecommontheme"
+
+
+class MapPatternMatcher:
+    """
+    One automaton over MAP_KEYWORDS and the literal parts of OEM map patterns.
+
+    Each path is scanned once for every keyword and OEM fragment; an OEM
+    regex only runs when all of its literal fragments were seen.
+
+    Args:
+        oem_patterns: Regex patterns from ``get_map_partial_patterns()``.
+    """
+
+    def __init__(self, oem_patterns: tuple = ()) -> None:
+        self.oem_patterns = [
+            (re.compile(p, re.IGNORECASE), frozenset(literal_fragments(p))) for p in oem_patterns
+        ]
+        fragments = [f for _, frags in self.oem_patterns for f in frags]
+        self.automaton = KeywordMatcher([*MAP_KEYWORDS, *fragments])
+
+    def hits(self, text: str) -> list:
+        """All (start, keyword) hits in ``text``; keywords are lowercase."""
+        return list(self.automaton.iter_matches(text))
+
+    def matches_oem(self, text: str, hits: Optional[list] = None) -> bool:
+        """True if any OEM pattern matches ``text``."""
+        found = {keyword for _, keyword in (self.hits(text) if hits is None else hits)}
+        return any(frags <= found and rx.search(text) for rx, frags in self.oem_patterns)
+
+    def is_generic_map_import(self, import_path: str, hits: Optional[list] = None) -> bool:
+        """
+        True if a map keyword starts a segment (after ``/`` or ``_``) somewhere
+        after ``DealerInspireCommonTheme`` in ``import_path``.
+        """
+        lower = import_path.lower()
+        anchor = lower.find(_COMMON_THEME_ANCHOR)
+        if anchor < 0:
+            return False
+        after = anchor + len(_COMMON_THEME_ANCHOR)
+        return any(
+            keyword in _MAP_KEYWORD_SET and start > after and lower[start - 1] in "/_"
+            for start, keyword in (self.hits(import_path) if hits is None else hits)
+        )
+
+
+@functools.lru_cache(maxsize=16)
+def _map_pattern_matcher(oem_patterns: tuple = ()) -> MapPatternMatcher:
+    return MapPatternMatcher(oem_patterns)
+
+
+def _oem_map_patterns(oem_handler: Optional[object]) -> tuple:
+    """The handler's map partial patterns, or () for the default handler."""
+    try:
+        from sbm.oem.default import DefaultHandler
+
+        is_oem = oem_handler and not isinstance(oem_handler, DefaultHandler)
+        if is_oem and hasattr(oem_handler, "get_map_partial_patterns"):
+            return tuple(oem_handler.get_map_partial_patterns())
+    except Exception:
+        pass
+    return ()
+
 
 def _resolve_scss_candidates(base_dir: Path, relative_path: str) -> List[Path]:
     """Generate candidate SCSS file paths (handling underscores and extensions)."""
@@ -82,19 +161,25 @@ def _resolve_scss_candidates(base_dir: Path, relative_path: str) -> List[Path]:
     return candidates
 
 
-def should_migrate_map_import(import_path: str, dealer_theme_dir: Union[str, Path]) -> bool:
+def should_migrate_map_import(
+    import_path: str,
+    dealer_theme_dir: Union[str, Path],
+    listings: Optional[DirectoryListingCache] = None,
+) -> bool:
     """
     Determine if a map import should be migrated by resolving its path.
 
     Args:
         import_path: The import string (e.g. 'map-section' or '../../DealerInspireCommonTheme/...')
         dealer_theme_dir: The dealer theme directory
+        listings: Optional directory listing cache shared across calls in one pass
 
     Returns:
         bool: True if it should be migrated (found in CommonTheme, not found locally), False otherwise.
     """
     import_path = import_path.strip().strip("'").strip('"')
     dealer_theme_dir = Path(dealer_theme_dir)
+    listings = listings or DirectoryListingCache()
 
     # 1. Check Local Existence (relative to css/)
     # We assume imports are relative to css/ folder where style.scss lives
@@ -110,7 +195,7 @@ def should_migrate_map_import(import_path: str, dealer_theme_dir: Union[str, Pat
     dealer_theme_abs = dealer_theme_dir.resolve()
 
     for p in local_candidates:
-        if p.exists():
+        if listings.exists(p):
             try:
                 # Check if the resolved path is inside the dealer theme
                 if p.resolve().is_relative_to(dealer_theme_abs):
@@ -134,7 +219,7 @@ def should_migrate_map_import(import_path: str, dealer_theme_dir: Union[str, Pat
     common_base = Path(COMMON_THEME_DIR)
     common_candidates = _resolve_scss_candidates(common_base, relative_part)
 
-    found_common = next((p for p in common_candidates if p.exists()), None)
+    found_common = listings.first_existing(common_candidates)
 
     if found_common:
         logger.debug(f"Import {import_path} resolved to CommonTheme: {found_common}")
@@ -163,13 +248,16 @@ def remove_scss_comments(content: str) -> str:
     return content
 
 
-def _resolve_commontheme_partial_file(partial_path: str) -> Optional[Path]:
+def _resolve_commontheme_partial_file(
+    partial_path: str, listings: Optional[DirectoryListingCache] = None
+) -> Optional[Path]:
     """Resolve a partial path to a concrete CommonTheme PHP file if present.
 
     Tries both the exact filename and the underscore-prefixed variant
     (e.g. map-row.php → _map-row.php) since some CommonTheme partials
     use leading underscores as a draft/disabled convention.
     """
+    listings = listings or DirectoryListingCache()
     normalized = partial_path.lstrip("/")
     path_candidates = [normalized]
     if not normalized.startswith("partials/"):
@@ -181,7 +269,7 @@ def _resolve_commontheme_partial_file(partial_path: str) -> Optional[Path]:
         stem = candidate_path.name  # e.g. "map-row"
         for filename in [f"{stem}.php", f"_{stem}.php"]:
             full = parent / filename
-            if full.exists():
+            if listings.exists(full):
                 return full
     return None
 
@@ -204,12 +292,11 @@ def _is_location_map_partial(partial_path: str) -> bool:
         return False
 
     try:
-        source = source_file.read_text(encoding="utf-8", errors="ignore")
+        source = read_text(source_file)
     except Exception:
         return False
 
-    source_lower = source.lower()
-    return any(marker.lower() in source_lower for marker in LOCATION_MAP_MARKERS)
+    return _LOCATION_MARKER_MATCHER.search(source)
 
 
 _MAP_MIGRATION_REPORT: Dict[str, dict] = {}
@@ -225,12 +312,14 @@ def get_map_report(slug: str) -> Optional[dict]:
     return _MAP_MIGRATION_REPORT.get(slug)
 
 
+@traced("maps.migrate_map_components", category="maps")
 def migrate_map_components(
     slug: str,
     oem_handler: Optional[Union[dict, object]] = None,
     interactive: bool = False,
     console: Optional[SBMConsole] = None,
     processor: Optional[Any] = None,
+    sources: Optional["ThemeSourceSet"] = None,
 ) -> bool:
     """
     Enhanced map components migration that scans for CommonTheme @import statements
@@ -242,11 +331,13 @@ def migrate_map_components(
         interactive: Whether to prompt for user confirmation (default: False)
         console: Optional console instance for unified UI.
         processor: Optional SCSSProcessor instance for content transformation.
+        sources: Optional theme source set shared with the rest of the migration.
 
     Returns:
         bool: True if migration was successful, False otherwise
     """
     logger.debug(f"Starting enhanced map components migration for {slug}")
+    annotate(slug=slug)
 
     try:
         theme_dir = Path(get_dealer_theme_dir(slug))
@@ -265,20 +356,34 @@ def migrate_map_components(
             except Exception as e:
                 logger.warning(f"Failed to instantiate SCSSProcessor: {e}")
 
+        # Candidate-path probes below share directory listings; nothing is
+        # written to the theme until the imports have been filtered.
+        listings = DirectoryListingCache()
+        sources = sources or ThemeSourceSet(theme_dir)
+
         # Step 1: explicit imports
-        map_imports = find_commontheme_map_imports(style_scss_path, oem_handler)
+        map_imports = find_commontheme_map_imports(
+            style_scss_path, oem_handler, listings, sources=sources
+        )
+
+        # Shortcode and template scans share one read of each PHP file
+        theme_index = ThemeMapIndex(theme_dir)
 
         # Step 1b: Shortcodes
-        shortcode_partials = find_map_shortcodes_in_functions(str(theme_dir), oem_handler)
+        shortcode_partials = find_map_shortcodes_in_functions(
+            str(theme_dir), oem_handler, index=theme_index
+        )
 
         # Step 1c: Template Partials (Always scan)
-        template_partials = find_map_partials_in_templates(slug, oem_handler)
+        template_partials = find_map_partials_in_templates(slug, oem_handler, index=theme_index)
 
         # Combine all partials
         all_partials = shortcode_partials + template_partials
 
         # Derive SCSS from all partials
-        derived_imports = derive_map_imports_from_partials(all_partials, oem_handler=oem_handler)
+        derived_imports = derive_map_imports_from_partials(
+            all_partials, oem_handler=oem_handler, listings=listings
+        )
 
         # Combine all imports (explicit + derived)
         all_imports = map_imports + derived_imports
@@ -313,13 +418,13 @@ def migrate_map_components(
         for imp in all_imports:
             # Use 'import_path' if available, otherwise 'commontheme_relative'
             path_check = imp.get("import_path") or imp.get("commontheme_relative")
-            if should_migrate_map_import(path_check, theme_dir):
+            if should_migrate_map_import(path_check, theme_dir, listings):
                 valid_imports.append(imp)
             else:
                 logger.debug(f"Skipping import {path_check} (already local or invalid)")
 
         scss_success, scss_targets = migrate_map_scss_content(
-            slug, valid_imports, processor=processor
+            slug, valid_imports, processor=processor, sources=sources
         )
 
         # Step 3: Migrate Partials
@@ -394,29 +499,204 @@ def migrate_map_components(
         return False
 
 
-def find_map_partials_in_templates(slug: str, oem_handler: Optional[object] = None) -> List[dict]:
-    """Scan all template files for map partials."""
-    theme_dir = Path(get_dealer_theme_dir(slug))
-    template_files = [
-        theme_dir / "front-page.php",
-        theme_dir / "index.php",
-        theme_dir / "page.php",
-        theme_dir / "home.php",
-        theme_dir / "functions.php",
-    ]
-    partials_dir = theme_dir / "partials"
-    if partials_dir.exists():
-        template_files.extend(list(partials_dir.rglob("*.php")))
+# include/require statements, e.g.
+#   require_once( get_template_directory() . '/path/to/file.php' );
+#   include 'path/to/file.php';
+#   require_once( dirname(__FILE__) . '/path/to/file.php' );
+#   require_once( '../../DealerInspireCommonTheme/path/to/file.php' );
+_INCLUDE_PATTERN = re.compile(
+    r"(?:require_once|include_once|require|include)\s*\(?\s*(.*?)\s*\)?\s*;", re.IGNORECASE
+)
 
-    partial_paths = []
-    for template_file in template_files:
-        if template_file.exists():
-            partial_paths.extend(find_template_parts_in_file(str(template_file), [], oem_handler))
-    return partial_paths
+_SHORTCODE_REGISTRATION_PATTERN = re.compile(
+    rf"add_shortcode\s*\(\s*['\"]({_MAP_KEYWORD_PATTERN})['\"]\s*,\s*([^\)\s]+)", re.IGNORECASE
+)
+
+
+class ThemeMapIndex:
+    """
+    Per-theme index of the PHP files that map detection reads.
+
+    Template, shortcode and include scans all query the same index, so each
+    file is read and comment-stripped once per migration and its template
+    parts, shortcode registrations and include statements are extracted once.
+    Build a new index per migration; it does not notice files changed on disk.
+
+    Args:
+        theme_dir: Dealer theme directory.
+    """
+
+    TEMPLATE_FILES = ("front-page.php", "index.php", "page.php", "home.php", "functions.php")
+
+    def __init__(self, theme_dir: Union[str, Path]) -> None:
+        self.theme_dir = Path(theme_dir)
+        self._template_files: Optional[List[Path]] = None
+        self._content: Dict[str, Optional[str]] = {}
+        self._template_parts: Dict[tuple, List[dict]] = {}
+        self._shortcodes: Dict[str, List[tuple]] = {}
+        self._includes: Dict[str, List[str]] = {}
+
+    def template_files(self) -> List[Path]:
+        """Top-level templates plus every partials/**/*.php file that exists."""
+        if self._template_files is None:
+            files = [self.theme_dir / name for name in self.TEMPLATE_FILES]
+            partials_dir = self.theme_dir / "partials"
+            if partials_dir.exists():
+                files.extend(partials_dir.rglob("*.php"))
+            self._template_files = [f for f in files if f.exists()]
+        return self._template_files
+
+    def content(self, path: Union[str, Path]) -> Optional[str]:
+        """Comment-stripped file content, or None if it could not be read."""
+        key = str(path)
+        if key not in self._content:
+            try:
+                raw = read_text(path)
+                self._content[key] = remove_php_comments(raw)
+            except Exception as e:
+                logger.warning(f"Could not read {path}: {e}")
+                self._content[key] = None
+        return self._content[key]
+
+    def template_parts(
+        self, path: Union[str, Path], oem_handler: Optional[object] = None
+    ) -> List[dict]:
+        """Same result as ``find_template_parts_in_file`` for ``path``, computed once."""
+        patterns = _template_part_patterns(oem_handler)
+        key = (str(path), tuple(patterns))
+        if key not in self._template_parts:
+            content = self.content(path)
+            parts: List[dict] = []
+            if content is not None:
+                try:
+                    parts = _extract_template_parts(content, str(path), oem_handler, patterns)
+                except Exception as e:
+                    logger.warning(f"Error scanning template file {path}: {e}")
+            self._template_parts[key] = parts
+        return list(self._template_parts[key])
+
+    def shortcode_registrations(self, path: Union[str, Path]) -> List[tuple]:
+        """(shortcode, handler) pairs registered with add_shortcode() for map keywords."""
+        key = str(path)
+        if key not in self._shortcodes:
+            content = self.content(path) or ""
+            self._shortcodes[key] = [
+                (match.group(1).strip().lower(), match.group(2).strip().strip(","))
+                for match in _SHORTCODE_REGISTRATION_PATTERN.finditer(content)
+            ]
+        return self._shortcodes[key]
+
+    def includes(self, path: Union[str, Path]) -> List[str]:
+        """Raw path expressions of the include/require statements in ``path``."""
+        key = str(path)
+        if key not in self._includes:
+            content = self.content(path) or ""
+            self._includes[key] = [m.group(1) for m in _INCLUDE_PATTERN.finditer(content)]
+        return self._includes[key]
+
+    def find_template_parts(self, oem_handler: Optional[object] = None) -> List[dict]:
+        """Template parts across all template files, in scan order."""
+        partial_paths: List[dict] = []
+        for template_file in self.template_files():
+            partial_paths.extend(self.template_parts(template_file, oem_handler))
+        return partial_paths
 
 
+@dataclass(frozen=True)
+class ThemeSource:
+    """
+    One dealer theme source file as read by ``ThemeSourceSet``.
+
+    Attributes:
+        path: Absolute path of the file.
+        text: File content; bytes that are not valid UTF-8 are dropped.
+        stripped: Content with SCSS comments removed.
+        imports: ``(statement, path)`` for every @import in ``stripped``.
+        line_count: Number of lines in ``text``.
+        valid_utf8: False if ``text`` had undecodable bytes dropped. Such text
+            is fine for scanners but must not be transformed and written back.
+    """
+
+    path: Path
+    text: str
+    stripped: str
+    imports: Tuple[Tuple[str, str], ...]
+    line_count: int
+    valid_utf8: bool
+
+
+class ThemeSourceSet:
+    """
+    Per-run set of dealer theme sources (``css/style.scss``, ``css/inside.scss``...).
+
+    Style migration, map import detection, the existing-import pre-scan and
+    OEM indicator checks all look at the same sources. Each file is read once,
+    on first request, together with its comment-stripped variant and import
+    list; every later step gets the same ``ThemeSource``. Build one set per
+    migration: sources are not expected to change while it runs and the set
+    does not notice edits on disk.
+
+    Args:
+        theme_dir: Dealer theme directory.
+    """
+
+    def __init__(self, theme_dir: Union[str, Path]) -> None:
+        self.theme_dir = Path(theme_dir).absolute()
+        self._sources: Dict[Path, Optional[ThemeSource]] = {}
+
+    def get(self, path: Union[str, Path]) -> Optional[ThemeSource]:
+        """
+        The source at ``path`` (absolute, or relative to the theme directory),
+        or None if it does not exist or cannot be read.
+        """
+        path = Path(os.path.normpath(self.theme_dir / path))
+        if path not in self._sources:
+            self._sources[path] = self._load(path)
+        return self._sources[path]
+
+    def css(self, name: str) -> Optional[ThemeSource]:
+        """Shorthand for ``get("css/<name>")``."""
+        return self.get(Path("css") / name)
+
+    def _load(self, path: Path) -> Optional[ThemeSource]:
+        if not path.is_file():
+            return None
+        valid_utf8 = True
+        try:
+            text = read_text(path, errors="strict")
+        except UnicodeDecodeError:
+            logger.warning(f"{path} is not valid UTF-8; scanning it with undecodable bytes dropped")
+            valid_utf8 = False
+            text = read_text(path)
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return None
+
+        stripped = remove_scss_comments(text)
+        imports = tuple(
+            (match.group(0), match.group(1))
+            for match in _IMPORT_STATEMENT_PATTERN.finditer(stripped)
+        )
+        line_count = text.count("\n") + (bool(text) and not text.endswith("\n"))
+        return ThemeSource(path, text, stripped, imports, line_count, valid_utf8)
+
+
+@traced("maps.find_map_partials_in_templates", category="maps")
+def find_map_partials_in_templates(
+    slug: str, oem_handler: Optional[object] = None, index: Optional[ThemeMapIndex] = None
+) -> List[dict]:
+    """Scan all template files for map partials."""
+    if index is None:
+        index = ThemeMapIndex(get_dealer_theme_dir(slug))
+    return index.find_template_parts(oem_handler)
+
+
+@traced("maps.find_commontheme_map_imports", category="maps")
 def find_commontheme_map_imports(
-    style_scss_path: Union[str, Path], oem_handler: Optional[object] = None
+    style_scss_path: Union[str, Path],
+    oem_handler: Optional[object] = None,
+    listings: Optional[DirectoryListingCache] = None,
+    sources: Optional[ThemeSourceSet] = None,
 ) -> List[dict]:
     """
     Find CommonTheme @import statements that contain "map" in the filename.
@@ -424,6 +704,8 @@ def find_commontheme_map_imports(
     Args:
         style_scss_path: Path to style.scss file
         oem_handler: Optional OEM handler to use for specific patterns
+        listings: Optional directory listing cache shared across calls in one pass
+        sources: Optional theme source set the style.scss read is shared through
 
     Returns:
         list: List of dictionaries containing import information
@@ -432,71 +714,70 @@ def find_commontheme_map_imports(
 
     try:
         path_style_scss = Path(style_scss_path)
-        raw_content = path_style_scss.read_text(encoding="utf-8", errors="ignore")
-        content = remove_scss_comments(raw_content)
+        sources = sources or ThemeSourceSet(path_style_scss.parent)
+        source = sources.get(path_style_scss.absolute())
+        if source is None:
+            raise FileNotFoundError(path_style_scss)
+        annotate(file=str(path_style_scss), bytes=len(source.text))
 
         map_imports = []
+        listings = listings or DirectoryListingCache()
 
         # Determine patterns to search for
-        from sbm.oem.default import DefaultHandler
-
-        is_oem = oem_handler and not isinstance(oem_handler, DefaultHandler)
-
-        if is_oem and hasattr(oem_handler, "get_map_partial_patterns"):
-            search_patterns = oem_handler.get_map_partial_patterns()
-            logger.info(f"Using {len(search_patterns)} OEM-specific map patterns")
+        oem_patterns = _oem_map_patterns(oem_handler)
+        matcher = _map_pattern_matcher(oem_patterns)
+        if oem_patterns:
+            logger.info(f"Using {len(oem_patterns)} OEM-specific map patterns")
         else:
             # Default mode: Use generic keywords with start-of-segment boundary
-            keyword_list = "|".join([re.escape(k) for k in MAP_KEYWORDS])
-            search_patterns = [f"DealerInspireCommonTheme[^'\"]*(?:/|_)(?:{keyword_list})"]
             logger.info("Using generic map keyword patterns with segment boundary")
 
-        for pattern in search_patterns:
-            import_pattern = r"@import\s+['\"]([^'\"]*" + pattern + r"[^'\"]*)['\"]"
-            matches = re.finditer(import_pattern, content, re.IGNORECASE)
-
-            for match in matches:
-                import_path = match.group(1)
+        # The source set collected the @import paths; the automaton screens each path once
+        for statement, import_path in source.imports:
+            hits = matcher.hits(import_path)
+            if oem_patterns:
+                if not matcher.matches_oem(import_path, hits):
+                    continue
+            elif not matcher.is_generic_map_import(import_path, hits):
+                continue
 
-                # Convert relative path to absolute CommonTheme path
-                # Remove leading ../../DealerInspireCommonTheme/ to get relative path within CommonTheme
-                commontheme_relative = re.sub(r"^.*?DealerInspireCommonTheme/", "", import_path)
-                commontheme_absolute = Path(COMMON_THEME_DIR) / commontheme_relative
+            # Convert relative path to absolute CommonTheme path
+            # Remove leading ../../DealerInspireCommonTheme/ to get relative path within CommonTheme
+            commontheme_relative = re.sub(r"^.*?DealerInspireCommonTheme/", "", import_path)
+            commontheme_absolute = Path(COMMON_THEME_DIR) / commontheme_relative
+
+            map_import = {
+                "original_import": statement,
+                "import_path": import_path,
+                "commontheme_relative": commontheme_relative,
+                "commontheme_absolute": str(commontheme_absolute),
+                "filename": commontheme_absolute.name,
+            }
 
-                map_import = {
-                    "original_import": match.group(0),
-                    "import_path": import_path,
-                    "commontheme_relative": commontheme_relative,
-                    "commontheme_absolute": str(commontheme_absolute),
-                    "filename": commontheme_absolute.name,
-                }
+            # Verify the file exists in CommonTheme with several fallbacks
+            filename = commontheme_absolute.name
+            directory = commontheme_absolute.parent
 
-                # Verify the file exists in CommonTheme with several fallbacks
-                filename = commontheme_absolute.name
-                directory = commontheme_absolute.parent
+            candidate_paths = [commontheme_absolute]
 
-                candidate_paths = [commontheme_absolute]
+            # Underscore prefix
+            if not filename.startswith("_"):
+                candidate_paths.append(directory / f"_{filename}")
 
-                # Underscore prefix
+            # Add .scss if missing
+            if not filename.lower().endswith(".scss"):
+                candidate_paths.append(commontheme_absolute.with_suffix(".scss"))
                 if not filename.startswith("_"):
-                    candidate_paths.append(directory / f"_{filename}")
+                    candidate_paths.append(directory / f"_{filename}.scss")
 
-                # Add .scss if missing
-                if not filename.lower().endswith(".scss"):
-                    candidate_paths.append(commontheme_absolute.with_suffix(".scss"))
-                    if not filename.startswith("_"):
-                        candidate_paths.append(directory / f"_{filename}.scss")
+            actual_file_path = listings.first_existing(candidate_paths)
 
-                actual_file_path = next((p for p in candidate_paths if p.exists()), None)
-
-                if actual_file_path:
-                    map_import["commontheme_absolute"] = str(actual_file_path)
-                    map_imports.append(map_import)
-                    logger.debug(
-                        f"Found map import: {map_import['filename']} at {actual_file_path}"
-                    )
-                else:
-                    logger.debug(f"CommonTheme file not found (skipping): {commontheme_absolute}")
+            if actual_file_path:
+                map_import["commontheme_absolute"] = str(actual_file_path)
+                map_imports.append(map_import)
+                logger.debug(f"Found map import: {map_import['filename']} at {actual_file_path}")
+            else:
+                logger.debug(f"CommonTheme file not found (skipping): {commontheme_absolute}")
 
         if map_imports:
             logger.info(f"Found {len(map_imports)} CommonTheme map imports")
@@ -522,8 +803,9 @@ def dedupe_map_imports(map_imports: List[dict]) -> List[dict]:
     return deduped
 
 
+@traced("maps.find_map_shortcodes_in_functions", category="maps")
 def find_map_shortcodes_in_functions(
-    theme_dir: str, oem_handler: Optional[object] = None
+    theme_dir: str, oem_handler: Optional[object] = None, index: Optional[ThemeMapIndex] = None
 ) -> List[dict]:
     """
     Scan functions.php AND included shared function files for map/directions shortcodes
@@ -542,43 +824,28 @@ def find_map_shortcodes_in_functions(
     seen_files = {str(start_file.resolve())}
 
     partial_paths = []
-
-    # regex for finding include/require statements
-    # Matches: require_once( get_template_directory() . '/path/to/file.php' );
-    # Matches: include 'path/to/file.php';
-    # Matches: require_once( dirname(__FILE__) . '/path/to/file.php' );
-    # Matches: require_once( '../../DealerInspireCommonTheme/path/to/file.php' );
-    include_pattern = re.compile(
-        r"(?:require_once|include_once|require|include)\s*\(?\s*(.*?)\s*\)?\s*;", re.IGNORECASE
-    )
-
-    keyword_pattern = "|".join([re.escape(k) for k in MAP_KEYWORDS])
-    shortcode_pattern = rf"add_shortcode\s*\(\s*['\"]({keyword_pattern})['\"]\s*,\s*([^\)\s]+)"
+    if index is None:
+        index = ThemeMapIndex(theme_dir)
 
     while files_to_scan:
         current_file_path, context = files_to_scan.pop(0)
 
-        try:
-            raw_content = current_file_path.read_text(encoding="utf-8", errors="ignore")
-            content = remove_php_comments(raw_content)
-        except Exception as e:
-            logger.warning(f"Could not read {context}: {e}")
+        content = index.content(current_file_path)
+        if content is None:
+            logger.warning(f"Could not read {context}")
             continue
 
         logger.debug(f"Scanning {current_file_path.name} for map shortcodes...")
 
         # 1. Find shortcode registrations in this file
-        shortcodes = []
-        for match in re.finditer(shortcode_pattern, content, re.IGNORECASE):
-            shortcode = match.group(1).strip().lower()
-            handler = match.group(2).strip().strip(",")
-            shortcodes.append((shortcode, handler))
+        shortcodes = index.shortcode_registrations(current_file_path)
+        for shortcode, handler in shortcodes:
             logger.info(
                 f"Found shortcode registration in {current_file_path.name}: {shortcode} -> {handler}"
             )
 
         # 2. Find get_template_part calls in this file (top-level)
-        partial_paths.extend(find_template_parts_in_file(str(current_file_path), [], oem_handler))
+        partial_paths.extend(index.template_parts(current_file_path, oem_handler))
 
         # 3. Look inside handler functions for template parts
         for shortcode, handler in shortcodes:
@@ -618,10 +885,7 @@ def find_map_shortcodes_in_functions(
         # 4. Find included files to recurse into
         # Only relevant for the main functions.php or other shared function files
         # We generally only want to follow paths that look like they might contain shared logic
-        include_matches = include_pattern.finditer(content)
-        for match in include_matches:
-            raw_path_statement = match.group(1)
-
+        for raw_path_statement in index.includes(current_file_path):
             # Simple heuristic cleaning of PHP string concatenation
             # Remove get_template_directory(), dirname(__FILE__), quotes, dots, parens
             clean_path = raw_path_statement
@@ -705,29 +969,17 @@ def _resolve_commontheme_scss_from_shortcode(
 
     keywords = keyword_map.get(shortcode, [shortcode])
     common_base = Path(COMMON_THEME_DIR)
-    css_root = common_base / "css"
-    if not css_root.exists():
+    catalog = get_commontheme_catalog(common_base)
+    if not catalog.is_dir("css"):
         return []
 
-    patterns: list[re.Pattern] = []
-    try:
-        from sbm.oem.default import DefaultHandler
-
-        is_oem = oem_handler and not isinstance(oem_handler, DefaultHandler)
-        if is_oem and hasattr(oem_handler, "get_map_partial_patterns"):
-            for p in oem_handler.get_map_partial_patterns():
-                patterns.append(re.compile(p, re.IGNORECASE))
-    except Exception:
-        pass
+    oem_patterns = _oem_map_patterns(oem_handler)
+    matcher = _map_pattern_matcher(oem_patterns)
 
     matches: list[dict] = []
-    for scss_path in css_root.rglob("*.scss"):
-        rel_path = scss_path.relative_to(common_base).as_posix()
-        rel_lower = rel_path.lower()
-        if not any(k in rel_lower for k in keywords):
-            continue
-
-        if patterns and not any(p.search(rel_path) for p in patterns):
+    for rel_path in catalog.with_any_keyword(keywords, under="css", suffix=".scss"):
+        scss_path = common_base / rel_path
+        if oem_patterns and not matcher.matches_oem(rel_path):
             continue
 
         matches.append(
@@ -743,13 +995,17 @@ def _resolve_commontheme_scss_from_shortcode(
     return matches
 
 
+@traced("maps.derive_map_imports_from_partials", category="maps")
 def derive_map_imports_from_partials(
-    partial_paths: List[dict], oem_handler: Optional[object] = None
+    partial_paths: List[dict],
+    oem_handler: Optional[object] = None,
+    listings: Optional[DirectoryListingCache] = None,
 ) -> List[dict]:
     """
     Derive CommonTheme SCSS paths from partial paths when no explicit @import is present.
     """
     imports = []
+    listings = listings or DirectoryListingCache()
     for partial in partial_paths:
         partial_path = partial.get("partial_path", "")
         if not partial_path:
@@ -779,7 +1035,7 @@ def derive_map_imports_from_partials(
         if not filename.startswith("_"):
             candidates.append(directory / f"_{filename}")
 
-        actual_path = next((p for p in candidates if p.exists()), None)
+        actual_path = listings.first_existing(candidates)
         if not actual_path:
             logger.debug(f"Could not resolve SCSS for partial-derived path: {scss_relative}")
             continue
@@ -797,8 +1053,12 @@ def derive_map_imports_from_partials(
     return imports
 
 
+@traced("maps.migrate_map_scss_content", category="maps")
 def migrate_map_scss_content(
-    slug: str, map_imports: List[dict], processor: Optional[Any] = None
+    slug: str,
+    map_imports: List[dict],
+    processor: Optional[Any] = None,
+    sources: Optional[ThemeSourceSet] = None,
 ) -> tuple[bool, List[str]]:
     """
     Migrate SCSS content from CommonTheme map files to sb-inside.scss and sb-home.scss.
@@ -807,6 +1067,7 @@ def migrate_map_scss_content(
         slug: Dealer theme slug
         map_imports: List of map import dictionaries
         processor: Optional SCSSProcessor instance for content transformation.
+        sources: Optional theme source set for the css/ sources scanned for imports.
 
     Returns:
         tuple[bool, list]: (success, list of modified files)
@@ -836,21 +1097,22 @@ def migrate_map_scss_content(
 
         # 1. Pre-scan existing SCSS files for imports
         existing_imports = set()
-        # candidate files to check for existing imports
-        check_files = [
-            sb_inside_path,
-            sb_home_path,
-            theme_dir / "css" / "style.scss",
-            theme_dir / "css" / "inside.scss",
-            theme_dir / "style.scss",
-        ]
+        # candidate files to check for existing imports: the css/ sources come from
+        # the source set, the other files are (re)written during a migration
+        sources = sources or ThemeSourceSet(theme_dir)
+        theme_sources = [theme_dir / "css" / "style.scss", theme_dir / "css" / "inside.scss"]
+        check_files = [sb_inside_path, sb_home_path, *theme_sources, theme_dir / "style.scss"]
 
         for check_path in check_files:
             if check_path.exists():
                 try:
-                    content = check_path.read_text(encoding="utf-8", errors="ignore")
                     # Find @import statements
-                    import_matches = re.findall(r"@import\s*['\"]([^'\"]+)['\"]", content)
+                    if check_path in theme_sources:
+                        source = sources.get(check_path.absolute())
+                        text = source.text if source else ""
+                        import_matches = _QUOTED_IMPORT_PATTERN.findall(text)
+                    else:
+                        import_matches = findall_in_file(check_path, _QUOTED_IMPORT_PATTERN)
                     for imp in import_matches:
                         if "CommonTheme" in imp or imp.startswith("../../"):
                             continue
@@ -953,6 +1215,7 @@ def migrate_map_scss_content(
         return False, []
 
 
+@traced("maps.migrate_map_partials", category="maps")
 def migrate_map_partials(
     slug: str,
     map_imports: List[dict],
@@ -960,6 +1223,7 @@ def migrate_map_partials(
     extra_partials: Optional[List[dict]] = None,
     oem_handler: Optional[object] = None,
     scan_templates: bool = True,
+    index: Optional[ThemeMapIndex] = None,
 ) -> tuple[bool, List[str]]:
     """
     Find and migrate corresponding PHP partials for map components.
@@ -971,6 +1235,7 @@ def migrate_map_partials(
         extra_partials: Optional list of additional partials to migrate.
         oem_handler: Optional OEM handler to use for specific patterns
         scan_templates: Whether to scan template files for partials (default: True)
+        index: Optional ThemeMapIndex already built for this theme
 
     Returns:
         tuple[bool, list]: (success, list of copied partials)
@@ -985,26 +1250,11 @@ def migrate_map_partials(
         partial_paths = []
 
         if scan_templates:
-            # Look for PHP partials in front-page.php and other template files
-            template_files = [
-                theme_dir / "front-page.php",
-                theme_dir / "index.php",
-                theme_dir / "page.php",
-                theme_dir / "home.php",
-                theme_dir / "functions.php",
-            ]
-
-            # Also check partials directory
-            partials_dir = theme_dir / "partials"
-            if partials_dir.exists():
-                template_files.extend(list(partials_dir.rglob("*.php")))
-
-            # Scan template files for get_template_part calls
-            for template_file in template_files:
-                if template_file.exists():
-                    partial_paths.extend(
-                        find_template_parts_in_file(str(template_file), map_imports, oem_handler)
-                    )
+            # Look for get_template_part calls in front-page.php, other template
+            # files and the partials directory
+            if index is None:
+                index = ThemeMapIndex(theme_dir)
+            partial_paths.extend(index.find_template_parts(oem_handler))
 
         # Include any extra partials provided (from shortcodes or pre-scanned)
         if extra_partials:
@@ -1158,148 +1408,159 @@ def find_template_parts_in_file(
         path_template = Path(template_file)
         raw_content = path_template.read_text(encoding="utf-8", errors="ignore")
         content = remove_php_comments(raw_content)
+        return _extract_template_parts(content, template_file, oem_handler)
 
-        partial_paths = []
+    except Exception as e:
+        logger.warning(f"Error scanning template file {template_file}: {e}")
+        return []
 
-        # Determine patterns to search for
-        from sbm.oem.default import DefaultHandler
 
-        is_oem = oem_handler and not isinstance(oem_handler, DefaultHandler)
+def _template_part_patterns(oem_handler: Optional[object] = None) -> List[str]:
+    """Return the get_template_part path patterns for the handler (OEM-specific or generic)."""
+    from sbm.oem.default import DefaultHandler
 
-        if is_oem and hasattr(oem_handler, "get_map_partial_patterns"):
-            search_patterns = oem_handler.get_map_partial_patterns()
-        else:
-            keyword_list = "|".join([re.escape(k) for k in MAP_KEYWORDS])
-            search_patterns = [f"[^'\"]*\\b(?:{keyword_list})[^'\"]*"]
-
-        # Guard: the 'directions' keyword can falsely match 'directionsForms/formDirections'
-        # because \b at the start of a captured group fires when the first char is a word char.
-        # Reject any match where the captured path segment starts with 'directions' followed
-        # immediately by a letter (i.e. it's a compound word like 'directionsForms', not a
-        # standalone path segment like 'dealer-groups/crown/directions').
-        _directions_false_positive = re.compile(r"(?i)^/?directions[a-zA-Z]")
-
-        for pattern in search_patterns:
-            template_part_pattern = (
-                r"get_template_part\s*\(\s*['\"](?:/)?(?:partials/)?(" + pattern + r")['\"]"
-            )
-            matches = re.finditer(template_part_pattern, content, re.IGNORECASE)
+    is_oem = oem_handler and not isinstance(oem_handler, DefaultHandler)
 
-            for match in matches:
-                partial_path = match.group(1)
+    if is_oem and hasattr(oem_handler, "get_map_partial_patterns"):
+        return list(oem_handler.get_map_partial_patterns())
+    keyword_list = "|".join([re.escape(k) for k in MAP_KEYWORDS])
+    return [f"[^'\"]*\\b(?:{keyword_list})[^'\"]*"]
 
-                if _directions_false_positive.match(partial_path):
-                    logger.debug(
-                        f"Skipping false-positive keyword match for '{partial_path}' "
-                        f"in {Path(template_file).name} ('directions' prefix of compound word)"
-                    )
-                    continue
 
-                partial_info = {
-                    "template_file": template_file,
-                    "partial_path": partial_path,
-                    "source": "found_in_template",
-                }
+def _extract_template_parts(
+    content: str,
+    template_file: str,
+    oem_handler: Optional[object] = None,
+    search_patterns: Optional[List[str]] = None,
+) -> List[dict]:
+    """Extract map partial references from comment-stripped PHP ``content``."""
+    partial_paths = []
 
-                logger.info(
-                    f"Found map template part: {partial_path} in {Path(template_file).name}"
-                )
-                partial_paths.append(partial_info)
+    # Determine patterns to search for
+    if search_patterns is None:
+        search_patterns = _template_part_patterns(oem_handler)
+
+    # Guard: the 'directions' keyword can falsely match 'directionsForms/formDirections'
+    # because \b at the start of a captured group fires when the first char is a word char.
+    # Reject any match where the captured path segment starts with 'directions' followed
+    # immediately by a letter (i.e. it's a compound word like 'directionsForms', not a
+    # standalone path segment like 'dealer-groups/crown/directions').
+    _directions_false_positive = re.compile(r"(?i)^/?directions[a-zA-Z]")
+
+    for pattern in search_patterns:
+        template_part_pattern = (
+            r"get_template_part\s*\(\s*['\"](?:/)?(?:partials/)?(" + pattern + r")['\"]"
+        )
+        matches = re.finditer(template_part_pattern, content, re.IGNORECASE)
 
-        # Guarded location* support: only include if the resolved CommonTheme file
-        # under partials/dealer-groups contains map markers (mapbox/google map init).
-        generic_template_part_pattern = r"get_template_part\s*\(\s*['\"]([^'\"]+)['\"]"
-        for match in re.finditer(generic_template_part_pattern, content, re.IGNORECASE):
+        for match in matches:
             partial_path = match.group(1)
-            normalized = partial_path.lstrip("/").lower()
-            if "location" not in normalized:
-                continue
-            if not _is_location_map_partial(partial_path):
+
+            if _directions_false_positive.match(partial_path):
+                logger.debug(
+                    f"Skipping false-positive keyword match for '{partial_path}' "
+                    f"in {Path(template_file).name} ('directions' prefix of compound word)"
+                )
                 continue
 
             partial_info = {
                 "template_file": template_file,
                 "partial_path": partial_path,
-                "source": "found_in_location_map_template",
+                "source": "found_in_template",
             }
-            logger.info(
-                f"Found map-bearing location partial: {partial_path} in {Path(template_file).name}"
-            )
-            partial_paths.append(partial_info)
-
-        # Detect direct do_shortcode('[full-map]') usage in templates
-        shortcode_pattern = r"do_shortcode\s*\(\s*['\"]\s*\[([^\]\s]+)[^\]]*\]\s*['\"]\s*\)"
-        for match in re.finditer(shortcode_pattern, content, re.IGNORECASE):
-            shortcode_name = match.group(1).strip().lower()
-            if shortcode_name not in MAP_KEYWORDS:
-                continue
 
-            partial_info = {
-                "template_file": template_file,
-                "partial_path": f"shortcode:{shortcode_name}",
-                "source": "found_in_template_shortcode",
-                "shortcode": shortcode_name,
-            }
-            logger.info(
-                f"Found map shortcode usage: {shortcode_name} in {Path(template_file).name}"
-            )
+            logger.info(f"Found map template part: {partial_path} in {Path(template_file).name}")
             partial_paths.append(partial_info)
 
-        # Custom shortcode search is already covered by find_map_shortcodes_in_functions
-        # and search_patterns above. Removing redundant keyword-only search.
+    # Guarded location* support: only include if the resolved CommonTheme file
+    # under partials/dealer-groups contains map markers (mapbox/google map init).
+    generic_template_part_pattern = r"get_template_part\s*\(\s*['\"]([^'\"]+)['\"]"
+    for match in re.finditer(generic_template_part_pattern, content, re.IGNORECASE):
+        partial_path = match.group(1)
+        normalized = partial_path.lstrip("/").lower()
+        if "location" not in normalized:
+            continue
+        if not _is_location_map_partial(partial_path):
+            continue
 
-        # Pattern: function xyz_map() { ... get_template_part('...directions...') ... }
-        # More flexible pattern: Use non-greedy match .*? instead of [^}]* to allow nested blocks
-        shortcode_function_pattern = (
-            r"function\s+(\w*(?:mapsection|maprow|mapbox|getdirections)\w*)\s*"
-            r"\([^)]*\)\s*\{.*?get_template_part\s*\(\s*['\"]"
-            r"([^'\"]*(?:directions|getdirections|mapsection)[^'\"]*)['\"]"
+        partial_info = {
+            "template_file": template_file,
+            "partial_path": partial_path,
+            "source": "found_in_location_map_template",
+        }
+        logger.info(
+            f"Found map-bearing location partial: {partial_path} in {Path(template_file).name}"
         )
-        matches = re.finditer(shortcode_function_pattern, content, re.IGNORECASE | re.DOTALL)
+        partial_paths.append(partial_info)
 
-        for match in matches:
-            function_name = match.group(1)
-            partial_path = match.group(2)
+    # Detect direct do_shortcode('[full-map]') usage in templates
+    shortcode_pattern = r"do_shortcode\s*\(\s*['\"]\s*\[([^\]\s]+)[^\]]*\]\s*['\"]\s*\)"
+    for match in re.finditer(shortcode_pattern, content, re.IGNORECASE):
+        shortcode_name = match.group(1).strip().lower()
+        if shortcode_name not in _MAP_KEYWORD_SET:
+            continue
 
-            partial_info = {
-                "template_file": template_file,
-                "partial_path": partial_path,
-                "source": "found_in_shortcode_function",
-                "function_name": function_name,
-            }
+        partial_info = {
+            "template_file": template_file,
+            "partial_path": f"shortcode:{shortcode_name}",
+            "source": "found_in_template_shortcode",
+            "shortcode": shortcode_name,
+        }
+        logger.info(f"Found map shortcode usage: {shortcode_name} in {Path(template_file).name}")
+        partial_paths.append(partial_info)
 
-            logger.info(
-                f"Found map shortcode function: {function_name}() calling {partial_path} in {Path(template_file).name}"
-            )
-            partial_paths.append(partial_info)
+    # Custom shortcode search is already covered by find_map_shortcodes_in_functions
+    # and search_patterns above. Removing redundant keyword-only search.
+
+    # Pattern: function xyz_map() { ... get_template_part('...directions...') ... }
+    # More flexible pattern: Use non-greedy match .*? instead of [^}]* to allow nested blocks
+    shortcode_function_pattern = (
+        r"function\s+(\w*(?:mapsection|maprow|mapbox|getdirections)\w*)\s*"
+        r"\([^)]*\)\s*\{.*?get_template_part\s*\(\s*['\"]"
+        r"([^'\"]*(?:directions|getdirections|mapsection)[^'\"]*)['\"]"
+    )
+    matches = re.finditer(shortcode_function_pattern, content, re.IGNORECASE | re.DOTALL)
+
+    for match in matches:
+        function_name = match.group(1)
+        partial_path = match.group(2)
+
+        partial_info = {
+            "template_file": template_file,
+            "partial_path": partial_path,
+            "source": "found_in_shortcode_function",
+            "function_name": function_name,
+        }
 
-        # 4. Specifically look for homecontent-getdirections pattern with word boundaries
-        homecontent_pattern = (
-            r"get_template_part\s*\(\s*['\"]([^'\"]*\bhomecontent[^'\"]*directions\b[^'\"]*)['\"]"
+        logger.info(
+            f"Found map shortcode function: {function_name}() calling {partial_path} in {Path(template_file).name}"
         )
-        matches = re.finditer(homecontent_pattern, content, re.IGNORECASE)
+        partial_paths.append(partial_info)
 
-        for match in matches:
-            partial_path = match.group(1)
+    # 4. Specifically look for homecontent-getdirections pattern with word boundaries
+    homecontent_pattern = (
+        r"get_template_part\s*\(\s*['\"]([^'\"]*\bhomecontent[^'\"]*directions\b[^'\"]*)['\"]"
+    )
+    matches = re.finditer(homecontent_pattern, content, re.IGNORECASE)
 
-            partial_info = {
-                "template_file": template_file,
-                "partial_path": partial_path,
-                "source": "found_homecontent_directions",
-            }
+    for match in matches:
+        partial_path = match.group(1)
 
-            logger.info(
-                f"Found homecontent-getdirections partial: {partial_path} in {Path(template_file).name}"
-            )
-            partial_paths.append(partial_info)
+        partial_info = {
+            "template_file": template_file,
+            "partial_path": partial_path,
+            "source": "found_homecontent_directions",
+        }
 
-        return partial_paths
+        logger.info(
+            f"Found homecontent-getdirections partial: {partial_path} in {Path(template_file).name}"
+        )
+        partial_paths.append(partial_info)
 
-    except Exception as e:
-        logger.warning(f"Error scanning template file {template_file}: {e}")
-        return []
+    return partial_paths
 
 
+@traced("maps.guess_partial_paths_from_scss", category="maps")
 def guess_partial_paths_from_scss(map_imports: List[dict]) -> List[dict]:
     """
     Guess partial paths based on SCSS import paths when not found in templates.
@@ -1381,10 +1642,21 @@ def copy_partial_to_dealer_theme(slug: str, partial_info: dict, interactive: boo
             path_parts = Path(commontheme_partial_path)
             directory = Path(COMMON_THEME_DIR) / path_parts.parent
             keyword = path_parts.name
-
-            if directory.exists():
+            rel_dir = path_parts.parent.as_posix()
+            catalog = get_commontheme_catalog(COMMON_THEME_DIR)
+
+            if catalog.covers(rel_dir):
+                matches = [
+                    directory / name
+                    for name in sorted(catalog.listdir(rel_dir))
+                    if name.endswith(".php") and keyword in name[:-4] and not name.startswith(".")
+                ]
+            elif directory.exists():
                 matches = list(directory.glob(f"*{keyword}*.php"))
+            else:
+                matches = []
 
+            if matches:
                 if len(matches) == 1:
                     commontheme_source = matches[0]
                     logger.info(
@@ -1457,6 +1729,7 @@ def copy_partial_to_dealer_theme(slug: str, partial_info: dict, interactive: boo
         return False
 
 
+@traced("maps.find_similar_partials", category="maps")
 def find_similar_partials(partial_path: str) -> List[str]:
     """
     Find similar partial files in CommonTheme when exact match is not found.
@@ -1471,20 +1744,21 @@ def find_similar_partials(partial_path: str) -> List[str]:
         # Extract key components from the path
         path_parts = partial_path.split("/")
         search_terms = [part for part in path_parts if "map" in part.lower() or len(part) > 3]
+        term_matcher = KeywordMatcher(search_terms)
 
         # Search in CommonTheme partials directory
-        search_base = Path(COMMON_THEME_DIR) / "partials"
-        if not search_base.exists():
+        catalog = get_commontheme_catalog(COMMON_THEME_DIR)
+        if not catalog.is_dir("partials"):
             return []
 
         similar_files = []
 
-        # Walk through CommonTheme partials using rglob
-        for php_file in search_base.rglob("*.php"):
-            relative_path = str(php_file.relative_to(search_base))
+        # Walk through the indexed CommonTheme partials
+        for rel_path in catalog.files_under("partials", suffix=".php"):
+            relative_path = rel_path[len("partials/") :]
 
             # Check if any search terms match
-            if any(term.lower() in relative_path.lower() for term in search_terms):
+            if term_matcher.search(relative_path):
                 similar_files.append(relative_path.replace(".php", ""))
 
         return similar_files[:5]  # Return top 5 matches
@@ -22,16 +22,17 @@ from rich.prompt import Confirm
 
 from sbm.oem.factory import OEMFactory
 from sbm.oem.stellantis import StellantisHandler
-from sbm.scss.processor import SCSSProcessor
+from sbm.scss.processor import SOURCE_SCSS_FILES, SCSSProcessor
 from sbm.ui.console import get_console
 from sbm.utils.command import execute_command, execute_interactive_command
 from sbm.utils.logger import logger
 from sbm.utils.path import get_common_theme_path, get_dealer_theme_dir, get_platform_dir
+from sbm.utils.source_files import read_text
 from sbm.utils.timer import timer_segment
 
 from .git import commit_changes, git_operations, push_changes
 from .git import create_pr as git_create_pr
-from .maps import migrate_map_components
+from .maps import ThemeSourceSet, migrate_map_components
 
 if TYPE_CHECKING:
     from sbm.ui.console import SBMConsole
@@ -471,10 +472,21 @@ def create_sb_files(slug: str, force_reset: bool = False) -> bool:
 
 
 def migrate_styles(
-    slug: str, processor: Optional[SCSSProcessor] = None
+    slug: str,
+    processor: Optional[SCSSProcessor] = None,
+    streaming: bool = False,
+    sources: Optional[ThemeSourceSet] = None,
 ) -> tuple[bool, int, int, int]:
     """Process SCSS files and return migration metrics.
 
+    Sources are read through ``sources`` (a new ``ThemeSourceSet`` if not
+    given), so later steps of the same migration reuse them. With
+    ``streaming=True`` every Site Builder file is instead transformed in
+    bounded-memory streaming mode straight from disk (see
+    ``SCSSProcessor.stream_scss_files``). Streaming is never switched on
+    automatically: its output can differ from the in-memory transform in
+    blank lines, and the generated files must not depend on source size.
+
     Returns:
         tuple: (success, lines_migrated, files_created_count, scss_line_count)
             - success: True if migration was successful
@@ -496,55 +508,54 @@ def migrate_styles(
         if processor is None:
             processor = SCSSProcessor(slug, exclude_nav_styles=True)
 
-        # Define source files for sb-inside
-        inside_sources = [
-            source_scss_dir / "style.scss",
-            source_scss_dir / "inside.scss",
-            source_scss_dir / "_support-requests.scss",
-        ]
-        # Only use lvdp.scss and lvrp.scss, not vdp.scss and vrp.scss
-        vdp_sources = [source_scss_dir / "lvdp.scss"]
-        vrp_sources = [source_scss_dir / "lvrp.scss"]
+        sources = sources or ThemeSourceSet(theme_dir)
+        target_files = {
+            target: [source_scss_dir / name for name in names if (source_scss_dir / name).exists()]
+            for target, names in SOURCE_SCSS_FILES.items()
+        }
+        streamed = set(target_files) if streaming else set()
 
-        # Count source SCSS lines before processing
+        # Load and count source SCSS lines before processing (streamed files count as they go)
         total_source_lines = 0
-        all_sources = inside_sources + vdp_sources + vrp_sources
-        for source_file in all_sources:
-            if source_file.exists():
-                try:
-                    content = source_file.read_text(encoding="utf-8", errors="ignore")
-                    total_source_lines += len(content.splitlines())
-                except Exception:
-                    pass  # Ignore read errors for line counting
-
-        # Process each category
-        inside_content = "\n".join(
-            [processor.process_scss_file(str(f)) for f in inside_sources if f.exists()]
-        )
-        vdp_content = "\n".join(
-            [processor.process_scss_file(str(f)) for f in vdp_sources if f.exists()]
-        )
-        vrp_content = "\n".join(
-            [processor.process_scss_file(str(f)) for f in vrp_sources if f.exists()]
-        )
+        loaded = {}
+        for target, files in target_files.items():
+            if target in streamed:
+                continue
+            loaded[target] = [s for s in (sources.css(f.name) for f in files) if s is not None]
+            total_source_lines += sum(source.line_count for source in loaded[target])
 
-        # Combine results
+        # Process each category and combine results
+        # Invalid UTF-8 is left for process_scss_file to re-read strictly, so the
+        # transform fails instead of running on text with bytes dropped
         results = {
-            "sb-inside.scss": inside_content,
-            "sb-vdp.scss": vdp_content,
-            "sb-vrp.scss": vrp_content,
+            target: "\n".join(
+                processor.process_scss_file(
+                    str(source.path), content=source.text if source.valid_utf8 else None
+                )
+                for source in target_sources
+            )
+            for target, target_sources in loaded.items()
         }
 
         # Write the resulting SCSS to files
         success = processor.write_files_atomically(str(theme_dir), results)
 
         if success:
+            line_counts = {
+                filename: len(content.splitlines()) for filename, content in results.items()
+            }
+            for target in streamed:
+                source_lines, output_lines = processor.stream_scss_files(
+                    [str(f) for f in target_files[target]], str(theme_dir / target)
+                )
+                total_source_lines += source_lines
+                line_counts[target] = output_lines
+
             generated_files = []
             total_lines_processed = 0
             files_with_content = 0
-            for filename, content in results.items():
-                if content:
-                    lines = len(content.splitlines())
+            for filename, lines in line_counts.items():
+                if lines:
                     total_lines_processed += lines
                     files_with_content += 1
                     generated_files.append(f"{filename} ({lines} lines)")
@@ -667,7 +678,10 @@ def _add_map_styles(theme_path: Path, oem_handler: object | None, slug: str) ->
 
 
 def _add_oem_predetermined_inside_styles(
-    theme_path: Path, oem_handler: object | None, slug: str
+    theme_path: Path,
+    oem_handler: object | None,
+    slug: str,
+    sources: ThemeSourceSet | None = None,
 ) -> bool:
     """Append OEM-configured CommonTheme styles into sb-inside.scss based on source indicators."""
     if not oem_handler or not hasattr(oem_handler, "get_predetermined_inside_style_configs"):
@@ -692,8 +706,8 @@ def _add_oem_predetermined_inside_styles(
         return False
 
     processor = SCSSProcessor(slug, exclude_nav_styles=True)
-    sb_inside_content = inside_path.read_text(encoding="utf-8", errors="ignore")
-    source_css_dir = theme_path / "css"
+    sb_inside_content = read_text(inside_path)
+    sources = sources or ThemeSourceSet(theme_path)
     success = True
 
     for cfg in configs:
@@ -715,12 +729,11 @@ def _add_oem_predetermined_inside_styles(
 
         indicator_matched = False
         for source_name in indicator_sources:
-            source_indicator_path = source_css_dir / source_name
-            if not source_indicator_path.exists():
+            source = sources.css(source_name)
+            if source is None:
                 continue
 
-            source_text = source_indicator_path.read_text(encoding="utf-8", errors="ignore")
-            if any(re.search(pattern, source_text) for pattern in indicator_patterns):
+            if any(re.search(pattern, source.text) for pattern in indicator_patterns):
                 indicator_matched = True
                 break
 
@@ -760,13 +773,18 @@ def _add_oem_predetermined_inside_styles(
     return success
 
 
-def add_predetermined_styles(slug: str, oem_handler: dict | object | None = None) -> bool:
+def add_predetermined_styles(
+    slug: str,
+    oem_handler: dict | object | None = None,
+    sources: ThemeSourceSet | None = None,
+) -> bool:
     """
     Add predetermined styles for cookie disclaimer and directions row.
 
     Args:
         slug: Dealer theme slug
         oem_handler: OEM handler for the dealer
+        sources: Optional theme source set shared with the rest of the migration
     """
     logger.info(f"Adding predetermined styles for {slug}")
     theme_path = Path(get_dealer_theme_dir(slug))
@@ -782,7 +800,7 @@ def add_predetermined_styles(slug: str, oem_handler: dict | object | None = None
         success = False
     if not _add_map_styles(theme_path, oem_handler, slug):
         success = False
-    if not _add_oem_predetermined_inside_styles(theme_path, oem_handler, slug):
+    if not _add_oem_predetermined_inside_styles(theme_path, oem_handler, slug, sources):
         success = False
     return success
 
@@ -1063,11 +1081,15 @@ def _perform_core_migration(
 
     console.print_step("Migrating SCSS styles and transforming syntax")
     processor = SCSSProcessor(slug, exclude_nav_styles=True)
+    # Every step below reads the theme's css/ sources through this one set
+    sources = ThemeSourceSet(get_dealer_theme_dir(slug))
     lines_migrated = 0
     files_created_count = 0
     scss_line_count = 0
     with timer_segment("SCSS Migration"):
-        success, lines, files_count, source_lines = migrate_styles(slug, processor=processor)
+        success, lines, files_count, source_lines = migrate_styles(
+            slug, processor=processor, sources=sources
+        )
         if not success:
             return False, 0, 0, 0
         lines_migrated = lines
@@ -1076,13 +1098,18 @@ def _perform_core_migration(
 
     _cleanup_exclusion_comments(slug)
     console.print_step("Adding predetermined OEM-specific styles")
-    add_predetermined_styles(slug, oem_handler)
+    add_predetermined_styles(slug, oem_handler, sources=sources)
 
     if not skip_maps:
         console.print_step("Migrating map components")
         # Pass the same processor to map components migration to ensure consistent variable transformation
         if not migrate_map_components(
-            slug, oem_handler, interactive=False, console=console, processor=processor
+            slug,
+            oem_handler,
+            interactive=False,
+            console=console,
+            processor=processor,
+            sources=sources,
         ):
             return False, 0, 0, 0
 
@@ -8,11 +8,13 @@ import os
 import re
 import subprocess
 import tempfile
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sbm.utils.helpers import darken_hex, lighten_hex
 from sbm.utils.logger import logger
 from sbm.utils.path import get_common_theme_path, get_dealer_theme_dir
+from sbm.utils.source_files import read_text
+from sbm.utils.tracing import annotate, span, traced
 
 from .classifiers import ProfessionalStyleClassifier, StyleClassifier, robust_css_processing
 from .mixin_parser import CommonThemeMixinParser
@@ -77,6 +79,95 @@ GROUP_MAPPINGS = {
     ],
 }
 
+# Dealer theme css/ sources combined (in order) into each Site Builder file
+SOURCE_SCSS_FILES = {
+    "sb-inside.scss": ("style.scss", "inside.scss", "_support-requests.scss"),
+    # Only lvdp.scss and lvrp.scss, not vdp.scss and vrp.scss
+    "sb-vdp.scss": ("lvdp.scss",),
+    "sb-vrp.scss": ("lvrp.scss",),
+}
+
+# In streaming mode, top-level statements are batched into chunks of about this
+# many characters; a single block larger than this still goes through whole
+STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def _scan_scss_line(
+    line: str, depth: int, parens: int, in_comment: bool
+) -> Tuple[int, int, bool, str]:
+    """
+    Track brace/paren depth across one line, ignoring comments and strings.
+
+    Returns the updated ``(depth, parens, in_comment)`` and the last significant
+    character of the line (empty if the line holds no code).
+    """
+    last = ""
+    quote = ""
+    i = 0
+    n = len(line)
+    while i < n:
+        char = line[i]
+        i += 1
+        if in_comment:
+            if char == "*" and line.startswith("/", i):
+                in_comment = False
+                i += 1
+            continue
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = ""
+            continue
+        if char == "/" and line.startswith("*", i):
+            in_comment = True
+            i += 1
+            continue
+        if char == "/" and line.startswith("/", i) and not line[: i - 1].endswith(":"):
+            # Line comment (but not the scheme separator in url(http://...))
+            break
+        if char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth = max(depth - 1, 0)
+        elif char == "(":
+            parens += 1
+        elif char == ")":
+            parens = max(parens - 1, 0)
+        if not char.isspace():
+            last = char
+    return depth, parens, in_comment, last
+
+
+def iter_top_level_blocks(lines: Iterable[str], chunk_chars: Optional[int] = None) -> Iterator[str]:
+    """
+    Group SCSS source lines into chunks of complete top-level statements.
+
+    A chunk only ends after a top-level ``}`` or ``;`` outside any comment or
+    parenthesised map, so every rule block, @mixin definition and variable map
+    reaches the pipeline whole. Comments attach to the statement that follows
+    them. Chunks are closed once they reach ``chunk_chars`` characters, so at
+    most one chunk (or the largest single block) is held in memory at a time.
+    """
+    if chunk_chars is None:
+        chunk_chars = STREAM_CHUNK_CHARS
+    buffer: List[str] = []
+    size = 0
+    depth = parens = 0
+    in_comment = False
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        depth, parens, in_comment, last = _scan_scss_line(line, depth, parens, in_comment)
+        if size >= chunk_chars and last in ("}", ";") and not (depth or parens or in_comment):
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
 
 class SCSSProcessor:
     """
@@ -106,6 +197,7 @@ class SCSSProcessor:
                 logger.warning(f"Using fallback style classifier (professional parser failed: {e})")
                 logger.info("Style exclusion enabled for header/footer/navigation components")
 
+    @traced("scss.variables", category="scss")
     def _process_scss_variables(self, content: str) -> str:
         """
         Processes SCSS variables by converting usages to CSS custom properties.
@@ -204,6 +296,7 @@ class SCSSProcessor:
 
         return "\n".join(lines)
 
+    @traced("scss.trim_whitespace", category="scss")
     def _trim_whitespace(self, content: str) -> str:
         """
         Removes excess whitespace and blank lines from the final output.
@@ -214,6 +307,7 @@ class SCSSProcessor:
         # Remove leading/trailing whitespace
         return content.strip()
 
+    @traced("scss.clean_comments", category="scss")
     def _clean_comment_blocks(self, content: str) -> str:
         """
         Remove large comment blocks and section dividers that clutter PR diffs.
@@ -260,6 +354,7 @@ class SCSSProcessor:
             return True, None
         return False, f"Mismatched braces: {opening_braces} opening, {closing_braces} closing"
 
+    @traced("scss.image_paths", category="scss")
     def _convert_image_paths(self, content: str) -> str:
         """
         Converts relative image paths to absolute Site Builder paths for both DealerTheme and CommonTheme,
@@ -335,6 +430,7 @@ class SCSSProcessor:
 
         return content
 
+    @traced("scss.remove_imports", category="scss")
     def _remove_imports(self, content: str) -> str:
         """
         Removes all @import statements from SCSS content.
@@ -368,6 +464,7 @@ class SCSSProcessor:
             flags=re.MULTILINE,
         )
 
+    @traced("scss.fix_commented_selectors", category="scss")
     def _fix_commented_selector_blocks(self, content: str) -> str:
         """
         Restore selector lines that are commented but followed by live declarations.
@@ -403,6 +500,7 @@ class SCSSProcessor:
 
         return "".join(lines)
 
+    @traced("scss.functions", category="scss")
     def _convert_scss_functions(self, content: str) -> str:
         """
         Convert SCSS functions to CSS-compatible equivalents.
@@ -599,11 +697,13 @@ class SCSSProcessor:
         logger.info("Fallback validation passed")
         return True
 
+    @traced("scss.transform", category="scss")
     def transform_scss_content(self, content: str) -> str:
         """
         Performs transformations on SCSS content.
         """
         logger.debug(f"Performing SCSS transformation for {self.slug}...")
+        annotate(slug=self.slug, bytes=len(content))
 
         try:
             # Step 0: Utility functions removed - Site Builder has its own utilities
@@ -613,13 +713,17 @@ class SCSSProcessor:
                     "Filtering header/footer/navigation styles for Site Builder compatibility..."
                 )
 
-                try:
-                    # Try the configured classifier first
-                    content, exclusion_result = self.style_classifier.filter_scss_content(content)
-                except Exception as e:
-                    logger.warning(f"Style classifier failed: {e}, using robust processing")
-                    # Use robust processing as ultimate fallback
-                    content, exclusion_result = robust_css_processing(content)
+                with span("scss.exclude_nav_styles", category="scss") as exclusion_span:
+                    try:
+                        # Try the configured classifier first
+                        content, exclusion_result = self.style_classifier.filter_scss_content(
+                            content
+                        )
+                    except Exception as e:
+                        logger.warning(f"Style classifier failed: {e}, using robust processing")
+                        # Use robust processing as ultimate fallback
+                        content, exclusion_result = robust_css_processing(content)
+                    exclusion_span.set(excluded_rules=exclusion_result.excluded_count)
 
                 if exclusion_result.excluded_count > 0:
                     categories = []
@@ -642,7 +746,12 @@ class SCSSProcessor:
 
             # Step 3: Convert all @include mixins using the intelligent parser
             logger.debug("Converting mixins to CSS...")
-            content, errors, unconverted = self.mixin_parser.parse_and_convert_mixins(content)
+            with span("scss.mixins", category="scss") as mixin_span:
+                content, errors, unconverted = self.mixin_parser.parse_and_convert_mixins(content)
+                mixin_span.set(
+                    converted_mixins=len(self.mixin_parser.converted_mixins),
+                    unconverted_mixins=len(unconverted),
+                )
             if errors:
                 logger.warning(f"Encountered {len(errors)} errors during mixin conversion.")
                 for error in errors:
@@ -671,18 +780,72 @@ class SCSSProcessor:
             )
             return f"/* SBM: UNEXPECTED ERROR. CHECK LOGS. ERROR: {e} */\n{content}"
 
-    def process_scss_file(self, file_path: str) -> str:
+    def process_scss_file(self, file_path: str, content: Optional[str] = None) -> str:
         """
-        Reads an SCSS file and applies transformations.
+        Reads an SCSS file (unless its ``content`` was already read) and applies transformations.
         """
-        if not os.path.exists(file_path):
+        if content is None and not os.path.exists(file_path):
             logger.warning(f"File not found, skipping: {file_path}")
             return ""
 
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+        with span("scss.file", category="scss", slug=self.slug, file=file_path):
+            if content is None:
+                content = read_text(file_path, errors="strict")
+            annotate(bytes=len(content))
+
+            return self.transform_scss_content(content)
+
+    def stream_scss_files(
+        self, file_paths: Iterable[str], target_path: str, chunk_chars: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Transform SCSS sources chunk by chunk, writing the result to ``target_path``.
 
-        return self.transform_scss_content(content)
+        This is the bounded-memory counterpart of ``process_scss_file`` plus
+        ``write_files_atomically``: sources are read line by line, each chunk
+        from ``iter_top_level_blocks`` is transformed on its own and appended to
+        a temporary file that replaces the target once complete. Nothing is
+        written when the output is empty, matching ``write_files_atomically``.
+
+        Comment cleanup and whitespace trimming run per chunk and chunks are
+        joined with a newline, so the result can differ from the in-memory
+        transform in blank lines. Callers opt in explicitly.
+
+        Returns:
+            tuple: (source_lines, output_lines)
+        """
+        source_lines = 0
+        output_lines = 0
+        chunks = 0
+        tmp_path = f"{target_path}.{os.getpid()}.tmp"
+        with span("scss.stream", category="scss", slug=self.slug, file=target_path) as stream_span:
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as out:
+                    for file_path in file_paths:
+                        if not os.path.exists(file_path):
+                            logger.warning(f"File not found, skipping: {file_path}")
+                            continue
+                        with open(file_path, encoding="utf-8") as source:
+                            for chunk in iter_top_level_blocks(source, chunk_chars):
+                                source_lines += chunk.count("\n") + (not chunk.endswith("\n"))
+                                transformed = self.transform_scss_content(chunk)
+                                chunks += 1
+                                if not transformed:
+                                    continue
+                                if output_lines:
+                                    out.write("\n")
+                                out.write(transformed)
+                                output_lines += transformed.count("\n") + 1
+                if output_lines:
+                    os.replace(tmp_path, target_path)
+                    logger.info(f"Successfully wrote {target_path}")
+                else:
+                    logger.info(f"Skipping empty file: {os.path.basename(target_path)}")
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            stream_span.set(chunks=chunks, source_lines=source_lines, output_lines=output_lines)
+        return source_lines, output_lines
 
     def light_cleanup_scss_content(self, content: str) -> str:
         """
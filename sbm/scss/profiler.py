@@ -0,0 +1,229 @@
+"""
+Per-rule profiler for the SCSS transformation pipeline.
+
+``SCSSProfiler`` instruments one ``SCSSProcessor`` (its pipeline steps) and the
+``MIXIN_TRANSFORMATIONS`` handlers while ``transform_scss_content`` runs, and
+records wall time, call count, input/output bytes and match count per rule.
+Nothing is written to the theme; ``profile_theme`` only reads the sources.
+
+Matches mean:
+    step ``exclude_nav_styles``: rules excluded
+    step ``mixins``: mixin calls converted
+    other steps: source lines the step rewrote or removed
+    mixin handlers: calls handled
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from sbm.utils.path import get_dealer_theme_dir
+from sbm.utils.source_files import read_text
+
+from .mixin_parser import MIXIN_TRANSFORMATIONS
+from .processor import SOURCE_SCSS_FILES, SCSSProcessor
+
+# SCSSProcessor methods called by transform_scss_content, in pipeline order
+PIPELINE_STEPS = (
+    ("variables", "_process_scss_variables"),
+    ("image_paths", "_convert_image_paths"),
+    ("functions", "_convert_scss_functions"),
+    ("remove_imports", "_remove_imports"),
+    ("fix_commented_selectors", "_fix_commented_selector_blocks"),
+    ("clean_comments", "_clean_comment_blocks"),
+    ("trim_whitespace", "_trim_whitespace"),
+)
+
+# Columns ``ProfileReport.sorted_rules`` can sort by
+SORT_KEYS = ("seconds", "calls", "bytes_in", "bytes_out", "matches", "name")
+
+
+@dataclass
+class RuleStats:
+    """Accumulated cost of one pipeline step or mixin handler."""
+
+    name: str
+    kind: str
+    calls: int = 0
+    seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    matches: int = 0
+
+
+@dataclass
+class ProfileReport:
+    """Result of profiling a theme's SCSS sources."""
+
+    slug: str
+    files: list[dict] = field(default_factory=list)
+    total_seconds: float = 0.0
+    rules: dict[str, RuleStats] = field(default_factory=dict)
+
+    def sorted_rules(self, key: str = "seconds") -> list[RuleStats]:
+        if key not in SORT_KEYS:
+            msg = f"Unknown sort key {key!r}; expected one of {', '.join(SORT_KEYS)}"
+            raise ValueError(msg)
+        return sorted(
+            self.rules.values(),
+            key=lambda rule: getattr(rule, key),
+            reverse=key != "name",
+        )
+
+    def to_dict(self, sort: str = "seconds") -> dict:
+        return {
+            "slug": self.slug,
+            "files": self.files,
+            "total_seconds": self.total_seconds,
+            "rules": [asdict(rule) for rule in self.sorted_rules(sort)],
+        }
+
+
+def _changed_lines(before: str, after: str) -> int:
+    """Number of lines in ``before`` that are missing from ``after``."""
+    return sum((Counter(before.splitlines()) - Counter(after.splitlines())).values())
+
+
+class SCSSProfiler:
+    """
+    Collects per-rule statistics for one processor.
+
+    Args:
+        processor: Processor whose pipeline is instrumented.
+    """
+
+    def __init__(self, processor: SCSSProcessor) -> None:
+        self.processor = processor
+        self.rules: dict[str, RuleStats] = {}
+
+    def _record(
+        self,
+        name: str,
+        kind: str,
+        seconds: float,
+        bytes_in: int,
+        bytes_out: int,
+        matches: int,
+    ) -> None:
+        rule = self.rules.get(name)
+        if rule is None:
+            rule = self.rules[name] = RuleStats(name=name, kind=kind)
+        rule.calls += 1
+        rule.seconds += seconds
+        rule.bytes_in += bytes_in
+        rule.bytes_out += bytes_out
+        rule.matches += matches
+
+    def _wrap_step(self, name: str, method: Callable[[str], Any]) -> Callable[[str], Any]:
+        def step(content: str) -> Any:
+            start = time.perf_counter()
+            result = method(content)
+            seconds = time.perf_counter() - start
+
+            output = result[0] if isinstance(result, tuple) else result
+            if name == "exclude_nav_styles":
+                matches = result[1].excluded_count
+            elif name == "mixins":
+                matches = len(self.processor.mixin_parser.converted_mixins)
+            else:
+                matches = _changed_lines(content, output)
+            self._record(f"step:{name}", "step", seconds, len(content), len(output or ""), matches)
+            return result
+
+        return step
+
+    def _wrap_handler(self, mixin_name: str, handler: Callable[..., str]) -> Callable[..., str]:
+        def wrapped(name: str, args: list, content: str) -> str:
+            start = time.perf_counter()
+            replacement = handler(name, args, content)
+            seconds = time.perf_counter() - start
+            bytes_in = len(content) + sum(len(arg) for arg in args)
+            self._record(
+                f"mixin:{mixin_name}", "mixin", seconds, bytes_in, len(replacement or ""), 1
+            )
+            return replacement
+
+        return wrapped
+
+    @contextmanager
+    def instrument(self) -> Iterator[SCSSProfiler]:
+        """Install the timing wrappers for the duration of the block."""
+        processor = self.processor
+        patched: list[tuple[object, str]] = []
+
+        def patch(owner: object, attr: str, name: str) -> None:
+            setattr(owner, attr, self._wrap_step(name, getattr(owner, attr)))
+            patched.append((owner, attr))
+
+        for name, attr in PIPELINE_STEPS:
+            patch(processor, attr, name)
+        patch(processor.mixin_parser, "parse_and_convert_mixins", "mixins")
+        if processor.exclude_nav_styles:
+            patch(processor.style_classifier, "filter_scss_content", "exclude_nav_styles")
+
+        handlers = dict(MIXIN_TRANSFORMATIONS)
+        for mixin_name, handler in handlers.items():
+            MIXIN_TRANSFORMATIONS[mixin_name] = self._wrap_handler(mixin_name, handler)
+        try:
+            yield self
+        finally:
+            MIXIN_TRANSFORMATIONS.update(handlers)
+            for owner, attr in patched:
+                # The wrappers are instance attributes shadowing the class methods
+                delattr(owner, attr)
+
+    def transform(self, content: str) -> str:
+        """Run ``transform_scss_content`` once with instrumentation."""
+        with self.instrument():
+            return self.processor.transform_scss_content(content)
+
+
+def theme_scss_sources(slug: str) -> list[Path]:
+    """Existing source files ``migrate_styles`` would process for ``slug``."""
+    css_dir = Path(get_dealer_theme_dir(slug)) / "css"
+    return [
+        css_dir / name
+        for names in SOURCE_SCSS_FILES.values()
+        for name in names
+        if (css_dir / name).is_file()
+    ]
+
+
+def profile_theme(
+    slug: str, repeat: int = 1, processor: SCSSProcessor | None = None
+) -> ProfileReport:
+    """
+    Profile the SCSS transformation of ``slug``'s sources without writing anything.
+
+    Args:
+        slug: Dealer theme slug.
+        repeat: Times to transform each file; statistics are summed over all runs.
+        processor: Processor to profile; a fresh one (nav exclusion on, as in a
+            migration) by default.
+
+    Raises:
+        UnicodeDecodeError: If a source is not valid UTF-8; the migration's
+            style step rejects such a file too.
+    """
+    if processor is None:
+        processor = SCSSProcessor(slug, exclude_nav_styles=True)
+    profiler = SCSSProfiler(processor)
+    report = ProfileReport(slug=slug)
+
+    for path in theme_scss_sources(slug):
+        content = read_text(path, errors="strict")
+        file_seconds = 0.0
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            profiler.transform(content)
+            file_seconds += time.perf_counter() - start
+        report.files.append({"path": str(path), "bytes": len(content), "seconds": file_seconds})
+        report.total_seconds += file_seconds
+
+    report.rules = profiler.rules
+    return report
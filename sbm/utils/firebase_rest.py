@@ -0,0 +1,224 @@
+"""
+Pooled HTTP client for the Firebase Realtime Database REST API.
+
+User Mode talks to Firebase over REST. Every call used to go through the
+module-level ``requests`` helpers, paying a fresh TCP/TLS handshake each time.
+This module keeps a single keep-alive ``requests.Session`` per process and wraps
+it in a small client that handles auth tokens, 401 refresh and transient retries.
+
+Usage:
+    from sbm.utils.firebase_sync import get_firebase_rest_client
+
+    client = get_firebase_rest_client()
+    resp = client.get("users")
+    if resp.ok:
+        users = resp.json()
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from .logger import logger
+from .tracing import span
+
+if TYPE_CHECKING:
+    import requests
+
+# HTTP statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Firebase REST writes (PUT/PATCH/DELETE) are idempotent, so all verbs we use can be retried
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_CAP = 8.0
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide pooled HTTP session.
+
+    The session keeps connections alive between requests and advertises gzip so
+    large ``/users`` downloads are compressed on the wire.
+    """
+    global _session
+
+    if _session is not None:
+        return _session
+
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+            _session = session
+    return _session
+
+
+def reset_http_session() -> None:
+    """Close and drop the shared session (used by tests and after fork)."""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            try:
+                _session.close()
+            except Exception as e:
+                logger.debug(f"Error closing HTTP session: {e}")
+        _session = None
+
+
+class FirebaseRestClient:
+    """
+    Firebase Realtime Database REST client on top of the shared session.
+
+    Args:
+        database_url: Base database URL, e.g. https://<project>-default-rtdb.firebaseio.com
+        namespace: Database name sent as ``?ns=`` (needed when talking to an emulator).
+        identity_provider: Returns (uid, id_token) or None when auth is unavailable.
+        invalidate_identity: Drops the cached id_token so the next identity call refreshes it.
+        session: Session to use; defaults to the shared pooled session.
+        max_retries: Retries for connection errors and retryable HTTP statuses.
+        backoff_base: Base delay in seconds for jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        identity_provider: Callable[[], tuple[str, str] | None] | None = None,
+        invalidate_identity: Callable[[], None] | None = None,
+        session: requests.Session | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        namespace: str | None = None,
+    ) -> None:
+        self.database_url = database_url.rstrip("/")
+        self.namespace = namespace
+        self._identity_provider = identity_provider
+        self._invalidate_identity = invalidate_identity
+        self._session = session
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session or get_http_session()
+
+    def identity(self) -> tuple[str, str] | None:
+        """Return the current (uid, id_token), or None if auth is unavailable."""
+        if self._identity_provider is None:
+            return None
+        return self._identity_provider()
+
+    def invalidate_identity(self) -> None:
+        """Drop the cached id_token so the next identity() call refreshes it."""
+        if self._invalidate_identity is not None:
+            self._invalidate_identity()
+
+    def url_for(self, path: str) -> str:
+        """Build the REST URL for a database path ("" addresses the root)."""
+        path = path.strip("/")
+        return f"{self.database_url}/{path}.json" if path else f"{self.database_url}/.json"
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        timeout: float = 10,
+        authenticated: bool = True,
+    ) -> requests.Response:
+        """
+        Send a request, refreshing the token once on 401 and retrying transient failures.
+
+        Returns:
+            The final response (callers check ``resp.ok``).
+
+        Raises:
+            requests.RequestException: If the connection still fails after all retries.
+        """
+        import requests
+
+        token = None
+        if authenticated:
+            identity = self.identity()
+            token = identity[1] if identity else None
+
+        refreshed = False
+        attempt = 0
+        while True:
+            params = {"ns": self.namespace} if self.namespace else {}
+            if token:
+                params["auth"] = token
+            try:
+                with span(
+                    f"firebase {method}", category="firebase", path=path, attempt=attempt
+                ) as request_span:
+                    resp = self.session.request(
+                        method,
+                        self.url_for(path),
+                        params=params or None,
+                        json=json_body,
+                        timeout=timeout,
+                    )
+                    request_span.set(status=resp.status_code)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.debug(f"Firebase REST {method} {path} failed ({e}); retrying")
+                self._sleep_before_retry(attempt)
+                attempt += 1
+                continue
+
+            if resp.status_code == 401 and token and not refreshed:
+                refreshed = True
+                if self._invalidate_identity is not None:
+                    self._invalidate_identity()
+                identity = self.identity()
+                new_token = identity[1] if identity else None
+                if new_token and new_token != token:
+                    logger.debug("Firebase REST token rejected; retrying with refreshed token")
+                    token = new_token
+                    continue
+                return resp
+
+            if resp.status_code in RETRYABLE_STATUSES and attempt < self.max_retries:
+                logger.debug(f"Firebase REST {method} {path} returned {resp.status_code}; retrying")
+                self._sleep_before_retry(attempt, resp.headers.get("Retry-After"))
+                attempt += 1
+                continue
+
+            return resp
+
+    def get(self, path: str, timeout: float = 10, authenticated: bool = True) -> requests.Response:
+        return self.request("GET", path, timeout=timeout, authenticated=authenticated)
+
+    def put(self, path: str, json_body: Any, timeout: float = 10) -> requests.Response:
+        return self.request("PUT", path, json_body=json_body, timeout=timeout)
+
+    def patch(self, path: str, json_body: Any, timeout: float = 10) -> requests.Response:
+        return self.request("PATCH", path, json_body=json_body, timeout=timeout)
+
+    def delete(self, path: str, timeout: float = 10) -> requests.Response:
+        return self.request("DELETE", path, timeout=timeout)
+
+    def _sleep_before_retry(self, attempt: int, retry_after: str | None = None) -> None:
+        """Full-jitter exponential backoff, honoring a numeric Retry-After header."""
+        delay = random.uniform(0, min(DEFAULT_BACKOFF_CAP, self.backoff_base * (2**attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, min(DEFAULT_BACKOFF_CAP, float(retry_after)))
+            except ValueError:
+                pass
+        time.sleep(delay)
@@ -14,27 +14,37 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 from sbm.config import get_settings
+from sbm.utils.firebase_rest import FirebaseRestClient, get_http_session
 from sbm.utils.logger import logger
 from sbm.utils.run_helpers import is_complete_run
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from firebase_admin import App
     from firebase_admin import db as firebase_db
 
+    # (run_path, flattened path -> value payload, per-item fallback writer)
+    _BulkItem = tuple[str, dict[str, Any], Callable[[], bool]]
+
 # Module-level state for lazy initialization
 _firebase_app: App | None = None
 _firebase_initialized: bool = False
 _firebase_user_mode: bool = False
 _initialization_lock = threading.Lock()
 _auth_lock = threading.Lock()
+_rest_client: FirebaseRestClient | None = None
 _auth_cache_path = Path.home() / ".sbm_firebase_auth.json"
 _user_auth_state = {
     "id_token": None,
@@ -44,6 +54,13 @@ _user_auth_state = {
     "api_key": None,
 }
 
+# Standard Firebase emulator variables ("host:port"); when set, User Mode talks to the emulators
+DATABASE_EMULATOR_ENV_VAR = "FIREBASE_DATABASE_EMULATOR_HOST"
+AUTH_EMULATOR_ENV_VAR = "FIREBASE_AUTH_EMULATOR_HOST"
+
+# Upper bound for one multi-location PATCH; keeps each write quick for the server to apply.
+BULK_UPDATE_MAX_BYTES = 256 * 1024
+
 
 class FirebaseInitializationError(Exception):
     """Raised when Firebase initialization fails."""
@@ -161,6 +178,13 @@ def _save_auth_cache(cache: dict) -> None:
         return
 
 
+def _auth_url(service: str, endpoint: str, api_key: str) -> str:
+    """Google auth endpoint URL, routed through the Auth emulator when one is configured."""
+    emulator_host = os.environ.get(AUTH_EMULATOR_ENV_VAR)
+    base = f"http://{emulator_host}/{service}" if emulator_host else f"https://{service}"
+    return f"{base}/v1/{endpoint}?key={api_key}"
+
+
 def _get_user_mode_identity() -> tuple[str, str] | None:
     """
     Return (uid, id_token) for user mode using anonymous auth.
@@ -193,10 +217,8 @@ def _get_user_mode_identity() -> tuple[str, str] | None:
             refresh_token = cache.get("refresh_token")
             if refresh_token:
                 try:
-                    import requests
-
-                    resp = requests.post(
-                        f"https://securetoken.googleapis.com/v1/token?key={api_key}",
+                    resp = get_http_session().post(
+                        _auth_url("securetoken.googleapis.com", "token", api_key),
                         data={"grant_type": "refresh_token", "refresh_token": refresh_token},
                         timeout=10,
                     )
@@ -223,10 +245,8 @@ def _get_user_mode_identity() -> tuple[str, str] | None:
                     logger.debug(f"Firebase token refresh failed: {e}")
 
         try:
-            import requests
-
-            resp = requests.post(
-                f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={api_key}",
+            resp = get_http_session().post(
+                _auth_url("identitytoolkit.googleapis.com", "accounts:signUp", api_key),
                 json={"returnSecureToken": True},
                 timeout=10,
             )
@@ -255,11 +275,52 @@ def _get_user_mode_identity() -> tuple[str, str] | None:
     return None
 
 
+def _invalidate_user_mode_token() -> None:
+    """Drop the cached id_token so the next identity lookup refreshes it."""
+    with _auth_lock:
+        _user_auth_state["id_token"] = None
+        _user_auth_state["expires_at"] = 0.0
+        cache = _load_auth_cache()
+        if cache.get("id_token"):
+            cache["id_token"] = None
+            cache["expires_at"] = 0.0
+            _save_auth_cache(cache)
+
+
 def get_user_mode_identity() -> tuple[str, str] | None:
     """Public accessor for user-mode auth identity."""
     return _get_user_mode_identity()
 
 
+def get_firebase_rest_client() -> FirebaseRestClient:
+    """
+    Return the shared REST client for User Mode.
+
+    The client reuses one pooled HTTP session and refreshes the anonymous auth
+    token automatically when Firebase answers 401. With
+    ``FIREBASE_DATABASE_EMULATOR_HOST`` set, requests go to that emulator and
+    name the configured database with ``?ns=``.
+    """
+    global _rest_client
+
+    database_url = str(get_settings().firebase.database_url).rstrip("/")
+    namespace = None
+    emulator_host = os.environ.get(DATABASE_EMULATOR_ENV_VAR)
+    if emulator_host:
+        namespace = (urlparse(database_url).hostname or "").split(".")[0] or None
+        database_url = f"http://{emulator_host}"
+    client = _rest_client
+    if client is None or (client.database_url, client.namespace) != (database_url, namespace):
+        client = FirebaseRestClient(
+            database_url,
+            identity_provider=_get_user_mode_identity,
+            invalidate_identity=_invalidate_user_mode_token,
+            namespace=namespace,
+        )
+        _rest_client = client
+    return client
+
+
 def is_firebase_available() -> bool:
     """
     Check if Firebase is available and properly configured.
@@ -346,31 +407,8 @@ class FirebaseSync:
         try:
             settings = get_settings()
 
-            # Remove internal fields
-            data_to_push = run_data.copy()
-            if "sync_status" in data_to_push:
-                del data_to_push["sync_status"]
-            if not data_to_push.get("user_id"):
-                data_to_push["user_id"] = user_id
-            if not data_to_push.get("pr_author"):
-                data_to_push["pr_author"] = user_id
-
-            # Generate readable key
-            slug = data_to_push.get("slug", "unknown")
-            timestamp = data_to_push.get("timestamp", datetime.now().isoformat())
-
-            # Clean timestamp for key
-            ts_clean = timestamp.strip()
-            if ts_clean.endswith("Z"):
-                ts_clean = ts_clean[:-1]
-            try:
-                dt = datetime.fromisoformat(ts_clean.replace("Z", "+00:00"))
-                ts_str = dt.strftime("%Y-%m-%d_%H-%M-%S")
-            except ValueError:
-                # Fallback if timestamp is weird
-                ts_str = str(int(time.time()))
-
-            key = f"{slug}_{ts_str}"
+            data_to_push = _prepare_run_payload(user_id, run_data)
+            key = build_run_key(data_to_push)
 
             # Default to provided user_id (GitHub login)
             target_user_id = user_id
@@ -383,20 +421,18 @@ class FirebaseSync:
                 ref.child(key).set(data_to_push)
             else:
                 # User Mode: REST
-                import requests
-
-                identity = _get_user_mode_identity()
+                client = get_firebase_rest_client()
+                identity = client.identity()
                 if not identity:
                     return False
-                local_id, token = identity  # Unpack local_id (UID)
+                local_id, _ = identity  # Unpack local_id (UID)
 
                 # CRITICAL FIX: Use local_id (UID) as the key in the database path
                 # This aligns with Firebase Security Rules allow-write owner check
                 target_user_id = local_id
 
-                # Use requests.put for custom ID
-                url = f"{settings.firebase.database_url}/users/{target_user_id}/runs/{key}.json?auth={token}"
-                resp = requests.put(url, json=data_to_push, timeout=10)
+                # Use PUT for custom ID
+                resp = client.put(f"users/{target_user_id}/runs/{key}", data_to_push)
                 if not resp.ok:
                     logger.debug(f"Firebase REST put failed: {resp.status_code} {resp.text}")
                     return False
@@ -439,15 +475,11 @@ class FirebaseSync:
                 users_data = ref.get()
             else:
                 # User Mode: REST
-                import requests
-
-                identity = _get_user_mode_identity()
-                if not identity:
+                client = get_firebase_rest_client()
+                if not client.identity():
                     return None
-                _, token = identity
 
-                url = f"{settings.firebase.database_url}/users.json?auth={token}"
-                resp = requests.get(url, timeout=10)
+                resp = client.get("users")
                 if resp.ok:
                     users_data = resp.json()
                 else:
@@ -547,15 +579,11 @@ class FirebaseSync:
                 users_data = ref.get()
             else:
                 # User Mode: REST
-                import requests
-
-                identity = _get_user_mode_identity()
-                if not identity:
+                client = get_firebase_rest_client()
+                if not client.identity():
                     return {}
-                _, token = identity
 
-                url = f"{settings.firebase.database_url}/users.json?auth={token}"
-                resp = requests.get(url, timeout=10)
+                resp = client.get("users")
                 if resp.ok:
                     users_data = resp.json()
                 else:
@@ -638,13 +666,9 @@ class FirebaseSync:
                 return data if isinstance(data, dict) else {}
 
             # User Mode: REST
-            import requests
-
-            url = f"{settings.firebase.database_url}/users/{target_uid}/runs.json"
-            if token:
-                url += f"?auth={token}"
-
-            resp = requests.get(url, timeout=10)
+            resp = get_firebase_rest_client().get(
+                f"users/{target_uid}/runs", authenticated=bool(token)
+            )
             if resp.ok:
                 data = resp.json()
                 return data if isinstance(data, dict) else {}
@@ -674,18 +698,9 @@ class FirebaseSync:
                 return data if isinstance(data, dict) else {}
 
             # User Mode: REST
-            import requests
-
             # We need an identity to read, even if rules are public,
             # but usually 'users' is readable by auth users.
-            identity = _get_user_mode_identity()
-            token = identity[1] if identity else None
-
-            url = f"{settings.firebase.database_url}/users.json"
-            if token:
-                url += f"?auth={token}"
-
-            resp = requests.get(url, timeout=15)
+            resp = get_firebase_rest_client().get("users", timeout=15)
             if resp.ok:
                 data = resp.json()
                 return data if isinstance(data, dict) else {}
@@ -741,14 +756,11 @@ class FirebaseSync:
                 return True
 
             # User Mode: REST
-            import requests
-
             if not token:
                 logger.debug("Cannot update run in User Mode without auth token")
                 return False
 
-            url = f"{settings.firebase.database_url}/users/{target_uid}/runs/{run_key}.json?auth={token}"
-            resp = requests.patch(url, json=updates, timeout=10)
+            resp = get_firebase_rest_client().patch(f"users/{target_uid}/runs/{run_key}", updates)
 
             if resp.ok:
                 return True
@@ -759,6 +771,231 @@ class FirebaseSync:
             logger.debug(f"Failed to update run: {e}")
             return False
 
+    def update_runs_bulk(
+        self,
+        updates: Iterable[tuple[str | None, str, dict]],
+        max_payload_bytes: int = BULK_UPDATE_MAX_BYTES,
+    ) -> dict[str, bool]:
+        """
+        Update fields on many runs using multi-location writes on the database root.
+
+        Each run's fields are flattened to ``users/{uid}/runs/{key}/{field}`` paths so
+        sibling fields are preserved (same semantics as ``update_run``). Paths are
+        grouped into PATCH requests of at most ``max_payload_bytes``. A multi-location
+        write is all-or-nothing, so a rejected chunk is retried run by run to give
+        accurate per-run results.
+
+        Args:
+            updates: Iterable of (user_id, run_key, fields). A None user_id resolves
+                to the current identity in User Mode.
+            max_payload_bytes: Upper bound on the serialized size of one request.
+
+        Returns:
+            Mapping of ``users/{uid}/runs/{key}`` to True if the update was applied.
+        """
+        results: dict[str, bool] = {}
+        try:
+            settings = get_settings()
+            admin_mode = settings.firebase.is_admin_mode()
+
+            token = None
+            current_uid = None
+            if not admin_mode:
+                identity = _get_user_mode_identity()
+                if identity:
+                    current_uid, token = identity
+
+            pending: list[_BulkItem] = []
+            for user_id, run_key, fields in updates:
+                target_uid = user_id or current_uid
+                if not target_uid:
+                    if admin_mode:
+                        raise ValueError("Must provide user_id in Admin Mode")
+                    results[f"users/{user_id}/runs/{run_key}"] = False
+                    continue
+                run_path = f"users/{target_uid}/runs/{run_key}"
+                if not fields:
+                    results[run_path] = True
+                    continue
+                pending.append(
+                    (
+                        run_path,
+                        {f"{run_path}/{field}": value for field, value in fields.items()},
+                        functools.partial(self.update_run, target_uid, run_key, fields),
+                    )
+                )
+
+            if pending and not admin_mode and not token:
+                logger.debug("Cannot update runs in User Mode without auth token")
+                results.update({run_path: False for run_path, _, _ in pending})
+                return results
+
+            results.update(self._write_bulk(pending, max_payload_bytes))
+            return results
+
+        except Exception as e:
+            logger.debug(f"Failed to bulk update runs: {e}")
+            return results
+
+    def push_runs_bulk(
+        self,
+        user_id: str,
+        runs: Iterable[dict],
+        max_payload_bytes: int = BULK_UPDATE_MAX_BYTES,
+    ) -> list[bool]:
+        """
+        Push many new runs with multi-location writes (batched ``push_run``).
+
+        Each run is written whole at ``users/{uid}/runs/{key}`` where the key comes
+        from ``build_run_key``, so re-pushing the same run is idempotent. Runs
+        without a usable timestamp have no stable key and are not written.
+
+        Args:
+            user_id: GitHub login of the run owner (used as the path in Admin Mode).
+            runs: Run dictionaries as stored in the local tracker.
+            max_payload_bytes: Upper bound on the serialized size of one request.
+
+        Returns:
+            One entry per run, in input order: True if the run was written.
+        """
+        runs = list(runs)
+        results = [False] * len(runs)
+        try:
+            settings = get_settings()
+            target_uid = user_id
+            if not settings.firebase.is_admin_mode():
+                identity = _get_user_mode_identity()
+                if not identity:
+                    return results
+                # Security rules only allow writes under the anonymous UID
+                target_uid = identity[0]
+
+            pending: list[_BulkItem] = []
+            run_paths: list[str | None] = []
+            for run in runs:
+                data_to_push = _prepare_run_payload(user_id, run)
+                try:
+                    key = build_run_key(data_to_push)
+                except ValueError as e:
+                    logger.debug(f"Not pushing run: {e}")
+                    run_paths.append(None)
+                    continue
+                run_path = f"users/{target_uid}/runs/{key}"
+                run_paths.append(run_path)
+                pending.append(
+                    (
+                        run_path,
+                        {run_path: data_to_push},
+                        functools.partial(self.push_run, user_id, run),
+                    )
+                )
+
+            path_results = self._write_bulk(pending, max_payload_bytes)
+            results = [bool(path and path_results.get(path, False)) for path in run_paths]
+            logger.debug(f"Pushed {sum(results)}/{len(results)} runs to Firebase")
+            return results
+
+        except Exception as e:
+            logger.debug(f"Failed to bulk push runs: {e}")
+            return results
+
+    def _write_bulk(self, pending: list[_BulkItem], max_payload_bytes: int) -> dict[str, bool]:
+        """
+        Write items in size-bounded multi-location chunks.
+
+        A multi-location write is all-or-nothing, so a rejected chunk is retried
+        item by item via its fallback to give accurate per-path results.
+        """
+        results: dict[str, bool] = {}
+        for chunk in _chunk_bulk_items(pending, max_payload_bytes):
+            payload = {path: value for _, flat, _ in chunk for path, value in flat.items()}
+            if self._write_multi_location(payload):
+                results.update({run_path: True for run_path, _, _ in chunk})
+                continue
+
+            logger.debug(f"Multi-location write of {len(chunk)} runs failed; retrying individually")
+            for run_path, _, fallback in chunk:
+                results[run_path] = fallback()
+        return results
+
+    def _write_multi_location(self, payload: dict) -> bool:
+        """Apply a flattened path -> value mapping atomically at the database root."""
+        try:
+            settings = get_settings()
+            if settings.firebase.is_admin_mode():
+                db = get_firebase_db()
+                db.reference("/").update(payload)
+                return True
+
+            resp = get_firebase_rest_client().patch("", payload, timeout=30)
+            if resp.ok:
+                return True
+            logger.debug(f"REST multi-location update failed: {resp.status_code} {resp.text}")
+            return False
+        except Exception as e:
+            logger.debug(f"Multi-location update failed: {e}")
+            return False
+
+
+def build_run_key(run_data: dict) -> str:
+    """
+    Return the readable Firebase key for a run: ``{slug}_{YYYY-mm-dd_HH-MM-SS}``.
+
+    The key is derived from the run's own timestamp so it is stable across retries
+    and serves as the run's idempotency key.
+
+    Raises:
+        ValueError: If the run has no parseable timestamp (no stable key exists).
+    """
+    slug = run_data.get("slug", "unknown")
+    timestamp = run_data.get("timestamp")
+    if not timestamp:
+        msg = f"Run for {slug} has no timestamp"
+        raise ValueError(msg)
+
+    # Clean timestamp for key
+    ts_clean = str(timestamp).strip()
+    if ts_clean.endswith("Z"):
+        ts_clean = ts_clean[:-1]
+    try:
+        dt = datetime.fromisoformat(ts_clean.replace("Z", "+00:00"))
+    except ValueError as e:
+        msg = f"Run for {slug} has an unparseable timestamp {timestamp!r}"
+        raise ValueError(msg) from e
+
+    return f"{slug}_{dt.strftime('%Y-%m-%d_%H-%M-%S')}"
+
+
+def _prepare_run_payload(user_id: str, run_data: dict) -> dict:
+    """Copy a tracker run for upload: drop internal fields, default attribution."""
+    data_to_push = run_data.copy()
+    data_to_push.pop("sync_status", None)
+    if not data_to_push.get("user_id"):
+        data_to_push["user_id"] = user_id
+    if not data_to_push.get("pr_author"):
+        data_to_push["pr_author"] = user_id
+    return data_to_push
+
+
+def _chunk_bulk_items(
+    pending: list[_BulkItem], max_payload_bytes: int
+) -> Iterator[list[_BulkItem]]:
+    """Group items so each combined payload stays under max_payload_bytes."""
+    chunk: list[_BulkItem] = []
+    chunk_bytes = 2  # Enclosing braces
+    for item in pending:
+        item_bytes = sum(
+            len(json.dumps(path)) + len(json.dumps(value)) + 2 for path, value in item[1].items()
+        )
+        if chunk and chunk_bytes + item_bytes > max_payload_bytes:
+            yield chunk
+            chunk = []
+            chunk_bytes = 2
+        chunk.append(item)
+        chunk_bytes += item_bytes
+    if chunk:
+        yield chunk
+
 
 def get_firebase_app() -> App | None:
     """
@@ -779,7 +1016,7 @@ def reset_firebase() -> None:
     WARNING: This deletes the Firebase app instance. Only use in tests
     or when reconfiguration is explicitly required.
     """
-    global _firebase_app, _firebase_initialized, _firebase_user_mode
+    global _firebase_app, _firebase_initialized, _firebase_user_mode, _rest_client
 
     with _initialization_lock:
         if _firebase_app is not None:
@@ -793,3 +1030,4 @@ def reset_firebase() -> None:
         _firebase_app = None
         _firebase_initialized = False
         _firebase_user_mode = False
+        _rest_client = None
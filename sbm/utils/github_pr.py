@@ -6,12 +6,115 @@ Used by: PR creation, stats sync, daily updates, and migration scripts.
 """
 
 import json
+import re
 import subprocess
 import time
-from typing import Optional
+from typing import Iterable, Optional
 
 from .logger import logger
 
+# GitHub caps a single GraphQL query at 100 top-level nodes
+GRAPHQL_BATCH_SIZE = 100
+
+# Pause before the next batch once the remaining GraphQL budget drops below this
+RATE_LIMIT_FLOOR = 50
+
+# Never block longer than this on a rate limit; give up and let the next refresh retry
+MAX_RATE_LIMIT_WAIT = 300
+
+_PR_URL_RE = re.compile(r"github\.com/([^/\s]+)/([^/\s]+)/pull/(\d+)")
+
+_PR_FIELDS = "createdAt mergedAt closedAt state additions author { login }"
+
+
+def _validate_timestamp(ts: Optional[str]) -> Optional[str]:
+    if not ts:
+        return None
+    # Basic validation: check if it looks like ISO format
+    if len(ts) >= 19 and "T" in ts:
+        return ts
+    logger.warning(f"Invalid timestamp format: {ts}")
+    return None
+
+
+def _metadata_from_pr(data: dict) -> dict:
+    """Normalize a gh/GraphQL pull request object into our metadata dict."""
+    author = None
+    if data.get("author") and isinstance(data["author"], dict):
+        author = data["author"].get("login")
+
+    return {
+        "created_at": _validate_timestamp(data.get("createdAt")),
+        "merged_at": _validate_timestamp(data.get("mergedAt")),
+        "closed_at": _validate_timestamp(data.get("closedAt")),
+        "state": data.get("state"),  # OPEN, CLOSED, MERGED
+        "author": author,
+    }
+
+
+def _parse_pr_url(pr_url: str) -> Optional[tuple[str, str, int]]:
+    """Split a PR URL into (owner, repo, number)."""
+    match = _PR_URL_RE.search(pr_url or "")
+    if not match:
+        return None
+    owner, repo, number = match.groups()
+    return owner, repo, int(number)
+
+
+def _build_batch_query(prs: list[tuple[str, str, int]]) -> str:
+    """Build one GraphQL query with an aliased pullRequest lookup per PR."""
+    parts = [
+        f"pr{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+        f"{{ pullRequest(number: {number}) {{ {_PR_FIELDS} }} }}"
+        for i, (owner, repo, number) in enumerate(prs)
+    ]
+    parts.append("rateLimit { cost remaining resetAt }")
+    return "query {\n  " + "\n  ".join(parts) + "\n}"
+
+
+def _split_http_response(output: str) -> tuple[Optional[int], dict[str, str], str]:
+    """Split ``gh api --include`` output into (status, lowercase headers, body)."""
+    text = (output or "").replace("\r\n", "\n")
+    if not text.startswith("HTTP/"):
+        return None, {}, text
+    head, _, body = text.partition("\n\n")
+    lines = head.split("\n")
+    status = None
+    status_parts = lines[0].split()
+    if len(status_parts) > 1 and status_parts[1].isdigit():
+        status = int(status_parts[1])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def _rate_limit_wait(
+    status: Optional[int], headers: dict[str, str], now: Optional[float] = None
+) -> float:
+    """
+    Seconds to wait before the next GraphQL request, based on response headers.
+
+    Honors ``Retry-After`` (secondary rate limits) and pauses until
+    ``X-RateLimit-Reset`` once the remaining budget is nearly spent.
+    """
+    retry_after = headers.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    low = remaining and remaining.isdigit() and int(remaining) < RATE_LIMIT_FLOOR
+    if low and reset and reset.isdigit():
+        return max(0.0, int(reset) - (now if now is not None else time.time()))
+
+    if status in (403, 429):
+        # Secondary rate limit without a hint: GitHub asks clients to wait a minute
+        return 60.0
+    return 0.0
+
 
 class GitHubPRManager:
     """Manages GitHub PR metadata fetching and enrichment."""
@@ -58,29 +161,7 @@ class GitHubPRManager:
                     timeout=10,
                 )
                 data = json.loads(result.stdout)
-
-                # Validate and extract fields
-                def validate_timestamp(ts: Optional[str]) -> Optional[str]:
-                    if not ts:
-                        return None
-                    # Basic validation: check if it looks like ISO format
-                    if len(ts) >= 19 and "T" in ts:
-                        return ts
-                    logger.warning(f"Invalid timestamp format: {ts}")
-                    return None
-
-                # Extract author login
-                author = None
-                if data.get("author") and isinstance(data["author"], dict):
-                    author = data["author"].get("login")
-
-                return {
-                    "created_at": validate_timestamp(data.get("createdAt")),
-                    "merged_at": validate_timestamp(data.get("mergedAt")),
-                    "closed_at": validate_timestamp(data.get("closedAt")),
-                    "state": data.get("state"),  # OPEN, CLOSED, MERGED
-                    "author": author,
-                }
+                return _metadata_from_pr(data)
 
             except subprocess.TimeoutExpired:
                 if attempt == max_retries - 1:
@@ -157,6 +238,157 @@ class GitHubPRManager:
                     return None
         return None
 
+    @staticmethod
+    def fetch_pr_metadata_batch(
+        pr_urls: Iterable[str],
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+        max_retries: int = 3,
+    ) -> dict[str, Optional[dict]]:
+        """
+        Fetch metadata for many PRs with one ``gh api graphql`` call per batch.
+
+        Each batch asks for up to ``batch_size`` pull requests in a single
+        query, so refreshing N PRs costs ceil(N / 100) requests instead of 2N
+        ``gh pr view`` subprocesses. Batches run back to back and pause only
+        when GitHub's rate-limit headers say so.
+
+        Args:
+            pr_urls: GitHub PR URLs (duplicates are fetched once)
+            batch_size: PRs per GraphQL query (GitHub allows at most 100)
+            max_retries: Maximum attempts per batch for transient failures
+
+        Returns:
+            Mapping of each URL to the same dict as ``fetch_pr_metadata`` plus
+            ``additions``, or None if that PR could not be fetched
+        """
+        results: dict[str, Optional[dict]] = {}
+        parsed: list[tuple[str, tuple[str, str, int]]] = []
+        for url in pr_urls:
+            if url in results:
+                continue
+            results[url] = None
+            pr = _parse_pr_url(url)
+            if pr:
+                parsed.append((url, pr))
+            else:
+                logger.warning(f"Not a GitHub PR URL: {url}")
+
+        batch_size = max(1, min(batch_size, GRAPHQL_BATCH_SIZE))
+        for start in range(0, len(parsed), batch_size):
+            chunk = parsed[start : start + batch_size]
+            data = GitHubPRManager.run_graphql(
+                _build_batch_query([pr for _, pr in chunk]), max_retries=max_retries
+            )
+            if data is None:
+                continue
+            for i, (url, _) in enumerate(chunk):
+                node = (data.get(f"pr{i}") or {}).get("pullRequest")
+                if not node:
+                    logger.warning(f"PR not found: {url}")
+                    continue
+                metadata = _metadata_from_pr(node)
+                additions = node.get("additions")
+                metadata["additions"] = additions if isinstance(additions, int) else None
+                results[url] = metadata
+
+        return results
+
+    @staticmethod
+    def run_graphql(
+        query: str, variables: Optional[dict] = None, max_retries: int = 3
+    ) -> Optional[dict]:
+        """
+        Run a GraphQL query through ``gh api graphql``.
+
+        Retries transient failures and paces itself from the rate-limit
+        response headers.
+
+        Args:
+            query: GraphQL document
+            variables: Query variables; None values are omitted (GraphQL null)
+            max_retries: Maximum attempts for transient failures
+
+        Returns:
+            The response ``data`` object, or None if the query failed
+        """
+        cmd = ["gh", "api", "graphql", "--include", "-f", f"query={query}"]
+        for name, value in (variables or {}).items():
+            if value is None:
+                continue
+            # -f sends strings verbatim; -F types numbers and booleans
+            flag = "-f" if isinstance(value, str) else "-F"
+            if isinstance(value, bool):
+                value = str(value).lower()
+            cmd.extend([flag, f"{name}={value}"])
+
+        for attempt in range(max_retries):
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=60,
+                )
+            except subprocess.TimeoutExpired:
+                logger.debug(f"GraphQL query timed out (attempt {attempt + 1}/{max_retries})")
+                continue
+            except Exception as e:
+                logger.warning(f"Could not run gh api graphql: {e}")
+                return None
+
+            status, headers, body = _split_http_response(result.stdout)
+            wait = _rate_limit_wait(status, headers)
+            try:
+                payload = json.loads(body) if body.strip() else {}
+            except json.JSONDecodeError:
+                payload = {}
+
+            # gh exits non-zero when any lookup errors (e.g. one missing PR),
+            # but the rest of the batch is still in "data"
+            data = payload.get("data") if isinstance(payload, dict) else None
+            if isinstance(data, dict):
+                if wait > MAX_RATE_LIMIT_WAIT:
+                    logger.debug("GraphQL rate limit nearly exhausted; later queries may fail")
+                elif wait:
+                    logger.debug(f"GraphQL rate limit low, waiting {wait:.0f}s")
+                    time.sleep(wait)
+                return data
+
+            stderr_str = str(result.stderr or "")
+            if status in (401, 404) or "authentication" in stderr_str.lower():
+                logger.warning(f"Permanent error from gh api graphql: {stderr_str.strip()}")
+                return None
+            if attempt == max_retries - 1:
+                logger.warning(
+                    f"GraphQL query failed after {max_retries} attempts: {stderr_str.strip()}"
+                )
+                return None
+
+            delay = wait or 2 ** (attempt + 1)
+            if delay > MAX_RATE_LIMIT_WAIT:
+                logger.warning(f"GitHub rate limit resets in {delay:.0f}s; giving up for now")
+                return None
+            logger.debug(f"Retry {attempt + 1}/{max_retries} after {delay:.0f}s...")
+            time.sleep(delay)
+
+        return None
+
+    @staticmethod
+    def _needs_fetch(run: dict, force_refresh: bool) -> bool:
+        return force_refresh or not run.get("created_at") or not run.get("pr_author")
+
+    @staticmethod
+    def _apply_pr_metadata(run: dict, metadata: dict) -> None:
+        run["created_at"] = metadata["created_at"]
+        run["merged_at"] = metadata["merged_at"]
+        run["closed_at"] = metadata["closed_at"]
+        run["pr_state"] = metadata["state"]
+
+        # Update pr_author if available
+        if metadata["author"]:
+            run["pr_author"] = metadata["author"]
+
     @staticmethod
     def enrich_run_with_pr_data(run: dict, force_refresh: bool = False) -> dict:
         """
@@ -179,9 +411,7 @@ class GitHubPRManager:
             return run
 
         # Check if we need to fetch
-        needs_fetch = force_refresh or not run.get("created_at") or not run.get("pr_author")
-
-        if not needs_fetch:
+        if not GitHubPRManager._needs_fetch(run, force_refresh):
             return run
 
         # Fetch metadata from GitHub
@@ -190,21 +420,47 @@ class GitHubPRManager:
 
         if metadata:
             # Update run with fetched data
-            run["created_at"] = metadata["created_at"]
-            run["merged_at"] = metadata["merged_at"]
-            run["closed_at"] = metadata["closed_at"]
-            run["pr_state"] = metadata["state"]
-
-            # Update pr_author if available
-            if metadata["author"]:
-                run["pr_author"] = metadata["author"]
-
+            GitHubPRManager._apply_pr_metadata(run, metadata)
             logger.debug(f"Updated PR metadata for {pr_url}: {metadata['state']}")
         else:
             logger.warning(f"Failed to fetch PR metadata for {pr_url}")
 
         return run
 
+    @staticmethod
+    def enrich_runs_with_pr_data(runs: Iterable[dict], force_refresh: bool = False) -> list[dict]:
+        """
+        Batch version of ``enrich_run_with_pr_data``.
+
+        Fetches metadata for every run that needs it with GraphQL batches
+        instead of one ``gh pr view`` per run.
+
+        Args:
+            runs: Run dictionaries (modified in place)
+            force_refresh: If True, fetch from GitHub even if data exists
+
+        Returns:
+            The runs, in order
+        """
+        runs = list(runs)
+        to_fetch = [
+            run
+            for run in runs
+            if run.get("pr_url") and GitHubPRManager._needs_fetch(run, force_refresh)
+        ]
+        if not to_fetch:
+            return runs
+
+        metadata_by_url = GitHubPRManager.fetch_pr_metadata_batch(run["pr_url"] for run in to_fetch)
+        for run in to_fetch:
+            metadata = metadata_by_url.get(run["pr_url"])
+            if metadata:
+                GitHubPRManager._apply_pr_metadata(run, metadata)
+            else:
+                logger.warning(f"Failed to fetch PR metadata for {run['pr_url']}")
+
+        return runs
+
     @staticmethod
     def should_refresh_pr_data(run: dict) -> bool:
         """
@@ -257,3 +513,8 @@ def fetch_pr_additions(pr_url: str) -> Optional[int]:
 def enrich_run_with_pr_data(run: dict, force_refresh: bool = False) -> dict:
     """Enrich run with PR data. Convenience wrapper."""
     return GitHubPRManager.enrich_run_with_pr_data(run, force_refresh)
+
+
+def fetch_pr_metadata_batch(pr_urls: Iterable[str]) -> dict[str, Optional[dict]]:
+    """Fetch metadata for many PRs with batched GraphQL queries. Convenience wrapper."""
+    return GitHubPRManager.fetch_pr_metadata_batch(pr_urls)
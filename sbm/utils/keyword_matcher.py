@@ -0,0 +1,128 @@
+"""
+Multi-keyword substring matching for the SBM tool.
+
+``KeywordMatcher`` is an Aho-Corasick automaton: it is built once from a set of
+keywords and then reports every keyword occurrence in a string in a single
+left-to-right pass, regardless of how many keywords there are. Matching is
+case-insensitive.
+
+``literal_fragments`` pulls the plain-text runs out of a simple regular
+expression so regex patterns (such as OEM map partial patterns) can be
+pre-screened with the automaton before the regex itself is run.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+# Regex syntax that makes a literal run optional or alternative
+_OPTIONAL_SYNTAX = set("|?*{")
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+
+    Args:
+        keywords: Keywords to find. Blank keywords are ignored and duplicates
+            (after lowercasing) are merged.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: tuple[str, ...] = tuple(
+            dict.fromkeys(k.lower() for k in keywords if k and k.strip())
+        )
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+
+        for keyword in self.keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (keyword,)
+
+        # Breadth-first pass to link each state to its longest proper suffix state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                if state:
+                    fallback = self._fail[state]
+                    while fallback and ch not in self._goto[fallback]:
+                        fallback = self._fail[fallback]
+                    self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield (start_index, keyword) for every occurrence, overlapping ones included."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text.lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword in out[state]:
+                yield i - len(keyword) + 1, keyword
+
+    def find(self, text: str) -> set[str]:
+        """Return the set of keywords that occur in ``text``."""
+        return {keyword for _, keyword in self.iter_matches(text)}
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in ``text`` (stops at the first hit)."""
+        return next(self.iter_matches(text), None) is not None
+
+
+def literal_fragments(pattern: str, min_length: int = 3) -> list[str]:
+    """
+    Return literal runs that every match of ``pattern`` must contain.
+
+    Only handles the simple patterns used for map partials; anything with
+    alternation, optional or repeated-zero pieces yields no fragments, meaning
+    "no pre-screen, always run the regex".
+    """
+    if _OPTIONAL_SYNTAX & set(pattern):
+        return []
+
+    fragments: list[str] = []
+    current: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped.isalnum():
+                # Character class (\d, \w, ...) or backreference: ends the run
+                fragments.append("".join(current))
+                current = []
+            else:
+                current.append(escaped)
+            i += 2
+            continue
+        if ch == "[":
+            fragments.append("".join(current))
+            current = []
+            close = pattern.find("]", i + 2)
+            i = len(pattern) if close == -1 else close + 1
+            continue
+        if ch in "().^$+":
+            fragments.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    fragments.append("".join(current))
+    return [f.lower() for f in fragments if len(f) >= min_length]
@@ -10,6 +10,8 @@ import sys
 from datetime import datetime
 from typing import Optional
 
+from sbm.utils.path import get_output_dir
+
 
 def setup_logger(name=None, log_file=None, level=logging.INFO, use_rich=True):
     """
@@ -68,9 +70,7 @@ def setup_logger(name=None, log_file=None, level=logging.INFO, use_rich=True):
         # Create file handler if a log file is specified or use default
         if log_file is None:
             # Create logs directory if it doesn't exist
-            log_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "logs"
-            )
+            log_dir = str(get_output_dir("logs"))
             os.makedirs(log_dir, exist_ok=True)
 
             # Default log file name with timestamp
@@ -8,20 +8,54 @@ import logging
 import os
 import re
 from os.path import expanduser
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Environment variable pointing at a DI Websites Platform checkout
+PLATFORM_DIR_ENV_VAR = "SBM_PLATFORM_DIR"
+
+# Environment variable redirecting generated reports and logs out of the auto-sbm checkout
+OUTPUT_DIR_ENV_VAR = "SBM_OUTPUT_DIR"
+
+# The auto-sbm checkout, where reports and logs go by default
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def get_output_dir(name: str, root: Optional[Path] = None) -> Path:
+    """
+    Directory ``name`` for generated reports or logs.
+
+    Lives under ``root`` (the auto-sbm checkout by default) unless
+    ``SBM_OUTPUT_DIR`` is set (used by the offline benchmark, which keeps its
+    artifacts in its work directory).
+    """
+    override = os.environ.get(OUTPUT_DIR_ENV_VAR)
+    base = Path(override) if override else (root or _REPO_ROOT)
+    return base / name
+
 
 def get_platform_dir():
     """
     Get the DI Websites Platform directory.
 
+    ``SBM_PLATFORM_DIR`` overrides the standard locations (used by the
+    benchmarks, which run against a generated platform tree).
+
     Returns:
         str: Path to the DI Websites Platform directory
 
     Raises:
         ValueError: If the directory is not found.
     """
+    override = os.environ.get(PLATFORM_DIR_ENV_VAR)
+    if override:
+        if os.path.isdir(override):
+            return override
+        msg = f"{PLATFORM_DIR_ENV_VAR} is set but is not a directory: {override}"
+        raise ValueError(msg)
+
     home_dir = expanduser("~")
 
     # Check multiple possible locations
@@ -117,3 +151,68 @@ def get_common_theme_path() -> str:
         return ""
 
     return common_theme_path
+
+
+class DirectoryListingCache:
+    """
+    Answer path-existence probes from cached directory listings.
+
+    Each directory is read with ``os.scandir`` the first time one of its
+    entries is probed; later probes in the same directory are set lookups.
+    Resolving an import usually tries several spellings of one file
+    (``_name``, ``name.scss``, ...) in a single directory, so this turns a
+    handful of ``stat`` calls per candidate into one listing per directory,
+    which matters on network-mounted and Docker-shared volumes.
+
+    Listings are never refreshed: use one cache per pass and do not keep it
+    across writes to the directories it has read.
+    """
+
+    def __init__(self) -> None:
+        # directory -> entry names (lowercased on case-insensitive filesystems),
+        # or None if the directory could not be read
+        self._listings: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._case_insensitive: Dict[str, bool] = {}
+
+    def _listing(self, directory: str) -> Optional[FrozenSet[str]]:
+        if directory in self._listings:
+            return self._listings[directory]
+        try:
+            with os.scandir(directory) as entries:
+                names = [entry.name for entry in entries]
+        except OSError:
+            self._listings[directory] = None
+            return None
+
+        # Path.exists() ignores case on case-insensitive filesystems (macOS
+        # default); detect that once per directory with a single stat.
+        folded = False
+        name_set = set(names)
+        probe = next((n for n in names if n.swapcase() != n), None)
+        if probe is not None and probe.swapcase() not in name_set:
+            folded = os.path.exists(os.path.join(directory, probe.swapcase()))
+        listing = frozenset(n.lower() for n in names) if folded else frozenset(name_set)
+        self._listings[directory] = listing
+        self._case_insensitive[directory] = folded
+        return listing
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """Equivalent of ``os.path.exists(path)`` answered from the parent's listing."""
+        directory, name = os.path.split(os.fspath(path))
+        if name in ("", ".", ".."):
+            return os.path.exists(path)
+        directory = directory or "."
+        listing = self._listing(directory)
+        if listing is None:
+            return False
+        if self._case_insensitive[directory]:
+            name = name.lower()
+        return name in listing
+
+    def first_existing(self, candidates: Iterable[Path]) -> Optional[Path]:
+        """Return the first of ``candidates`` that exists, or None."""
+        return next((p for p in candidates if self.exists(p)), None)
+
+    def clear(self) -> None:
+        self._listings.clear()
+        self._case_insensitive.clear()
@@ -9,17 +9,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from .logger import logger
+from .path import get_output_dir
 
 if TYPE_CHECKING:
     from sbm.core.migration import MigrationResult
 
-# Reports directory in repo root
-REPO_ROOT = Path(__file__).parent.parent.parent.resolve()
-REPORTS_DIR = REPO_ROOT / ".sbm-reports"
+# Reports directory in repo root (or under SBM_OUTPUT_DIR)
+REPORTS_DIR = get_output_dir(".sbm-reports")
 
 
 @dataclass
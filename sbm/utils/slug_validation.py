@@ -2,6 +2,7 @@ import json
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable, Optional
@@ -10,6 +11,8 @@ from sbm.utils.helpers import validate_slug
 
 _CACHE_PATH = Path.home() / ".sbm_slug_validation.json"
 _CACHE_TTL_DAYS = 30
+# devtools has no multi-slug query, so misses are resolved by a bounded pool
+_MAX_DEVTOOLS_WORKERS = 8
 _DEFAULT_DEVTOOLS_DIR = Path(
     "/Users/nathanhart/code/dealerinspire/feature-dev-shared-scripts/devtools-cli"
 )
@@ -59,7 +62,10 @@ def _load_cache() -> dict:
 
 def _save_cache(cache: dict) -> None:
     try:
-        _CACHE_PATH.write_text(json.dumps(cache, indent=2))
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2))
+        tmp_path.replace(_CACHE_PATH)
     except Exception:
         return
 
@@ -98,8 +104,8 @@ def _parse_devtools_output(output: str) -> list[dict]:
     return data
 
 
-def _devtools_slug_valid(slug: str) -> Optional[bool]:
-    devtools_script = _find_devtools_script()
+def _devtools_slug_valid(slug: str, devtools_script: Optional[Path] = None) -> Optional[bool]:
+    devtools_script = devtools_script or _find_devtools_script()
     if not devtools_script:
         return None
 
@@ -130,29 +136,70 @@ def _devtools_slug_valid(slug: str) -> Optional[bool]:
     return False
 
 
-def is_official_slug(slug: str) -> Optional[bool]:
-    """Return True/False if verified, or None if verification unavailable."""
-    if not slug:
-        return False
-    slug_norm = _normalize_slug(slug)
-    if not validate_slug(slug_norm):
-        return False
+def verify_slugs(slugs: Iterable[str]) -> dict[str, Optional[bool]]:
+    """
+    Verify many slugs at once.
+
+    Loads the cache once, resolves every missing or stale slug through
+    devtools with a bounded thread pool, and writes the cache once.
+
+    Returns:
+        Mapping of each input slug to True/False, or None if verification
+        was unavailable for it
+    """
+    results: dict[str, Optional[bool]] = {}
+    norm_by_slug: dict[str, str] = {}
+    for slug in slugs:
+        if slug in results or slug in norm_by_slug:
+            continue
+        if not slug:
+            results[slug] = False
+            continue
+        slug_norm = _normalize_slug(slug)
+        if not validate_slug(slug_norm):
+            results[slug] = False
+            continue
+        norm_by_slug[slug] = slug_norm
+
+    if not norm_by_slug:
+        return results
 
     cache = _load_cache()
-    entry = cache.get("slugs", {}).get(slug_norm)
-    if entry and _is_cache_fresh(entry):
-        return bool(entry.get("valid"))
+    cached = cache.get("slugs", {})
+    resolved: dict[str, Optional[bool]] = {}
+    for slug_norm in set(norm_by_slug.values()):
+        entry = cached.get(slug_norm)
+        if entry and _is_cache_fresh(entry):
+            resolved[slug_norm] = bool(entry.get("valid"))
+
+    missing = sorted(set(norm_by_slug.values()) - resolved.keys())
+    devtools_script = _find_devtools_script() if missing else None
+    if missing and devtools_script:
+        workers = min(_MAX_DEVTOOLS_WORKERS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            checked = dict(
+                zip(
+                    missing,
+                    pool.map(lambda s: _devtools_slug_valid(s, devtools_script), missing),
+                )
+            )
+
+        now = datetime.now(timezone.utc).isoformat()
+        for slug_norm, valid in checked.items():
+            if valid is not None:
+                cache.setdefault("slugs", {})[slug_norm] = {"valid": bool(valid), "checked_at": now}
+        if any(valid is not None for valid in checked.values()):
+            _save_cache(cache)
+        resolved.update(checked)
+
+    for slug, slug_norm in norm_by_slug.items():
+        results[slug] = resolved.get(slug_norm)
+    return results
 
-    valid = _devtools_slug_valid(slug_norm)
-    if valid is None:
-        return None
 
-    cache.setdefault("slugs", {})[slug_norm] = {
-        "valid": bool(valid),
-        "checked_at": datetime.now(timezone.utc).isoformat(),
-    }
-    _save_cache(cache)
-    return bool(valid)
+def is_official_slug(slug: str) -> Optional[bool]:
+    """Return True/False if verified, or None if verification unavailable."""
+    return verify_slugs([slug]).get(slug, False)
 
 
 def filter_valid_slugs(slugs: Iterable[str]) -> list[str]:
@@ -165,12 +212,8 @@ def filter_valid_slugs(slugs: Iterable[str]) -> list[str]:
     if not has_devtools:
         return slugs_list
 
-    valid_slugs = []
-    for slug in slugs_list:
-        valid = is_official_slug(slug)
-        if valid:
-            valid_slugs.append(slug)
-    return valid_slugs
+    verified = verify_slugs(slugs_list)
+    return [slug for slug in slugs_list if verified.get(slug)]
 
 
 def filter_valid_runs(runs: Iterable[dict]) -> list[dict]:
@@ -183,9 +226,5 @@ def filter_valid_runs(runs: Iterable[dict]) -> list[dict]:
     if not has_devtools:
         return runs_list
 
-    filtered = []
-    for run in runs_list:
-        slug = run.get("slug")
-        if is_official_slug(slug):
-            filtered.append(run)
-    return filtered
+    verified = verify_slugs(run.get("slug") for run in runs_list)
+    return [run for run in runs_list if verified.get(run.get("slug"))]
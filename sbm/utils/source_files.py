@@ -0,0 +1,92 @@
+"""
+Memory-mapped access to theme source files.
+
+These helpers read theme sources through an ``mmap`` of the file instead of
+``Path.read_text`` copies:
+
+- ``count_lines`` counts newlines over the mapping in fixed-size windows,
+  without decoding the file;
+- ``search_file`` and ``findall_in_file`` run bytes regexes directly over
+  the mapping;
+- ``read_text`` decodes straight from the mapping, translating newlines as
+  text-mode ``open`` does.
+
+Sources that several steps of one migration need are shared through
+``sbm.core.maps.ThemeSourceSet``, which reads each of them once.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Pattern, Union
+
+# Window size for newline counting; bounds the bytes copied out of the mapping at once
+COUNT_WINDOW_BYTES = 1024 * 1024
+
+
+@contextmanager
+def mapped(path: Union[str, Path]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Map ``path`` read-only; empty files (which cannot be mapped) yield ``b""``."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            yield buf
+
+
+def count_lines(path: Union[str, Path]) -> int:
+    """Number of lines in ``path``, as ``len(text.splitlines())`` counts them for \\n files."""
+    with mapped(path) as buf:
+        size = len(buf)
+        if not size:
+            return 0
+        window = COUNT_WINDOW_BYTES
+        newlines = sum(buf[i : i + window].count(b"\n") for i in range(0, size, window))
+        return newlines + (buf[size - 1 : size] != b"\n")
+
+
+def read_text(path: Union[str, Path], errors: str = "ignore") -> str:
+    """Decode ``path`` as UTF-8 with ``\r\n`` and ``\r`` translated to ``\n``."""
+    with mapped(path) as buf:
+        text = str(buf, "utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _bytes_pattern(pattern: Union[str, bytes, Pattern]) -> Pattern:
+    if isinstance(pattern, re.Pattern):
+        if isinstance(pattern.pattern, str):
+            return re.compile(pattern.pattern.encode("utf-8"), pattern.flags & ~re.UNICODE)
+        return pattern
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    return re.compile(pattern)
+
+
+def search_file(path: Union[str, Path], pattern: Union[str, bytes, Pattern]) -> bool:
+    """
+    Whether ``pattern`` matches anywhere in ``path``, scanning the mapping directly.
+
+    String patterns are compiled as bytes patterns, so ``\\w``, ``\\d`` and
+    case-insensitive matching only cover ASCII.
+    """
+    with mapped(path) as buf:
+        return _bytes_pattern(pattern).search(buf) is not None
+
+
+def findall_in_file(path: Union[str, Path], pattern: Union[str, bytes, Pattern]) -> list:
+    """``re.findall`` over the mapping of ``path``, with matches decoded to ``str``."""
+    with mapped(path) as buf:
+        matches = _bytes_pattern(pattern).findall(buf)
+    return [
+        tuple(group.decode("utf-8", "ignore") for group in match)
+        if isinstance(match, tuple)
+        else match.decode("utf-8", "ignore")
+        for match in matches
+    ]
@@ -0,0 +1,185 @@
+"""
+Durable outbox for runs waiting to be synced to Firebase.
+
+Successful runs are appended to a small SQLite table keyed by their Firebase run
+key, which doubles as an idempotency key: enqueueing the same run twice is a
+no-op, and a run that has been synced is never pushed again. A single flusher
+(guarded by a lease row) drains pending rows in batches, so concurrent
+background refreshes never double-push or fight over the tracker file.
+
+The tracker JSON keeps its ``sync_status`` field for display and backwards
+compatibility, but this table is the source of truth for what still needs
+uploading.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+OUTBOX_FILENAME = ".sbm_sync_outbox.sqlite3"
+
+# Statuses that the flusher will (re)attempt
+RETRYABLE_STATUSES = ("pending_sync", "validation_unavailable")
+SYNCED_STATUS = "synced"
+
+# A flusher that crashed releases its lease after this many seconds
+DEFAULT_LEASE_SECONDS = 300
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    idempotency_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, created_at);
+CREATE TABLE IF NOT EXISTS lease (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SyncOutbox:
+    """
+    SQLite-backed queue of run payloads awaiting Firebase sync.
+
+    Args:
+        path: Database file. Created on first use.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+        try:
+            if not self._schema_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, key: str, run: dict, status: str = "pending_sync") -> None:
+        """
+        Record a run under its idempotency key.
+
+        Re-enqueueing an unsynced run refreshes its payload and status (so a
+        manual reset to pending is honored); a synced run is left untouched.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO outbox (idempotency_key, payload, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(idempotency_key) DO UPDATE SET
+                    payload = excluded.payload,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at
+                WHERE outbox.status != ?
+                """,
+                (key, json.dumps(run), status, now, now, SYNCED_STATUS),
+            )
+
+    def pending(self, limit: int | None = None) -> list[tuple[str, dict]]:
+        """Return (key, run) pairs that still need syncing, oldest first."""
+        placeholders = ", ".join("?" for _ in RETRYABLE_STATUSES)
+        query = (
+            f"SELECT idempotency_key, payload FROM outbox WHERE status IN ({placeholders}) "  # noqa: S608
+            "ORDER BY created_at"
+        )
+        params: list = list(RETRYABLE_STATUSES)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [(key, json.loads(payload)) for key, payload in rows]
+
+    def mark(self, statuses: dict[str, str], errors: dict[str, str] | None = None) -> None:
+        """Set the status of many rows in one transaction; only unsynced rows count an attempt."""
+        if not statuses:
+            return
+        errors = errors or {}
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                UPDATE outbox
+                SET status = ?, attempts = attempts + ?, last_error = ?, updated_at = ?
+                WHERE idempotency_key = ?
+                """,
+                [
+                    (status, int(status != SYNCED_STATUS), errors.get(key), now, key)
+                    for key, status in statuses.items()
+                ],
+            )
+            conn.execute("COMMIT")
+
+    def status_of(self, key: str) -> str | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT status FROM outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def acquire_flush_lease(self, seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """Claim the single-flusher lease; False if another live flusher holds it."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT owner, expires_at FROM lease WHERE name = 'flush'"
+                ).fetchone()
+                if row and row[0] != self._owner and row[1] > now:
+                    conn.execute("COMMIT")
+                    return False
+                conn.execute(
+                    "INSERT OR REPLACE INTO lease (name, owner, expires_at) VALUES ('flush', ?, ?)",
+                    (self._owner, now + seconds),
+                )
+                conn.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Could not acquire outbox flush lease: {e}")
+            return False
+        return True
+
+    def release_flush_lease(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM lease WHERE name = 'flush' AND owner = ?", (self._owner,))
+
+
+def open_outbox(directory: Path) -> SyncOutbox | None:
+    """Open the outbox in ``directory``, or None if SQLite is unusable there."""
+    try:
+        outbox = SyncOutbox(directory / OUTBOX_FILENAME)
+        with outbox._connect():
+            pass
+        return outbox
+    except sqlite3.Error as e:
+        logger.debug(f"Sync outbox unavailable: {e}")
+        return None
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from sbm.utils.logger import logger
+from sbm.utils.tracing import span
 
 # Global timing summary storage
 _timing_summary: Dict[str, float] = {}
@@ -246,31 +247,33 @@ def timer_segment(name: str):
     """
     Context manager for timing a segment of work.
     Creates standalone segment timer if no main timer exists.
+    The segment is also recorded as a span when a trace is running.
 
     Args:
         name: Name of the segment
     """
     timer = get_current_timer()
-    if timer:
-        # Use existing timer system
-        timer.start_segment(name)
-        try:
-            yield timer
-        finally:
-            timer.end_segment()
-    else:
-        # Create standalone segment timer and track in global summary
-        start_time = time.time()
-        logger.info(f"⏱️  Started: {name}")
-        try:
-            yield None
-        finally:
-            duration = time.time() - start_time
-            logger.info(f"✅ Completed: {name} ({duration:.2f}s)")
-
-            # Add to global timing summary
-            global _timing_summary
-            _timing_summary[name] = duration
+    with span(name, category="segment"):
+        if timer:
+            # Use existing timer system
+            timer.start_segment(name)
+            try:
+                yield timer
+            finally:
+                timer.end_segment()
+        else:
+            # Create standalone segment timer and track in global summary
+            start_time = time.time()
+            logger.info(f"⏱️  Started: {name}")
+            try:
+                yield None
+            finally:
+                duration = time.time() - start_time
+                logger.info(f"✅ Completed: {name} ({duration:.2f}s)")
+
+                # Add to global timing summary
+                global _timing_summary
+                _timing_summary[name] = duration
 
 
 @contextmanager
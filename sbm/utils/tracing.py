@@ -0,0 +1,316 @@
+"""
+Nested tracing spans for SBM migrations.
+
+``timer_segment`` only says that "SCSS Migration" took 40 seconds. Spans break
+that down: every SCSS transformation step, map discovery function, subprocess
+and Firebase request records its own timed span with attributes (slug, file,
+bytes, mixin counts, command, status...). A finished trace is written as
+Chrome-trace JSON to ``~/.sbm/traces/`` and can be opened in Perfetto
+(https://ui.perfetto.dev) or ``chrome://tracing``.
+
+Tracing is off unless a trace is running, and spans cost one global lookup
+when it is off. Start one with ``sbm auto --trace``, ``sbm migrate --trace``
+or by setting ``SBM_TRACE=1``.
+
+Usage:
+    from sbm.utils.tracing import annotate, span, traced
+
+    @traced("maps.find_shortcodes", category="maps")
+    def find_shortcodes(slug): ...
+
+    with span("scss.mixins", category="scss", slug=slug) as s:
+        ...
+        s.set(unconverted=len(unconverted))
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from sbm.utils.logger import logger
+
+TRACE_DIR = Path.home() / ".sbm" / "traces"
+
+# Set to "1" to trace every migration without passing --trace
+TRACE_ENV_VAR = "SBM_TRACE"
+
+# Longest command line kept on a subprocess span
+MAX_COMMAND_LENGTH = 500
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed region of work; ``set`` adds attributes shown in the trace viewer."""
+
+    __slots__ = ("args", "category", "name", "start_ns", "tid", "trace")
+
+    def __init__(self, trace: Trace, name: str, category: str, args: dict) -> None:
+        self.trace = trace
+        self.name = name
+        self.category = category
+        self.args = args
+        self.tid = threading.get_native_id()
+        self.start_ns = time.perf_counter_ns()
+
+    def set(self, **attrs: Any) -> None:
+        self.args.update(attrs)
+
+
+class _NullSpan:
+    """Stand-in yielded by ``span`` when no trace is running."""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Trace:
+    """
+    Spans recorded during one traced run.
+
+    Args:
+        label: Name of the run (usually the dealer slug); used in the file name.
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.started_at = time.time()
+        self.start_ns = time.perf_counter_ns()
+        self.events: list[dict] = []
+        self._local = threading.local()
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current(self) -> Optional[Span]:
+        """Innermost open span on the calling thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def begin(self, name: str, category: str, args: dict, nested: bool = True) -> Span:
+        """Open a span; ``nested`` spans become the target of ``annotate`` until they end."""
+        span = Span(self, name, category, args)
+        if nested:
+            self._stack().append(span)
+        return span
+
+    def end(self, span: Span) -> None:
+        end_ns = time.perf_counter_ns()
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        self.events.append(
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self.start_ns) / 1000,
+                "dur": (end_ns - span.start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": span.tid,
+                "args": _jsonable(span.args),
+            }
+        )
+
+    def to_chrome(self) -> dict:
+        """Chrome trace event format (the JSON object form)."""
+        return {
+            "traceEvents": [
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "args": {"name": f"sbm {self.label}"},
+                },
+                *sorted(self.events, key=lambda event: event["ts"]),
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "label": self.label,
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            },
+        }
+
+    def write(self, directory: Optional[Path] = None) -> Path:
+        directory = directory or TRACE_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        safe_label = re.sub(r"[^\w.-]", "_", self.label) or "trace"
+        path = directory / f"{safe_label}-{stamp}-{os.getpid()}.json"
+        path.write_text(json.dumps(self.to_chrome()))
+        return path
+
+
+def _jsonable(args: dict) -> dict:
+    return {
+        key: value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+        for key, value in args.items()
+    }
+
+
+_active: Optional[Trace] = None
+
+
+def get_active_trace() -> Optional[Trace]:
+    return _active
+
+
+def tracing_requested() -> bool:
+    """True if ``SBM_TRACE`` asks for every run to be traced."""
+    return os.environ.get(TRACE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@contextmanager
+def span(name: str, category: str = "sbm", **attrs: Any) -> Iterator[Span | _NullSpan]:
+    """Time the enclosed block as a span nested under the current one."""
+    trace = _active
+    if trace is None:
+        yield _NULL_SPAN
+        return
+    current = trace.begin(name, category, attrs)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=type(e).__name__)
+        raise
+    finally:
+        trace.end(current)
+
+
+def traced(name: Optional[str] = None, category: str = "sbm") -> Callable[[F], F]:
+    """Decorator form of ``span``; the span is named after the function by default."""
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes to the innermost open span, if a trace is running."""
+    trace = _active
+    if trace is None:
+        return
+    current = trace.current()
+    if current is not None:
+        current.set(**attrs)
+
+
+_ORIGINAL_POPEN = subprocess.Popen
+
+
+class _TracedPopen(subprocess.Popen):
+    """``subprocess.Popen`` that records a span from spawn until the exit status is collected."""
+
+    def __init__(self, args: Any, *popenargs: Any, **kwargs: Any) -> None:
+        self._sbm_span: Optional[Span] = None
+        trace = _active
+        if trace is not None:
+            argv = [args] if isinstance(args, (str, bytes, os.PathLike)) else list(args)
+            command = " ".join(str(arg) for arg in argv)
+            program = os.path.basename((str(argv[0]).split() or ["?"])[0]) if argv else "?"
+            self._sbm_span = trace.begin(
+                f"subprocess {program}",
+                "subprocess",
+                {"cmd": command[:MAX_COMMAND_LENGTH], "cwd": kwargs.get("cwd")},
+                nested=False,
+            )
+        try:
+            super().__init__(args, *popenargs, **kwargs)
+        except BaseException as e:
+            if self._sbm_span is not None:
+                self._sbm_span.set(error=type(e).__name__)
+                self._sbm_finish()
+            raise
+
+    def _sbm_finish(self) -> None:
+        current, self._sbm_span = self._sbm_span, None
+        if current is not None:
+            current.set(returncode=getattr(self, "returncode", None))
+            current.trace.end(current)
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        returncode = super().wait(timeout)
+        self._sbm_finish()
+        return returncode
+
+    def poll(self) -> Optional[int]:
+        returncode = super().poll()
+        if returncode is not None:
+            self._sbm_finish()
+        return returncode
+
+
+def start_trace(label: str) -> Trace:
+    """
+    Start recording spans (and subprocess spans) for ``label``.
+
+    Like ``patch_click_confirm_for_timing``, this swaps in a wrapper for the
+    duration of the run: ``subprocess.Popen`` is replaced so every command
+    started through ``subprocess`` gets a span. ``finish_trace`` restores it.
+    """
+    global _active
+    if _active is not None:
+        logger.debug(f"Trace for {_active.label} already running; continuing it")
+        return _active
+    _active = Trace(label)
+    if subprocess.Popen is _ORIGINAL_POPEN:
+        subprocess.Popen = _TracedPopen  # type: ignore[misc]
+    return _active
+
+
+def finish_trace(directory: Optional[Path] = None) -> Optional[Path]:
+    """Stop recording and write the trace file; returns its path."""
+    global _active
+    trace, _active = _active, None
+    if subprocess.Popen is _TracedPopen:
+        subprocess.Popen = _ORIGINAL_POPEN  # type: ignore[misc]
+    if trace is None:
+        return None
+    try:
+        path = trace.write(directory)
+    except OSError as e:
+        logger.warning(f"Could not write trace for {trace.label}: {e}")
+        return None
+    logger.info(f"Trace written to {path} (open it in https://ui.perfetto.dev)")
+    return path
+
+
+@contextmanager
+def trace_run(label: str, enabled: bool = False) -> Iterator[Optional[Trace]]:
+    """Trace the enclosed run if ``enabled`` or ``SBM_TRACE`` is set."""
+    if not (enabled or tracing_requested()) or _active is not None:
+        yield _active
+        return
+    trace = start_trace(label)
+    try:
+        with span(label, category="run", slug=label):
+            yield trace
+    finally:
+        finish_trace()
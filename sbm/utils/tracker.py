@@ -12,6 +12,7 @@ import os
 import re
 import socket
 import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -28,11 +29,18 @@ from .constants import (
     PR_STATE_OPEN,
     RUN_STATUS_SUCCESS,
 )
-from .firebase_sync import FirebaseSync, get_user_mode_identity, is_firebase_available
+from .firebase_sync import (
+    FirebaseSync,
+    build_run_key,
+    get_firebase_rest_client,
+    get_user_mode_identity,
+    is_firebase_available,
+)
 from .logger import logger
 from .processes import run_background_task
 from .run_helpers import is_complete_run
-from .slug_validation import is_official_slug
+from .slug_validation import is_official_slug, verify_slugs
+from .sync_outbox import RETRYABLE_STATUSES, SyncOutbox, open_outbox
 
 # Local tracker file (legacy/individual)
 TRACKER_FILE = Path.home() / ".sbm_migrations.json"
@@ -40,6 +48,9 @@ TRACKER_FILE = Path.home() / ".sbm_migrations.json"
 # Repository root for reference
 REPO_ROOT = Path(__file__).parent.parent.parent.resolve()
 
+# Runs pushed per multi-location write when draining the sync outbox
+SYNC_BATCH_SIZE = 50
+
 
 class SyncStatus:
     PENDING = "pending_sync"
@@ -145,6 +156,11 @@ def _write_tracker(data: dict) -> None:
         logger.warning(f"Failed to write local migration tracker to {TRACKER_FILE}: {e}")
 
 
+def _get_outbox() -> SyncOutbox | None:
+    """Open the sync outbox that lives alongside the tracker file."""
+    return open_outbox(TRACKER_FILE.parent)
+
+
 def record_migration(slug: str) -> tuple[bool, int]:
     """
     Record a completed migration. Returns (added, total_count).
@@ -262,6 +278,14 @@ def record_run(
         data["runs"] = runs
         _write_tracker(data)
 
+        # Durable record for the background flusher (no-op once synced)
+        try:
+            outbox = _get_outbox()
+            if outbox:
+                outbox.enqueue(build_run_key(run_entry), run_entry, run_entry["sync_status"])
+        except Exception as e:
+            logger.debug(f"Could not record run in sync outbox: {e}")
+
         # Always trigger background update to handle any other pending items
         trigger_background_stats_update()
 
@@ -394,48 +418,29 @@ def _parse_date_input(input_str: str) -> tuple[datetime, datetime] | None:
     return None
 
 
-def filter_runs(
-    runs: list[dict],
-    limit: int | None = None,
-    since: str | None = None,
-    until: str | None = None,
-    user: str | None = None,
-) -> list[dict]:
+def get_run_effective_date(run: dict) -> str:
+    """Get best date for filtering based on PR completion state."""
+    completion_state = get_pr_completion_state(run)
+    if completion_state == COMPLETION_COMPLETE:
+        return run.get("merged_at") or run.get("timestamp") or ""
+    if completion_state == COMPLETION_IN_REVIEW:
+        return run.get("created_at") or run.get("timestamp") or ""
+    if completion_state == COMPLETION_CLOSED:
+        return run.get("closed_at") or run.get("timestamp") or ""
+    if completion_state == COMPLETION_SUPERSEDED:
+        return run.get("superseded_at") or run.get("merged_at") or run.get("timestamp") or ""
+    return run.get("merged_at") or run.get("timestamp") or ""
+
+
+def resolve_date_window(
+    since: str | None = None, until: str | None = None
+) -> tuple[datetime | None, datetime | None]:
     """
-    Filter migration runs based on provided criteria.
-
-    Args:
-        runs: List of run dictionaries from tracker
-        limit: Maximum number of runs to return (most recent)
-        since: Period string ("day", "week", "month", "7") OR ISO date (YYYY-MM-DD).
-               Period strings filter runs from the last N days.
-        until: ISO date string (YYYY-MM-DD) - include runs up to this date
-        user: User ID to filter by (case-insensitive partial match)
+    Resolve ``filter_runs``-style since/until strings into aware datetimes.
 
     Returns:
-        Filtered list of runs, sorted by date (most recent first)
-
-    Note:
-        Date filtering uses PR state-aware timestamps:
-        merged_at for complete, created_at for in_review, closed_at for closed,
-        and timestamp as fallback.
+        (since_date, until_date); either may be None for an open bound
     """
-    filtered = runs.copy()
-
-    def get_effective_date(run: dict) -> str:
-        """Get best date for filtering based on PR completion state."""
-        completion_state = get_pr_completion_state(run)
-        if completion_state == COMPLETION_COMPLETE:
-            return run.get("merged_at") or run.get("timestamp") or ""
-        if completion_state == COMPLETION_IN_REVIEW:
-            return run.get("created_at") or run.get("timestamp") or ""
-        if completion_state == COMPLETION_CLOSED:
-            return run.get("closed_at") or run.get("timestamp") or ""
-        if completion_state == COMPLETION_SUPERSEDED:
-            return run.get("superseded_at") or run.get("merged_at") or run.get("timestamp") or ""
-        return run.get("merged_at") or run.get("timestamp") or ""
-
-    # Apply date filtering using effective date
     since_date = None
     until_date = None
 
@@ -477,10 +482,44 @@ def filter_runs(
     if until_date and until_date.tzinfo is None:
         until_date = until_date.replace(tzinfo=timezone.utc)
 
+    return since_date, until_date
+
+
+def filter_runs(
+    runs: list[dict],
+    limit: int | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    user: str | None = None,
+) -> list[dict]:
+    """
+    Filter migration runs based on provided criteria.
+
+    Args:
+        runs: List of run dictionaries from tracker
+        limit: Maximum number of runs to return (most recent)
+        since: Period string ("day", "week", "month", "7") OR ISO date (YYYY-MM-DD).
+               Period strings filter runs from the last N days.
+        until: ISO date string (YYYY-MM-DD) - include runs up to this date
+        user: User ID to filter by (case-insensitive partial match)
+
+    Returns:
+        Filtered list of runs, sorted by date (most recent first)
+
+    Note:
+        Date filtering uses PR state-aware timestamps:
+        merged_at for complete, created_at for in_review, closed_at for closed,
+        and timestamp as fallback.
+    """
+    filtered = runs.copy()
+
+    # Apply date filtering using effective date
+    since_date, until_date = resolve_date_window(since, until)
+
     if since_date or until_date:
         date_filtered = []
         for run in filtered:
-            date_str = get_effective_date(run)
+            date_str = get_run_effective_date(run)
             if not date_str:
                 continue
             try:
@@ -517,7 +556,7 @@ def filter_runs(
         filtered = user_filtered
 
     # Sort by effective date (merged_at or timestamp, most recent first)
-    filtered.sort(key=get_effective_date, reverse=True)
+    filtered.sort(key=get_run_effective_date, reverse=True)
 
     # Apply limit (take first N after sorting)
     if limit is not None and limit > 0:
@@ -804,16 +843,11 @@ def get_global_reporting_data() -> tuple[list[dict], dict[str, set]]:
             users_ref = db.reference("/users")
             users_data = users_ref.get()
         else:
-            # User mode: use REST API for read access
-            import requests
-
-            identity = get_user_mode_identity()
-            if not identity:
+            # User mode: use REST API for read access (pooled session)
+            if not get_user_mode_identity():
                 return all_runs, user_migrations
-            _, token = identity
 
-            url = f"{settings.firebase.database_url}/users.json?auth={token}"
-            resp = requests.get(url, timeout=10)
+            resp = get_firebase_rest_client().get("users")
             if resp.ok:
                 users_data = resp.json()
             else:
@@ -823,38 +857,54 @@ def get_global_reporting_data() -> tuple[list[dict], dict[str, set]]:
         if not users_data:
             return all_runs, user_migrations
 
-        # Process all users' data from Firebase
-        for user_id, user_data in users_data.items():
-            if not isinstance(user_data, dict):
-                continue
-            runs = user_data.get("runs", {})
-
-            for _run_id, run in runs.items():
-                if run.get("status") == "invalid":
-                    continue
-                if run.get("slug") == "verification-ping":
-                    continue
-                run_author = _get_run_author(run)
-                run["_user"] = run_author
-                all_runs.append(run)
-
-                # Track unique migrations per user
-                # Only count complete (merged) runs
-                slug = run.get("slug")
-                if (
-                    slug
-                    and run.get("status") == "success"
-                    and get_pr_completion_state(run) == "complete"
-                ):
-                    user_migrations.setdefault(run_author, set()).add(slug)
-
-        return all_runs, user_migrations
+        return build_reporting_data(users_data)
 
     except Exception as e:
         logger.debug(f"Error fetching global reporting data from Firebase: {e}")
         return all_runs, user_migrations
 
 
+def build_reporting_data(users_data: dict) -> tuple[list[dict], dict[str, set]]:
+    """
+    Flatten a raw ``/users`` tree into (all_runs, user_migrations).
+
+    Each returned run is a copy tagged with its author in ``_user``; the input
+    tree is not modified, so callers can keep it as a live mirror.
+    """
+    all_runs: list[dict] = []
+    user_migrations: dict[str, set] = {}
+
+    for user_data in users_data.values():
+        if not isinstance(user_data, dict):
+            continue
+        runs = user_data.get("runs") or {}
+        if not isinstance(runs, dict):
+            continue
+
+        for run in runs.values():
+            if not isinstance(run, dict):
+                continue
+            if run.get("status") == "invalid":
+                continue
+            if run.get("slug") == "verification-ping":
+                continue
+            run_author = _get_run_author(run)
+            run = {**run, "_user": run_author}
+            all_runs.append(run)
+
+            # Track unique migrations per user
+            # Only count complete (merged) runs
+            slug = run.get("slug")
+            if (
+                slug
+                and run.get("status") == "success"
+                and get_pr_completion_state(run) == "complete"
+            ):
+                user_migrations.setdefault(run_author, set()).add(slug)
+
+    return all_runs, user_migrations
+
+
 def get_pr_completion_state(run: dict) -> str:
     """
     Classify run completion state based on PR timestamps and state.
@@ -974,15 +1024,12 @@ def _calculate_metrics(data: dict) -> dict:
 def trigger_background_stats_update() -> None:
     """
     Trigger a silent background refresh of statistics.
-    Uses the sbm cli to run the backfill script and sync global stats.
+
+    Spawns the lightweight ``sbm.worker`` entry point, which flushes the sync
+    outbox and refreshes recent PR statuses without importing the full CLI.
     """
     try:
-        # Trigger command in background
-        # Trigger internal refresh stats command
-        # This command is responsible for calling process_pending_syncs among other things
-        # We need to make sure sbm.cli exposes a command that calls process_pending_syncs
-        # For now, let's assume 'internal-refresh-stats' does or will do that.
-        run_background_task([os.sys.executable, "-m", "sbm.cli", "internal-refresh-stats"])
+        run_background_task([sys.executable, "-m", "sbm.worker", "refresh-stats"])
 
     except Exception as e:
         logger.debug(f"Failed to trigger background stats update: {e}")
@@ -994,42 +1041,8 @@ def _sync_to_firebase(run_entry: dict) -> bool:
         return False
 
     try:
-        github_login = _get_github_login()
+        github_login = _prepare_run_for_sync(run_entry, _get_github_login())
         if not github_login:
-            run_entry["sync_status"] = SyncStatus.MISSING_GITHUB_AUTH
-            logger.warning("Skipping Firebase sync: GitHub CLI not authenticated.")
-            return False
-
-        pr_author = run_entry.get("pr_author")
-        if pr_author and pr_author != github_login:
-            run_entry["sync_status"] = SyncStatus.AUTHOR_MISMATCH
-            logger.warning(
-                "Skipping Firebase sync: PR author does not match authenticated GitHub user "
-                f"('{pr_author}' != '{github_login}')."
-            )
-            return False
-
-        run_entry["user_id"] = github_login
-        run_entry["pr_author"] = github_login
-
-        slug = run_entry.get("slug")
-        if slug:
-            valid = is_official_slug(slug)
-            # Allow backfill_recovery to bypass validation
-            if valid is False and run_entry.get("command") != "backfill_recovery":
-                run_entry["sync_status"] = SyncStatus.INVALID_SLUG
-                logger.warning(f"Skipping Firebase sync for invalid slug: {slug}")
-                return False
-            if valid is None:
-                run_entry["sync_status"] = SyncStatus.VALIDATION_UNAVAILABLE
-                logger.warning("Devtools validation unavailable; delaying Firebase sync.")
-                return False
-
-        # Check for empty migrations (false positives)
-        lines = run_entry.get("lines_migrated", 0)
-        if lines <= 0:
-            run_entry["sync_status"] = SyncStatus.SKIPPED_EMPTY
-            logger.info(f"Skipping Firebase sync for empty migration ({lines} lines)")
             return False
 
         sync = FirebaseSync()
@@ -1039,36 +1052,148 @@ def _sync_to_firebase(run_entry: dict) -> bool:
         return False
 
 
+def _prepare_run_for_sync(run_entry: dict, github_login: str | None) -> str | None:
+    """
+    Apply the sync gates to a run and stamp its attribution.
+
+    Returns the GitHub login to push under, or None after setting ``sync_status``
+    to the reason the run cannot be synced yet.
+    """
+    if not github_login:
+        run_entry["sync_status"] = SyncStatus.MISSING_GITHUB_AUTH
+        logger.warning("Skipping Firebase sync: GitHub CLI not authenticated.")
+        return None
+
+    pr_author = run_entry.get("pr_author")
+    if pr_author and pr_author != github_login:
+        run_entry["sync_status"] = SyncStatus.AUTHOR_MISMATCH
+        logger.warning(
+            "Skipping Firebase sync: PR author does not match authenticated GitHub user "
+            f"('{pr_author}' != '{github_login}')."
+        )
+        return None
+
+    run_entry["user_id"] = github_login
+    run_entry["pr_author"] = github_login
+
+    slug = run_entry.get("slug")
+    if slug:
+        valid = is_official_slug(slug)
+        # Allow backfill_recovery to bypass validation
+        if valid is False and run_entry.get("command") != "backfill_recovery":
+            run_entry["sync_status"] = SyncStatus.INVALID_SLUG
+            logger.warning(f"Skipping Firebase sync for invalid slug: {slug}")
+            return None
+        if valid is None:
+            run_entry["sync_status"] = SyncStatus.VALIDATION_UNAVAILABLE
+            logger.warning("Devtools validation unavailable; delaying Firebase sync.")
+            return None
+
+    # Check for empty migrations (false positives)
+    lines = run_entry.get("lines_migrated", 0)
+    if lines <= 0:
+        run_entry["sync_status"] = SyncStatus.SKIPPED_EMPTY
+        logger.info(f"Skipping Firebase sync for empty migration ({lines} lines)")
+        return None
+
+    return github_login
+
+
+def flush_sync_outbox(
+    outbox: SyncOutbox | None = None, batch_size: int = SYNC_BATCH_SIZE
+) -> dict[str, str]:
+    """
+    Push pending outbox runs to Firebase in batches.
+
+    Only one flusher runs at a time (lease in the outbox database); a concurrent
+    call returns immediately. Each batch is a single multi-location write.
+
+    Returns:
+        Mapping of run key to the sync status recorded for it during this flush.
+    """
+    outbox = outbox or _get_outbox()
+    if outbox is None or not is_firebase_available():
+        return {}
+    if not outbox.acquire_flush_lease():
+        logger.debug("Another process is flushing the sync outbox")
+        return {}
+
+    statuses: dict[str, str] = {}
+    try:
+        github_login = _get_github_login()
+        sync = FirebaseSync()
+        attempted: set[str] = set()
+        while True:
+            batch = [(k, r) for k, r in outbox.pending(limit=batch_size) if k not in attempted]
+            if not batch:
+                break
+            attempted.update(key for key, _ in batch)
+
+            # Warm the slug cache for the whole batch (one devtools pass, one write)
+            verify_slugs(run.get("slug") for _, run in batch)
+
+            batch_statuses: dict[str, str] = {}
+            to_push: list[tuple[str, dict]] = []
+            for key, run in batch:
+                run["sync_status"] = SyncStatus.PENDING
+                if _prepare_run_for_sync(run, github_login):
+                    to_push.append((key, run))
+                else:
+                    batch_statuses[key] = run["sync_status"]
+
+            pushed = sync.push_runs_bulk(github_login, [r for _, r in to_push]) if to_push else []
+            for (key, _), ok in zip(to_push, pushed):
+                batch_statuses[key] = SyncStatus.SYNCED if ok else SyncStatus.PENDING
+
+            outbox.mark(batch_statuses)
+            statuses.update(batch_statuses)
+    except Exception as e:
+        logger.debug(f"Sync outbox flush failed: {e}")
+    finally:
+        outbox.release_flush_lease()
+
+    return statuses
+
+
 def process_pending_syncs() -> None:
     """
-    Check for runs with 'pending_sync' status and attempt to upload them.
-    Updates the local tracker file with new statuses.
+    Upload runs waiting in the sync outbox and mirror the results to the tracker.
+
+    Pending runs found in the tracker (recorded before the outbox existed, or reset
+    by hand) are enqueued first; enqueueing is idempotent per run key.
     """
+    outbox = _get_outbox()
+    if outbox is None:
+        return
+
     data = _read_tracker()
     runs = data.get("runs", [])
-    updated = False
+    run_keys: dict[int, str] = {}
+    for run in runs:
+        if run.get("status") != RUN_STATUS_SUCCESS:
+            continue
+        sync_status = run.get("sync_status", SyncStatus.PENDING)  # Default to pending if missing
+        if sync_status in RETRYABLE_STATUSES:
+            try:
+                key = build_run_key(run)
+            except ValueError as e:
+                # Without a stable key every flush would push it as a new run
+                logger.warning(f"Not syncing run: {e}")
+                continue
+            run_keys[id(run)] = key
+            outbox.enqueue(key, run, sync_status)
+
+    statuses = flush_sync_outbox(outbox)
+    if not statuses:
+        return
 
-    # Check for pending items
+    # Mirror outcomes into the tracker (single write) for display and compatibility
+    updated = False
     for run in runs:
-        # Check if it's a success run that hasn't been synced (or marked as failed/pending)
-        # We primarily care about runs where status='success' and sync_status != 'synced'
-        if run.get("status") == "success":
-            sync_status = run.get(
-                "sync_status", SyncStatus.PENDING
-            )  # Default to pending if missing
-
-            if sync_status in {SyncStatus.PENDING, SyncStatus.VALIDATION_UNAVAILABLE}:
-                # Attempt sync
-                success = _sync_to_firebase(run)
-                if success:
-                    run["sync_status"] = SyncStatus.SYNCED
-                    updated = True
-                elif run.get("sync_status") == SyncStatus.INVALID_SLUG:
-                    # If it failed, ensure it is marked as pending unless invalid
-                    updated = True
-                elif sync_status != SyncStatus.PENDING:
-                    run["sync_status"] = SyncStatus.PENDING
-                    updated = True
+        key = run_keys.get(id(run))
+        if key in statuses and run.get("sync_status") != statuses[key]:
+            run["sync_status"] = statuses[key]
+            updated = True
 
     if updated:
         _write_tracker(data)
@@ -1138,8 +1263,6 @@ def mark_runs_for_remigration(slugs: list[str]) -> dict[str, int]:
             users_data = ref.get()
         else:
             # User Mode: REST
-            import requests
-
             from sbm.utils.firebase_sync import _get_user_mode_identity
 
             identity = _get_user_mode_identity()
@@ -1147,9 +1270,7 @@ def mark_runs_for_remigration(slugs: list[str]) -> dict[str, int]:
                 logger.warning("Cannot authenticate for remigration marking")
                 return {"updated": 0, "failed": 0, "not_found": len(slugs)}
 
-            _, token = identity
-            url = f"{settings.firebase.database_url}/users.json?auth={token}"
-            resp = requests.get(url, timeout=10)
+            resp = get_firebase_rest_client().get("users")
             if resp.ok:
                 users_data = resp.json()
             else:
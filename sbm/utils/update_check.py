@@ -0,0 +1,164 @@
+"""
+Cached check for newer auto-sbm versions.
+
+Commands never wait on the network to learn whether an update exists. The CLI
+reads the last result from ``UPDATE_CHECK_PATH`` and, once it is older than
+``UPDATE_CHECK_TTL_SECONDS``, starts ``python -m sbm.worker check-update`` in
+the background to refresh it. The worker fetches the checkout's branch from
+origin and records the version in origin's ``pyproject.toml``.
+
+Keep module-level imports limited to the standard library; the worker imports
+this module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+UPDATE_CHECK_PATH = Path.home() / ".sbm_update_check.json"
+
+# How long a remote version check stays fresh
+UPDATE_CHECK_TTL_SECONDS = 6 * 60 * 60
+
+# Don't start another background check while the last one is probably still running
+UPDATE_CHECK_RETRY_SECONDS = 120
+
+# Only these branches track released versions
+UPDATE_BRANCHES = ("main", "master")
+
+_VERSION_PATTERN = re.compile(r'^version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+# Numeric release segment at the start of a version string ("2.10.1" in "2.10.1rc1")
+_RELEASE_PATTERN = re.compile(r"\d+(?:\.\d+)*")
+
+
+def read_version_from_text(text: str) -> Optional[str]:
+    match = _VERSION_PATTERN.search(text)
+    return match.group(1) if match else None
+
+
+def parse_version(version: str) -> Optional[tuple[int, ...]]:
+    """Release segment of ``version`` as an int tuple without trailing zeros, or None."""
+    match = _RELEASE_PATTERN.match(version.strip().lstrip("vV"))
+    if not match:
+        return None
+    release = [int(part) for part in match.group().split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
+def read_head_branch(repo_root: Path) -> Optional[str]:
+    """Branch checked out in ``repo_root`` (read from .git/HEAD), or None if detached."""
+    try:
+        head = (repo_root / ".git" / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    prefix = "ref: refs/heads/"
+    return head[len(prefix) :] if head.startswith(prefix) else None
+
+
+def get_remote_version(repo_root: Path, branch: str) -> Optional[str]:
+    """Fetch ``branch`` from origin and return the version in its pyproject.toml."""
+    fetch_res = subprocess.run(
+        ["git", "fetch", "--quiet", "origin", branch],
+        check=False,
+        cwd=str(repo_root),
+        capture_output=True,
+        timeout=10,
+    )
+    if fetch_res.returncode != 0:
+        return None
+
+    show_res = subprocess.run(
+        ["git", "show", f"origin/{branch}:pyproject.toml"],
+        check=False,
+        cwd=str(repo_root),
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    if show_res.returncode != 0:
+        return None
+
+    return read_version_from_text(show_res.stdout)
+
+
+def load_update_check(path: Optional[Path] = None) -> dict:
+    try:
+        data = json.loads((path or UPDATE_CHECK_PATH).read_text())
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_update_check(data: dict, path: Optional[Path] = None) -> None:
+    path = path or UPDATE_CHECK_PATH
+    try:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def update_check_due(data: dict, now: Optional[float] = None) -> bool:
+    """True if the cached result is stale and no refresh was requested recently."""
+    now = time.time() if now is None else now
+    if now - data.get("requested_at", 0) < UPDATE_CHECK_RETRY_SECONDS:
+        return False
+    return now - data.get("checked_at", 0) >= UPDATE_CHECK_TTL_SECONDS
+
+
+def available_update(data: dict, repo_root: Path, local_version: Optional[str]) -> Optional[str]:
+    """Remote version from the cached check if it is newer than ``local_version``."""
+    remote_version = data.get("remote_version")
+    if not remote_version or not local_version or local_version == "Unknown":
+        return None
+    if data.get("branch") != read_head_branch(repo_root):
+        return None
+    remote_release = parse_version(remote_version)
+    local_release = parse_version(local_version)
+    if remote_release is None or local_release is None:
+        return None
+    return remote_version if remote_release > local_release else None
+
+
+def request_update_check(repo_root: Path, data: dict, path: Optional[Path] = None) -> None:
+    """Start a background refresh of the cached check (fire-and-forget)."""
+    from sbm.utils.processes import run_background_task
+
+    save_update_check({**data, "requested_at": time.time()}, path)
+    run_background_task(
+        [sys.executable, "-m", "sbm.worker", "check-update", "--repo-root", str(repo_root)]
+    )
+
+
+def check_for_update(repo_root: Path, path: Optional[Path] = None) -> dict:
+    """
+    Look up the remote version for the checked-out branch and cache the result.
+
+    Detached checkouts and branches other than main/master record no remote
+    version, so no update is reported for them.
+    """
+    branch = read_head_branch(repo_root)
+    remote_version = None
+    if branch in UPDATE_BRANCHES:
+        try:
+            remote_version = get_remote_version(repo_root, branch)
+        except (OSError, subprocess.SubprocessError):
+            remote_version = None
+
+    data = {"checked_at": time.time(), "branch": branch, "remote_version": remote_version}
+    if branch in UPDATE_BRANCHES and remote_version is None:
+        # Offline or fetch failed: keep the last known version, retry after the TTL
+        data["remote_version"] = load_update_check(path).get("remote_version")
+    save_update_check(data, path)
+    return data
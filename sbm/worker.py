@@ -0,0 +1,175 @@
+"""
+Lightweight background worker for SBM.
+
+Runs the post-migration housekeeping (flushing the Firebase sync outbox and
+refreshing PR statuses) and the auto-sbm update check without importing
+``sbm.cli``. The CLI pulls in rich_click, GitPython, the migration core, the
+SCSS processor and the OEM handlers, none of which are needed here, so the
+background process starts quickly and stays small.
+
+Usage:
+    python -m sbm.worker refresh-stats [--max-prs N]
+    python -m sbm.worker check-update --repo-root PATH
+
+Keep module-level imports limited to the standard library; everything else is
+imported inside the task functions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+# Default number of in-progress PRs re-checked by a background refresh
+DEFAULT_MAX_PRS = 10
+
+
+def update_recent_pr_statuses(max_to_check: int | None = DEFAULT_MAX_PRS) -> None:
+    """
+    Update PR statuses for recent in-progress runs.
+
+    Called by the background refresh to provide near-real-time updates.
+    Limits to recent runs to avoid excessive API calls.
+
+    Supports User Mode by using the FirebaseSync abstraction. PR metadata is
+    fetched with batched GraphQL queries and written back with a single bulk
+    update.
+
+    Args:
+        max_to_check: Maximum number of recent runs to check (default: 10). None = unlimited.
+    """
+    try:
+        from sbm.utils.firebase_sync import FirebaseSync, is_firebase_available
+        from sbm.utils.github_pr import GitHubPRManager
+
+        if not is_firebase_available():
+            return
+
+        sync = FirebaseSync()
+
+        # GLOBAL UPDATE STRATEGY
+        # We fetch ALL data so we can update ANY stale run, regardless of who owns it.
+        # This relies on Firebase Rules being set to allow global writes (auth != null).
+        all_data = sync.fetch_all_users_raw()
+
+        if not all_data:
+            return
+
+        # Flatten all runs into a list of (user_id, run_id, run_data)
+        all_runs_flat = []
+        for u_id, u_data in all_data.items():
+            if not isinstance(u_data, dict):
+                continue
+            runs = u_data.get("runs", {})
+            for r_id, r_data in runs.items():
+                # Filter out verification-ping here too so we don't waste time checking it
+                if r_data.get("slug") == "verification-ping":
+                    continue
+                all_runs_flat.append((u_id, r_id, r_data))
+
+        # Sort runs by timestamp desc to check most recent first (GLOBAL priority)
+        sorted_runs = sorted(all_runs_flat, key=lambda x: x[2].get("timestamp", ""), reverse=True)
+
+        # Only check runs that need refresh
+        to_check = [
+            (user_id, run_id, run_data)
+            for user_id, run_id, run_data in sorted_runs
+            if isinstance(run_data, dict) and GitHubPRManager.should_refresh_pr_data(run_data)
+        ]
+        if max_to_check is not None:
+            to_check = to_check[:max_to_check]
+        if not to_check:
+            return
+
+        # Enrich all selected runs with batched GraphQL lookups
+        GitHubPRManager.enrich_runs_with_pr_data(
+            [run_data for _, _, run_data in to_check], force_refresh=True
+        )
+
+        pending_updates: list[tuple[str, str, dict]] = []
+        for user_id, run_id, enriched in to_check:
+            # Update Firebase via helper (supports REST/User Mode)
+            update_data = {
+                "created_at": enriched.get("created_at"),
+                "merged_at": enriched.get("merged_at"),
+                "closed_at": enriched.get("closed_at"),
+                "pr_state": enriched.get("pr_state"),
+                "pr_author": enriched.get("pr_author"),  # Ensure author is synced
+            }
+            # Remove None values
+            update_data = {k: v for k, v in update_data.items() if v is not None}
+
+            if update_data:
+                # Keep the specific user_id of the run owner
+                pending_updates.append((user_id, run_id, update_data))
+
+        if pending_updates:
+            # One multi-location write instead of a PATCH per run
+            sync.update_runs_bulk(pending_updates)
+
+    except Exception:
+        # Silent failure for background task
+        pass
+
+
+def refresh_stats(max_prs: int | None = DEFAULT_MAX_PRS) -> None:
+    """Flush pending Firebase syncs, then refresh recent PR statuses."""
+    try:
+        from sbm.utils.tracker import process_pending_syncs
+
+        # Process pending Firebase syncs (retry offline queue)
+        process_pending_syncs()
+
+        # Update PR statuses for in-progress runs (limited to most recent)
+        update_recent_pr_statuses(max_to_check=max_prs)
+
+    except Exception:
+        # Silent failure for background tasks
+        pass
+
+
+def check_update(repo_root: str) -> None:
+    """Refresh the cached remote-version check read by the CLI at startup."""
+    try:
+        from pathlib import Path
+
+        from sbm.utils.update_check import check_for_update
+
+        check_for_update(Path(repo_root))
+
+    except Exception:
+        # Silent failure for background tasks
+        pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m sbm.worker", description="SBM background maintenance tasks."
+    )
+    subparsers = parser.add_subparsers(dest="task", required=True)
+
+    refresh = subparsers.add_parser(
+        "refresh-stats", help="Flush pending Firebase syncs and refresh recent PR statuses."
+    )
+    refresh.add_argument(
+        "--max-prs",
+        type=int,
+        default=DEFAULT_MAX_PRS,
+        help=f"Maximum recent PRs to re-check (default: {DEFAULT_MAX_PRS}, 0 = unlimited).",
+    )
+
+    update = subparsers.add_parser(
+        "check-update", help="Record the latest auto-sbm version available on origin."
+    )
+    update.add_argument("--repo-root", required=True, help="auto-sbm checkout to check.")
+
+    args = parser.parse_args(argv)
+    if args.task == "refresh-stats":
+        refresh_stats(max_prs=args.max_prs or None)
+    elif args.task == "check-update":
+        check_update(args.repo_root)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
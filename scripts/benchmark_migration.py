@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark a full ``sbm auto`` batch offline and report per-stage timings.
+
+A batch of synthetic themes is migrated by the real CLI in a child process,
+against the stand-ins from scripts/offline_harness.py: fake docker/gh/just,
+a local Firebase emulator and a throwaway platform repo with a bare origin.
+Every migration runs with --trace; the Chrome traces are folded into one row
+per timer segment, external command and Firebase call, so orchestration
+regressions (extra subprocesses, sleeps, round trips) show up even though
+the SCSS work itself is covered by scripts/benchmark_scss.py.
+
+Usage:
+    python scripts/benchmark_migration.py [--themes N] [--lines N] [--profile P]
+    python scripts/benchmark_migration.py --save-baseline migration.json
+    python scripts/benchmark_migration.py --baseline migration.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# Allow running as ``python scripts/benchmark_migration.py`` from a checkout
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.benchmark_scss import compare  # noqa: E402
+from scripts.offline_harness import (  # noqa: E402
+    FirebaseEmulator,
+    make_platform_repo,
+    offline_env,
+    write_fake_executables,
+)
+from scripts.synthetic_theme import PROFILES  # noqa: E402
+
+# Trace categories reported as stages; scss/maps spans are left to ``sbm profile``
+STAGE_CATEGORIES = ("run", "segment", "subprocess", "firebase")
+
+
+def _stage_name(event: dict) -> str:
+    if event["cat"] == "run":
+        return "run/total"
+    if event["cat"] == "subprocess":
+        return "subprocess/" + event["name"].split(" ", 1)[1]
+    return f"{event['cat']}/{event['name']}"
+
+
+def summarize_traces(paths: list) -> dict:
+    """Fold Chrome traces into ``{stage: {"calls": n, "seconds": total}}``."""
+    stages = defaultdict(lambda: {"calls": 0, "seconds": 0.0})
+    for path in paths:
+        for event in json.loads(Path(path).read_text())["traceEvents"]:
+            if event.get("ph") != "X" or event.get("cat") not in STAGE_CATEGORIES:
+                continue
+            stage = stages[_stage_name(event)]
+            stage["calls"] += 1
+            stage["seconds"] += event["dur"] / 1_000_000
+    return dict(stages)
+
+
+def run_batch(workdir: Path, themes: int, lines: int, profile: str) -> dict:
+    """Migrate ``themes`` synthetic themes with ``sbm auto`` and collect the results."""
+    slugs = [f"benchdealer{i + 1}" for i in range(themes)]
+    bin_dir = write_fake_executables(workdir / "bin")
+    platform_dir = make_platform_repo(workdir, slugs, lines, profile)
+    home = workdir / "home"
+    home.mkdir()
+
+    with FirebaseEmulator() as emulator:
+        env = offline_env(home, bin_dir, platform_dir, emulator)
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-m", "sbm", "auto", *slugs, "--yes", "--trace"],
+            cwd=workdir,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+        wall = time.perf_counter() - start
+        firebase_requests = Counter(method for method, _ in emulator.requests)
+
+    traces = sorted((home / ".sbm" / "traces").glob("*.json"))
+    return {
+        "themes": themes,
+        "lines": lines,
+        "profile": profile,
+        "returncode": proc.returncode,
+        "output": proc.stdout + proc.stderr,
+        "traced_themes": len(traces),
+        "wall_seconds": wall,
+        "firebase_requests": dict(firebase_requests),
+        "stages": summarize_traces(traces),
+    }
+
+
+def per_theme_seconds(result: dict) -> dict:
+    """Mean seconds per theme for every stage, plus the batch wall time."""
+    themes = max(result["themes"], 1)
+    means = {name: stage["seconds"] / themes for name, stage in result["stages"].items()}
+    means["batch/wall"] = result["wall_seconds"] / themes
+    return means
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--themes", type=int, default=3, help="Themes in the batch")
+    parser.add_argument("--lines", type=int, default=5_000, help="SCSS lines per theme")
+    parser.add_argument("--profile", choices=PROFILES, default="mixed")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved run")
+    parser.add_argument("--save-baseline", type=Path, help="Save this run as a baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--min-ms", type=float, default=20.0, help="Ignore stages faster than this in the baseline"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the work directory")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="sbm-e2e-bench-"))
+    try:
+        result = run_batch(workdir, args.themes, args.lines, args.profile)
+    finally:
+        if args.keep:
+            print(f"Work directory kept at {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if result["returncode"] != 0 or result["traced_themes"] != args.themes:
+        print(result["output"][-4000:], file=sys.stderr)
+        print(
+            f"sbm auto exited {result['returncode']} with "
+            f"{result['traced_themes']}/{args.themes} traced migrations",
+            file=sys.stderr,
+        )
+        return 2
+
+    means = per_theme_seconds(result)
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["per_theme_seconds"]
+
+    if args.json:
+        print(json.dumps({**result, "output": None, "per_theme_seconds": means}, indent=2))
+    else:
+        print(f"{args.themes} themes x {args.lines:,} lines ({args.profile})")
+        print(f"{'stage':<45} {'calls':>6} {'ms/theme':>10} {'baseline':>10} {'change':>8}")
+        for name, seconds in sorted(means.items(), key=lambda item: -item[1]):
+            calls = result["stages"].get(name, {}).get("calls", "")
+            reference = baseline.get(name)
+            ref_ms = f"{reference * 1000:>10.1f}" if reference else f"{'-':>10}"
+            change = f"{(seconds / reference - 1) * 100:>+7.0f}%" if reference else f"{'-':>8}"
+            print(f"{name:<45} {calls:>6} {seconds * 1000:>10.1f} {ref_ms} {change}")
+        requests = ", ".join(f"{m} {n}" for m, n in sorted(result["firebase_requests"].items()))
+        print(f"Firebase emulator requests: {requests or 'none'}")
+
+    if args.save_baseline:
+        record = {key: result[key] for key in ("themes", "lines", "profile")}
+        record["per_theme_seconds"] = means
+        args.save_baseline.write_text(json.dumps(record, indent=2) + "\n")
+        print(f"Baseline saved to {args.save_baseline}", file=sys.stderr)
+
+    # Stages of a few milliseconds are mostly process start-up noise
+    significant = {name: s for name, s in baseline.items() if s * 1000 >= args.min_ms}
+    regressions = compare(means, significant, args.tolerance)
+    for name, seconds, reference, ratio in regressions:
+        print(
+            f"REGRESSION {name}: {seconds * 1000:.1f} ms vs {reference * 1000:.1f} ms "
+            f"({ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
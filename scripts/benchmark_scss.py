@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SCSS pipeline on synthetic themes and compare against a baseline.
+
+Each scenario generates deterministic SCSS with scripts/synthetic_theme.py and
+times the pipeline entry points on it; we report the median of several runs.
+With --baseline the results are compared against a stored run and the script
+exits 1 if any benchmark got slower than the tolerance allows.
+
+Usage:
+    python scripts/benchmark_scss.py [--scenario NAME ...] [--target NAME ...] [--repeat N]
+    python scripts/benchmark_scss.py --save-baseline
+    python scripts/benchmark_scss.py --baseline [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running as ``python scripts/benchmark_scss.py`` from a checkout
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.synthetic_theme import generate_scss  # noqa: E402
+from sbm.utils.path import PLATFORM_DIR_ENV_VAR  # noqa: E402
+
+DEFAULT_BASELINE = ROOT / "scripts" / "benchmark_baselines" / "scss.json"
+
+# name -> (lines, generator profile)
+SCENARIOS = {
+    "mixed-1k": (1_000, "mixed"),
+    "mixed-10k": (10_000, "mixed"),
+    "mixed-100k": (100_000, "mixed"),
+    "nested-10k": (10_000, "nested"),
+    "mixins-10k": (10_000, "mixins"),
+    "variables-10k": (10_000, "variables"),
+}
+
+
+def _targets(platform_dir: Path) -> dict:
+    """Benchmark name -> callable taking the SCSS content."""
+    from sbm.scss.classifiers import StyleClassifier
+    from sbm.scss.formatter import SCSSFormatter
+    from sbm.scss.mixin_parser import CommonThemeMixinParser
+    from sbm.scss.processor import SCSSProcessor
+
+    (platform_dir / "dealer-themes" / "benchmark").mkdir(parents=True, exist_ok=True)
+    return {
+        "transform": lambda scss: SCSSProcessor(
+            "benchmark", exclude_nav_styles=False
+        ).transform_scss_content(scss),
+        "mixins": lambda scss: CommonThemeMixinParser().parse_and_convert_mixins(scss),
+        "classifier": lambda scss: StyleClassifier(strict_mode=True).filter_scss_content(scss),
+        "formatter": lambda scss: SCSSFormatter().format(scss),
+    }
+
+
+def measure(func, content: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def run(scenarios: list, targets: list, repeat: int) -> dict:
+    """Return ``{"scenario/target": seconds}`` for every requested combination."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="sbm-bench-") as tmp:
+        previous = os.environ.get(PLATFORM_DIR_ENV_VAR)
+        os.environ[PLATFORM_DIR_ENV_VAR] = tmp
+        try:
+            funcs = _targets(Path(tmp))
+            for scenario in scenarios:
+                lines, profile = SCENARIOS[scenario]
+                content = generate_scss(lines, profile)
+                for target in targets:
+                    results[f"{scenario}/{target}"] = measure(funcs[target], content, repeat)
+        finally:
+            if previous is None:
+                os.environ.pop(PLATFORM_DIR_ENV_VAR, None)
+            else:
+                os.environ[PLATFORM_DIR_ENV_VAR] = previous
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return ``(name, seconds, baseline_seconds, ratio)`` for results slower than allowed."""
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference and seconds > reference * (1 + tolerance):
+            regressions.append((name, seconds, reference, seconds / reference))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Repeatable")
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=("transform", "mixins", "classifier", "formatter"),
+        help="Repeatable",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (median)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        type=Path,
+        help="Compare against a stored baseline (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        type=Path,
+        help="Write the results as the new baseline (default: %(const)s)",
+    )
+    args = parser.parse_args()
+
+    # Keep pipeline logging out of the timings and the output
+    logging.disable(logging.WARNING)
+    scenarios = args.scenario or list(SCENARIOS)
+    targets = args.target or ["transform", "mixins", "classifier", "formatter"]
+    results = run(scenarios, targets, max(args.repeat, 1))
+
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'benchmark':<30} {'median ms':>10} {'baseline ms':>12} {'change':>8}")
+        for name, seconds in results.items():
+            reference = baseline.get(name)
+            ref_ms = f"{reference * 1000:>12.1f}" if reference else f"{'-':>12}"
+            change = f"{(seconds / reference - 1) * 100:>+7.0f}%" if reference else f"{'-':>8}"
+            print(f"{name:<30} {seconds * 1000:>10.1f} {ref_ms} {change}")
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        args.save_baseline.write_text(json.dumps(record, indent=2) + "\n")
+        print(f"Baseline saved to {args.save_baseline}", file=sys.stderr)
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, seconds, reference, ratio in regressions:
+        print(
+            f"REGRESSION {name}: {seconds * 1000:.1f} ms vs {reference * 1000:.1f} ms "
+            f"({ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare the startup cost of the background worker against the full CLI.
+
+Each target is imported in a fresh interpreter several times; we report the
+median wall time and the peak RSS of the child process.
+
+Usage:
+    python scripts/benchmark_worker_import.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "sbm.cli": "import sbm.cli",
+    "sbm.worker": "import sbm.worker",
+    "sbm.worker (+ task imports)": (
+        "import sbm.worker, sbm.utils.tracker, sbm.utils.firebase_sync, sbm.utils.github_pr"
+    ),
+}
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss_kb, "modules": len(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target")
+    args = parser.parse_args()
+
+    print(f"{'target':<30} {'median ms':>10} {'peak RSS MB':>12} {'modules':>8}")
+    for name, statement in TARGETS.items():
+        samples = [measure(statement) for _ in range(args.runs)]
+        ms = statistics.median(s["seconds"] for s in samples) * 1000
+        rss_mb = statistics.median(s["rss_kb"] for s in samples) / 1024
+        modules = samples[-1]["modules"]
+        print(f"{name:<30} {ms:>10.1f} {rss_mb:>12.1f} {modules:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
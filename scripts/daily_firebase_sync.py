@@ -3,15 +3,18 @@
 Daily Firebase sync script for GitHub Action.
 
 This script:
-1. Fetches recently merged SBM PRs from GitHub (last 7 days)
+1. Fetches SBM PRs merged since the previous sync (one paginated GraphQL search)
 2. Updates Firebase runs with merged_at, lines_migrated, pr_state
 3. Marks runs without merged PRs as needs_review after 30 days
 
+The newest mergedAt seen is stored in Firebase as a cursor, so each run only
+fetches PRs merged since the last one. The first run (or --days) falls back
+to a fixed lookback window.
+
 Designed to run as a scheduled GitHub Action.
 """
 
-import json
-import subprocess
+import argparse
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -19,59 +22,114 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(REPO_ROOT))
 
-from sbm.utils.firebase_sync import get_firebase_db, is_firebase_available
+from sbm.utils.firebase_sync import FirebaseSync, get_firebase_db, is_firebase_available
+from sbm.utils.github_pr import GitHubPRManager
+
+SBM_PR_REPO = "carsdotcom/di-websites-platform"
+
+# Title phrases that identify SBM PRs (combined into one OR search)
+SBM_TITLE_PHRASES = ["SBM FE Audit", "Site Builder Migration", "SBM: Migrate"]
+
+# Firebase node holding the last mergedAt processed
+CURSOR_PATH = "/sync_state/daily_firebase_sync"
+
+# Re-scan a little before the cursor to cover search-index lag
+CURSOR_OVERLAP = timedelta(hours=1)
+
+DEFAULT_LOOKBACK_DAYS = 7
+
+_SEARCH_QUERY = """
+query($q: String!, $after: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $after) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        url title headRefName additions number mergedAt
+        author { login }
+      }
+    }
+  }
+}
+"""
+
+
+def _format_search_datetime(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_merged_search(since: datetime) -> str:
+    """Build one search query covering every SBM title pattern."""
+    phrases = " OR ".join(f'"{phrase}"' for phrase in SBM_TITLE_PHRASES)
+    return (
+        f"repo:{SBM_PR_REPO} is:pr is:merged "
+        f"merged:>={_format_search_datetime(since)} in:title {phrases}"
+    )
+
+
+def get_merged_sbm_prs_since(since: datetime) -> list[dict] | None:
+    """
+    Fetch every SBM PR merged at or after ``since``, following search pages.
+
+    Returns:
+        PR dicts with url, title, headRefName, additions, author, mergedAt and
+        number, or None if any page failed (so the cursor is not advanced)
+    """
+    search = build_merged_search(since)
+    phrases = [phrase.lower() for phrase in SBM_TITLE_PHRASES]
+
+    prs: list[dict] = []
+    seen: set[int] = set()
+    after = None
+    while True:
+        data = GitHubPRManager.run_graphql(_SEARCH_QUERY, {"q": search, "after": after})
+        if data is None:
+            return None
+        result = data.get("search") or {}
+        if after is None and result.get("issueCount", 0) > 1000:
+            print("WARNING: search matched over 1000 PRs; GitHub only returns the first 1000")
+
+        for node in result.get("nodes") or []:
+            number = node.get("number") if node else None
+            if not number or number in seen:
+                continue
+            # Search matches words loosely; keep only real SBM titles
+            if not any(phrase in (node.get("title") or "").lower() for phrase in phrases):
+                continue
+            seen.add(number)
+            prs.append(node)
 
+        page = result.get("pageInfo") or {}
+        if not page.get("hasNextPage"):
+            return prs
+        after = page.get("endCursor")
 
-def get_recently_merged_sbm_prs(days: int = 7) -> list[dict]:
+
+def get_recently_merged_sbm_prs(days: int = DEFAULT_LOOKBACK_DAYS) -> list[dict]:
     """Fetch SBM PRs merged in the last N days."""
-    since_date = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    return get_merged_sbm_prs_since(since) or []
+
+
+def load_sync_cursor(db) -> datetime | None:
+    """Return the last mergedAt processed by a previous sync, if any."""
+    try:
+        state = db.reference(CURSOR_PATH).get() or {}
+        last = state.get("last_merged_at") if isinstance(state, dict) else None
+        if last:
+            return datetime.fromisoformat(last.replace("Z", "+00:00"))
+    except Exception as e:
+        print(f"WARNING: could not read sync cursor: {e}")
+    return None
 
-    all_prs = []
-    search_queries = [
-        f'"SBM FE Audit" in:title merged:>={since_date}',
-        f'"Site Builder Migration" in:title merged:>={since_date}',
-        f'"SBM: Migrate" in:title merged:>={since_date}',
-    ]
 
-    for query in search_queries:
-        try:
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "list",
-                    "--repo",
-                    "carsdotcom/di-websites-platform",
-                    "--state",
-                    "merged",
-                    "--search",
-                    query,
-                    "--json",
-                    "url,title,headRefName,additions,author,mergedAt,number",
-                    "--limit",
-                    "100",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=60,
-            )
-            if result.returncode == 0:
-                prs = json.loads(result.stdout)
-                all_prs.extend(prs)
-        except Exception as e:
-            print(f"Error searching PRs: {e}")
-
-    # Deduplicate
-    seen = set()
-    unique = []
-    for pr in all_prs:
-        pr_num = pr.get("number")
-        if pr_num and pr_num not in seen:
-            seen.add(pr_num)
-            unique.append(pr)
-
-    return unique
+def save_sync_cursor(db, last_merged_at: str) -> None:
+    db.reference(CURSOR_PATH).update(
+        {
+            "last_merged_at": last_merged_at,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
 
 
 def extract_slug_from_pr(pr: dict) -> str | None:
@@ -112,6 +170,17 @@ def extract_slug_from_pr(pr: dict) -> str | None:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Sync merged SBM PRs into Firebase")
+    parser.add_argument(
+        "--days",
+        type=int,
+        help=(
+            "Ignore the stored cursor and re-scan PRs merged in the last N days "
+            f"(default when no cursor exists: {DEFAULT_LOOKBACK_DAYS})"
+        ),
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("DAILY FIREBASE SYNC")
     print(f"Started at: {datetime.now(timezone.utc).isoformat()}")
@@ -121,10 +190,23 @@ def main():
         print("ERROR: Firebase not available")
         sys.exit(1)
 
-    # 1. Fetch recently merged PRs
-    print("\n[1/3] Fetching recently merged SBM PRs...")
-    merged_prs = get_recently_merged_sbm_prs(days=7)
-    print(f"Found {len(merged_prs)} merged SBM PRs in last 7 days")
+    db = get_firebase_db()
+
+    # 1. Fetch PRs merged since the last sync
+    cursor = None if args.days else load_sync_cursor(db)
+    if cursor:
+        since = cursor - CURSOR_OVERLAP
+        print(f"\n[1/3] Fetching SBM PRs merged since last sync ({cursor.isoformat()})...")
+    else:
+        days = args.days or DEFAULT_LOOKBACK_DAYS
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        print(f"\n[1/3] Fetching SBM PRs merged in the last {days} days...")
+
+    merged_prs = get_merged_sbm_prs_since(since)
+    if merged_prs is None:
+        print("ERROR: GitHub search failed; cursor left unchanged")
+        sys.exit(1)
+    print(f"Found {len(merged_prs)} merged SBM PRs")
 
     # Build slug -> PR mapping
     pr_by_slug = {}
@@ -133,8 +215,8 @@ def main():
         if slug:
             pr_by_slug[slug] = {
                 "url": pr.get("url"),
-                "lines": pr.get("additions", 0),
-                "author": pr.get("author", {}).get("login"),
+                "lines": pr.get("additions") or 0,
+                "author": (pr.get("author") or {}).get("login"),
                 "merged_at": pr.get("mergedAt"),
                 "pr_number": pr.get("number"),
             }
@@ -143,10 +225,10 @@ def main():
 
     # 2. Update Firebase runs
     print("\n[2/3] Updating Firebase runs...")
-    db = get_firebase_db()
     users_ref = db.reference("/users")
     users_data = users_ref.get() or {}
 
+    pending_updates: list[tuple[str, str, dict]] = []
     updates_made = 0
     stale_runs = 0
 
@@ -183,7 +265,7 @@ def main():
                     updates["status"] = "success"
 
                 if updates:
-                    db.reference(f"/users/{user_id}/runs/{run_key}").update(updates)
+                    pending_updates.append((user_id, run_key, updates))
                     updates_made += 1
                     print(f"  Updated: {slug} - {list(updates.keys())}")
 
@@ -194,23 +276,42 @@ def main():
                     try:
                         run_date = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
                         if datetime.now(timezone.utc) - run_date > timedelta(days=30):
-                            db.reference(f"/users/{user_id}/runs/{run_key}").update(
-                                {"status": "needs_review"}
-                            )
+                            pending_updates.append((user_id, run_key, {"status": "needs_review"}))
                             stale_runs += 1
                             print(f"  Stale: {slug} -> needs_review (>30 days)")
                     except Exception:
                         pass
 
+    # Write everything with a few multi-location updates
+    failed = []
+    if pending_updates:
+        results = FirebaseSync().update_runs_bulk(pending_updates)
+        failed = [path for path, ok in results.items() if not ok]
+        for path in failed:
+            print(f"  FAILED: {path}")
+
+    # Advance the cursor only once every update landed
+    newest = max((pr.get("mergedAt") or "" for pr in merged_prs), default="")
+    advanced = bool(newest) and (
+        cursor is None or datetime.fromisoformat(newest.replace("Z", "+00:00")) > cursor
+    )
+    if advanced and not failed:
+        save_sync_cursor(db, newest)
+
     # 3. Summary
     print("\n[3/3] Summary")
     print("=" * 60)
     print(f"PRs processed:    {len(merged_prs)}")
-    print(f"Runs updated:     {updates_made}")
+    print(f"Runs updated:     {updates_made - len(failed)}")
     print(f"Stale runs marked: {stale_runs}")
+    cursor_label = newest if advanced else (cursor.isoformat() if cursor else "unset")
+    print(f"Cursor:           {cursor_label}")
     print(f"Completed at:     {datetime.now(timezone.utc).isoformat()}")
     print("=" * 60)
 
+    if failed:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
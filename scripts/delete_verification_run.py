@@ -1,9 +1,8 @@
 import logging
 
-import requests
 from rich.console import Console
 
-from sbm.utils.firebase_sync import FirebaseSync, _get_user_mode_identity, get_settings
+from sbm.utils.firebase_sync import FirebaseSync, get_firebase_rest_client
 
 logging.basicConfig(level=logging.DEBUG)
 console = Console()
@@ -28,18 +27,10 @@ def delete_verification_runs():
 
                 # DELETE IT
                 # We can't use sync.update_run for deletion easily (it's for updates)
-                # We'll use raw requests.delete
-
-                settings = get_settings()
-                identity = _get_user_mode_identity()
-                token = identity[1] if identity else None
-
-                url = f"{settings.firebase.database_url}/users/{user_id}/runs/{run_id}.json"
-                if token:
-                    url += f"?auth={token}"
-
-                console.print(f"Deleting via {url}...")
-                resp = requests.delete(url)
+                # We'll use the shared REST client directly
+                path = f"users/{user_id}/runs/{run_id}"
+                console.print(f"Deleting {path}...")
+                resp = get_firebase_rest_client().delete(path)
 
                 if resp.ok:
                     console.print("[green]Deleted successfully.[/green]")
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for everything an ``sbm auto`` run talks to.
+
+    fake executables    docker (replays a gulp log for dealerinspire_legacy_assets),
+                        gh, devtools (every slug is official), just, saml2aws,
+                        open and pbcopy
+    FirebaseEmulator    in-memory Realtime Database and anonymous Auth over HTTP,
+                        reached through the standard FIREBASE_*_EMULATOR_HOST variables
+    make_platform_repo  throwaway di-websites-platform checkout of synthetic themes
+                        with a bare repository as origin
+    offline_env         environment pointing a child ``python -m sbm`` at all of the above
+
+Nothing here touches the network, Docker or the real platform checkout, and
+the reports and logs a run writes go under ``home`` rather than the auto-sbm
+checkout, so a full migration can run in CI. See scripts/benchmark_migration.py.
+"""
+
+import json
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from scripts.synthetic_theme import write_synthetic_theme
+
+# Log the fake gulp watcher reports after every change: one clean sass/processCss cycle
+GULP_LOG = """\
+[10:00:00] Starting 'sass'...
+[10:00:01] Finished 'sass' after 412 ms
+[10:00:01] Starting 'processCss'...
+[10:00:01] Finished 'processCss' after 88 ms
+"""
+
+_FAKE_DOCKER = """\
+import os, sys
+
+args = sys.argv[1:]
+if args[:1] == ["logs"]:
+    log_path = os.environ.get("FAKE_GULP_LOG")
+    sys.stdout.write(open(log_path).read() if log_path else {gulp_log!r})
+"""
+
+_FAKE_GH = """\
+import json, os, re, subprocess, sys, zlib
+from datetime import datetime, timezone
+
+args = sys.argv[1:]
+state_path = os.path.join(os.environ["FAKE_GH_STATE"], "prs.json")
+try:
+    prs = json.load(open(state_path))
+except OSError:
+    prs = {{}}
+
+def option(name):
+    return args[args.index(name) + 1] if name in args else None
+
+def pr_json(url):
+    pr = prs.get(url)
+    if pr is None:
+        return None
+    numstat = subprocess.run(
+        ["git", "diff", "--numstat", "origin/main...origin/" + pr["head"]],
+        cwd=os.environ["FAKE_GH_REPO"], capture_output=True, text=True,
+    ).stdout
+    additions = sum(int(line.split()[0]) for line in numstat.splitlines() if line[:1].isdigit())
+    return {{
+        "url": url, "state": "OPEN", "author": {{"login": "sbm-bench"}},
+        "createdAt": pr["createdAt"], "mergedAt": None, "closedAt": None,
+        "additions": additions, "mergeable": "MERGEABLE", "mergeStateStatus": "CLEAN",
+        "statusCheckRollup": [], "reviewDecision": "APPROVED",
+    }}
+
+if args[:1] == ["--version"]:
+    print("gh version 2.40.0 (offline stand-in)")
+elif args[:2] == ["api", "user"]:
+    print("sbm-bench")
+elif args[:2] == ["api", "graphql"]:
+    query = option("-f")[len("query="):]
+    data = {{"rateLimit": {{"cost": 1, "remaining": 4999, "resetAt": None}}}}
+    lookups = re.findall(
+        r'(pr\\d+): repository\\(owner: "([^"]+)", name: "([^"]+)"\\) '
+        r'\\{{ pullRequest\\(number: (\\d+)\\)',
+        query,
+    )
+    for alias, owner, name, number in lookups:
+        url = "https://github.com/%s/%s/pull/%s" % (owner, name, number)
+        data[alias] = {{"pullRequest": pr_json(url)}}
+    print("HTTP/2.0 200 OK\\nX-Ratelimit-Remaining: 4999\\n")
+    print(json.dumps({{"data": data}}))
+elif args[:2] == ["pr", "create"]:
+    head = option("--head")
+    number = zlib.crc32(head.encode()) % 100000
+    url = "https://github.com/{repo}/pull/%d" % number
+    prs[url] = {{"head": head, "createdAt": datetime.now(timezone.utc).isoformat()}}
+    json.dump(prs, open(state_path, "w"))
+    print(url)
+elif args[:2] == ["pr", "view"]:
+    pr = pr_json(args[2])
+    if pr is None:
+        sys.exit("HTTP 404: Not Found")
+    print(json.dumps(pr))
+elif args[:2] == ["pr", "list"]:
+    print("[]")
+"""
+
+# Run as ``bash devtools search SLUG``; reports every slug as an official site
+_FAKE_DEVTOOLS = """\
+#!/bin/sh
+printf '[{"slug": "%s"}]\\n' "$2"
+"""
+
+# Commands that only need to exist and succeed
+_NOOP_COMMANDS = ("just", "saml2aws", "open", "pbcopy")
+
+PLATFORM_REPO = "carsdotcom/di-websites-platform"
+
+# The auto-sbm checkout these scripts belong to; the child sbm runs from it
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def write_fake_executables(bin_dir: Path) -> Path:
+    """Write the stand-in commands into ``bin_dir`` (put it first on PATH)."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    scripts = {
+        "docker": _FAKE_DOCKER.format(gulp_log=GULP_LOG),
+        "gh": _FAKE_GH.format(repo=PLATFORM_REPO),
+        **{name: "" for name in _NOOP_COMMANDS},
+    }
+    for name, body in scripts.items():
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{body}")
+    (bin_dir / "devtools").write_text(_FAKE_DEVTOOLS)
+    for path in bin_dir.iterdir():
+        path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return bin_dir
+
+
+class FirebaseEmulator:
+    """
+    In-memory Firebase Realtime Database and Auth emulator.
+
+    Serves ``/<path>.json`` GET/PUT/PATCH/POST/DELETE with Realtime Database
+    semantics (multi-location PATCH at the root included) and the anonymous
+    ``accounts:signUp`` and token refresh endpoints of the Auth emulator.
+    """
+
+    def __init__(self, data: dict = None) -> None:
+        self.data = data or {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        return "%s:%d" % self._server.server_address[:2]
+
+    def start(self) -> "FirebaseEmulator":
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                status, payload = emulator.handle(self.command, self.path, raw)
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_PUT = do_PATCH = do_POST = do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FirebaseEmulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def handle(self, method: str, raw_path: str, raw_body: bytes):
+        url = urlparse(raw_path)
+        with self._lock:
+            self.requests.append((method, url.path))
+            if url.path.endswith(("accounts:signUp", "/token")):
+                return 200, self._sign_in(url.path, raw_body)
+            if not url.path.endswith(".json"):
+                return 404, {"error": "Not Found"}
+
+            keys = [key for key in url.path[: -len(".json")].split("/") if key]
+            body = json.loads(raw_body) if raw_body else None
+            if method == "GET":
+                return 200, self._get(keys)
+            if method == "PUT":
+                self._set(keys, body)
+                return 200, body
+            if method == "PATCH":
+                for sub_path, value in body.items():
+                    self._set(keys + [key for key in sub_path.split("/") if key], value)
+                return 200, body
+            if method == "POST":
+                name = "-bench%08d" % len(self.requests)
+                self._set(keys + [name], body)
+                return 200, {"name": name}
+            if method == "DELETE":
+                self._set(keys, None)
+                return 200, None
+            return 405, {"error": "Method Not Allowed"}
+
+    def _sign_in(self, path: str, raw_body: bytes) -> dict:
+        if path.endswith("accounts:signUp"):
+            uid = "bench-user-%d" % sum(1 for m, p in self.requests if p == path)
+            return {"idToken": uid, "refreshToken": uid, "localId": uid, "expiresIn": "3600"}
+        uid = parse_qs(raw_body.decode()).get("refresh_token", ["bench-user"])[0]
+        return {"id_token": uid, "refresh_token": uid, "user_id": uid, "expires_in": "3600"}
+
+    def _get(self, keys: list):
+        node = self.data
+        for key in keys:
+            if not isinstance(node, dict) or key not in node:
+                return None
+            node = node[key]
+        return node
+
+    def _set(self, keys: list, value) -> None:
+        if not keys:
+            self.data = value if isinstance(value, dict) else {}
+            return
+        node = self.data
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        if value is None:
+            node.pop(keys[-1], None)
+        else:
+            node[keys[-1]] = value
+
+
+def _git(*args: str, cwd: Path) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def make_platform_repo(root: Path, slugs: list, lines: int = 5_000, profile: str = "mixed") -> Path:
+    """
+    Create ``root/platform`` (a checkout of ``root/origin.git``) holding ``slugs``.
+
+    Each theme gets ``lines`` lines of synthetic legacy SCSS. Returns the
+    checkout, which is what SBM_PLATFORM_DIR should point at.
+    """
+    origin = root / "origin.git"
+    platform_dir = root / "platform"
+    _git("init", "--quiet", "--bare", "--initial-branch=main", str(origin), cwd=root)
+    _git("init", "--quiet", "--initial-branch=main", str(platform_dir), cwd=root)
+    _git("config", "user.name", "SBM Bench", cwd=platform_dir)
+    _git("config", "user.email", "sbm-bench@example.com", cwd=platform_dir)
+    _git("remote", "add", "origin", str(origin), cwd=platform_dir)
+
+    common_theme = platform_dir / "app/dealer-inspire/wp-content/themes/DealerInspireCommonTheme"
+    (common_theme / "css").mkdir(parents=True)
+    (common_theme / "css" / "_mixins.scss").write_text("// synthetic common theme\n")
+    for seed, slug in enumerate(slugs):
+        write_synthetic_theme(platform_dir, slug, lines, profile, seed)
+
+    _git("add", "-A", cwd=platform_dir)
+    _git("commit", "--quiet", "-m", "Synthetic platform", cwd=platform_dir)
+    _git("push", "--quiet", "-u", "origin", "main", cwd=platform_dir)
+    return platform_dir
+
+
+def offline_env(home: Path, bin_dir: Path, platform_dir: Path, emulator: FirebaseEmulator) -> dict:
+    """
+    Environment for a child ``python -m sbm`` that only talks to the stand-ins.
+
+    ``home`` isolates every ~/.sbm* cache; it gets a fresh update-check entry so
+    the CLI doesn't start a background fetch of the real auto-sbm remote.
+    Reports and logs are written to ``home/sbm-output`` via ``SBM_OUTPUT_DIR``.
+    """
+    state_dir = home / ".fake-gh"
+    state_dir.mkdir(parents=True, exist_ok=True)
+    (home / ".sbm_update_check.json").write_text(json.dumps({"checked_at": time.time()}))
+
+    env = dict(os.environ)
+    env.update(
+        {
+            "HOME": str(home),
+            "PATH": f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])),
+            "SBM_PLATFORM_DIR": str(platform_dir),
+            "SBM_OUTPUT_DIR": str(home / "sbm-output"),
+            "SBM_SKIP_SETUP": "1",
+            "FIREBASE__DATABASE_URL": "https://sbm-bench-default-rtdb.firebaseio.com",
+            "FIREBASE__API_KEY": "offline-bench-key",
+            "FIREBASE__CREDENTIALS_PATH": "",
+            "FIREBASE_DATABASE_EMULATOR_HOST": emulator.host,
+            "FIREBASE_AUTH_EMULATOR_HOST": emulator.host,
+            "DEVTOOLS_CLI_PATH": str(bin_dir / "devtools"),
+            "FAKE_GH_STATE": str(state_dir),
+            "FAKE_GH_REPO": str(platform_dir),
+            "GIT_TERMINAL_PROMPT": "0",
+            "NO_COLOR": "1",
+        }
+    )
+    env.pop("GH_TOKEN", None)
+    env.pop("GITHUB_TOKEN", None)
+    return env
@@ -12,39 +12,17 @@ Usage:
 """
 
 import argparse
-import json
-import subprocess
 import sys
-import time
 from pathlib import Path
 
 # Add project root to path
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(REPO_ROOT))
 
-from sbm.utils.firebase_sync import get_firebase_db, is_firebase_available
+from sbm.utils.firebase_sync import FirebaseSync, get_firebase_db, is_firebase_available
 from sbm.utils.github_pr import GitHubPRManager
 
 
-def fetch_additions(pr_url: str) -> int | None:
-    """Fetch PR additions via gh CLI."""
-    try:
-        result = subprocess.run(
-            ["gh", "pr", "view", pr_url, "--json", "additions"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=15,
-        )
-        if result.returncode != 0:
-            return None
-        data = json.loads(result.stdout)
-        additions = data.get("additions")
-        return additions if isinstance(additions, int) else None
-    except Exception:
-        return None
-
-
 def needs_lines_backfill(run: dict) -> bool:
     lines = run.get("lines_migrated")
     return lines is None or lines == 0
@@ -76,12 +54,6 @@ def main() -> None:
         default=0,
         help="Limit number of runs processed (0 = no limit)",
     )
-    parser.add_argument(
-        "--sleep",
-        type=float,
-        default=0.5,
-        help="Sleep between GitHub requests in seconds (default: 0.5)",
-    )
     args = parser.parse_args()
 
     if not is_firebase_available():
@@ -95,6 +67,7 @@ def main() -> None:
     updated = 0
     lines_updated = 0
     scanned = 0
+    candidates: list[tuple[str, str, dict, bool]] = []
 
     for user_id, user_data in users_data.items():
         if not isinstance(user_data, dict):
@@ -109,49 +82,63 @@ def main() -> None:
             scanned += 1
             if args.limit and scanned > args.limit:
                 break
-            pr_url = run.get("pr_url")
-            if not pr_url:
+            if not run.get("pr_url"):
                 continue
-
-            update_data = {}
-
-            if should_refresh_run(run, args.all):
-                metadata = GitHubPRManager.fetch_pr_metadata(pr_url)
-                if metadata:
-                    update_data.update(
-                        {
-                            "created_at": metadata.get("created_at"),
-                            "merged_at": metadata.get("merged_at"),
-                            "closed_at": metadata.get("closed_at"),
-                            "pr_state": metadata.get("state"),
-                            "pr_author": metadata.get("author"),
-                        }
-                    )
-            if update_data.get("pr_author"):
-                update_data["user_id"] = update_data["pr_author"]
-            elif should_fix_user_id(run):
-                update_data["user_id"] = run.get("pr_author")
-
-            if needs_lines_backfill(run):
-                additions = fetch_additions(pr_url)
-                if additions is not None:
-                    update_data["lines_migrated"] = additions
-
-            if update_data:
-                if args.dry_run:
-                    print(f"[DRY RUN] Update {user_id}/{run_id}: {update_data}")
-                else:
-                    db.reference(f"/users/{user_id}/runs/{run_id}").update(update_data)
-                updated += 1
-                if "lines_migrated" in update_data:
-                    lines_updated += 1
-
-            # Rate limit GitHub requests
-            if not args.dry_run and args.sleep > 0:
-                time.sleep(args.sleep)
+            candidates.append((user_id, run_id, run, should_refresh_run(run, args.all)))
         if args.limit and scanned > args.limit:
             break
 
+    # One GraphQL batch per 100 PRs covers both metadata and additions
+    fetch_urls = [
+        run["pr_url"]
+        for _, _, run, refresh in candidates
+        if refresh or needs_lines_backfill(run)
+    ]
+    metadata_by_url = GitHubPRManager.fetch_pr_metadata_batch(fetch_urls) if fetch_urls else {}
+
+    pending_updates: list[tuple[str, str, dict]] = []
+    # Run paths (as update_runs_bulk reports them) whose update backfills lines_migrated
+    lines_paths: set[str] = set()
+    for user_id, run_id, run, refresh in candidates:
+        metadata = metadata_by_url.get(run["pr_url"])
+        update_data = {}
+
+        if refresh and metadata:
+            update_data.update(
+                {
+                    "created_at": metadata.get("created_at"),
+                    "merged_at": metadata.get("merged_at"),
+                    "closed_at": metadata.get("closed_at"),
+                    "pr_state": metadata.get("state"),
+                    "pr_author": metadata.get("author"),
+                }
+            )
+        if update_data.get("pr_author"):
+            update_data["user_id"] = update_data["pr_author"]
+        elif should_fix_user_id(run):
+            update_data["user_id"] = run.get("pr_author")
+
+        if needs_lines_backfill(run) and metadata and metadata.get("additions") is not None:
+            update_data["lines_migrated"] = metadata["additions"]
+
+        if update_data:
+            if args.dry_run:
+                print(f"[DRY RUN] Update {user_id}/{run_id}: {update_data}")
+            else:
+                pending_updates.append((user_id, run_id, update_data))
+            updated += 1
+            if "lines_migrated" in update_data:
+                lines_updated += 1
+                lines_paths.add(f"users/{user_id}/runs/{run_id}")
+
+    if pending_updates:
+        results = FirebaseSync().update_runs_bulk(pending_updates)
+        failed = [path for path, ok in results.items() if not ok]
+        for path in failed:
+            print(f"Failed to update {path}")
+        updated -= len(failed)
+        lines_updated -= len(lines_paths.intersection(failed))
+
     print(f"Scanned runs: {scanned}")
     print(f"Updated runs: {updated}")
     print(f"Runs with lines_migrated backfilled: {lines_updated}")
@@ -5,20 +5,44 @@ Script to retrieve dealer slugs from account names using devtools search.
 This script reads a list of dealer account names from an Excel or CSV file,
 uses 'devtools search' to find the corresponding slug for each dealer,
 and writes the results to a formatted slugs.txt file.
+
+Lookups run on a small thread pool, and found slugs are memoized on disk
+(``~/.sbm_slug_search_cache.json``) for a week. Repeat names that differ only
+in case, punctuation, a leading ``www.`` or the TLD are answered from that memo
+instead of another ``devtools search`` subprocess. Names that are merely
+similar (``bmwofeastlongisland`` vs ``bmwofwestlongisland``) are always
+searched.
 """
 
 from __future__ import annotations
 
+import csv
+import itertools
 import json
 import logging
+import os
 import re
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import urlparse
 
 import click
+from rapidfuzz import fuzz, process
 
 # Optional imports for Excel support
+try:
+    import openpyxl
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+    openpyxl = None  # type: ignore[assignment]
+
 try:
     import pandas as pd
 
@@ -29,20 +53,239 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEVTOOLS_CLI_DIR = Path(
+    "/Users/nathanhart/code/dealerinspire/feature-dev-shared-scripts/devtools-cli"
+)
+
+# Concurrent devtools searches; each one is a separate bash subprocess
+DEFAULT_WORKERS = 8
+
+SEARCH_CACHE_PATH = Path.home() / ".sbm_slug_search_cache.json"
+SEARCH_CACHE_TTL_DAYS = 7
+
+# Minimum rapidfuzz ratio (0-100) for a memoized name to be logged as a candidate;
+# candidates are never used without a search
+FUZZY_SCORE_CUTOFF = 95
+
+
+# Column names tried in order (exact first, then case-insensitive)
+URL_COLUMNS = ["Account: Website", "Website", "website", "URL", "url", "prod"]
+STAGE_COLUMNS = ["Stage", "stage", "Status", "status"]
+NAME_COLUMNS = [
+    "Account: Account Name",
+    "Account Name",
+    "account_name",
+    "name",
+    "Name",
+    "Dealer Name",
+    "dealer_name",
+]
+
+# Bytes of a CSV used to sniff its delimiter
+CSV_SNIFF_BYTES = 64 * 1024
+
+# Rows at the top of a spreadsheet searched for the header row
+HEADER_SCAN_ROWS = 20
+
+
+def _find_column(headers: list, candidates: list[str]) -> int | None:
+    """Return the index of the first candidate column present in ``headers``."""
+    names = [str(h).strip() if h is not None else "" for h in headers]
+    for candidate in candidates:
+        if candidate in names:
+            return names.index(candidate)
+    lowered = [name.lower() for name in names]
+    for candidate in candidates:
+        if candidate.lower() in lowered:
+            return lowered.index(candidate.lower())
+    return None
+
+
+def _cell(row: list[str], index: int) -> str:
+    return row[index].strip() if index < len(row) else ""
+
+
+def _find_header_row(rows: list[tuple]) -> tuple[int, int | None]:
+    """
+    Locate the header row and account-name column among the first sheet rows.
+
+    Returns (header_row_index, name_column_index). Falls back to the first
+    non-empty row and its first non-empty column when no known header is found.
+    """
+    for i, row in enumerate(rows):
+        name_idx = _find_column(list(row), NAME_COLUMNS)
+        if name_idx is not None:
+            return i, name_idx
+
+    # Salesforce-style header without a standard name column
+    for i, row in enumerate(rows):
+        values = [v for v in row if v is not None]
+        if len(values) >= 3 and any("Account" in str(v) or "Name" in str(v) for v in values):
+            name_idx = next(j for j, v in enumerate(row) if "Account" in str(v) or "Name" in str(v))
+            return i, name_idx
+
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            if value is not None and str(value).strip():
+                click.echo(
+                    f"⚠️  No standard name column found. Using first non-empty column: {value}"
+                )
+                return i, j
+    return 0, None
+
+
+def _normalize_term(term: str) -> str:
+    """Normalize a search term for memo lookups (case, whitespace, leading www.)."""
+    term = term.strip().lower()
+    return term[4:] if term.startswith("www.") else term
+
+
+def _memo_identity(term: str) -> str:
+    """
+    Identity of a search term for memo hits.
+
+    Case, punctuation, whitespace, a URL scheme, a leading ``www.`` and the
+    TLD of a domain are ignored, so ``https://www.HondaOfTulsa.com/`` and
+    ``Honda of Tulsa`` are the same term.
+    """
+    term = re.sub(r"^[a-z][a-z0-9+.-]*://", "", term.strip().lower())
+    host = term.split("/", 1)[0]
+    if "." in host and not re.search(r"\s", host):
+        host = host[4:] if host.startswith("www.") else host
+        term = host.rsplit(".", 1)[0]
+    return re.sub(r"[^a-z0-9]", "", term)
+
+
+def _devtools_script() -> Path:
+    """The devtools entry point; raises FileNotFoundError if devtools-cli is missing."""
+    script = DEVTOOLS_CLI_DIR / "devtools"
+    if not script.exists():
+        msg = f"devtools script not found at {script}; check that devtools-cli is cloned"
+        raise FileNotFoundError(msg)
+    return script
+
+
+class SlugSearchCache:
+    """
+    On-disk memo of devtools search results, indexed by normalized term and dealer name.
+
+    Only found slugs are stored; a miss is always searched again. Entries
+    older than ``ttl_days`` are ignored and dropped on save.
+
+    Args:
+        path: JSON file backing the memo.
+        ttl_days: Age after which an entry is no longer trusted.
+    """
+
+    def __init__(
+        self, path: Path = SEARCH_CACHE_PATH, ttl_days: int = SEARCH_CACHE_TTL_DAYS
+    ) -> None:
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self.entries: dict[str, dict] = {}
+        self._index: dict[str, str] | None = None
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except Exception:
+            return
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        for term, entry in data.get("terms", {}).items():
+            try:
+                fresh = datetime.fromisoformat(entry["checked_at"]) >= cutoff
+            except Exception:
+                fresh = False
+            if fresh and entry.get("slug"):
+                self.entries[term] = entry
+
+    def save(self) -> None:
+        """Write the memo atomically; failures are logged and ignored."""
+        try:
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"version": 1, "terms": self.entries}, indent=2))
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.debug(f"Could not write slug search cache: {e}")
+
+    def put(self, search_term: str, slug: str, dealer_data: dict) -> None:
+        self.entries[_normalize_term(search_term)] = {
+            "slug": slug,
+            "dealer_data": dealer_data,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._index = None
+
+    def _build_index(self) -> dict[str, str]:
+        """Map the identity of every memo term and dealer name to the memo key it resolves to."""
+        index: dict[str, str] = {}
+        for term, entry in self.entries.items():
+            index.setdefault(_memo_identity(term), term)
+            name = (entry.get("dealer_data") or {}).get("name")
+            if name:
+                index.setdefault(_memo_identity(name), term)
+        index.pop("", None)
+        return index
+
+    def lookup(self, search_term: str) -> tuple[str, dict] | None:
+        """
+        Return a memoized (slug, dealer_data) for a term with the same identity.
+
+        A similar but different term (e.g. ``hondaofaurora2.com`` for
+        ``hondaofaurora.com``) is only logged as a candidate and returns None,
+        so the caller still searches devtools for it.
+        """
+        entry = self.entries.get(_normalize_term(search_term))
+        if entry is None:
+            if self._index is None:
+                self._index = self._build_index()
+            identity = _memo_identity(search_term)
+            term = self._index.get(identity)
+            if term is None:
+                if identity and self._index:
+                    candidate = process.extractOne(
+                        identity,
+                        self._index.keys(),
+                        scorer=fuzz.ratio,
+                        processor=None,
+                        score_cutoff=FUZZY_SCORE_CUTOFF,
+                    )
+                    if candidate is not None:
+                        logger.debug(
+                            f"Memo candidate for '{search_term}': '{candidate[0]}' "
+                            f"({candidate[1]:.0f}), searching anyway"
+                        )
+                return None
+            entry = self.entries[term]
+        return entry["slug"], entry["dealer_data"]
+
 
 class SlugRetriever:
     """Retrieve dealer slugs from account names."""
 
-    def __init__(self, input_file: Path, output_file: Path) -> None:
+    def __init__(
+        self,
+        input_file: Path,
+        output_file: Path,
+        workers: int = DEFAULT_WORKERS,
+        cache: SlugSearchCache | None = None,
+        use_cache: bool = True,
+    ) -> None:
         """
         Initialize the slug retriever.
 
         Args:
             input_file: Path to input file (Excel or CSV)
             output_file: Path to output slugs.txt file
+            workers: Maximum concurrent devtools searches
+            cache: Search memo to use (default: the shared on-disk memo)
+            use_cache: If False, search every term and leave the memo untouched
         """
         self.input_file = input_file
         self.output_file = output_file
+        self.workers = max(1, workers)
+        self.cache = (cache or SlugSearchCache()) if use_cache else None
         self.results: list[dict[str, str]] = []
 
     def read_input_file(self) -> list[str]:
@@ -55,79 +298,78 @@ class SlugRetriever:
         Raises:
             ValueError: If file format is not supported or pandas is not available
         """
+        return list(self.iter_search_terms())
+
+    def iter_search_terms(self) -> Iterator[str]:
+        """
+        Yield unique search terms from the input file as rows are parsed.
+
+        CSV and .xlsx files are streamed row by row, so memory stays flat on
+        large exports and searches can start before the file is fully read.
+        Legacy .xls files still go through pandas.
+
+        Raises:
+            ValueError: If file format is not supported or a reader is not available
+        """
         file_ext = self.input_file.suffix.lower()
 
         if file_ext == ".csv":
-            return self._read_csv()
-        if file_ext in [".xlsx", ".xls"]:
+            return self._iter_csv()
+        if file_ext == ".xlsx":
+            if not OPENPYXL_AVAILABLE:
+                msg = "openpyxl is required for .xlsx files. Install with: pip install openpyxl"
+                raise ValueError(msg)
+            return self._iter_xlsx()
+        if file_ext == ".xls":
             if not PANDAS_AVAILABLE:
-                msg = (
-                    "pandas is required for Excel files. Install with: pip install pandas openpyxl"
-                )
+                msg = "pandas is required for .xls files. Install with: pip install pandas xlrd"
                 raise ValueError(msg)
-            return self._read_excel()
+            return iter(self._read_excel())
 
         msg = f"Unsupported file format: {file_ext}. Supported formats: .csv, .xlsx, .xls"
         raise ValueError(msg)
 
-    def _read_csv(self) -> list[str]:
-        """Read website URLs from CSV file, filtering by Stage column."""
-        import csv
-        from urllib.parse import urlparse
-
-        websites = []
-        seen_urls = set()  # Track duplicates
+    def _iter_csv(self) -> Iterator[str]:
+        """Yield website domains from a CSV file, filtering by Stage column."""
+        with self.input_file.open("r", encoding="utf-8-sig", newline="") as f:
+            # Salesforce exports are comma-separated, but sniff in case of ; or tab
+            try:
+                dialect: type[csv.Dialect] | csv.Dialect = csv.Sniffer().sniff(
+                    f.read(CSV_SNIFF_BYTES), delimiters=",;\t"
+                )
+            except csv.Error:
+                dialect = csv.excel
+            f.seek(0)
 
-        with self.input_file.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if not reader.fieldnames:
+            reader = csv.reader(f, dialect)
+            headers = next(reader, None)
+            if not headers:
                 msg = "CSV file has no headers"
                 raise ValueError(msg)
 
             # Look for website URL column (Salesforce format)
-            url_columns = [
-                "Account: Website",
-                "Website",
-                "website",
-                "URL",
-                "url",
-                "prod",
-            ]
-            url_col = None
-            for col in url_columns:
-                if col in reader.fieldnames:
-                    url_col = col
-                    click.echo(f"  Using column: {url_col}")
-                    break
-
-            if not url_col:
+            url_idx = _find_column(headers, URL_COLUMNS)
+            if url_idx is None:
                 msg = "Could not find website URL column in CSV"
                 raise ValueError(msg)
+            click.echo(f"  Using column: {headers[url_idx]}")
 
             # Look for Stage column (Salesforce format) for filtering
-            stage_columns = [
-                "Stage",
-                "stage",
-                "Status",
-                "status",
-            ]
-            stage_col = None
-            for col in stage_columns:
-                if col in reader.fieldnames:
-                    stage_col = col
-                    click.echo(f"  Filtering by column: {stage_col}")
-                    break
+            stage_idx = _find_column(headers, STAGE_COLUMNS)
+            if stage_idx is not None:
+                click.echo(f"  Filtering by column: {headers[stage_idx]}")
 
+            seen_urls = set()  # Track duplicates
             skipped_count = 0
             for row in reader:
                 # Filter by stage if column exists - only include "Mockup Approved"
-                if stage_col:
-                    stage = row.get(stage_col, "").strip()
+                if stage_idx is not None:
+                    stage = _cell(row, stage_idx)
                     if "Mockup Approved" not in stage:
                         skipped_count += 1
                         continue
 
-                url = row.get(url_col, "").strip()
+                url = _cell(row, url_idx)
                 if url:
                     # Extract domain from URL (e.g., "https://www.lexusofcoloradosprings.com/" -> "www.lexusofcoloradosprings.com")
                     parsed = urlparse(url)
@@ -137,16 +379,44 @@ class SlugRetriever:
                     domain = domain.strip("/")
 
                     if domain and domain not in seen_urls:
-                        websites.append(domain)
                         seen_urls.add(domain)
+                        yield domain
 
             if skipped_count > 0:
                 click.echo(f"  ⏭️  Skipped {skipped_count} rows (not in 'Mockup Approved' stage)")
 
-        return websites
+    def _iter_xlsx(self) -> Iterator[str]:
+        """Yield account names from an .xlsx file using openpyxl's read-only mode."""
+        workbook = openpyxl.load_workbook(self.input_file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+
+            # Salesforce reports put a title block above the header row, so
+            # buffer the first rows and look for the header among them
+            head = list(itertools.islice(rows, HEADER_SCAN_ROWS))
+            header_at, name_idx = _find_header_row(head)
+            if name_idx is None:
+                msg = "Could not find any column with data in Excel file"
+                raise ValueError(msg)
+            if header_at:
+                click.echo(f"  Found header row at row {header_at}")
+            click.echo(f"  Using column: {head[header_at][name_idx]}")
+
+            seen_names = set()
+            for row in itertools.chain(head[header_at + 1 :], rows):
+                value = row[name_idx] if name_idx < len(row) else None
+                if value is None:
+                    continue
+                # Normalize common character encoding issues
+                name = str(value).strip().replace("?", "'")  # Fix common apostrophe encoding issue
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    yield name
+        finally:
+            workbook.close()
 
     def _read_excel(self) -> list[str]:
-        """Read account names from Excel file."""
+        """Read account names from a legacy .xls file with pandas."""
         if not PANDAS_AVAILABLE or pd is None:
             msg = "pandas is required for Excel files"
             raise ValueError(msg)
@@ -173,17 +443,8 @@ class SlugRetriever:
                     break
 
         # Try common column name patterns (including Salesforce format)
-        name_columns = [
-            "Account: Account Name",
-            "Account Name",
-            "account_name",
-            "name",
-            "Name",
-            "Dealer Name",
-            "dealer_name",
-        ]
         name_col = None
-        for col in name_columns:
+        for col in NAME_COLUMNS:
             if col in df.columns:
                 name_col = col
                 click.echo(f"  Using column: {name_col}")
@@ -229,9 +490,7 @@ class SlugRetriever:
             Tuple of (slug, dealer_data) if found, None otherwise
         """
         # Path to main devtools script
-        devtools_cli_dir = Path(
-            "/Users/nathanhart/code/dealerinspire/feature-dev-shared-scripts/devtools-cli"
-        )
+        devtools_cli_dir = DEVTOOLS_CLI_DIR
         devtools_script = devtools_cli_dir / "devtools"
 
         if not devtools_script.exists():
@@ -378,35 +637,91 @@ class SlugRetriever:
 
         return best_match if best_score > 0 else results[0]
 
-    def retrieve_all_slugs(self, search_terms: list[str]) -> None:
+    def iter_results(self, search_terms: Iterable[str]) -> Iterator[dict]:
+        """
+        Resolve search terms lazily, yielding one result dict per term in input order.
+
+        Terms found in the memo resolve immediately; the rest are searched on
+        a thread pool as soon as they are read, so a streamed input file keeps
+        the workers busy while it is still being parsed. Each result is also
+        appended to ``self.results``.
+
+        Args:
+            search_terms: Website domains or account names, e.g. from
+                ``iter_search_terms()``
+        """
+        click.echo("\n🔍 Searching for dealer slugs...")
+
+        pending: deque[tuple[str, Future | tuple[str, dict] | None]] = deque()
+        pool: ThreadPoolExecutor | None = None
+        try:
+            for search_term in search_terms:
+                hit = self.cache.lookup(search_term) if self.cache else None
+                if hit:
+                    pending.append((search_term, hit))
+                else:
+                    if pool is None:
+                        # Fail here rather than inside a worker thread
+                        _devtools_script()
+                        pool = ThreadPoolExecutor(max_workers=self.workers)
+                    pending.append((search_term, pool.submit(self.search_slug, search_term)))
+
+                # Hand back whatever has finished at the head of the queue
+                while pending and not (
+                    isinstance(pending[0][1], Future) and not pending[0][1].done()
+                ):
+                    yield self._record_result(*pending.popleft())
+
+            while pending:
+                yield self._record_result(*pending.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+                if self.cache is not None:
+                    self.cache.save()
+
+    def _record_result(self, search_term: str, outcome: Future | tuple[str, dict] | None) -> dict:
+        cached = not isinstance(outcome, Future)
+        result = outcome if cached else outcome.result()
+        position = len(self.results) + 1
+
+        if result:
+            slug, dealer_data = result
+            entry = {
+                "search_term": search_term,
+                "slug": slug,
+                "dealer_data": dealer_data,
+                "status": "found",
+            }
+            if not cached and self.cache is not None:
+                self.cache.put(search_term, slug, dealer_data)
+            label = f"✅ {slug}" + (" (cached)" if cached else "")
+        else:
+            entry = {"search_term": search_term, "slug": "", "status": "not_found"}
+            label = "❌ Not found"
+
+        self.results.append(entry)
+        click.echo(f"  [{position}] {search_term}: {label}")
+        return entry
+
+    def retrieve_all_slugs(self, search_terms: Iterable[str]) -> None:
         """
         Retrieve slugs for all search terms (websites or account names).
 
         Args:
-            search_terms: List of website domains or account names to search
+            search_terms: Website domains or account names to search
         """
-        total = len(search_terms)
-        click.echo(f"\n🔍 Searching for {total} dealer slugs...")
-
-        for i, search_term in enumerate(search_terms, 1):
-            click.echo(f"  [{i}/{total}] Searching: {search_term}")
-
-            result = self.search_slug(search_term)
-
-            if result:
-                slug, dealer_data = result
-                self.results.append(
-                    {
-                        "search_term": search_term,
-                        "slug": slug,
-                        "dealer_data": dealer_data,
-                        "status": "found",
-                    }
-                )
-                click.echo(f"    ✅ Found: {slug}")
-            else:
-                self.results.append({"search_term": search_term, "slug": "", "status": "not_found"})
-                click.echo("    ❌ Not found")
+        for _ in self.iter_results(search_terms):
+            pass
+
+    def iter_slugs(self, search_terms: Iterable[str]) -> Iterator[str]:
+        """Yield each unique found slug as soon as it is resolved, in input order."""
+        seen = set()
+        for result in self.iter_results(search_terms):
+            slug = result["slug"]
+            if result["status"] == "found" and slug and slug not in seen:
+                seen.add(slug)
+                yield slug
 
     def write_output_file(self) -> None:
         """Write results to output file in JSON format matching devtools search output."""
@@ -463,8 +778,19 @@ class SlugRetriever:
     type=click.Path(path_type=Path),
     help="Output file path (default: slugs.json in auto-sbm directory)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Concurrent devtools searches",
+)
+@click.option("--no-cache", is_flag=True, help="Ignore and don't update the search memo")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def main(input_file: Path, output: Path | None, verbose: bool) -> None:
+def main(
+    input_file: Path, output: Path | None, workers: int, no_cache: bool, verbose: bool
+) -> None:
     """
     Retrieve dealer slugs from account names using devtools search.
 
@@ -495,22 +821,12 @@ def main(input_file: Path, output: Path | None, verbose: bool) -> None:
     click.echo(f"📂 Input file: {input_file}")
     click.echo(f"📝 Output file: {output}")
 
-    # Check if pandas is available for Excel files
-    if input_file.suffix.lower() in [".xlsx", ".xls"] and not PANDAS_AVAILABLE:
-        click.echo("❌ Error: pandas is required for Excel files")
-        click.echo("Install with: pip install pandas openpyxl")
-        sys.exit(1)
-
     try:
-        retriever = SlugRetriever(input_file, output)
+        retriever = SlugRetriever(input_file, output, workers=workers, use_cache=not no_cache)
 
-        # Read input file
+        # Read the input file and resolve slugs as rows stream in
         click.echo("\n📖 Reading input file...")
-        search_terms = retriever.read_input_file()
-        click.echo(f"✅ Found {len(search_terms)} websites")
-
-        # Retrieve slugs
-        retriever.retrieve_all_slugs(search_terms)
+        retriever.retrieve_all_slugs(retriever.iter_search_terms())
 
         # Write output
         click.echo(f"\n💾 Writing results to {output}...")
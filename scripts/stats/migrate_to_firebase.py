@@ -145,10 +145,12 @@ def track_progress(sequence, description):
 def get_existing_signatures(user_id: str) -> set[str]:
     """Fetch existing runs to prevent duplicates (by timestamp + slug)."""
     try:
-        import requests
-
         from sbm.config import get_settings
-        from sbm.utils.firebase_sync import get_firebase_db, is_firebase_available
+        from sbm.utils.firebase_sync import (
+            get_firebase_db,
+            get_firebase_rest_client,
+            is_firebase_available,
+        )
 
         if not is_firebase_available():
             return set()
@@ -161,8 +163,7 @@ def get_existing_signatures(user_id: str) -> set[str]:
             ref = db.reference(f"users/{user_id}/runs")
             data = ref.get()
         else:
-            url = f"{settings.firebase.database_url}/users/{user_id}/runs.json"
-            resp = requests.get(url, timeout=10)
+            resp = get_firebase_rest_client().get(f"users/{user_id}/runs")
             data = resp.json() if resp.ok else None
 
         if data:
@@ -314,9 +315,8 @@ def push_migrations_list(user_id: str, migrations: List[str]) -> bool:
         return True
 
     try:
-        import requests
-
         from sbm.config import get_settings
+        from sbm.utils.firebase_sync import get_firebase_rest_client
 
         settings = get_settings()
         merged = migrations
@@ -328,11 +328,11 @@ def push_migrations_list(user_id: str, migrations: List[str]) -> bool:
             merged = _merge_migrations(existing, migrations)
             ref.set(merged)
         else:
-            url = f"{settings.firebase.database_url}/users/{user_id}/migrations.json"
-            resp = requests.get(url, timeout=10)
+            client = get_firebase_rest_client()
+            resp = client.get(f"users/{user_id}/migrations")
             existing = resp.json() if resp.ok else []
             merged = _merge_migrations(existing, migrations)
-            put = requests.put(url, json=merged, timeout=10)
+            put = client.put(f"users/{user_id}/migrations", merged)
             if not put.ok:
                 console.print(
                     f"[yellow]Failed to update migrations list for {user_id}: {put.status_code}[/yellow]"
@@ -17,9 +17,10 @@ import os
 import sys
 import urllib.parse
 import urllib.request
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add project root to sys.path to ensure 'sbm' package is findable
 REPO_ROOT = Path(__file__).parent.parent.parent.resolve()
@@ -165,6 +166,21 @@ def filter_runs_by_date(runs: List[Dict[str, Any]], days_or_period: str) -> List
     return filter_runs(runs, since=days_or_period)
 
 
+def _previous_calendar_day_bounds(tz_name: str) -> Tuple[Any, datetime, datetime]:
+    """Return (tz, start, end) of the previous calendar day in ``tz_name``."""
+    try:
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo(tz_name)
+    except ImportError:
+        tz = timezone.utc
+
+    now = datetime.now(tz)
+    prev_day_start = datetime(now.year, now.month, now.day, 0, 0, 0, tzinfo=tz) - timedelta(days=1)
+    prev_day_end = datetime(now.year, now.month, now.day, 0, 0, 0, tzinfo=tz)
+    return tz, prev_day_start, prev_day_end
+
+
 def filter_runs_by_previous_calendar_day(
     runs: List[Dict[str, Any]], tz_name: str = "America/Chicago"
 ) -> List[Dict[str, Any]]:
@@ -177,16 +193,7 @@ def filter_runs_by_previous_calendar_day(
     Returns:
         List of runs from the previous calendar day
     """
-    try:
-        from zoneinfo import ZoneInfo
-
-        tz = ZoneInfo(tz_name)
-    except ImportError:
-        tz = timezone.utc
-
-    now = datetime.now(tz)
-    prev_day_start = datetime(now.year, now.month, now.day, 0, 0, 0, tzinfo=tz) - timedelta(days=1)
-    prev_day_end = datetime(now.year, now.month, now.day, 0, 0, 0, tzinfo=tz)
+    tz, prev_day_start, prev_day_end = _previous_calendar_day_bounds(tz_name)
 
     filtered = []
     for run in runs:
@@ -408,6 +415,192 @@ def calculate_global_metrics_all_time() -> Dict[str, Any]:
     return calculate_metrics(all_runs, user_migrations, is_all_time=True)
 
 
+def _parse_run_datetime(ts: Optional[str]) -> Optional[datetime]:
+    """Parse a run timestamp into an aware datetime, or None."""
+    if not ts:
+        return None
+    if ts.endswith("+00:00Z"):
+        ts = ts[:-1]
+    elif ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(ts)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class RunWindowIndex:
+    """
+    Runs sorted once by an effective timestamp.
+
+    A time window becomes a pair of bisects over the sorted timestamps, so
+    day/week/month/range lookups cost O(log n) instead of a full rescan.
+    """
+
+    def __init__(
+        self, runs: List[Dict[str, Any]], timestamp_of: Callable[[Dict[str, Any]], Optional[str]]
+    ) -> None:
+        entries = []
+        for position, run in enumerate(runs):
+            dt = _parse_run_datetime(timestamp_of(run))
+            if dt is not None:
+                entries.append((dt, -position, run))
+        # Ties sort by descending input position so reversed slices keep input
+        # order, matching filter_runs' stable newest-first sort
+        entries.sort(key=lambda entry: entry[:2])
+        self._times = [dt for dt, _, _ in entries]
+        self._runs = [run for _, _, run in entries]
+
+    def bounds(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        include_end: bool = True,
+    ) -> Tuple[int, int]:
+        """Return the [lo, hi) positions of runs inside the window."""
+        lo = bisect_left(self._times, start) if start else 0
+        if end is None:
+            hi = len(self._times)
+        elif include_end:
+            hi = bisect_right(self._times, end)
+        else:
+            hi = bisect_left(self._times, end)
+        return lo, max(lo, hi)
+
+    def slice(self, lo: int, hi: int) -> List[Dict[str, Any]]:
+        """Runs between two positions, most recent first."""
+        return self._runs[lo:hi][::-1]
+
+
+class MetricsWindows:
+    """
+    Period and per-user stats for one data snapshot.
+
+    Indexes are built lazily (one per timestamp rule and user) and metrics
+    are memoized by the slice bounds of their window, so repeated or
+    overlapping requests against the same snapshot skip both the rescan and
+    the aggregation. Build a new instance (see ``get_metrics_windows``)
+    whenever the snapshot changes.
+    """
+
+    def __init__(
+        self,
+        all_runs: List[Dict[str, Any]],
+        user_migrations: Dict[str, set],
+        version: Optional[int] = None,
+    ) -> None:
+        self.all_runs = all_runs
+        self.user_migrations = user_migrations
+        self.version = version
+        self._indexes: Dict[Tuple[str, Optional[str]], RunWindowIndex] = {}
+        self._user_runs: Dict[str, List[Dict[str, Any]]] = {}
+        self._metrics: Dict[tuple, Dict[str, Any]] = {}
+        self._in_review_count: Optional[int] = None
+
+    def _runs_for_user(self, user: Optional[str]) -> List[Dict[str, Any]]:
+        if not user:
+            return self.all_runs
+        key = user.strip().lower()
+        if key not in self._user_runs:
+            self._user_runs[key] = filter_runs_by_user(self.all_runs, user)
+        return self._user_runs[key]
+
+    def _index(self, rule: str, user: Optional[str]) -> RunWindowIndex:
+        key = (rule, user.strip().lower() if user else None)
+        index = self._indexes.get(key)
+        if index is None:
+            if rule == "filter":
+                from sbm.utils.tracker import get_run_effective_date
+
+                timestamp_of = get_run_effective_date
+            else:
+                timestamp_of = _get_effective_timestamp
+            index = RunWindowIndex(self._runs_for_user(user), timestamp_of)
+            self._indexes[key] = index
+        return index
+
+    def _period_window(
+        self, period: str, user: Optional[str]
+    ) -> Tuple[tuple, List[Dict[str, Any]]]:
+        from sbm.utils.tracker import resolve_date_window
+
+        user_key = user.strip().lower() if user else None
+        since_date, until_date = resolve_date_window(period)
+        if since_date is None and until_date is None:
+            # Unbounded: same as filter_runs with no date filter
+            return ("filter", user_key, None), filter_runs_by_date(
+                self._runs_for_user(user), period
+            )
+        index = self._index("filter", user)
+        lo, hi = index.bounds(since_date, until_date, include_end=True)
+        return ("filter", user_key, lo, hi), index.slice(lo, hi)
+
+    def runs_for(self, period: str, user: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Same result as ``filter_runs_by_date`` (+ ``filter_runs_by_user``)."""
+        return self._period_window(period, user)[1]
+
+    def metrics_for(self, period: str, user: Optional[str] = None) -> Dict[str, Any]:
+        """``calculate_metrics`` for a period (and optional user), memoized."""
+        is_all_time = period.lower() == "all"
+        window_key, runs = self._period_window(period, user)
+        return self._memo_metrics((*window_key, is_all_time), runs, is_all_time)
+
+    def previous_calendar_day(self, tz_name: str = "America/Chicago") -> List[Dict[str, Any]]:
+        """Same result as ``filter_runs_by_previous_calendar_day``."""
+        _, start, end = _previous_calendar_day_bounds(tz_name)
+        index = self._index("calendar", None)
+        return index.slice(*index.bounds(start, end, include_end=False))
+
+    def previous_calendar_day_metrics(self, tz_name: str = "America/Chicago") -> Dict[str, Any]:
+        _, start, end = _previous_calendar_day_bounds(tz_name)
+        index = self._index("calendar", None)
+        lo, hi = index.bounds(start, end, include_end=False)
+        return self._memo_metrics(("calendar", None, lo, hi, False), index.slice(lo, hi), False)
+
+    @property
+    def in_review_count(self) -> int:
+        if self._in_review_count is None:
+            self._in_review_count = sum(
+                1 for r in self.all_runs if _get_completion_state(r) == "in_review"
+            )
+        return self._in_review_count
+
+    def _memo_metrics(
+        self, key: tuple, runs: List[Dict[str, Any]], is_all_time: bool
+    ) -> Dict[str, Any]:
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = calculate_metrics(runs, self.user_migrations, is_all_time)
+            self._metrics[key] = metrics
+        return metrics
+
+
+_windows_cache: Optional[MetricsWindows] = None
+
+
+def get_metrics_windows(
+    all_runs: List[Dict[str, Any]],
+    user_migrations: Dict[str, set],
+    version: Optional[int] = None,
+) -> MetricsWindows:
+    """
+    Return the ``MetricsWindows`` for a snapshot, reusing it while ``version`` is unchanged.
+
+    Without a version a fresh (unshared) instance is returned.
+    """
+    global _windows_cache
+    cached = _windows_cache
+    if version is not None and cached is not None and cached.version == version:
+        return cached
+    windows = MetricsWindows(all_runs, user_migrations, version)
+    if version is not None:
+        _windows_cache = windows
+    return windows
+
+
 def format_slack_payload(
     metrics: Dict[str, Any],
     period: str,
@@ -639,19 +832,11 @@ def main() -> None:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # 2. Filter
-    filtered_runs = filter_runs_by_date(all_runs, args.period)
-    if args.user:
-        filtered_runs = filter_runs_by_user(filtered_runs, args.user)
-
-    # 3. Aggregate
-    is_all_time = args.period.lower() == "all"
-    if is_all_time and not args.user:
-        metrics = calculate_global_metrics_all_time()
-    else:
-        metrics = calculate_metrics(filtered_runs, user_migrations, is_all_time)
+    # 2. Filter + 3. Aggregate
+    windows = get_metrics_windows(all_runs, user_migrations)
+    metrics = windows.metrics_for(args.period, args.user)
 
-    current_in_review_count = len([r for r in all_runs if _get_completion_state(r) == "in_review"])
+    current_in_review_count = windows.in_review_count
 
     # 4. Format
     import re
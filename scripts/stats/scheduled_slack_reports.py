@@ -31,11 +31,9 @@ except ImportError:
 
 # Import report logic
 from report_slack import (
-    calculate_global_metrics_all_time,
     calculate_metrics,
-    filter_runs_by_date,
-    filter_runs_by_previous_calendar_day,
     format_slack_payload,
+    get_metrics_windows,
     load_all_stats,
     send_slack_message_api,
 )
@@ -124,6 +122,8 @@ def main() -> None:
         sys.exit(1)
 
     all_runs, user_migrations = load_all_stats()
+    # One index for every report sent from this snapshot
+    windows = get_metrics_windows(all_runs, user_migrations)
 
     weekday = now.weekday()  # Monday=0
     is_month_start = now.day == 1
@@ -144,10 +144,11 @@ def main() -> None:
 
     # Use calendar day filter for daily reports, calendar week (Mon-Sun) for weekly
     if period == "day":
-        filtered_runs = filter_runs_by_previous_calendar_day(all_runs, tz_name)
+        filtered_runs = windows.previous_calendar_day(tz_name)
+        metrics = windows.previous_calendar_day_metrics(tz_name)
     else:
         filtered_runs = _filter_runs_previous_calendar_week(all_runs, tz_name)
-    metrics = calculate_metrics(filtered_runs, user_migrations, period == "all")
+        metrics = calculate_metrics(filtered_runs, user_migrations, period == "all")
     payload = format_slack_payload(metrics, period, context_label=context, top_n=top_n)
 
     if args.dry_run:
@@ -164,11 +165,7 @@ def main() -> None:
 
     if is_month_start:
         # Monthly report + leaderboard (top 3)
-        month_metrics = calculate_metrics(
-            filter_runs_by_date(all_runs, "month"),
-            user_migrations,
-            False,
-        )
+        month_metrics = windows.metrics_for("month")
         month_payload = format_slack_payload(
             month_metrics,
             "month",
@@ -176,7 +173,7 @@ def main() -> None:
             top_n=3,
         )
         # All-time report + leaderboard reminder
-        all_metrics = calculate_global_metrics_all_time()
+        all_metrics = windows.metrics_for("all")
         all_payload = format_slack_payload(
             all_metrics,
             "all",
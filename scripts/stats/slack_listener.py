@@ -60,6 +60,10 @@ token = os.environ.get("SLACK_BOT_TOKEN") or os.environ.get("SLACK_BOT_OAUTH")
 app = App(token=token)
 
 import report_slack
+from stats_cache import RunTableCache
+
+# Warm mirror of Firebase /users so slash commands are answered from memory
+stats_cache = RunTableCache()
 
 
 @app.command("/sbm-stats")
@@ -155,8 +159,9 @@ def handle_sbm_stats(ack, body, say, logger):
     )
 
     try:
-        # 1. Load Data
-        all_runs, user_migrations = report_slack.load_all_stats()
+        # 1. Load Data (from the warm in-memory cache)
+        version, all_runs, user_migrations = stats_cache.snapshot()
+        windows = report_slack.get_metrics_windows(all_runs, user_migrations, version)
 
         # 2. Parse date range for header
         import re
@@ -201,21 +206,13 @@ def handle_sbm_stats(ack, body, say, logger):
             say(blocks=payload["blocks"], text=payload["text"])
             return
 
-        filtered_runs = report_slack.filter_runs_by_date(all_runs, period)
-        if username:
-            filtered_runs = report_slack.filter_runs_by_user(filtered_runs, username)
+        filtered_runs = windows.runs_for(period, username)
 
-        # 4. Aggregate
-        is_all_time = period == "all"
-        if is_all_time and not username:
-            metrics = report_slack.calculate_global_metrics_all_time()
-        else:
-            metrics = report_slack.calculate_metrics(filtered_runs, user_migrations, is_all_time)
+        # 4. Aggregate (memoized per snapshot and window)
+        metrics = windows.metrics_for(period, username)
 
         # 5. Format
-        current_in_review_count = len(
-            [r for r in all_runs if report_slack._get_completion_state(r) == "in_review"]
-        )
+        current_in_review_count = windows.in_review_count
 
         payload = report_slack.format_slack_payload(
             metrics,
@@ -273,9 +270,14 @@ if __name__ == "__main__":
         bot_user_id = auth_test["user_id"]
         bot_name = auth_test["user"]
 
+        # Load the run table once and keep it current in the background
+        stats_cache.start()
+        _, cached_runs, _ = stats_cache.snapshot()
+
         print("⚡️ SBM Stats Socket Mode listener is running!")
         print(f"   Authenticated as: {bot_name} ({bot_user_id})")
         print("   Listening for command: /sbm-stats")
+        print(f"   Stats cache: {len(cached_runs)} runs ({stats_cache.mode})")
 
         handler = SocketModeHandler(app, app_token)
         handler.start()
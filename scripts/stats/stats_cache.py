@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Warm in-memory mirror of Firebase ``/users`` for the Slack listener.
+
+The listener used to download every user's runs and rebuild the reporting data
+on each ``/sbm-stats`` command. ``RunTableCache`` instead keeps the raw tree in
+memory and applies changes as they arrive:
+
+- Admin mode subscribes with ``firebase_admin``'s ``Reference.listen()``.
+- User Mode opens the Realtime Database REST streaming endpoint
+  (Server-Sent Events) on the shared HTTP session.
+- If streaming is unavailable the cache falls back to a periodic full refresh
+  on a background thread.
+
+Either way, slash commands are answered from memory. The flattened
+``(all_runs, user_migrations)`` view is rebuilt lazily, at most once per
+change, and ``version`` increases whenever the mirror changes.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Add project root to sys.path to ensure 'sbm' package is findable
+REPO_ROOT = Path(__file__).parent.parent.parent.resolve()
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sbm.utils.logger import logger
+
+# Full refresh interval when streaming is unavailable
+DEFAULT_POLL_SECONDS = 300.0
+
+# Firebase sends a keep-alive every 30s; treat a longer silence as a dead stream
+STREAM_READ_TIMEOUT = 90
+
+# Reconnect backoff bounds for the REST stream
+STREAM_BACKOFF_MIN = 1.0
+STREAM_BACKOFF_MAX = 60.0
+
+
+def _split_path(path: str) -> list[str]:
+    return [part for part in (path or "").split("/") if part]
+
+
+def _set_path(tree: dict, parts: list[str], value: Any) -> None:
+    """Set (or delete, for None) ``value`` at ``parts`` inside ``tree``."""
+    node = tree
+    for part in parts[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            if value is None:
+                return
+            child = {}
+            node[part] = child
+        node = child
+    if value is None:
+        node.pop(parts[-1], None)
+    else:
+        node[parts[-1]] = value
+
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (event, data) pairs from Server-Sent Events lines."""
+    event = None
+    data: list[str] = []
+    for line in lines:
+        if line is None:
+            continue
+        if line == "":
+            if event is not None:
+                yield event, "\n".join(data)
+            event, data = None, []
+        elif line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:") :].strip())
+    if event is not None:
+        yield event, "\n".join(data)
+
+
+class RunTableCache:
+    """
+    Incrementally refreshed copy of Firebase ``/users``.
+
+    Args:
+        poll_interval: Seconds between full refreshes when streaming is unavailable.
+        fetch_users: Callable returning the whole ``/users`` tree. Defaults to
+            ``FirebaseSync().fetch_all_users_raw``.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = DEFAULT_POLL_SECONDS,
+        fetch_users: Optional[Callable[[], dict]] = None,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self._fetch_users = fetch_users
+        self._lock = threading.Lock()
+        self._tree: dict = {}
+        self._loaded = False
+        self.version = 0
+        self._view_version = -1
+        self._view: tuple[list[dict], dict[str, set]] = ([], {})
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._admin_listener: Any = None
+        self.mode = "idle"
+
+    # -- Reads -----------------------------------------------------------------
+
+    def snapshot(self) -> tuple[int, list[dict], dict[str, set]]:
+        """Return (version, all_runs, user_migrations), loading once if still cold."""
+        if not self._loaded:
+            self.refresh()
+
+        from sbm.utils.tracker import build_reporting_data
+
+        with self._lock:
+            if self._view_version != self.version:
+                self._view = build_reporting_data(self._tree)
+                self._view_version = self.version
+            return self._view_version, self._view[0], self._view[1]
+
+    def get_reporting_data(self) -> tuple[list[dict], dict[str, set]]:
+        """Drop-in replacement for ``report_slack.load_all_stats``."""
+        _, all_runs, user_migrations = self.snapshot()
+        return all_runs, user_migrations
+
+    # -- Writes ----------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Replace the mirror with a full fetch of ``/users``."""
+        fetch = self._fetch_users
+        if fetch is None:
+            from sbm.utils.firebase_sync import FirebaseSync
+
+            fetch = FirebaseSync().fetch_all_users_raw
+        data = fetch()
+        self.apply_event("put", "/", data if isinstance(data, dict) else {})
+
+    def apply_event(self, event_type: str, path: str, data: Any) -> None:
+        """
+        Apply a Realtime Database change event relative to ``/users``.
+
+        ``put`` replaces the value at ``path`` (None deletes it); ``patch``
+        sets each child key of ``data`` under ``path``.
+        """
+        parts = _split_path(path)
+        with self._lock:
+            if event_type == "put":
+                if not parts:
+                    self._tree = data if isinstance(data, dict) else {}
+                else:
+                    _set_path(self._tree, parts, data)
+            elif event_type == "patch" and isinstance(data, dict):
+                for key, value in data.items():
+                    _set_path(self._tree, parts + _split_path(key), value)
+            else:
+                return
+            self._loaded = True
+            self.version += 1
+
+    # -- Background sync -------------------------------------------------------
+
+    def start(self) -> None:
+        """Begin streaming changes (or polling) in the background."""
+        from sbm.utils.firebase_sync import is_firebase_available
+
+        if not is_firebase_available():
+            raise RuntimeError("Firebase unavailable; Slack reports must be database-driven.")
+
+        from sbm.config import get_settings
+
+        self._stop.clear()
+        if get_settings().firebase.is_admin_mode():
+            try:
+                from sbm.utils.firebase_sync import get_firebase_db
+
+                ref = get_firebase_db().reference("/users")
+                self._admin_listener = ref.listen(
+                    lambda event: self.apply_event(event.event_type, event.path, event.data)
+                )
+                self.mode = "stream"
+                logger.info("Stats cache streaming /users via firebase_admin")
+                return
+            except Exception as e:
+                logger.warning(f"Firebase listen() unavailable, polling instead: {e}")
+                target = self._poll_loop
+        else:
+            target = self._rest_stream_loop
+
+        self._thread = threading.Thread(target=target, name="sbm-stats-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._admin_listener is not None:
+            try:
+                self._admin_listener.close()
+            except Exception as e:
+                logger.debug(f"Error closing Firebase listener: {e}")
+            self._admin_listener = None
+        self.mode = "idle"
+
+    def _poll_loop(self) -> None:
+        self.mode = "poll"
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Stats cache refresh failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def _rest_stream_loop(self) -> None:
+        """Follow the REST streaming endpoint, reconnecting with backoff."""
+        from sbm.utils.firebase_sync import get_firebase_rest_client
+
+        client = get_firebase_rest_client()
+        backoff = STREAM_BACKOFF_MIN
+        while not self._stop.is_set():
+            identity = client.identity()
+            if not identity:
+                logger.warning("No Firebase identity for streaming; polling instead")
+                self._poll_loop()
+                return
+            try:
+                with client.session.get(
+                    client.url_for("users"),
+                    params={"auth": identity[1]},
+                    headers={"Accept": "text/event-stream"},
+                    stream=True,
+                    timeout=(10, STREAM_READ_TIMEOUT),
+                ) as resp:
+                    if resp.status_code == 401:
+                        outcome = "auth_revoked"
+                    else:
+                        resp.raise_for_status()
+                        self.mode = "stream"
+                        backoff = STREAM_BACKOFF_MIN
+                        outcome = self._consume_stream(resp.iter_lines(decode_unicode=True))
+                if outcome == "cancel":
+                    logger.warning("Firebase cancelled the stats stream; polling instead")
+                    self._poll_loop()
+                    return
+                if outcome == "auth_revoked":
+                    client.invalidate_identity()
+            except Exception as e:
+                logger.debug(f"Stats stream dropped: {e}")
+            self.mode = "reconnecting"
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, STREAM_BACKOFF_MAX)
+
+    def _consume_stream(self, lines: Iterable[str]) -> Optional[str]:
+        """Apply events until the stream ends; return a terminal event name, if any."""
+        for event, raw in iter_sse_events(lines):
+            if self._stop.is_set():
+                return None
+            if event in ("put", "patch"):
+                payload = json.loads(raw)
+                self.apply_event(event, payload.get("path", "/"), payload.get("data"))
+            elif event in ("cancel", "auth_revoked"):
+                return event
+        return None
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic legacy dealer themes for benchmarks.
+
+Output is deterministic for a given (lines, profile, seed), so benchmark runs
+on different days or machines transform exactly the same SCSS. Each profile
+stresses a different part of the pipeline:
+
+    mixed      a realistic blend of everything below
+    nested     deeply nested selectors (brace matching, classifier parsing)
+    mixins     @include-heavy rules (CommonThemeMixinParser and handlers)
+    variables  $variable declarations and usages (variable conversion)
+
+Usage:
+    python scripts/synthetic_theme.py OUTPUT_DIR [--lines N] [--profile P] [--slug S]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+PROFILES = ("mixed", "nested", "mixins", "variables")
+
+# Relative weight of each block kind per profile
+_BLOCK_WEIGHTS = {
+    "mixed": {"rule": 5, "nested": 2, "mixin": 3, "variables": 2, "chrome": 1, "comment": 1},
+    "nested": {"rule": 1, "nested": 8, "mixin": 1, "variables": 0, "chrome": 0, "comment": 0},
+    "mixins": {"rule": 1, "nested": 1, "mixin": 8, "variables": 0, "chrome": 0, "comment": 0},
+    "variables": {"rule": 2, "nested": 0, "mixin": 0, "variables": 8, "chrome": 0, "comment": 0},
+}
+
+_BREAKPOINTS = ("xxs", "xs", "sm", "md", "lg", "xl", "mobile-tablet", "tablet-only")
+_PROPERTIES = ("padding", "margin", "font-size", "line-height", "width", "max-width")
+_COLORS = ("color", "background-color", "border-color")
+# Header/footer/nav selectors the style classifier strips out
+_CHROME_SELECTORS = ("header .navbar", "#footer .links", ".navbar-nav > li", ".main-nav a")
+
+
+class _Generator:
+    def __init__(self, profile: str, seed: int) -> None:
+        if profile not in PROFILES:
+            msg = f"Unknown profile {profile!r}; expected one of {', '.join(PROFILES)}"
+            raise ValueError(msg)
+        self.rng = random.Random(f"{profile}:{seed}")
+        weights = _BLOCK_WEIGHTS[profile]
+        self.kinds = [kind for kind, weight in weights.items() if weight]
+        self.weights = [weights[kind] for kind in self.kinds]
+        self.variables: list[str] = []
+        self.counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}-{self.counter}"
+
+    def _hex(self) -> str:
+        return f"#{self.rng.randrange(0x1000000):06x}"
+
+    def _declaration(self) -> str:
+        rng = self.rng
+        roll = rng.random()
+        if self.variables and roll < 0.3:
+            return f"{rng.choice(_COLORS)}: ${rng.choice(self.variables)};"
+        if roll < 0.4:
+            return f"background: url('../images/{self._name('bg')}.jpg') no-repeat;"
+        if roll < 0.5:
+            fn = rng.choice(("lighten", "darken"))
+            return f"{rng.choice(_COLORS)}: {fn}({self._hex()}, {rng.randint(5, 30)}%);"
+        return f"{rng.choice(_PROPERTIES)}: {rng.randint(0, 60)}px;"
+
+    def _rule(self, depth: int = 0) -> list[str]:
+        pad = "  " * depth
+        lines = [f"{pad}.{self._name('block')} .item {{"]
+        lines += [f"{pad}  {self._declaration()}" for _ in range(self.rng.randint(2, 5))]
+        lines.append(f"{pad}}}")
+        return lines
+
+    def _nested(self) -> list[str]:
+        depth = self.rng.randint(4, 9)
+        lines = []
+        for level in range(depth):
+            lines.append(f"{'  ' * level}.{self._name('level')} {{")
+            lines.append(f"{'  ' * (level + 1)}{self._declaration()}")
+        lines += self._rule(depth)
+        lines += [f"{'  ' * level}}}" for level in reversed(range(depth))]
+        return lines
+
+    def _mixin(self) -> list[str]:
+        rng = self.rng
+        lines = [f".{self._name('widget')} {{", f"  {self._declaration()}"]
+        for _ in range(rng.randint(2, 4)):
+            roll = rng.random()
+            if roll < 0.4:
+                lines += [
+                    f"  @include breakpoint({rng.choice(_BREAKPOINTS)}) {{",
+                    f"    {self._declaration()}",
+                    "  }",
+                ]
+            elif roll < 0.6:
+                lines.append("  @include flexbox();")
+            elif roll < 0.75:
+                lines.append(f"  @include border-radius({rng.randint(2, 12)}px);")
+            elif roll < 0.9:
+                lines.append("  @include clearfix;")
+            else:
+                lines += ["  @include button-variant() {", f"    {self._declaration()}", "  }"]
+        lines.append("}")
+        return lines
+
+    def _variables(self) -> list[str]:
+        lines = []
+        for _ in range(self.rng.randint(3, 8)):
+            name = self._name("color")
+            self.variables.append(name)
+            lines.append(f"${name}: {self._hex()};")
+        return lines + self._rule()
+
+    def _chrome(self) -> list[str]:
+        selector = self.rng.choice(_CHROME_SELECTORS)
+        return [f"{selector} {{", f"  {self._declaration()}", "}"]
+
+    def _comment(self) -> list[str]:
+        title = self._name("section").upper()
+        return ["/* ==========================", f"   {title}", "   ========================== */"]
+
+    def generate(self, lines: int) -> str:
+        out = [
+            '@import "../../DealerInspireCommonTheme/css/mixins";',
+            '@import "variables";',
+        ]
+        while len(out) < lines:
+            kind = self.rng.choices(self.kinds, self.weights)[0]
+            out += getattr(self, f"_{kind}")()
+        return "\n".join(out) + "\n"
+
+
+def generate_scss(lines: int, profile: str = "mixed", seed: int = 0) -> str:
+    """Return at least ``lines`` lines of legacy theme SCSS."""
+    return _Generator(profile, seed).generate(lines)
+
+
+def write_synthetic_theme(
+    platform_dir: Path, slug: str, lines: int, profile: str = "mixed", seed: int = 0
+) -> Path:
+    """
+    Write a dealer theme under ``platform_dir/dealer-themes/slug`` and return its path.
+
+    ``lines`` is split across the sources a migration reads: style.scss gets
+    most of it, inside.scss, lvdp.scss and lvrp.scss a slice each.
+    """
+    theme_dir = platform_dir / "dealer-themes" / slug
+    css_dir = theme_dir / "css"
+    css_dir.mkdir(parents=True, exist_ok=True)
+    shares = {"style.scss": 0.7, "inside.scss": 0.1, "lvdp.scss": 0.1, "lvrp.scss": 0.1}
+    for index, (name, share) in enumerate(shares.items()):
+        scss = generate_scss(max(int(lines * share), 1), profile, seed * 10 + index)
+        (css_dir / name).write_text(scss, encoding="utf-8")
+    return theme_dir
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output", type=Path, help="Platform directory to create the theme in")
+    parser.add_argument("--lines", type=int, default=10_000, help="Total SCSS lines")
+    parser.add_argument("--profile", choices=PROFILES, default="mixed")
+    parser.add_argument("--slug", default="synthetictheme")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    theme_dir = write_synthetic_theme(args.output, args.slug, args.lines, args.profile, args.seed)
+    print(theme_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
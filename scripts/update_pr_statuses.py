@@ -24,9 +24,8 @@ REPO_ROOT = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(REPO_ROOT))
 
 from rich.console import Console
-from rich.progress import track
 
-from sbm.utils.firebase_sync import get_firebase_db, is_firebase_available
+from sbm.utils.firebase_sync import FirebaseSync, get_firebase_db, is_firebase_available
 from sbm.utils.github_pr import GitHubPRManager
 
 console = Console()
@@ -72,26 +71,18 @@ def get_runs_needing_update(force_all: bool = False) -> list[tuple[str, str, dic
     return runs_needing_update
 
 
-def update_run_in_firebase(user_id: str, run_id: str, run_data: dict) -> bool:
+def build_pr_update(run_id: str, enriched_run: dict) -> dict | None:
     """
-    Update a run in Firebase with fresh PR metadata.
+    Build the Firebase field updates for a run from fresh PR metadata.
 
     Args:
-        user_id: Firebase user ID
         run_id: Firebase run ID
-        run_data: Run dictionary (will be enriched with fresh PR data)
+        enriched_run: Run dictionary already enriched with fresh PR data
 
     Returns:
-        True if update successful, False otherwise
+        Dictionary of PR fields to update, or None if nothing to update
     """
     try:
-        # Enrich run with fresh PR metadata
-        enriched_run = GitHubPRManager.enrich_run_with_pr_data(run_data, force_refresh=True)
-
-        # Update Firebase with new data
-        db = get_firebase_db()
-        run_ref = db.reference(f"/users/{user_id}/runs/{run_id}")
-
         # Only update the PR-related fields
         update_data = {
             "created_at": enriched_run.get("created_at"),
@@ -104,14 +95,11 @@ def update_run_in_firebase(user_id: str, run_id: str, run_data: dict) -> bool:
         # Remove None values
         update_data = {k: v for k, v in update_data.items() if v is not None}
 
-        if update_data:
-            run_ref.update(update_data)
-            return True
-        return False
+        return update_data or None
 
     except Exception as e:
-        console.print(f"[red]Error updating run {run_id}: {e}[/red]")
-        return False
+        console.print(f"[red]Error building PR update for run {run_id}: {e}[/red]")
+        return None
 
 
 def main():
@@ -168,15 +156,27 @@ def main():
     # Execute updates
     console.print("\n[bold blue]Starting updates...[/bold blue]\n")
 
-    updated = 0
     errors = 0
+    pending_updates: list[tuple[str, str, dict]] = []
 
-    for user_id, run_id, run_data in track(runs, description="Updating PR statuses"):
-        if update_run_in_firebase(user_id, run_id, run_data):
-            updated += 1
+    # Fetch fresh PR metadata in GraphQL batches of up to 100 PRs
+    with console.status("Fetching PR statuses..."):
+        GitHubPRManager.enrich_runs_with_pr_data(
+            [run_data for _, _, run_data in runs], force_refresh=True
+        )
+
+    for user_id, run_id, run_data in runs:
+        update_data = build_pr_update(run_id, run_data)
+        if update_data:
+            pending_updates.append((user_id, run_id, update_data))
         else:
             errors += 1
 
+    # Write all changes with a few multi-location updates instead of one per run
+    results = FirebaseSync().update_runs_bulk(pending_updates) if pending_updates else {}
+    updated = sum(1 for ok in results.values() if ok)
+    errors += len(results) - updated
+
     # Summary
     console.print("\n[bold green]Update Complete![/bold green]")
     console.print(f"Updated:  {updated}")
@@ -78,12 +78,10 @@ def run_verification():
             print(f"    ❌ Admin Connection/Reference failed: {e}")
 
     elif settings.firebase.is_user_mode():
-        import requests
-
-        from sbm.utils.firebase_sync import get_user_mode_identity
+        from sbm.utils.firebase_sync import get_firebase_rest_client, get_user_mode_identity
 
         print("    -> [USER] Using REST API (Anonymous Auth)")
-        base_url = settings.firebase.database_url
+        client = get_firebase_rest_client()
 
         # Authenticate first
         print("    -> [USER] Authenticating via Identity Toolkit...")
@@ -94,14 +92,14 @@ def run_verification():
             print("       Check FIREBASE__API_KEY in .env and internet connection.")
             return
 
-        uid, token = identity
+        uid, _ = identity
         print(f"    ✅ Authenticated as: {uid}")
 
         # Test READ (Public/User writable)
         # Try reading /verification_ping.json with auth
         print("    -> [USER] Attempting REST READ from /verification_ping.json...")
         try:
-            resp = requests.get(f"{base_url}/verification_ping.json?auth={token}", timeout=10)
+            resp = client.get("verification_ping")
             if resp.status_code == 200:
                 print(f"    ✅ REST READ Successful: {resp.json()}")
             elif resp.status_code == 401:
@@ -121,8 +119,7 @@ def run_verification():
                 "slug": "verification-ping",
                 "status": "success",
             }
-            url = f"{base_url}/users/{uid}/runs/ping.json?auth={token}"
-            resp = requests.put(url, json=payload, timeout=10)
+            resp = client.put(f"users/{uid}/runs/ping", payload)
 
             if resp.status_code == 200:
                 print(f"    ✅ REST WRITE Successful: {resp.json()}")
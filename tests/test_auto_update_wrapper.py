@@ -2,7 +2,8 @@
 Comprehensive tests for auto-update wrapper regeneration.
 
 Tests ensure that wrapper script is automatically regenerated during
-auto-updates, so users get the latest environment isolation fixes.
+updates, so users get the latest environment isolation fixes, and that the
+startup update check never blocks on the network.
 """
 
 import time
@@ -141,93 +142,105 @@ class TestAutoUpdateWrapperRegeneration:
 
 
 # =============================================================================
-# TEST 2: Auto-Update Integration
+# TEST 2: Update Hint at Startup
 # =============================================================================
 
 
-class TestAutoUpdateIntegration:
-    """Tests for auto-update integration with wrapper regeneration."""
+def _git_checkout(root, head="ref: refs/heads/master"):
+    (root / ".git").mkdir(parents=True)
+    (root / ".git" / "HEAD").write_text(f"{head}\n")
+    return root
 
-    @patch("sbm.cli._check_and_run_setup_if_needed")
-    @patch("subprocess.run")
-    def test_auto_update_calls_setup_after_pull(self, mock_subprocess, mock_setup):
-        """Verify _check_and_run_setup_if_needed is called after successful git pull."""
-        from sbm.cli import auto_update_repo
-
-        # Mock git operations to succeed
-        def subprocess_side_effect(*args, **kwargs):
-            # Git directory exists check
-            if "ls-remote" in args[0]:
-                return MagicMock(returncode=0)
-            # Not detached HEAD
-            if "symbolic-ref" in args[0]:
-                return MagicMock(returncode=0)
-            # Current branch
-            if "rev-parse" in args[0] and "--abbrev-ref" in args[0]:
-                return MagicMock(returncode=0, stdout="master\n")
-            # No uncommitted changes
-            if "status" in args[0] and "--porcelain" in args[0]:
-                return MagicMock(returncode=0, stdout="")
-            # Git pull (with updates)
-            if "pull" in args[0]:
-                return MagicMock(returncode=0, stdout="Updated files...\n")
-            return MagicMock(returncode=0)
-
-        mock_subprocess.side_effect = subprocess_side_effect
-
-        # Mock Path operations
-        mock_disable_file = MagicMock()
-        mock_disable_file.exists.return_value = False
-
-        mock_git_dir = MagicMock()
-        mock_git_dir.exists.return_value = True
-
-        def truediv_side_effect(name):
-            if ".sbm-no-auto-update" in str(name):
-                return mock_disable_file
-            if ".git" in str(name):
-                return mock_git_dir
-            return MagicMock()
 
-        mock_repo_root = MagicMock()
-        mock_repo_root.__truediv__.side_effect = truediv_side_effect
+def _ctx(subcommand="auto"):
+    return MagicMock(invoked_subcommand=subcommand)
 
-        with patch("sbm.cli.REPO_ROOT", mock_repo_root), patch("sbm.cli.logger"), patch(
-            "sbm.cli._should_auto_update", return_value=True
-        ):
-            auto_update_repo()
 
-            # Verify git commands were attempted
-            assert mock_subprocess.call_args_list
+class TestUpdateHint:
+    """Tests for the cached, non-blocking update check in the CLI callback."""
 
-    @patch("sbm.cli._check_and_run_setup_if_needed")
+    @patch("sbm.utils.processes.run_background_task")
     @patch("subprocess.run")
-    def test_auto_update_skips_setup_on_no_updates(self, mock_subprocess, mock_setup):
-        """Verify setup is not called if there are no updates."""
-        from sbm.cli import auto_update_repo
-
-        # Mock git operations
-        def subprocess_side_effect(*args, **kwargs):
-            if "ls-remote" in args[0]:
-                return MagicMock(returncode=0)
-            if "symbolic-ref" in args[0]:
-                return MagicMock(returncode=0)
-            if "rev-parse" in args[0] and "--abbrev-ref" in args[0]:
-                return MagicMock(returncode=0, stdout="master\n")
-            if "status" in args[0] and "--porcelain" in args[0]:
-                return MagicMock(returncode=0, stdout="")
-            # Git pull (already up to date)
-            if "pull" in args[0]:
-                return MagicMock(returncode=0, stdout="Already up to date.\n")
-            return MagicMock(returncode=0)
-
-        mock_subprocess.side_effect = subprocess_side_effect
-
-        with patch("pathlib.Path.exists", return_value=True), patch("sbm.cli.logger"):
-            auto_update_repo()
-
-            # Setup should not be called (no updates)
-            mock_setup.assert_not_called()
+    def test_hint_comes_from_cache_without_network(
+        self, mock_subprocess, mock_spawn, tmp_path, capsys
+    ):
+        """Verify a fresh cached result is shown without running git or a worker."""
+        from sbm.cli import _notify_if_update_available
+        from sbm.utils.update_check import save_update_check
+
+        repo = _git_checkout(tmp_path / "repo")
+        cache = tmp_path / "check.json"
+        save_update_check(
+            {"checked_at": time.time(), "branch": "master", "remote_version": "9.9.9"}, cache
+        )
+
+        with patch("sbm.cli.REPO_ROOT", repo), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", cache
+        ), patch("sbm.cli.get_version", return_value="1.0.0"):
+            _notify_if_update_available(_ctx())
+
+        assert "9.9.9 is available" in capsys.readouterr().err
+        mock_subprocess.assert_not_called()
+        mock_spawn.assert_not_called()
+
+    @patch("sbm.utils.processes.run_background_task")
+    def test_stale_cache_schedules_one_background_check(self, mock_spawn, tmp_path, capsys):
+        """Verify a stale cache starts the worker once and doesn't hint on old data."""
+        from sbm.cli import _notify_if_update_available
+
+        repo = _git_checkout(tmp_path / "repo")
+        cache = tmp_path / "check.json"
+
+        with patch("sbm.cli.REPO_ROOT", repo), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", cache
+        ), patch("sbm.cli.get_version", return_value="1.0.0"):
+            _notify_if_update_available(_ctx())
+            _notify_if_update_available(_ctx())
+
+        mock_spawn.assert_called_once()
+        command = mock_spawn.call_args[0][0]
+        assert command[1:4] == ["-m", "sbm.worker", "check-update"]
+        assert command[-1] == str(repo)
+        assert capsys.readouterr().err == ""
+
+    @patch("sbm.utils.processes.run_background_task")
+    def test_no_hint_when_versions_match_or_branch_changed(self, mock_spawn, tmp_path, capsys):
+        """Verify no hint for the same version or a result recorded on another branch."""
+        from sbm.cli import _notify_if_update_available
+        from sbm.utils.update_check import save_update_check
+
+        repo = _git_checkout(tmp_path / "repo", head="ref: refs/heads/feature/x")
+        cache = tmp_path / "check.json"
+        save_update_check(
+            {"checked_at": time.time(), "branch": "master", "remote_version": "9.9.9"}, cache
+        )
+
+        with patch("sbm.cli.REPO_ROOT", repo), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", cache
+        ):
+            with patch("sbm.cli.get_version", return_value="1.0.0"):
+                _notify_if_update_available(_ctx())
+            (repo / ".git" / "HEAD").write_text("ref: refs/heads/master\n")
+            with patch("sbm.cli.get_version", return_value="9.9.9"):
+                _notify_if_update_available(_ctx())
+
+        assert capsys.readouterr().err == ""
+
+    def test_hint_only_when_remote_version_is_newer(self, tmp_path):
+        """Verify versions are compared numerically and older remotes give no hint."""
+        from sbm.utils.update_check import available_update
+
+        repo = _git_checkout(tmp_path / "repo")
+
+        def hint(remote, local):
+            data = {"branch": "master", "remote_version": remote}
+            return available_update(data, repo, local)
+
+        assert hint("2.10.0", "2.9.3") == "2.10.0"
+        assert hint("2.9.3", "2.10.0") is None
+        assert hint("2.1", "2.1.0") is None
+        assert hint("2.1.1", "2.1.0rc1") == "2.1.1"
+        assert hint("nightly", "2.1.0") is None
 
 
 # =============================================================================
@@ -418,16 +431,19 @@ class TestErrorHandling:
             _check_and_run_setup_if_needed()
 
     @patch("subprocess.run")
-    def test_auto_update_handles_git_errors(self, mock_subprocess):
-        """Verify auto-update handles git errors gracefully."""
-        from sbm.cli import auto_update_repo
+    def test_update_check_handles_git_errors(self, mock_subprocess, tmp_path):
+        """Verify a failed fetch is recorded without losing the last known version."""
+        from sbm.utils.update_check import check_for_update, save_update_check
 
-        # Mock git error
+        repo = _git_checkout(tmp_path / "repo")
+        cache = tmp_path / "check.json"
+        save_update_check({"checked_at": 0, "branch": "master", "remote_version": "2.0.0"}, cache)
         mock_subprocess.return_value = MagicMock(returncode=1, stderr="fatal: error")
 
-        with patch("pathlib.Path.exists", return_value=True), patch("sbm.cli.logger"):
-            # Should not raise exception
-            auto_update_repo()
+        data = check_for_update(repo, cache)
+
+        assert data["remote_version"] == "2.0.0"
+        assert data["checked_at"] > 0
 
 
 # =============================================================================
@@ -436,89 +452,93 @@ class TestErrorHandling:
 
 
 class TestAutoUpdateConditions:
-    """Tests for conditions that trigger or skip auto-update."""
+    """Tests for conditions that skip the update check."""
 
-    @patch("subprocess.run")
-    def test_auto_update_skips_if_disabled(self, mock_subprocess):
-        """Verify auto-update is skipped if .sbm-no-auto-update file exists."""
-        from sbm.cli import auto_update_repo
+    @patch("sbm.utils.processes.run_background_task")
+    def test_update_check_skips_if_disabled(self, mock_spawn, tmp_path):
+        """Verify no check is scheduled if .sbm-no-auto-update file exists."""
+        from sbm.cli import _notify_if_update_available
 
-        with patch("pathlib.Path.exists", return_value=True):
-            auto_update_repo()
+        repo = _git_checkout(tmp_path / "repo")
+        (repo / ".sbm-no-auto-update").write_text("")
 
-            # Should not run any git commands
-            mock_subprocess.assert_not_called()
+        with patch("sbm.cli.REPO_ROOT", repo), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", tmp_path / "check.json"
+        ):
+            _notify_if_update_available(_ctx())
 
-    @patch("subprocess.run")
-    def test_auto_update_skips_if_not_git_repo(self, mock_subprocess):
-        """Verify auto-update is skipped if not in a git repository."""
-        from sbm.cli import auto_update_repo
+        mock_spawn.assert_not_called()
 
-        # Mock Path operations
-        mock_disable_file = MagicMock()
-        mock_disable_file.exists.return_value = False
+    @patch("sbm.utils.processes.run_background_task")
+    def test_update_check_skips_if_not_git_repo(self, mock_spawn, tmp_path):
+        """Verify no check is scheduled if not in a git repository."""
+        from sbm.cli import _notify_if_update_available
 
-        mock_git_dir = MagicMock()
-        mock_git_dir.exists.return_value = False
+        with patch("sbm.cli.REPO_ROOT", tmp_path), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", tmp_path / "check.json"
+        ):
+            _notify_if_update_available(_ctx())
 
-        def truediv_side_effect(name):
-            if ".sbm-no-auto-update" in str(name):
-                return mock_disable_file
-            if ".git" in str(name):
-                return mock_git_dir
-            return MagicMock()
+        mock_spawn.assert_not_called()
 
-        mock_repo_root = MagicMock()
-        mock_repo_root.__truediv__.side_effect = truediv_side_effect
+    @patch("sbm.utils.processes.run_background_task")
+    def test_update_check_skips_for_update_command(self, mock_spawn, tmp_path):
+        """Verify 'sbm update' itself doesn't schedule a check."""
+        from sbm.cli import _notify_if_update_available
 
-        with patch("sbm.cli.REPO_ROOT", mock_repo_root):
-            auto_update_repo()
+        repo = _git_checkout(tmp_path / "repo")
 
-            # Should not run git commands
-            mock_subprocess.assert_not_called()
+        with patch("sbm.cli.REPO_ROOT", repo), patch(
+            "sbm.utils.update_check.UPDATE_CHECK_PATH", tmp_path / "check.json"
+        ):
+            _notify_if_update_available(_ctx("update"))
+
+        mock_spawn.assert_not_called()
 
     @patch("subprocess.run")
-    def test_auto_update_skips_on_detached_head(self, mock_subprocess):
-        """Verify auto-update is skipped if in detached HEAD state."""
-        from sbm.cli import auto_update_repo
+    def test_update_check_skips_on_detached_head(self, mock_subprocess, tmp_path):
+        """Verify the worker doesn't fetch in detached HEAD state."""
+        from sbm.utils.update_check import check_for_update
+
+        repo = _git_checkout(tmp_path / "repo", head="0123456789abcdef")
+
+        data = check_for_update(repo, tmp_path / "check.json")
 
-        def subprocess_side_effect(*args, **kwargs):
-            if "ls-remote" in args[0]:
-                return MagicMock(returncode=0)
-            # Detached HEAD (symbolic-ref fails)
-            if "symbolic-ref" in args[0]:
-                return MagicMock(returncode=1)
-            return MagicMock(returncode=0)
+        mock_subprocess.assert_not_called()
+        assert data["remote_version"] is None
+
+    @patch("subprocess.run")
+    def test_update_check_skips_on_non_master_branch(self, mock_subprocess, tmp_path):
+        """Verify the worker doesn't fetch when not on master/main."""
+        from sbm.utils.update_check import check_for_update
 
-        mock_subprocess.side_effect = subprocess_side_effect
+        repo = _git_checkout(tmp_path / "repo", head="ref: refs/heads/feature/test")
 
-        with patch("pathlib.Path.exists", return_value=True), patch("sbm.cli.logger"):
-            auto_update_repo()
+        data = check_for_update(repo, tmp_path / "check.json")
 
-            # Should not attempt pull (stopped at detached HEAD check)
-            for call in mock_subprocess.call_args_list:
-                assert "pull" not in str(call)
+        mock_subprocess.assert_not_called()
+        assert data["branch"] == "feature/test"
+        assert data["remote_version"] is None
 
     @patch("subprocess.run")
-    def test_auto_update_skips_on_non_master_branch(self, mock_subprocess):
-        """Verify auto-update is skipped if not on master/main branch."""
-        from sbm.cli import auto_update_repo
-
-        def subprocess_side_effect(*args, **kwargs):
-            if "ls-remote" in args[0]:
-                return MagicMock(returncode=0)
-            if "symbolic-ref" in args[0]:
-                return MagicMock(returncode=0)
-            # On feature branch
-            if "rev-parse" in args[0] and "--abbrev-ref" in args[0]:
-                return MagicMock(returncode=0, stdout="feature/test\n")
-            return MagicMock(returncode=0)
-
-        mock_subprocess.side_effect = subprocess_side_effect
-
-        with patch("pathlib.Path.exists", return_value=True), patch("sbm.cli.logger"):
-            auto_update_repo()
-
-            # Should not attempt pull (not on master/main)
-            for call in mock_subprocess.call_args_list:
-                assert "pull" not in str(call)
+    def test_update_check_records_remote_version(self, mock_subprocess, tmp_path):
+        """Verify the worker fetches the branch and caches origin's version."""
+        from sbm.utils.update_check import check_for_update, load_update_check
+
+        repo = _git_checkout(tmp_path / "repo", head="ref: refs/heads/main")
+        cache = tmp_path / "check.json"
+        mock_subprocess.side_effect = [
+            MagicMock(returncode=0),
+            MagicMock(returncode=0, stdout='[project]\nversion = "3.1.0"\n'),
+        ]
+
+        check_for_update(repo, cache)
+
+        assert mock_subprocess.call_args_list[0][0][0] == [
+            "git",
+            "fetch",
+            "--quiet",
+            "origin",
+            "main",
+        ]
+        assert load_update_check(cache)["remote_version"] == "3.1.0"
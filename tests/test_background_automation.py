@@ -63,7 +63,7 @@ class TestRunBackgroundTask:
 
 
 class TestTriggerBackgroundStatsUpdate:
-    """Verify background stats refresh uses the internal CLI command."""
+    """Verify background stats refresh uses the lightweight worker entry point."""
 
     @patch("sbm.utils.tracker.run_background_task")
     def test_trigger_background_stats_update(self, mock_run_background):
@@ -73,65 +73,32 @@ class TestTriggerBackgroundStatsUpdate:
 
         mock_run_background.assert_called_once()
         args = mock_run_background.call_args[0][0]
-        assert args[1:] == ["-m", "sbm.cli", "internal-refresh-stats"]
+        assert args[1:] == ["-m", "sbm.worker", "refresh-stats"]
 
 
 # =============================================================================
-# TEST 4: Auto-Update Git Safety (sbm/cli.py)
+# TEST 4: Background Update Check (sbm/worker.py)
 # =============================================================================
 
 
-class TestAutoUpdateRepo:
-    """Tests for auto_update_repo git safety.
+class TestUpdateCheckWorker:
+    """Tests for the background update check worker."""
 
-    Note: Some tests are skipped because cli.py has module-level side effects
-    (setup checks, auto_update) that run on import and interfere with mocks.
-    The auto_update_repo logic was verified through code review.
-    """
+    @patch("sbm.utils.update_check.check_for_update")
+    def test_worker_runs_check_update(self, mock_check, tmp_path):
+        """Verify the check-update task checks the given checkout."""
+        from sbm.worker import main
 
-    @pytest.mark.skip(reason="cli.py import triggers setup.sh - verified via code review")
-    @patch("subprocess.run")
-    def test_skips_detached_head(self, mock_run):
-        """Verify auto-update skips when in detached HEAD state."""
-        from sbm.cli import auto_update_repo
+        assert main(["check-update", "--repo-root", str(tmp_path)]) == 0
 
-        # Mock: git dir exists, network OK, but detached HEAD
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # ls-remote (network check)
-            MagicMock(returncode=1),  # symbolic-ref (detached HEAD)
-        ]
+        mock_check.assert_called_once_with(tmp_path)
 
-        auto_update_repo()
+    @patch("sbm.utils.update_check.check_for_update", side_effect=OSError("offline"))
+    def test_worker_failures_are_silent(self, mock_check, tmp_path):
+        """Verify background check errors never escape the worker."""
+        from sbm.worker import main
 
-        # Should NOT have attempted pull
-        pull_calls = [c for c in mock_run.call_args_list if "pull" in str(c)]
-        assert len(pull_calls) == 0
-
-    def test_stash_restored_on_pull_failure(self):
-        """Verify stash is popped even when pull fails.
-
-        Verified via code review: cli.py:280-296 uses try/finally block
-        to ensure stash pop is always attempted.
-        """
-        # Verified via code review
-
-    @pytest.mark.skip(reason="cli.py import triggers setup.sh - verified via code review")
-    @patch("subprocess.run")
-    def test_skips_feature_branches(self, mock_run):
-        """Verify auto-update only runs on main/master."""
-        from sbm.cli import auto_update_repo
-
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # ls-remote
-            MagicMock(returncode=0),  # symbolic-ref
-            MagicMock(returncode=0, stdout="feature/test-branch"),  # rev-parse
-        ]
-
-        auto_update_repo()
-
-        # Should NOT have attempted pull on feature branch
-        pull_calls = [c for c in mock_run.call_args_list if "pull" in str(c)]
-        assert len(pull_calls) == 0
+        assert main(["check-update", "--repo-root", str(tmp_path)]) == 0
 
 
 # =============================================================================
@@ -4,7 +4,8 @@ from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
-from sbm.cli import _calculate_time_saved, _format_duration, cli
+from sbm.cli import cli
+from sbm.commands.stats import _calculate_time_saved, _format_duration
 
 
 class TestFormatDuration:
@@ -64,8 +65,8 @@ class TestCalculateTimeSaved:
 class TestStatsHistoryCommand:
     """Test the stats --history command."""
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_stats_history_runs_without_error(self, mock_console, mock_stats):
         """Test that stats --history command runs without error."""
         mock_stats.return_value = {
@@ -85,8 +86,8 @@ class TestStatsHistoryCommand:
         # Should not crash even with empty runs
         assert result.exit_code == 0
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_stats_history_with_limit(self, mock_console, mock_stats):
         """Test stats --history --limit option."""
         mock_stats.return_value = {
@@ -105,8 +106,8 @@ class TestStatsHistoryCommand:
         result = runner.invoke(cli, ["stats", "--history", "--limit", "25"])
         assert result.exit_code == 0
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_stats_history_with_since_filter(self, mock_console, mock_stats):
         """Test stats --history with --since days filter."""
         mock_stats.return_value = {
@@ -134,8 +135,8 @@ class TestStatsHistoryCommand:
         result = runner.invoke(cli, ["stats", "--history", "--since", "7"])
         assert result.exit_code == 0
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_stats_history_invalid_date_format(self, mock_console, mock_stats):
         """Test stats --history with invalid since value."""
         mock_stats.return_value = {
@@ -163,8 +164,8 @@ class TestStatsHistoryCommand:
 class TestStatsHistoryBackwardCompatibility:
     """Test backward compatibility with old run data."""
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_old_run_data_without_new_fields(self, mock_console, mock_stats):
         """Test that old runs without new fields display gracefully."""
         # Simulate old run data without lines_migrated, duration_seconds, report_path
@@ -193,8 +194,8 @@ class TestStatsHistoryBackwardCompatibility:
         # Should not crash with missing fields
         assert result.exit_code == 0
 
-    @patch("sbm.cli.get_migration_stats")
-    @patch("sbm.cli.get_console")
+    @patch("sbm.commands.stats.get_migration_stats")
+    @patch("sbm.commands.stats.get_console")
     def test_partial_run_data(self, mock_console, mock_stats):
         """Test runs with some but not all new fields."""
         mock_stats.return_value = {
@@ -2,7 +2,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from sbm.cli import _expand_theme_names
+from sbm.commands.migration import _expand_theme_names
 
 
 class TestCLIInput(unittest.TestCase):
@@ -57,8 +57,8 @@ class TestCLIInput(unittest.TestCase):
             # Mock the file content
             file_content = "fallback_slug"
             with patch("pathlib.Path.open", unittest.mock.mock_open(read_data=file_content)):
-                # Mock REPO_ROOT in sbm.cli
-                with patch("sbm.cli.REPO_ROOT", Path("/mock/repo")):
+                # Mock REPO_ROOT in sbm.commands.migration
+                with patch("sbm.commands.migration.REPO_ROOT", Path("/mock/repo")):
                     input_themes = ("@slugs.txt",)
                     result = _expand_theme_names(input_themes)
                     self.assertEqual(result, ["fallback_slug"])
@@ -0,0 +1,112 @@
+"""
+Tests for lazy command loading in the ``sbm`` CLI.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+from sbm import cli as cli_module
+from sbm.cli import LAZY_COMMANDS, SBMCommandGroup, cli
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules only the migration/stats/PR commands need; light commands must not load them
+HEAVY_MODULES = {
+    "git",
+    "sbm.commands.migration",
+    "sbm.commands.pr",
+    "sbm.commands.stats",
+    "sbm.commands.validation",
+    "sbm.core.git",
+    "sbm.core.maps",
+    "sbm.core.migration",
+    "sbm.oem.factory",
+    "sbm.scss.classifiers",
+    "sbm.scss.processor",
+    "sbm.utils.tracker",
+}
+
+# Generous ceiling for `import sbm.cli` so slow CI machines don't flake; the
+# heavy-module check below is what catches most regressions.
+COLD_START_BUDGET_US = 1_000_000
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Run ``statement`` under ``-X importtime``; return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+_greeted = []
+
+
+@click.command()
+@click.argument("names", nargs=-1)
+def _hello(names):
+    _greeted.append(names)
+
+
+class TestColdStart:
+    def test_cli_import_skips_heavy_modules_and_fits_budget(self):
+        timings = _importtime("import sbm.cli")
+
+        assert "sbm.cli" in timings
+        assert not HEAVY_MODULES.intersection(timings)
+        assert timings["sbm.cli"] < COLD_START_BUDGET_US
+
+    def test_resolving_a_light_command_stays_light(self):
+        timings = _importtime(
+            "import click, sbm.cli\n"
+            "ctx = click.Context(sbm.cli.cli)\n"
+            "assert sbm.cli.cli.get_command(ctx, 'version') is not None"
+        )
+
+        assert not HEAVY_MODULES.intersection(timings)
+
+
+class TestLazyRegistry:
+    def test_all_commands_are_listed(self):
+        commands = cli.list_commands(click.Context(cli))
+
+        assert set(LAZY_COMMANDS) <= set(commands)
+        assert {"version", "doctor", "update", "get-slugs"} <= set(commands)
+
+    def test_lazy_command_resolves_to_its_module(self):
+        command = cli.get_command(click.Context(cli), "pr")
+
+        assert isinstance(command, click.Group)
+        assert command.callback.__module__ == "sbm.commands.pr"
+        assert set(command.commands) == {"create", "merge"}
+
+    def test_commands_are_module_attributes(self):
+        from sbm.cli import auto
+
+        assert auto is cli.get_command(click.Context(cli), "auto")
+        assert cli_module.test_compilation.name == "test-compilation"
+
+    def test_lazy_command_is_imported_once_and_used_as_default(self):
+        group = SBMCommandGroup(
+            default_command="hello", lazy_commands={"hello": f"{__name__}:_hello"}
+        )
+
+        group.main(["theme-a", "theme-b"], standalone_mode=False)
+        group.main(["hello", "theme-c"], standalone_mode=False)
+
+        assert group.commands["hello"] is _hello
+        assert _greeted == [("theme-a", "theme-b"), ("theme-c",)]
@@ -10,7 +10,7 @@ from sbm.ui.console import SBMConsole
 
 @pytest.fixture
 def mock_get_migration_stats():
-    with patch("sbm.cli.get_migration_stats") as mock:
+    with patch("sbm.commands.stats.get_migration_stats") as mock:
         yield mock
 
 
@@ -32,7 +32,7 @@ def test_stats_display_uses_display_name(mock_get_migration_stats, runner):
     # Use real SBMConsole so output goes to stdout (captured by runner)
     real_sbm_console = SBMConsole(config=Config({}))
 
-    with patch("sbm.cli.get_console", return_value=real_sbm_console), patch("sbm.cli.get_settings"):
+    with patch("sbm.commands.stats.get_console", return_value=real_sbm_console), patch("sbm.cli.get_settings"):
         result = runner.invoke(cli, ["stats"])
 
         # Check output for the display name
@@ -54,6 +54,6 @@ def test_stats_display_fallback_to_uid(mock_get_migration_stats, runner):
 
     real_sbm_console = SBMConsole(config=Config({}))
 
-    with patch("sbm.cli.get_console", return_value=real_sbm_console), patch("sbm.cli.get_settings"):
+    with patch("sbm.commands.stats.get_console", return_value=real_sbm_console), patch("sbm.cli.get_settings"):
         result = runner.invoke(cli, ["stats"])
         assert "auth-uid-123" in result.output
@@ -23,6 +23,13 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def mock_setup_check():
+    # The real check reinstalls requirements and rewrites ~/.local/bin/sbm
+    with patch("sbm.cli._check_and_run_setup_if_needed") as mock:
+        yield mock
+
+
 def test_update_aborts_rebase(mock_subprocess, mock_legacy_sync, runner):
     """Verify that update attempts to abort a rebase if detected."""
 
@@ -105,3 +112,26 @@ def test_update_syncs_and_resets(mock_subprocess, mock_legacy_sync, runner):
         mock_subprocess.assert_any_call(
             ["git", "checkout", "stats/"], check=False, cwd=ANY, capture_output=ANY
         )
+
+
+def test_update_refreshes_setup_after_pull(
+    mock_subprocess, mock_legacy_sync, mock_setup_check, runner
+):
+    """Verify that a successful pull is followed by the setup/wrapper refresh."""
+    mock_settings = MagicMock()
+    mock_settings.firebase.api_key = "test-api-key"
+
+    with patch("sbm.cli.get_settings", return_value=mock_settings), patch(
+        "sbm.cli._validate_git_repository"
+    ), patch("sbm.cli._get_current_branch", return_value="main"), patch(
+        "sbm.cli.Path.exists", return_value=False
+    ), patch("sbm.cli._stash_changes_if_needed", return_value=False), patch(
+        "sbm.cli._ensure_devtools_cli"
+    ), patch("sbm.cli._update_dependencies"), patch("sbm.cli._install_precommit_hooks"):
+        mock_subprocess.return_value.returncode = 0
+        mock_subprocess.return_value.stdout = "Already up to date."
+
+        result = runner.invoke(cli, ["update"])
+
+    assert result.exit_code == 0, result.output
+    mock_setup_check.assert_called_once()
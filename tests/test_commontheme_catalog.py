@@ -0,0 +1,101 @@
+"""
+Tests for the indexed CommonTheme file catalog.
+"""
+
+import os
+
+import pytest
+
+from sbm.core import commontheme_catalog
+from sbm.core.commontheme_catalog import CommonThemeCatalog, get_commontheme_catalog
+
+
+@pytest.fixture
+def common_theme(tmp_path):
+    root = tmp_path / "DealerInspireCommonTheme"
+    (root / "css/dealer-groups/lexus").mkdir(parents=True)
+    (root / "css/dealer-groups/lexus/_section-map.scss").write_text("")
+    (root / "css/dealer-groups/lexus/_header.scss").write_text("")
+    (root / "partials/dealer-groups/lexus").mkdir(parents=True)
+    (root / "partials/dealer-groups/lexus/section-map.php").write_text("")
+    (root / "partials/map-row-2.php").write_text("")
+    (root / "js").mkdir()
+    (root / "js/section-map.js").write_text("")
+    return root
+
+
+@pytest.fixture(autouse=True)
+def _isolated_catalogs(tmp_path, monkeypatch):
+    monkeypatch.setattr(commontheme_catalog, "CATALOG_CACHE_PATH", tmp_path / "catalog.json")
+    commontheme_catalog.clear_commontheme_catalogs()
+    yield
+    commontheme_catalog.clear_commontheme_catalogs()
+
+
+def _fake_git(tmp_path, sha):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs/heads").mkdir(parents=True, exist_ok=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs/heads/main").write_text(f"{sha}\n")
+
+
+def test_queries_are_answered_from_the_index(common_theme):
+    catalog = CommonThemeCatalog.build(common_theme)
+
+    assert catalog.is_dir("css/dealer-groups/lexus")
+    assert catalog.exists("partials/map-row-2.php")
+    assert not catalog.exists("js/section-map.js")  # outside the indexed subtrees
+    assert catalog.listdir("partials") == {"map-row-2.php"}
+    assert catalog.find_by_name("SECTION-MAP.PHP") == [
+        "partials/dealer-groups/lexus/section-map.php"
+    ]
+    assert catalog.with_any_keyword(["section-map", "map-row"], under="css", suffix=".scss") == [
+        "css/dealer-groups/lexus/_section-map.scss"
+    ]
+    assert catalog.files_under("partials", ".php") == [
+        "partials/dealer-groups/lexus/section-map.php",
+        "partials/map-row-2.php",
+    ]
+
+
+def test_catalog_is_built_once_per_process(common_theme, mocker):
+    build = mocker.spy(CommonThemeCatalog, "build")
+
+    first = get_commontheme_catalog(common_theme)
+    second = get_commontheme_catalog(str(common_theme))
+
+    assert first is second
+    assert build.call_count == 1
+
+
+def test_saved_catalog_is_reused_until_head_or_directories_change(common_theme, tmp_path, mocker):
+    _fake_git(tmp_path, "a" * 40)
+    get_commontheme_catalog(common_theme)
+    assert (tmp_path / "catalog.json").exists()
+
+    build = mocker.spy(CommonThemeCatalog, "build")
+
+    commontheme_catalog.clear_commontheme_catalogs()
+    get_commontheme_catalog(common_theme)
+    assert build.call_count == 0
+
+    # A new file bumps its directory's mtime
+    new_file = common_theme / "partials/full-map.php"
+    new_file.write_text("")
+    partials = common_theme / "partials"
+    os.utime(partials, ns=(0, os.stat(partials).st_mtime_ns + 1_000_000))
+    commontheme_catalog.clear_commontheme_catalogs()
+    assert get_commontheme_catalog(common_theme).exists("partials/full-map.php")
+    assert build.call_count == 1
+
+    # A checkout moves HEAD
+    _fake_git(tmp_path, "b" * 40)
+    commontheme_catalog.clear_commontheme_catalogs()
+    get_commontheme_catalog(common_theme)
+    assert build.call_count == 2
+
+
+def test_catalog_is_not_persisted_outside_git(common_theme, tmp_path):
+    get_commontheme_catalog(common_theme)
+
+    assert not (tmp_path / "catalog.json").exists()
@@ -0,0 +1,78 @@
+"""
+Tests for the cursor-based merged-PR search in scripts/daily_firebase_sync.py.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from scripts import daily_firebase_sync as sync
+
+
+def _page(nodes, has_next=False, end_cursor=None, total=None):
+    return {
+        "search": {
+            "issueCount": total if total is not None else len(nodes),
+            "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+            "nodes": nodes,
+        }
+    }
+
+
+def _pr(number, title, merged_at="2026-01-02T10:00:00Z", additions=250):
+    return {
+        "number": number,
+        "title": title,
+        "url": f"https://github.com/org/repo/pull/{number}",
+        "headRefName": f"pcon-864-site{number}-sbm0126",
+        "additions": additions,
+        "mergedAt": merged_at,
+        "author": {"login": "dev1"},
+    }
+
+
+def test_single_search_covers_all_title_patterns():
+    query = sync.build_merged_search(datetime(2026, 1, 1, 6, 30, tzinfo=timezone.utc))
+
+    assert "merged:>=2026-01-01T06:30:00Z" in query
+    assert '"SBM FE Audit" OR "Site Builder Migration" OR "SBM: Migrate"' in query
+    assert "is:merged" in query
+
+
+@patch("scripts.daily_firebase_sync.GitHubPRManager.run_graphql")
+def test_follows_pages_and_filters_titles(mock_graphql):
+    mock_graphql.side_effect = [
+        _page(
+            [_pr(1, "site1 - SBM FE Audit"), _pr(2, "Unrelated SBM cleanup")],
+            has_next=True,
+            end_cursor="c1",
+        ),
+        _page([_pr(3, "SBM: Migrate site3 to Site Builder"), _pr(1, "site1 - SBM FE Audit")]),
+    ]
+
+    prs = sync.get_merged_sbm_prs_since(datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+    assert [pr["number"] for pr in prs] == [1, 3]
+    assert prs[0]["additions"] == 250
+    assert mock_graphql.call_args_list[0][0][1]["after"] is None
+    assert mock_graphql.call_args_list[1][0][1]["after"] == "c1"
+
+
+@patch("scripts.daily_firebase_sync.GitHubPRManager.run_graphql")
+def test_failed_page_returns_none(mock_graphql):
+    mock_graphql.side_effect = [_page([_pr(1, "a - SBM FE Audit")], True, "c1"), None]
+
+    assert sync.get_merged_sbm_prs_since(datetime(2026, 1, 1, tzinfo=timezone.utc)) is None
+
+
+def test_cursor_round_trip():
+    store = {}
+    db = MagicMock()
+    db.reference.return_value.get.side_effect = lambda: store.get("state")
+    db.reference.return_value.update.side_effect = lambda data: store.update(state=data)
+
+    assert sync.load_sync_cursor(db) is None
+
+    sync.save_sync_cursor(db, "2026-01-02T10:00:00Z")
+
+    assert sync.load_sync_cursor(db) == datetime(2026, 1, 2, 10, tzinfo=timezone.utc)
+    db.reference.assert_called_with(sync.CURSOR_PATH)
@@ -56,11 +56,11 @@ def test_get_all_migrated_slugs_offline(mock_is_avail):
     assert slugs == {}
 
 
-@patch("sbm.cli._expand_theme_names", return_value=["site-a", "site-new"])
+@patch("sbm.commands.migration._expand_theme_names", return_value=["site-a", "site-new"])
 @patch("sbm.utils.tracker.get_all_migrated_slugs")
-@patch("sbm.cli.migrate_dealer_theme")
-@patch("sbm.cli.get_console")
-@patch("sbm.cli.InteractivePrompts")
+@patch("sbm.commands.migration.migrate_dealer_theme")
+@patch("sbm.commands.migration.get_console")
+@patch("sbm.commands.migration.InteractivePrompts")
 @patch("sbm.cli.get_settings")
 def test_auto_duplicate_warn_skip(
     mock_get_settings, mock_prompts_class, mock_console, mock_migrate, mock_get_slugs, mock_expand
@@ -99,12 +99,12 @@ def test_auto_duplicate_warn_skip(
     assert mock_prompts_class.confirm_duplicate_migration.called
 
 
-@patch("sbm.cli._expand_theme_names", return_value=["site-a", "site-new"])
+@patch("sbm.commands.migration._expand_theme_names", return_value=["site-a", "site-new"])
 @patch("sbm.utils.tracker.get_all_migrated_slugs")
 @patch("sbm.utils.tracker.mark_runs_for_remigration")
-@patch("sbm.cli.migrate_dealer_theme")
-@patch("sbm.cli.get_console")
-@patch("sbm.cli.InteractivePrompts")
+@patch("sbm.commands.migration.migrate_dealer_theme")
+@patch("sbm.commands.migration.get_console")
+@patch("sbm.commands.migration.InteractivePrompts")
 @patch("sbm.cli.get_settings")
 def test_auto_duplicate_warn_remigrate(
     mock_get_settings,
@@ -150,11 +150,11 @@ def test_auto_duplicate_warn_remigrate(
     assert mock_prompts_class.confirm_duplicate_migration.called
 
 
-@patch("sbm.cli._expand_theme_names", return_value=["site-a", "site-new"])
+@patch("sbm.commands.migration._expand_theme_names", return_value=["site-a", "site-new"])
 @patch("sbm.utils.tracker.get_all_migrated_slugs")
-@patch("sbm.cli.migrate_dealer_theme")
-@patch("sbm.cli.get_console")
-@patch("sbm.cli.InteractivePrompts")
+@patch("sbm.commands.migration.migrate_dealer_theme")
+@patch("sbm.commands.migration.get_console")
+@patch("sbm.commands.migration.InteractivePrompts")
 @patch("sbm.cli.get_settings")
 def test_auto_duplicate_warn_cancel(
     mock_get_settings, mock_prompts_class, mock_console, mock_migrate, mock_get_slugs, mock_expand
@@ -0,0 +1,82 @@
+"""
+Tests for the fingerprinted environment health check in ``sbm.cli``.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from sbm import cli as cli_module
+from sbm.cli import REQUIRED_IMPORTS, is_env_healthy
+
+
+@pytest.fixture
+def dev_env(monkeypatch, tmp_path):
+    """An auto-sbm checkout with a venv that the running interpreter appears to use."""
+    repo = tmp_path / "auto-sbm"
+    bin_dir = repo / ".venv" / "bin"
+    bin_dir.mkdir(parents=True)
+    (bin_dir / "pip").write_text("")
+    (bin_dir / "python").write_text("")
+    (repo / "requirements.txt").write_text("click\n")
+
+    monkeypatch.setattr(cli_module, "REPO_ROOT", repo)
+    monkeypatch.setattr(cli_module, "ENV_HEALTH_PATH", tmp_path / "health.json")
+    monkeypatch.setattr(cli_module.shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(cli_module.sys, "prefix", str(repo / ".venv"))
+    monkeypatch.chdir(repo)
+    return repo
+
+
+@pytest.fixture
+def mock_run(monkeypatch):
+    run = MagicMock(return_value=MagicMock(returncode=0, stdout="\n"))
+    monkeypatch.setattr(cli_module.subprocess, "run", run)
+    return run
+
+
+def test_packages_checked_in_one_subprocess_then_cached(dev_env, mock_run):
+    assert is_env_healthy() is True
+    assert mock_run.call_count == 1
+    command = mock_run.call_args[0][0]
+    assert command[0] == str(dev_env / ".venv" / "bin" / "python")
+    assert command[3:] == list(REQUIRED_IMPORTS.values())
+
+    assert is_env_healthy() is True
+    assert mock_run.call_count == 1
+
+
+def test_changed_requirements_trigger_recheck(dev_env, mock_run):
+    assert is_env_healthy() is True
+
+    (dev_env / "requirements.txt").write_text("click\nrich\n")
+
+    assert is_env_healthy() is True
+    assert mock_run.call_count == 2
+
+
+def test_missing_package_is_reported_and_not_cached(dev_env, mock_run, mocker):
+    warning = mocker.patch.object(cli_module.logger, "warning")
+    mock_run.return_value = MagicMock(returncode=1, stdout="yaml rich_click\n")
+
+    assert is_env_healthy() is False
+    assert is_env_healthy() is False
+
+    assert mock_run.call_count == 2
+    warned = {call.args[0] for call in warning.call_args_list}
+    assert "Required Python package missing: pyyaml" in warned
+    assert "Required Python package missing: rich-click" in warned
+    assert not cli_module.ENV_HEALTH_PATH.exists()
+
+
+def test_installed_package_changes_fingerprint(dev_env, mock_run, monkeypatch, tmp_path):
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    monkeypatch.setattr(cli_module.sys, "path", [str(site_packages)])
+    (site_packages / "rich-13.0.0.dist-info").mkdir()
+    assert is_env_healthy() is True
+
+    (site_packages / "rich-13.0.0.dist-info").rename(site_packages / "rich-14.0.0.dist-info")
+
+    assert is_env_healthy() is True
+    assert mock_run.call_count == 2
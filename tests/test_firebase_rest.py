@@ -0,0 +1,173 @@
+"""
+Tests for the pooled Firebase REST client.
+
+Runs against a local HTTP stand-in for the Realtime Database so keep-alive,
+token refresh, retries and gzip decoding are exercised over real sockets.
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from sbm.utils.firebase_rest import FirebaseRestClient
+
+
+class _FakeFirebaseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, body, compress=False):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        token = parse_qs(parsed.query).get("auth", [None])[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        with server.lock:
+            server.requests.append((self.command, parsed.path, token, body))
+            server.ports.add(self.client_address[1])
+
+        if server.fail_next:
+            server.fail_next -= 1
+            self._send_json(503, {"error": "unavailable"})
+            return
+        if token not in server.valid_tokens:
+            self._send_json(401, {"error": "Permission denied"})
+            return
+        if self.command == "GET":
+            self._send_json(200, server.data, compress=True)
+        else:
+            self._send_json(200, body)
+
+    do_GET = _handle
+    do_PUT = _handle
+    do_PATCH = _handle
+
+
+@pytest.fixture
+def fake_firebase():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeFirebaseHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.ports = set()
+    server.valid_tokens = {"good-token"}
+    server.fail_next = 0
+    server.data = {"user1": {"runs": {"r1": {"slug": "testslug"}}}}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, tokens, session):
+    state = {"tokens": list(tokens), "invalidated": 0}
+
+    def identity():
+        return ("uid1", state["tokens"][0])
+
+    def invalidate():
+        state["invalidated"] += 1
+        if len(state["tokens"]) > 1:
+            state["tokens"].pop(0)
+
+    client = FirebaseRestClient(
+        f"http://127.0.0.1:{server.server_address[1]}",
+        identity_provider=identity,
+        invalidate_identity=invalidate,
+        session=session,
+        backoff_base=0.01,
+    )
+    return client, state
+
+
+@pytest.fixture
+def session():
+    s = requests.Session()
+    yield s
+    s.close()
+
+
+class TestFirebaseRestClient:
+    def test_get_decodes_gzip_and_sends_auth(self, fake_firebase, session):
+        client, _ = _client(fake_firebase, ["good-token"], session)
+
+        resp = client.get("users")
+
+        assert resp.ok
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.json() == fake_firebase.data
+        assert fake_firebase.requests == [("GET", "/users.json", "good-token", None)]
+
+    def test_connections_are_reused(self, fake_firebase, session):
+        client, _ = _client(fake_firebase, ["good-token"], session)
+
+        for i in range(5):
+            assert client.patch(f"users/uid1/runs/r{i}", {"pr_state": "OPEN"}).ok
+
+        assert len(fake_firebase.requests) == 5
+        assert len(fake_firebase.ports) == 1
+
+    def test_refreshes_token_once_on_401(self, fake_firebase, session):
+        client, state = _client(fake_firebase, ["stale-token", "good-token"], session)
+
+        resp = client.put("users/uid1/runs/r1", {"slug": "testslug"})
+
+        assert resp.ok
+        assert state["invalidated"] == 1
+        assert [r[2] for r in fake_firebase.requests] == ["stale-token", "good-token"]
+
+    def test_gives_up_when_refresh_does_not_help(self, fake_firebase, session):
+        client, state = _client(fake_firebase, ["bad-token"], session)
+
+        resp = client.get("users")
+
+        assert resp.status_code == 401
+        assert state["invalidated"] == 1
+        assert len(fake_firebase.requests) == 1
+
+    def test_retries_transient_server_errors(self, fake_firebase, session):
+        client, _ = _client(fake_firebase, ["good-token"], session)
+        fake_firebase.fail_next = 2
+
+        resp = client.patch("", {"users/uid1/runs/r1/pr_state": "MERGED"})
+
+        assert resp.ok
+        assert len(fake_firebase.requests) == 3
+        assert fake_firebase.requests[-1][1] == "/.json"
+
+    def test_returns_last_error_after_max_retries(self, fake_firebase, session):
+        client, _ = _client(fake_firebase, ["good-token"], session)
+        client.max_retries = 1
+        fake_firebase.fail_next = 5
+
+        resp = client.get("users")
+
+        assert resp.status_code == 503
+        assert len(fake_firebase.requests) == 2
+
+    def test_connection_errors_raise_after_retries(self, session):
+        client = FirebaseRestClient(
+            "http://127.0.0.1:9", session=session, max_retries=1, backoff_base=0.01
+        )
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("users", authenticated=False)
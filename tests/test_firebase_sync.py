@@ -11,6 +11,7 @@ from sbm.utils.firebase_sync import (
     FirebaseInitializationError,
     FirebaseSync,
     _initialize_firebase,
+    build_run_key,
     get_firebase_db,
     is_firebase_available,
     reset_firebase,
@@ -192,16 +193,23 @@ class TestFirebaseSync:
 
         sync = FirebaseSync()
 
-        run_data = {"slug": "test_slug", "status": "success", "sync_status": "pending"}
+        run_data = {
+            "slug": "test_slug",
+            "status": "success",
+            "sync_status": "pending",
+            "timestamp": "2026-01-01T00:00:00Z",
+        }
         result = sync.push_run("user1", run_data)
 
         assert result is True
         mock_db.reference.assert_called_with("users/user1/runs")
+        mock_ref.child.assert_called_with("test_slug_2026-01-01_00-00-00")
 
         # Verify sync_status was removed and data was set
         expected_push = {
             "slug": "test_slug",
             "status": "success",
+            "timestamp": "2026-01-01T00:00:00Z",
             "user_id": "user1",
             "pr_author": "user1",
         }
@@ -307,3 +315,146 @@ class TestAnonymousAuth:
         result = _initialize_firebase()
 
         assert result is True
+
+
+class TestBulkRunUpdates:
+    """Tests for multi-location run updates."""
+
+    @patch("sbm.utils.firebase_sync.is_firebase_available", return_value=True)
+    @patch("sbm.utils.firebase_sync.get_firebase_db")
+    @patch("sbm.utils.firebase_sync.get_settings")
+    def test_update_runs_bulk_admin_single_write(self, mock_get_settings, mock_get_db, mock_av):
+        """All runs are flattened into one root update in Admin Mode."""
+        settings = MagicMock()
+        settings.firebase.is_admin_mode.return_value = True
+        mock_get_settings.return_value = settings
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+
+        sync = FirebaseSync()
+        results = sync.update_runs_bulk(
+            [
+                ("user1", "run1", {"pr_state": "MERGED", "merged_at": "2026-01-10T10:00:00Z"}),
+                ("user2", "run2", {"pr_state": "CLOSED"}),
+            ]
+        )
+
+        assert results == {"users/user1/runs/run1": True, "users/user2/runs/run2": True}
+        mock_db.reference.assert_called_once_with("/")
+        mock_db.reference.return_value.update.assert_called_once_with(
+            {
+                "users/user1/runs/run1/pr_state": "MERGED",
+                "users/user1/runs/run1/merged_at": "2026-01-10T10:00:00Z",
+                "users/user2/runs/run2/pr_state": "CLOSED",
+            }
+        )
+
+    @patch("sbm.utils.firebase_sync.is_firebase_available", return_value=True)
+    @patch("sbm.utils.firebase_sync.get_firebase_db")
+    @patch("sbm.utils.firebase_sync.get_settings")
+    def test_update_runs_bulk_chunks_by_payload_size(
+        self, mock_get_settings, mock_get_db, mock_av
+    ):
+        """Payloads above max_payload_bytes are split across several writes."""
+        settings = MagicMock()
+        settings.firebase.is_admin_mode.return_value = True
+        mock_get_settings.return_value = settings
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+
+        sync = FirebaseSync()
+        updates = [("user1", f"run{i}", {"pr_state": "MERGED"}) for i in range(10)]
+        results = sync.update_runs_bulk(updates, max_payload_bytes=120)
+
+        assert all(results.values())
+        assert len(results) == 10
+        update_calls = mock_db.reference.return_value.update.call_args_list
+        assert len(update_calls) > 1
+        written = {path for call in update_calls for path in call.args[0]}
+        assert len(written) == 10
+
+    @patch("sbm.utils.firebase_sync.is_firebase_available", return_value=True)
+    @patch("sbm.utils.firebase_sync._get_user_mode_identity", return_value=("uid1", "tok"))
+    @patch("sbm.utils.firebase_sync.get_firebase_rest_client")
+    @patch("sbm.utils.firebase_sync.get_settings")
+    def test_update_runs_bulk_user_mode_rest(
+        self, mock_get_settings, mock_get_client, mock_identity, mock_av
+    ):
+        """User Mode issues one PATCH on the database root."""
+        settings = MagicMock()
+        settings.firebase.is_admin_mode.return_value = False
+        mock_get_settings.return_value = settings
+        client = mock_get_client.return_value
+        client.patch.return_value.ok = True
+
+        sync = FirebaseSync()
+        results = sync.update_runs_bulk(
+            [(None, "run1", {"pr_state": "OPEN"}), ("other", "run2", {"pr_state": "MERGED"})]
+        )
+
+        assert results == {"users/uid1/runs/run1": True, "users/other/runs/run2": True}
+        client.patch.assert_called_once()
+        assert client.patch.call_args.args == (
+            "",
+            {
+                "users/uid1/runs/run1/pr_state": "OPEN",
+                "users/other/runs/run2/pr_state": "MERGED",
+            },
+        )
+
+    @patch("sbm.utils.firebase_sync.is_firebase_available", return_value=True)
+    @patch("sbm.utils.firebase_sync._get_user_mode_identity", return_value=("uid1", "tok"))
+    @patch("sbm.utils.firebase_sync.get_firebase_rest_client")
+    @patch("sbm.utils.firebase_sync.get_settings")
+    def test_update_runs_bulk_falls_back_per_run(
+        self, mock_get_settings, mock_get_client, mock_identity, mock_av
+    ):
+        """A rejected multi-location write is retried run by run for per-path results."""
+        settings = MagicMock()
+        settings.firebase.is_admin_mode.return_value = False
+        mock_get_settings.return_value = settings
+
+        def fake_patch(path, json_body, timeout=10):
+            resp = MagicMock()
+            resp.ok = path != "" and not path.startswith("users/blocked/")
+            resp.status_code = 200 if resp.ok else 401
+            return resp
+
+        mock_get_client.return_value.patch.side_effect = fake_patch
+
+        sync = FirebaseSync()
+        results = sync.update_runs_bulk(
+            [("uid1", "run1", {"pr_state": "OPEN"}), ("blocked", "run2", {"pr_state": "OPEN"})]
+        )
+
+        assert results == {"users/uid1/runs/run1": True, "users/blocked/runs/run2": False}
+
+    @patch("sbm.utils.firebase_sync.is_firebase_available", return_value=True)
+    @patch("sbm.utils.firebase_sync.get_firebase_db")
+    @patch("sbm.utils.firebase_sync.get_settings")
+    def test_push_runs_bulk_results_follow_input_order(
+        self, mock_get_settings, mock_get_db, mock_av
+    ):
+        """Results line up with the input; runs without a stable key are not written."""
+        settings = MagicMock()
+        settings.firebase.is_admin_mode.return_value = True
+        mock_get_settings.return_value = settings
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+
+        runs = [
+            {"slug": "a", "timestamp": "2026-01-01T00:00:00Z"},
+            {"slug": "b"},
+            {"slug": "c", "timestamp": "not a date"},
+            {"slug": "d", "timestamp": "2026-01-02T03:04:05+00:00Z"},
+        ]
+        results = FirebaseSync().push_runs_bulk("user1", runs)
+
+        assert results == [True, False, False, True]
+        payload = mock_db.reference.return_value.update.call_args.args[0]
+        assert sorted(payload) == [
+            "users/user1/runs/a_2026-01-01_00-00-00",
+            "users/user1/runs/d_2026-01-02_03-04-05",
+        ]
+        with pytest.raises(ValueError):
+            build_run_key({"slug": "b"})
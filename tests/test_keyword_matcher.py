@@ -0,0 +1,66 @@
+"""
+Tests for the Aho-Corasick keyword matcher.
+"""
+
+import random
+import re
+
+from sbm.core import maps
+from sbm.utils.keyword_matcher import KeywordMatcher, literal_fragments
+
+
+def test_reports_overlapping_matches_case_insensitively():
+    matcher = KeywordMatcher(["mapbox", "mapboxdirections", "directions", "Map-Row"])
+
+    hits = sorted(matcher.iter_matches("css/MapBoxDirections_map-row"))
+
+    assert hits == [(4, "mapbox"), (4, "mapboxdirections"), (10, "directions"), (21, "map-row")]
+    assert matcher.search("sitemap.php") is False
+
+
+def test_agrees_with_naive_substring_search():
+    rng = random.Random(7)
+    for _ in range(500):
+        keywords = ["".join(rng.choice("ab") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+        text = "".join(rng.choice("abc") for _ in range(30))
+        expected = {k for k in keywords if k in text}
+
+        assert KeywordMatcher(keywords).find(text) == expected
+
+
+def test_literal_fragments_of_oem_patterns():
+    assert literal_fragments(r"dealer-groups/([^/]+)/map-row-\d+") == [
+        "dealer-groups/",
+        "/map-row-",
+    ]
+    assert literal_fragments(r"dealer-groups/landrover/directions-row") == [
+        "dealer-groups/landrover/directions-row"
+    ]
+    # Alternation could skip any run, so nothing is required
+    assert literal_fragments(r"map-row|directions") == []
+
+
+def test_map_pattern_matcher_agrees_with_the_original_import_regexes():
+    oem_patterns = (
+        r"dealer-groups/([^/]+)/map-row-\d+",
+        r"dealer-groups/([^/]+)/directions",
+        r"dealer-groups/landrover/location",
+    )
+    keyword_list = "|".join(re.escape(k) for k in maps.MAP_KEYWORDS)
+    generic = re.compile(f"DealerInspireCommonTheme[^'\"]*(?:/|_)(?:{keyword_list})", re.IGNORECASE)
+    oem = [re.compile(p, re.IGNORECASE) for p in oem_patterns]
+    matcher = maps.MapPatternMatcher(oem_patterns)
+
+    paths = [
+        "../../DealerInspireCommonTheme/css/dealer-groups/lexus/mapsection3",
+        "../../DealerInspireCommonTheme/css/dealer-groups/bmw/map-row-2",
+        "../../DealerInspireCommonTheme/css/dealer-groups/bmw/Directions",
+        "../../DealerInspireCommonTheme/css/dealer-groups/landrover/location-map",
+        "../../DealerInspireCommonTheme/css/sitemap",
+        "../../DealerInspireCommonTheme/css/dealer-groups/x/_full-map",
+        "dealer-groups/bmw/map-row-2",
+        "css/mapsection",
+    ]
+    for path in paths:
+        assert matcher.is_generic_map_import(path) == bool(generic.search(path)), path
+        assert matcher.matches_oem(path) == any(p.search(path) for p in oem), path
@@ -522,3 +522,29 @@ def test_directions_forms_not_falsely_detected(tmp_path):
         "directionsForms/formDirections should not be detected — "
         "it is a form utility, not a map section partial"
     )
+
+
+def test_theme_map_index_reads_each_php_file_once(tmp_path, mocker):
+    (tmp_path / "functions.php").write_text(
+        """
+        add_shortcode('full-map', 'full_map');
+        function full_map() {
+            get_template_part('partials/dealer-groups/lou-fusz/map');
+        }
+        """,
+        encoding="utf-8",
+    )
+    (tmp_path / "front-page.php").write_text(
+        "<?php get_template_part('partials/map-row'); ?>", encoding="utf-8"
+    )
+    (tmp_path / "partials").mkdir()
+    (tmp_path / "partials" / "footer.php").write_text("<?php echo 1; ?>", encoding="utf-8")
+    strip = mocker.spy(maps, "remove_php_comments")
+
+    index = maps.ThemeMapIndex(tmp_path)
+    shortcode_partials = maps.find_map_shortcodes_in_functions(str(tmp_path), index=index)
+    template_partials = maps.find_map_partials_in_templates("slug", index=index)
+
+    assert strip.call_count == 3
+    assert any(p["source"] == "found_in_shortcode_handler" for p in shortcode_partials)
+    assert [p["partial_path"] for p in template_partials] == ["map-row"]
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from sbm.core import maps
 
 
@@ -227,3 +229,51 @@ def test_missing_commontheme_partial_is_skipped(tmp_path, monkeypatch):
 
     status = maps.copy_partial_to_dealer_theme(dealer_slug, partial_info, interactive=False)
     assert status == "skipped_missing"
+
+
+def test_directory_listing_cache_scans_each_directory_once(tmp_path, monkeypatch):
+    from sbm.utils import path as path_utils
+
+    css_dir = tmp_path / "css"
+    css_dir.mkdir()
+    (css_dir / "_map-row.scss").write_text("// map")
+
+    scanned = []
+    real_scandir = path_utils.os.scandir
+
+    def counting_scandir(directory):
+        scanned.append(str(directory))
+        return real_scandir(directory)
+
+    monkeypatch.setattr(path_utils.os, "scandir", counting_scandir)
+
+    listings = path_utils.DirectoryListingCache()
+    candidates = maps._resolve_scss_candidates(tmp_path, "css/map-row")
+
+    assert listings.first_existing(candidates) == css_dir / "_map-row.scss"
+    assert not listings.exists(css_dir / "map-row.scss")
+    assert not listings.exists(tmp_path / "missing" / "map-row.scss")
+    assert listings.exists(css_dir / "..")
+    assert scanned == [str(css_dir), str(tmp_path / "missing")]
+
+
+def test_find_commontheme_map_imports_shares_listing_cache(tmp_path, monkeypatch):
+    from sbm.utils.path import DirectoryListingCache
+
+    common_theme = tmp_path / "CommonTheme"
+    target_dir = common_theme / "css" / "dealer-groups" / "lexus"
+    target_dir.mkdir(parents=True)
+    (target_dir / "_mapsection.scss").write_text("// map")
+    monkeypatch.setattr(maps, "COMMON_THEME_DIR", str(common_theme))
+
+    style_scss = tmp_path / "style.scss"
+    style_scss.write_text(
+        "@import '../../DealerInspireCommonTheme/css/dealer-groups/lexus/mapsection';\n"
+        "@import '../../DealerInspireCommonTheme/css/dealer-groups/lexus/directions-row';\n"
+    )
+
+    listings = DirectoryListingCache()
+    imports = maps.find_commontheme_map_imports(style_scss, listings=listings)
+
+    assert [Path(i["commontheme_absolute"]).name for i in imports] == ["_mapsection.scss"]
+    assert list(listings._listings) == [str(target_dir)]
@@ -0,0 +1,105 @@
+"""
+Tests for the per-snapshot metric windows used by Slack reports.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from scripts.stats import report_slack
+from scripts.stats.report_slack import (
+    MetricsWindows,
+    calculate_metrics,
+    filter_runs_by_date,
+    filter_runs_by_previous_calendar_day,
+    filter_runs_by_user,
+    get_metrics_windows,
+)
+
+
+def _iso(days_ago: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+
+
+def _runs():
+    runs = []
+    for i, days_ago in enumerate([0.2, 0.5, 2, 5, 6.5, 12, 25, 40, 90]):
+        user = "alice" if i % 2 == 0 else "bob"
+        runs.append(
+            {
+                "slug": f"site-{i % 5}",
+                "status": "success",
+                "_user": user,
+                "pr_author": user,
+                "lines_migrated": 100 * (i + 1),
+                "merged_at": _iso(days_ago),
+                "timestamp": _iso(days_ago + 1),
+            }
+        )
+    runs.append({"slug": "open-pr", "status": "success", "_user": "bob", "created_at": _iso(1)})
+    runs.append({"slug": "no-dates", "status": "success", "_user": "carol"})
+    return runs
+
+
+def _user_migrations(runs):
+    migrations = {}
+    for r in runs:
+        if r.get("merged_at"):
+            migrations.setdefault(r["_user"], set()).add(r["slug"])
+    return migrations
+
+
+class TestMetricsWindows:
+    def test_period_queries_match_full_scan(self):
+        runs = _runs()
+        migrations = _user_migrations(runs)
+        windows = MetricsWindows(runs, migrations)
+
+        for period in ["day", "week", "month", "14", "all"]:
+            for user in [None, "alice", "BOB"]:
+                expected_runs = filter_runs_by_date(runs, period)
+                if user:
+                    expected_runs = filter_runs_by_user(expected_runs, user)
+                expected = calculate_metrics(expected_runs, migrations, period == "all")
+
+                assert windows.runs_for(period, user) == expected_runs, (period, user)
+                assert windows.metrics_for(period, user) == expected, (period, user)
+
+    def test_metrics_are_memoized_per_window(self):
+        runs = _runs()
+        windows = MetricsWindows(runs, _user_migrations(runs))
+
+        with patch.object(
+            report_slack, "calculate_metrics", wraps=report_slack.calculate_metrics
+        ) as spy:
+            first = windows.metrics_for("week", "alice")
+            second = windows.metrics_for("weekly", "Alice")
+
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_previous_calendar_day_matches_full_scan(self):
+        runs = _runs()
+        windows = MetricsWindows(runs, _user_migrations(runs))
+
+        expected = filter_runs_by_previous_calendar_day(runs, "America/Chicago")
+
+        assert sorted(r["slug"] for r in windows.previous_calendar_day("America/Chicago")) == (
+            sorted(r["slug"] for r in expected)
+        )
+
+    def test_in_review_count(self):
+        runs = _runs()
+
+        assert MetricsWindows(runs, {}).in_review_count == 1
+
+    def test_windows_are_reused_until_version_changes(self):
+        runs = _runs()
+        migrations = _user_migrations(runs)
+
+        first = get_metrics_windows(runs, migrations, version=1)
+        again = get_metrics_windows(runs, migrations, version=1)
+        newer = get_metrics_windows(runs, migrations, version=2)
+
+        assert first is again
+        assert newer is not first
+        assert get_metrics_windows(runs, migrations) is not newer
@@ -329,13 +329,13 @@ def test_lines_migrated_assignment_on_failure():
         )
 
 
-@patch("sbm.cli.REPO_ROOT", new_callable=lambda: MagicMock())
+@patch("sbm.commands.migration.REPO_ROOT", new_callable=lambda: MagicMock())
 def test_migration_report_generation(mock_repo_root):
     """Test that migration report is generated with correct format."""
     import tempfile
     from pathlib import Path
 
-    from sbm.cli import _generate_migration_report
+    from sbm.commands.migration import _generate_migration_report
 
     # Create temp directory for reports
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,68 @@
+"""
+Tests for the offline migration harness and Firebase emulator routing.
+"""
+
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from sbm.utils import firebase_sync
+from scripts.benchmark_migration import run_batch
+from scripts.offline_harness import FirebaseEmulator
+
+
+@pytest.fixture
+def emulator():
+    with FirebaseEmulator() as fb:
+        yield fb
+
+
+def test_rest_client_uses_database_and_auth_emulators(emulator, monkeypatch, tmp_path):
+    settings = SimpleNamespace(
+        firebase=SimpleNamespace(
+            database_url="https://sbm-test-default-rtdb.firebaseio.com", api_key="test-key"
+        )
+    )
+    monkeypatch.setattr(firebase_sync, "get_settings", lambda: settings)
+    monkeypatch.setattr(firebase_sync, "_auth_cache_path", tmp_path / "auth.json")
+    monkeypatch.setattr(firebase_sync, "_rest_client", None)
+    monkeypatch.setattr(firebase_sync, "_user_auth_state", {"id_token": None, "expires_at": 0.0})
+    monkeypatch.setenv(firebase_sync.DATABASE_EMULATOR_ENV_VAR, emulator.host)
+    monkeypatch.setenv(firebase_sync.AUTH_EMULATOR_ENV_VAR, emulator.host)
+
+    client = firebase_sync.get_firebase_rest_client()
+    assert client.database_url == f"http://{emulator.host}"
+    assert client.namespace == "sbm-test-default-rtdb"
+
+    assert client.put("users/u1/runs/r1", {"slug": "dealer-a"}).ok
+    assert client.patch("", {"users/u1/runs/r1/pr_state": "OPEN"}).ok
+    assert client.get("users").json() == {
+        "u1": {"runs": {"r1": {"slug": "dealer-a", "pr_state": "OPEN"}}}
+    }
+    assert emulator.requests[0] == (
+        "POST",
+        "/identitytoolkit.googleapis.com/v1/accounts:signUp",
+    )
+
+
+@pytest.mark.slow
+def test_auto_migrates_a_synthetic_theme_offline(tmp_path):
+    result = run_batch(tmp_path, themes=1, lines=300, profile="mixed")
+
+    assert result["returncode"] == 0, result["output"][-2000:]
+    assert result["traced_themes"] == 1
+    stages = result["stages"]
+    assert stages["run/total"]["calls"] == 1
+    assert {"segment/SCSS Migration", "subprocess/gh", "subprocess/docker"} <= set(stages)
+    assert result["firebase_requests"].get("PUT", 0) >= 1
+    branches = subprocess.run(
+        ["git", "--git-dir", str(tmp_path / "origin.git"), "branch", "--list", "pcon-*"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert "benchdealer1" in branches
+    output_dir = tmp_path / "home" / "sbm-output"
+    assert list((output_dir / ".sbm-reports").glob("benchdealer1-*.md"))
+    assert list((output_dir / "logs").glob("sbm_*.log"))
@@ -0,0 +1,42 @@
+"""
+Tests for the bulk run refresh in scripts/refresh_run_metadata.py.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from scripts import refresh_run_metadata as refresh
+
+
+def _run(number):
+    return {
+        "status": "success",
+        "pr_url": f"https://github.com/org/repo/pull/{number}",
+        "pr_author": "dev1",
+        "user_id": "dev1",
+        "created_at": "2026-01-01T00:00:00Z",
+        "pr_state": "MERGED",
+        "lines_migrated": 0,
+    }
+
+
+def test_summary_leaves_out_failed_writes(capsys):
+    db = MagicMock()
+    db.reference.return_value.get.return_value = {"dev1": {"runs": {"r1": _run(1), "r2": _run(2)}}}
+    metadata = {_run(n)["pr_url"]: {"additions": 100 * n} for n in (1, 2)}
+    sync = MagicMock()
+    sync.update_runs_bulk.return_value = {
+        "users/dev1/runs/r1": True,
+        "users/dev1/runs/r2": False,
+    }
+
+    with patch("sys.argv", ["refresh_run_metadata.py"]), patch.object(
+        refresh, "is_firebase_available", return_value=True
+    ), patch.object(refresh, "get_firebase_db", return_value=db), patch.object(
+        refresh.GitHubPRManager, "fetch_pr_metadata_batch", return_value=metadata
+    ), patch.object(refresh, "FirebaseSync", return_value=sync):
+        refresh.main()
+
+    out = capsys.readouterr().out
+    assert "Failed to update users/dev1/runs/r2" in out
+    assert "Updated runs: 1" in out
+    assert "Runs with lines_migrated backfilled: 1" in out
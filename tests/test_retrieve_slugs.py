@@ -0,0 +1,176 @@
+"""
+Tests for concurrent, memoized dealer slug retrieval.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scripts import retrieve_slugs
+from scripts.retrieve_slugs import SlugRetriever, SlugSearchCache
+
+
+def _dealer(slug, name):
+    return {"slug": slug, "name": name}
+
+
+@pytest.fixture
+def devtools_present(mocker, tmp_path):
+    (tmp_path / "devtools").write_text("")
+    mocker.patch.object(retrieve_slugs, "DEVTOOLS_CLI_DIR", tmp_path)
+
+
+class TestSlugSearchCache:
+    def test_round_trip_and_fuzzy_name_match(self, tmp_path):
+        path = tmp_path / "memo.json"
+        cache = SlugSearchCache(path)
+        cache.put("Lexus of Colorado Springs", "lexusofcs", _dealer("lexusofcs", "Lexus CS"))
+        cache.put("www.hondaoftulsa.com", "hondatulsa", _dealer("hondatulsa", "Honda of Tulsa"))
+        cache.save()
+
+        reloaded = SlugSearchCache(path)
+        assert reloaded.lookup("lexus of colorado springs")[0] == "lexusofcs"
+        assert reloaded.lookup("Lexus of Colorado Springs.")[0] == "lexusofcs"
+        assert reloaded.lookup("hondaoftulsa.com")[0] == "hondatulsa"
+        assert reloaded.lookup("Honda Of Tulsa")[0] == "hondatulsa"
+        assert reloaded.lookup("Toyota of Tulsa") is None
+
+    def test_similar_dealers_are_not_memo_hits(self, tmp_path):
+        cache = SlugSearchCache(tmp_path / "memo.json")
+        cache.put("bmwofeastlongisland.com", "bmweli", _dealer("bmweli", "BMW of East LI"))
+        cache.put("hondaofaurora.com", "hondaaurora", _dealer("hondaaurora", "Honda Aurora"))
+
+        assert cache.lookup("https://www.BMWofEastLongIsland.net/")[0] == "bmweli"
+        assert cache.lookup("bmwofwestlongisland.com") is None
+        assert cache.lookup("hondaofaurora2.com") is None
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        path = tmp_path / "memo.json"
+        stale = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+        path.write_text(
+            json.dumps(
+                {"terms": {"old dealer": {"slug": "old", "dealer_data": {}, "checked_at": stale}}}
+            )
+        )
+
+        assert SlugSearchCache(path, ttl_days=7).lookup("old dealer") is None
+
+
+class TestRetrieveAllSlugs:
+    def test_searches_concurrently_and_keeps_input_order(self, mocker, tmp_path, devtools_present):
+        terms = [f"dealer{i}.com" for i in range(6)]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_search(term):
+            barrier.wait()  # only completes if three searches are in flight together
+            if term == "dealer4.com":
+                return None
+            slug = term.split(".")[0]
+            return slug, _dealer(slug, slug)
+
+        retriever = SlugRetriever(
+            tmp_path / "in.csv",
+            tmp_path / "out.json",
+            workers=3,
+            cache=SlugSearchCache(tmp_path / "memo.json"),
+        )
+        mocker.patch.object(retriever, "search_slug", side_effect=fake_search)
+
+        retriever.retrieve_all_slugs(terms)
+
+        assert [r["search_term"] for r in retriever.results] == terms
+        assert [r["status"] for r in retriever.results] == ["found"] * 4 + ["not_found", "found"]
+        assert retriever.results[5]["slug"] == "dealer5"
+
+    def test_memoized_terms_skip_devtools(self, mocker, tmp_path, devtools_present):
+        memo = tmp_path / "memo.json"
+        first = SlugRetriever(
+            tmp_path / "in.csv", tmp_path / "out.json", cache=SlugSearchCache(memo)
+        )
+        search = mocker.patch.object(
+            first, "search_slug", return_value=("bmwx", _dealer("bmwx", "BMW of X"))
+        )
+        first.retrieve_all_slugs(["www.bmwofx.com"])
+        assert search.call_count == 1
+
+        second = SlugRetriever(
+            tmp_path / "in.csv", tmp_path / "out.json", cache=SlugSearchCache(memo)
+        )
+        search = mocker.patch.object(second, "search_slug", return_value=None)
+        second.retrieve_all_slugs(["bmwofx.com", "BMW of X"])
+
+        search.assert_not_called()
+        assert [r["slug"] for r in second.results] == ["bmwx", "bmwx"]
+
+    def test_missing_devtools_raises_before_searching(self, mocker, tmp_path):
+        mocker.patch.object(retrieve_slugs, "DEVTOOLS_CLI_DIR", tmp_path / "missing")
+        retriever = SlugRetriever(tmp_path / "in.csv", tmp_path / "out.json", use_cache=False)
+        search = mocker.patch.object(retriever, "search_slug")
+
+        with pytest.raises(FileNotFoundError, match="devtools script not found"):
+            retriever.retrieve_all_slugs(["dealer.com"])
+        search.assert_not_called()
+
+    def test_use_cache_false_always_searches(self, mocker, tmp_path, devtools_present):
+        retriever = SlugRetriever(tmp_path / "in.csv", tmp_path / "out.json", use_cache=False)
+        search = mocker.patch.object(retriever, "search_slug", return_value=None)
+
+        retriever.retrieve_all_slugs(["a.com", "b.com"])
+
+        assert search.call_count == 2
+        assert retriever.cache is None
+
+
+class TestStreamingReaders:
+    def test_csv_is_sniffed_and_filtered_by_stage(self, tmp_path):
+        path = tmp_path / "report.csv"
+        path.write_text(
+            "﻿Opportunity;stage;Account: Website\n"
+            "A;Mockup Approved;https://www.alpha.com/\n"
+            "B;Prospecting;https://www.beta.com/\n"
+            "C;Mockup Approved;gamma.com\n"
+            "D;Mockup Approved;https://www.alpha.com/home\n",
+            encoding="utf-8",
+        )
+
+        retriever = SlugRetriever(path, tmp_path / "out.json", use_cache=False)
+
+        assert retriever.read_input_file() == ["www.alpha.com", "gamma.com"]
+
+    def test_xlsx_finds_header_below_report_title(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        path = tmp_path / "report.xlsx"
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Mockup Approved Report"])
+        sheet.append([])
+        sheet.append(["Owner", "Account: Account Name", "Stage"])
+        sheet.append(["x", "Honda of Tulsa", "Mockup Approved"])
+        sheet.append(["y", "Dealer?s Choice", "Mockup Approved"])
+        sheet.append(["z", "Honda of Tulsa", "Mockup Approved"])
+        sheet.append(["z", None, "Mockup Approved"])
+        workbook.save(path)
+
+        retriever = SlugRetriever(path, tmp_path / "out.json", use_cache=False)
+
+        assert retriever.read_input_file() == ["Honda of Tulsa", "Dealer's Choice"]
+
+    def test_searches_start_before_input_is_exhausted(self, mocker, tmp_path, devtools_present):
+        searched = threading.Event()
+
+        def terms():
+            yield "a.com"
+            # The first search must already be running while the file is still being read
+            assert searched.wait(timeout=5)
+            yield "b.com"
+
+        def fake_search(term):
+            searched.set()
+            return term[0], {"slug": term[0]}
+
+        retriever = SlugRetriever(tmp_path / "in.csv", tmp_path / "out.json", use_cache=False)
+        mocker.patch.object(retriever, "search_slug", side_effect=fake_search)
+
+        assert list(retriever.iter_slugs(terms())) == ["a", "b"]
@@ -0,0 +1,129 @@
+"""
+Tests for the per-rule SCSS profiler and the ``sbm profile`` command.
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from sbm.commands.profile import profile
+from sbm.scss.mixin_parser import MIXIN_TRANSFORMATIONS
+from sbm.scss.processor import SCSSProcessor
+from sbm.scss.profiler import PIPELINE_STEPS, profile_theme
+
+STYLE_SCSS = """\
+@import "../../DealerInspireCommonTheme/css/mixins";
+$primary: #c00;
+.hero {
+  color: $primary;
+  background: url("../images/hero.jpg");
+  @include breakpoint(md) { padding: 10px; }
+  @include breakpoint(xs) { padding: 0; }
+  @include flexbox();
+}
+"""
+
+
+@pytest.fixture
+def theme(monkeypatch, tmp_path):
+    theme_dir = tmp_path / "dealer-themes" / "dealer-a"
+    (theme_dir / "css").mkdir(parents=True)
+    (theme_dir / "css" / "style.scss").write_text(STYLE_SCSS)
+    (theme_dir / "css" / "lvdp.scss").write_text(
+        ".vdp { @include breakpoint(sm) { margin: 0; } }\n"
+    )
+    for module in ("sbm.scss.profiler", "sbm.scss.processor"):
+        monkeypatch.setattr(f"{module}.get_dealer_theme_dir", lambda slug: str(theme_dir))
+    monkeypatch.setattr("sbm.scss.processor.get_common_theme_path", lambda: str(tmp_path))
+    return theme_dir
+
+
+def test_profile_reports_each_step_and_mixin_handler(theme):
+    handlers = dict(MIXIN_TRANSFORMATIONS)
+    files_before = sorted(p.name for p in theme.rglob("*"))
+
+    report = profile_theme("dealer-a", repeat=2)
+
+    assert [f["path"] for f in report.files] == [
+        str(theme / "css" / "style.scss"),
+        str(theme / "css" / "lvdp.scss"),
+    ]
+    for name, _ in PIPELINE_STEPS:
+        assert report.rules[f"step:{name}"].calls == 4
+    assert report.rules["step:exclude_nav_styles"].calls == 4
+
+    breakpoint = report.rules["mixin:breakpoint"]
+    assert breakpoint.kind == "mixin"
+    assert breakpoint.calls == breakpoint.matches == 6
+    assert breakpoint.bytes_out > 0
+    assert report.rules["mixin:flexbox"].calls == 2
+    assert report.rules["step:mixins"].matches == 8
+    assert report.rules["step:remove_imports"].matches == 2
+    assert report.rules["step:variables"].bytes_in > report.rules["step:variables"].bytes_out
+
+    # Dry run: nothing instrumented or written is left behind
+    assert MIXIN_TRANSFORMATIONS == handlers
+    assert sorted(p.name for p in theme.rglob("*")) == files_before
+
+
+def test_instrumentation_is_removed_from_the_processor(theme):
+    processor = SCSSProcessor("dealer-a", exclude_nav_styles=False)
+
+    profile_theme("dealer-a", processor=processor)
+
+    assert "_process_scss_variables" not in vars(processor)
+    assert "parse_and_convert_mixins" not in vars(processor.mixin_parser)
+
+
+def test_rules_sort_by_any_column(theme):
+    report = profile_theme("dealer-a")
+
+    by_calls = report.sorted_rules("calls")
+    assert [r.calls for r in by_calls] == sorted((r.calls for r in by_calls), reverse=True)
+    assert [r.name for r in report.sorted_rules("name")] == sorted(report.rules)
+    with pytest.raises(ValueError):
+        report.sorted_rules("bogus")
+
+
+def test_profile_decodes_sources_as_strictly_as_a_migration(theme):
+    (theme / "css" / "lvdp.scss").write_bytes(b".vdp { content: '\xff'; }\n")
+
+    with pytest.raises(UnicodeDecodeError):
+        profile_theme("dealer-a")
+
+    result = CliRunner().invoke(profile, ["dealer-a"], obj={})
+    assert result.exit_code == 1
+
+
+def test_profile_command_prints_and_saves_json(theme, tmp_path):
+    output = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(
+        profile, ["dealer-a", "--json", "--sort", "name", "-o", str(output)], obj={}
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(output.read_text())
+    assert data["slug"] == "dealer-a"
+    names = [rule["name"] for rule in data["rules"]]
+    assert names == sorted(names)
+    assert set(data["rules"][0]) == {
+        "name",
+        "kind",
+        "calls",
+        "seconds",
+        "bytes_in",
+        "bytes_out",
+        "matches",
+    }
+    assert json.loads(result.stdout[result.stdout.index("{") :]) == data
+
+
+def test_profile_command_fails_without_sources(theme):
+    for source in (theme / "css").iterdir():
+        source.unlink()
+
+    result = CliRunner().invoke(profile, ["dealer-a"], obj={})
+
+    assert result.exit_code == 1
@@ -0,0 +1,154 @@
+"""
+Tests for bounded-memory (streaming) SCSS processing.
+"""
+
+import logging
+import re
+import tracemalloc
+
+import pytest
+
+from sbm.core.migration import migrate_styles
+from sbm.scss.processor import SCSSProcessor, iter_top_level_blocks
+from sbm.utils.path import PLATFORM_DIR_ENV_VAR
+from scripts.synthetic_theme import generate_scss, write_synthetic_theme
+
+
+def _normalize_blank_lines(scss: str) -> str:
+    return re.sub(r"\n\s*\n", "\n", scss).strip()
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    (tmp_path / "dealer-themes" / "streamed").mkdir(parents=True)
+    return SCSSProcessor("streamed", exclude_nav_styles=False)
+
+
+def test_chunks_only_end_between_top_level_statements():
+    scss = (
+        "/* header { */\n"
+        "$map: (\n"
+        "  a: 1;\n"
+        ");\n"
+        ".a {\n"
+        '  content: "}";\n'
+        "  // }\n"
+        "  background: url(http://example.com/x.png);\n"
+        "}\n"
+        "@mixin m {\n"
+        "  .b { color: red; }\n"
+        "}\n"
+    )
+
+    chunks = list(iter_top_level_blocks(scss.splitlines(keepends=True), chunk_chars=0))
+
+    assert "".join(chunks) == scss
+    assert chunks == [
+        "/* header { */\n$map: (\n  a: 1;\n);\n",
+        '.a {\n  content: "}";\n  // }\n  background: url(http://example.com/x.png);\n}\n',
+        "@mixin m {\n  .b { color: red; }\n}\n",
+    ]
+    assert list(iter_top_level_blocks(scss.splitlines(keepends=True))) == [scss]
+
+
+@pytest.mark.parametrize("exclude_nav_styles", [False, True])
+def test_streamed_output_matches_in_memory_transform(tmp_path, monkeypatch, exclude_nav_styles):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    (tmp_path / "dealer-themes" / "streamed").mkdir(parents=True)
+    processor = SCSSProcessor("streamed", exclude_nav_styles=exclude_nav_styles)
+    scss = generate_scss(3_000)
+    source = tmp_path / "style.scss"
+    source.write_text(scss, encoding="utf-8")
+    target = tmp_path / "sb-inside.scss"
+
+    source_lines, output_lines = processor.stream_scss_files(
+        [str(source), str(tmp_path / "missing.scss")], str(target), chunk_chars=2_048
+    )
+
+    streamed = target.read_text(encoding="utf-8")
+    expected = processor.transform_scss_content(scss)
+    assert _normalize_blank_lines(streamed) == _normalize_blank_lines(expected)
+    assert source_lines == len(scss.splitlines())
+    assert output_lines == len(streamed.splitlines())
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_streaming_skips_empty_output(processor, tmp_path):
+    source = tmp_path / "inside.scss"
+    source.write_text('@import "variables";\n', encoding="utf-8")
+    target = tmp_path / "sb-inside.scss"
+
+    assert processor.stream_scss_files([str(source)], str(target)) == (1, 0)
+    assert not target.exists()
+
+
+def test_streaming_peak_memory_does_not_grow_with_source_size(processor, tmp_path):
+    logging.disable(logging.WARNING)
+
+    def peak(lines: int) -> tuple:
+        source = tmp_path / f"style-{lines}.scss"
+        source.write_text(generate_scss(lines), encoding="utf-8")
+        tracemalloc.start()
+        try:
+            processor.stream_scss_files([str(source)], str(tmp_path / "out.scss"), 4_096)
+            return tracemalloc.get_traced_memory()[1], source.stat().st_size
+        finally:
+            tracemalloc.stop()
+
+    try:
+        small_peak, _ = peak(5_000)
+        large_peak, large_size = peak(40_000)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert large_peak < large_size / 8
+    assert large_peak < small_peak * 1.5 + 64 * 1024
+
+
+def test_migrate_styles_streaming_matches_default_mode(tmp_path, monkeypatch):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    theme_dir = write_synthetic_theme(tmp_path, "streamed", 2_000)
+
+    success, _, files, source_lines = migrate_styles("streamed", streaming=False)
+    in_memory = {p.name: p.read_text() for p in theme_dir.glob("sb-*.scss")}
+    streamed_result = migrate_styles("streamed", streaming=True)
+    streamed = {p.name: p.read_text() for p in theme_dir.glob("sb-*.scss")}
+
+    assert success and streamed_result[0]
+    assert (files, source_lines) == streamed_result[2:]
+    assert sorted(streamed) == ["sb-inside.scss", "sb-vdp.scss", "sb-vrp.scss"]
+    for name, content in streamed.items():
+        assert _normalize_blank_lines(content) == _normalize_blank_lines(in_memory[name])
+
+
+def test_migrate_styles_never_streams_unless_asked(tmp_path, monkeypatch):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    write_synthetic_theme(tmp_path, "streamed", 500)
+
+    def unexpected_stream(*args, **kwargs):
+        raise AssertionError("streamed without streaming=True")
+
+    monkeypatch.setattr(SCSSProcessor, "stream_scss_files", unexpected_stream)
+
+    assert migrate_styles("streamed")[0]
+
+
+def test_crlf_sources_give_the_same_output_in_both_modes(tmp_path, monkeypatch):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    theme_dir = write_synthetic_theme(tmp_path, "streamed", 500)
+    for source in (theme_dir / "css").glob("*.scss"):
+        source.write_bytes(source.read_bytes().replace(b"\n", b"\r\n"))
+
+    assert migrate_styles("streamed", streaming=False)[0]
+    in_memory = {p.name: p.read_bytes() for p in theme_dir.glob("sb-*.scss")}
+    assert migrate_styles("streamed", streaming=True)[0]
+    streamed = {p.name: p.read_bytes() for p in theme_dir.glob("sb-*.scss")}
+
+    assert sorted(streamed) == sorted(in_memory)
+    for name, content in streamed.items():
+        assert b"\r" not in content
+        assert b"\r" not in in_memory[name]
+        assert _normalize_blank_lines(content.decode()) == _normalize_blank_lines(
+            in_memory[name].decode()
+        )
@@ -0,0 +1,94 @@
+"""
+Tests for batched slug verification.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sbm.utils import slug_validation
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "slug_cache.json"
+    monkeypatch.setattr(slug_validation, "_CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture
+def devtools(monkeypatch):
+    """Fake devtools lookup: slugs starting with 'real' are official."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_valid(slug, devtools_script=None):
+        with lock:
+            calls.append(slug)
+        return slug.startswith("real")
+
+    monkeypatch.setattr(slug_validation, "_find_devtools_script", lambda: Path("/fake/devtools"))
+    monkeypatch.setattr(slug_validation, "_devtools_slug_valid", fake_valid)
+    return calls
+
+
+def test_verify_slugs_writes_cache_once(cache_path, devtools):
+    slugs = [f"realsite{i}" for i in range(20)] + ["bogus1", "RealSite0", "", "bad slug!"]
+
+    with patch.object(slug_validation, "_save_cache", wraps=slug_validation._save_cache) as save:
+        results = slug_validation.verify_slugs(slugs)
+
+    assert save.call_count == 1
+    assert sorted(devtools) == sorted({s.lower() for s in slugs[:21]})
+    assert results["realsite3"] is True
+    assert results["RealSite0"] is True
+    assert results["bogus1"] is False
+    assert results[""] is False
+    assert results["bad slug!"] is False
+    assert len(json.loads(cache_path.read_text())["slugs"]) == 21
+
+
+def test_fresh_cache_entries_skip_devtools(cache_path, devtools):
+    now = datetime.now(timezone.utc)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "slugs": {
+                    "realfresh": {"valid": True, "checked_at": now.isoformat()},
+                    "realstale": {
+                        "valid": False,
+                        "checked_at": (now - timedelta(days=90)).isoformat(),
+                    },
+                },
+            }
+        )
+    )
+
+    results = slug_validation.verify_slugs(["realfresh", "realstale"])
+
+    assert devtools == ["realstale"]
+    assert results == {"realfresh": True, "realstale": True}
+
+
+def test_unavailable_devtools_returns_none_without_writing(cache_path, monkeypatch):
+    monkeypatch.setattr(slug_validation, "_find_devtools_script", lambda: None)
+
+    assert slug_validation.verify_slugs(["realsite"]) == {"realsite": None}
+    assert slug_validation.is_official_slug("realsite") is None
+    assert not cache_path.exists()
+
+
+def test_filter_valid_runs_uses_one_batch(cache_path, devtools):
+    runs = [{"slug": "realsite"}, {"slug": "bogus"}, {"slug": None}, {"slug": "realsite"}]
+
+    with patch.object(slug_validation, "verify_slugs", wraps=slug_validation.verify_slugs) as spy:
+        filtered = slug_validation.filter_valid_runs(runs)
+
+    assert spy.call_count == 1
+    assert filtered == [{"slug": "realsite"}, {"slug": "realsite"}]
+    assert sorted(devtools) == ["bogus", "realsite"]
@@ -0,0 +1,59 @@
+"""
+Tests for memory-mapped source file access.
+"""
+
+import re
+
+import pytest
+
+from sbm.utils import source_files
+from sbm.utils.source_files import count_lines, findall_in_file, read_text, search_file
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"\n", b"one", b"one\n", b"one\ntwo", b"one\r\ntwo\r\n", b"a\n\n\nb\n" * 50],
+)
+def test_count_lines_matches_splitlines(tmp_path, monkeypatch, content):
+    monkeypatch.setattr(source_files, "COUNT_WINDOW_BYTES", 7)
+    path = tmp_path / "style.scss"
+    path.write_bytes(content)
+
+    assert count_lines(path) == len(content.decode().splitlines())
+
+
+def test_read_text_errors(tmp_path):
+    path = tmp_path / "broken.scss"
+    path.write_bytes(b".a { content: '\xff'; }")
+
+    assert read_text(path) == ".a { content: ''; }"
+    with pytest.raises(UnicodeDecodeError):
+        read_text(path, errors="strict")
+    empty = tmp_path / "empty.scss"
+    empty.touch()
+    assert read_text(empty) == ""
+
+
+def test_read_text_translates_newlines(tmp_path):
+    path = tmp_path / "windows.scss"
+    path.write_bytes(b".a {\r\n  color: red;\r\n}\r.b {}\n")
+
+    assert read_text(path) == ".a {\n  color: red;\n}\n.b {}\n"
+    assert read_text(path) == path.read_text(encoding="utf-8")
+
+
+def test_regex_scans_run_over_the_mapping(tmp_path):
+    path = tmp_path / "style.scss"
+    path.write_text(
+        "@import \"variables\";\n// @import '_national-offers.scss';\n.a { color: red; }\n",
+        encoding="utf-8",
+    )
+
+    assert search_file(path, r"_national-offers(?:-land-rover)?\.scss")
+    assert search_file(path, re.compile(r"COLOR", re.IGNORECASE))
+    assert not search_file(path, "missing")
+    assert findall_in_file(path, rb"@import\s*['\"]([^'\"]+)['\"]") == [
+        "variables",
+        "_national-offers.scss",
+    ]
+    assert findall_in_file(path, r"(\.\w) \{ (\w+)") == [(".a", "color")]
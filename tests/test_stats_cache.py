@@ -0,0 +1,109 @@
+"""
+Tests for the Slack listener's warm stats cache.
+"""
+
+import json
+
+from scripts.stats.stats_cache import RunTableCache, iter_sse_events
+
+
+def _users():
+    return {
+        "alice": {
+            "runs": {
+                "r1": {
+                    "slug": "site-a",
+                    "status": "success",
+                    "pr_author": "alice",
+                    "merged_at": "2026-01-02T00:00:00Z",
+                },
+                "r2": {"slug": "site-b", "status": "success", "pr_author": "alice"},
+            }
+        },
+        "bob": {"runs": {"r3": {"slug": "verification-ping", "status": "success"}}},
+    }
+
+
+class TestRunTableCache:
+    def test_cold_cache_loads_once(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return _users()
+
+        cache = RunTableCache(fetch_users=fetch)
+        all_runs, user_migrations = cache.get_reporting_data()
+        cache.get_reporting_data()
+
+        assert len(calls) == 1
+        assert sorted(r["slug"] for r in all_runs) == ["site-a", "site-b"]
+        assert user_migrations == {"alice": {"site-a"}}
+
+    def test_view_is_rebuilt_only_after_changes(self):
+        cache = RunTableCache(fetch_users=_users)
+        version, runs, _ = cache.snapshot()
+        again_version, again_runs, _ = cache.snapshot()
+
+        assert again_version == version
+        assert again_runs is runs
+
+        cache.apply_event("put", "/alice/runs/r2/merged_at", "2026-01-03T00:00:00Z")
+        new_version, _, user_migrations = cache.snapshot()
+
+        assert new_version == version + 1
+        assert user_migrations == {"alice": {"site-a", "site-b"}}
+
+    def test_patch_and_delete_events(self):
+        cache = RunTableCache(fetch_users=_users)
+        cache.snapshot()
+
+        cache.apply_event(
+            "patch",
+            "/carol/runs",
+            {"r9": {"slug": "site-c", "status": "success", "pr_author": "carol"}},
+        )
+        cache.apply_event("put", "/alice/runs/r1", None)
+        all_runs, user_migrations = cache.get_reporting_data()
+
+        assert sorted(r["slug"] for r in all_runs) == ["site-b", "site-c"]
+        assert user_migrations == {}
+
+    def test_cached_tree_is_not_tagged_by_reporting_view(self):
+        tree = _users()
+        cache = RunTableCache(fetch_users=lambda: tree)
+        all_runs, _ = cache.get_reporting_data()
+
+        assert all(r["_user"] for r in all_runs)
+        assert "_user" not in tree["alice"]["runs"]["r1"]
+
+    def test_consume_rest_stream(self):
+        cache = RunTableCache(fetch_users=dict)
+        put = {"path": "/", "data": _users()}
+        patch = {"path": "/alice/runs/r2", "data": {"merged_at": "2026-01-03T00:00:00Z"}}
+        lines = [
+            "event: put",
+            f"data: {json.dumps(put)}",
+            "",
+            "event: keep-alive",
+            "data: null",
+            "",
+            "event: patch",
+            f"data: {json.dumps(patch)}",
+            "",
+            "event: auth_revoked",
+            "data: credential is no longer valid",
+            "",
+        ]
+
+        outcome = cache._consume_stream(lines)
+        _, user_migrations = cache.get_reporting_data()
+
+        assert outcome == "auth_revoked"
+        assert user_migrations == {"alice": {"site-a", "site-b"}}
+
+
+def test_iter_sse_events_handles_trailing_event():
+    events = list(iter_sse_events(["event: put", 'data: {"path": "/"}', "", "event: cancel"]))
+
+    assert events == [("put", '{"path": "/"}'), ("cancel", "")]
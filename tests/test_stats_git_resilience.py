@@ -249,11 +249,11 @@ class TestCheckoutMainAutoStash:
 class TestPostMigrateRecordsRun:
     """Test that post-migrate CLI command records runs."""
 
-    @patch("sbm.cli.record_run")
-    @patch("sbm.cli.record_migration")
-    @patch("sbm.cli.run_post_migration_workflow")
-    @patch("sbm.cli.Repo")
-    @patch("sbm.cli.get_platform_dir", return_value="/fake/platform")
+    @patch("sbm.commands.migration.record_run")
+    @patch("sbm.commands.migration.record_migration")
+    @patch("sbm.commands.migration.run_post_migration_workflow")
+    @patch("sbm.commands.migration.Repo")
+    @patch("sbm.commands.migration.get_platform_dir", return_value="/fake/platform")
     def test_post_migrate_records_successful_run(
         self,
         mock_platform,
@@ -302,3 +302,164 @@ class TestPostMigrateRecordsRun:
 
         # Should have called record_migration
         mock_record_migration.assert_called_once_with("test-theme")
+
+
+def _graphql_response(data, remaining=4999, reset=0, status="200 OK", errors=None):
+    """Build `gh api graphql --include` output."""
+    body = {"data": data}
+    if errors:
+        body["errors"] = errors
+    return (
+        f"HTTP/2.0 {status}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"X-Ratelimit-Remaining: {remaining}\r\n"
+        f"X-Ratelimit-Reset: {reset}\r\n"
+        "\r\n" + json.dumps(body)
+    )
+
+
+def _pr_node(state="MERGED", additions=120, author="dev1"):
+    return {
+        "pullRequest": {
+            "createdAt": "2026-01-01T00:00:00Z",
+            "mergedAt": "2026-01-02T00:00:00Z" if state == "MERGED" else None,
+            "closedAt": "2026-01-02T00:00:00Z" if state != "OPEN" else None,
+            "state": state,
+            "additions": additions,
+            "author": {"login": author},
+        }
+    }
+
+
+class TestFetchPRMetadataBatch:
+    """Test batched GraphQL PR metadata refresh."""
+
+    @patch("sbm.utils.github_pr.time.sleep")
+    @patch("subprocess.run")
+    def test_one_query_covers_many_prs(self, mock_run, mock_sleep):
+        from sbm.utils.github_pr import GitHubPRManager
+
+        urls = [f"https://github.com/org/repo/pull/{n}" for n in (1, 2, 3)]
+        mock_run.return_value = MagicMock(
+            stdout=_graphql_response(
+                {"pr0": _pr_node(), "pr1": _pr_node("OPEN", 5), "pr2": _pr_node("CLOSED")}
+            ),
+            stderr="",
+            returncode=0,
+        )
+
+        results = GitHubPRManager.fetch_pr_metadata_batch(urls + urls[:1])
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ["gh", "api", "graphql"]
+        query = args[-1]
+        assert query.count("pullRequest(number:") == 3
+        assert results[urls[0]]["state"] == "MERGED"
+        assert results[urls[0]]["author"] == "dev1"
+        assert results[urls[1]]["additions"] == 5
+        assert results[urls[2]]["closed_at"] == "2026-01-02T00:00:00Z"
+        mock_sleep.assert_not_called()
+
+    @patch("sbm.utils.github_pr.time.sleep")
+    @patch("subprocess.run")
+    def test_splits_into_batches_of_100(self, mock_run, mock_sleep):
+        from sbm.utils.github_pr import GitHubPRManager
+
+        urls = [f"https://github.com/org/repo/pull/{n}" for n in range(150)]
+        mock_run.return_value = MagicMock(stdout=_graphql_response({}), stderr="", returncode=0)
+
+        GitHubPRManager.fetch_pr_metadata_batch(urls)
+
+        assert mock_run.call_count == 2
+        counts = [c[0][0][-1].count("pullRequest(number:") for c in mock_run.call_args_list]
+        assert counts == [100, 50]
+
+    @patch("sbm.utils.github_pr.time.sleep")
+    @patch("subprocess.run")
+    def test_missing_pr_does_not_fail_batch(self, mock_run, mock_sleep):
+        from sbm.utils.github_pr import GitHubPRManager
+
+        urls = ["https://github.com/org/repo/pull/1", "https://github.com/org/repo/pull/2"]
+        # gh exits non-zero when any lookup in the query errors
+        mock_run.return_value = MagicMock(
+            stdout=_graphql_response(
+                {"pr0": _pr_node(), "pr1": {"pullRequest": None}},
+                errors=[{"type": "NOT_FOUND"}],
+            ),
+            stderr="gh: Could not resolve to a PullRequest",
+            returncode=1,
+        )
+
+        results = GitHubPRManager.fetch_pr_metadata_batch(urls + ["not-a-pr-url"])
+
+        mock_run.assert_called_once()
+        assert results[urls[0]]["state"] == "MERGED"
+        assert results[urls[1]] is None
+        assert results["not-a-pr-url"] is None
+
+    @patch("sbm.utils.github_pr.time.sleep")
+    @patch("subprocess.run")
+    def test_waits_for_rate_limit_reset_instead_of_fixed_sleeps(self, mock_run, mock_sleep):
+        import time
+
+        from sbm.utils.github_pr import GitHubPRManager
+
+        reset = int(time.time()) + 30
+        mock_run.return_value = MagicMock(
+            stdout=_graphql_response({"pr0": _pr_node()}, remaining=10, reset=reset),
+            stderr="",
+            returncode=0,
+        )
+
+        GitHubPRManager.fetch_pr_metadata_batch(["https://github.com/org/repo/pull/1"])
+
+        mock_sleep.assert_called_once()
+        assert 25 <= mock_sleep.call_args[0][0] <= 30
+
+    @patch("sbm.utils.github_pr.time.sleep")
+    @patch("subprocess.run")
+    def test_honors_retry_after_on_secondary_rate_limit(self, mock_run, mock_sleep):
+        from sbm.utils.github_pr import GitHubPRManager
+
+        limited = MagicMock(
+            stdout="HTTP/2.0 403 Forbidden\r\nRetry-After: 7\r\n\r\n{}",
+            stderr="gh: secondary rate limit",
+            returncode=1,
+        )
+        ok = MagicMock(stdout=_graphql_response({"pr0": _pr_node()}), stderr="", returncode=0)
+        mock_run.side_effect = [limited, ok]
+
+        results = GitHubPRManager.fetch_pr_metadata_batch(["https://github.com/org/repo/pull/1"])
+
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+        assert results["https://github.com/org/repo/pull/1"]["state"] == "MERGED"
+
+    @patch("sbm.utils.github_pr.GitHubPRManager.fetch_pr_metadata_batch")
+    def test_enrich_runs_batches_only_runs_needing_refresh(self, mock_batch):
+        from sbm.utils.github_pr import GitHubPRManager
+
+        mock_batch.return_value = {
+            "https://github.com/org/repo/pull/1": {
+                "created_at": "2026-01-01T00:00:00Z",
+                "merged_at": None,
+                "closed_at": None,
+                "state": "OPEN",
+                "author": "dev1",
+                "additions": 10,
+            }
+        }
+        stale = {"pr_url": "https://github.com/org/repo/pull/1"}
+        complete = {
+            "pr_url": "https://github.com/org/repo/pull/2",
+            "created_at": "2026-01-01T00:00:00Z",
+            "pr_author": "dev2",
+        }
+
+        GitHubPRManager.enrich_runs_with_pr_data([stale, complete, {"slug": "no-pr"}])
+
+        assert list(mock_batch.call_args[0][0]) == ["https://github.com/org/repo/pull/1"]
+        assert stale["pr_state"] == "OPEN"
+        assert stale["pr_author"] == "dev1"
+        assert "pr_state" not in complete
@@ -0,0 +1,78 @@
+"""
+Tests for the durable Firebase sync outbox.
+"""
+
+import sqlite3
+
+from sbm.utils.sync_outbox import SyncOutbox, open_outbox
+
+
+def _run(slug="slug1"):
+    return {"slug": slug, "status": "success", "lines_migrated": 10}
+
+
+class TestSyncOutbox:
+    def test_enqueue_is_idempotent_per_key(self, tmp_path):
+        outbox = open_outbox(tmp_path)
+
+        outbox.enqueue("slug1_2026-01-01_00-00-00", _run())
+        outbox.enqueue("slug1_2026-01-01_00-00-00", _run())
+
+        assert outbox.pending() == [("slug1_2026-01-01_00-00-00", _run())]
+
+    def test_synced_rows_are_never_requeued(self, tmp_path):
+        outbox = open_outbox(tmp_path)
+        outbox.enqueue("k1", _run())
+        outbox.mark({"k1": "synced"})
+
+        outbox.enqueue("k1", _run(), "pending_sync")
+
+        assert outbox.status_of("k1") == "synced"
+        assert outbox.pending() == []
+
+    def test_manual_reset_to_pending_is_honored(self, tmp_path):
+        outbox = open_outbox(tmp_path)
+        outbox.enqueue("k1", _run())
+        outbox.mark({"k1": "invalid_slug"})
+
+        outbox.enqueue("k1", _run(), "pending_sync")
+
+        assert outbox.status_of("k1") == "pending_sync"
+
+    def test_only_failed_attempts_are_counted(self, tmp_path):
+        outbox = open_outbox(tmp_path)
+        outbox.enqueue("k1", _run())
+        outbox.mark({"k1": "pending_sync"}, {"k1": "timeout"})
+        outbox.mark({"k1": "validation_unavailable"})
+        outbox.mark({"k1": "synced"})
+
+        with sqlite3.connect(str(outbox.path)) as conn:
+            row = conn.execute("SELECT attempts, status FROM outbox").fetchone()
+        assert row == (2, "synced")
+
+    def test_pending_is_oldest_first_and_limited(self, tmp_path):
+        outbox = open_outbox(tmp_path)
+        for i in range(5):
+            outbox.enqueue(f"k{i}", _run(f"slug{i}"))
+        outbox.enqueue("k5", _run("slug5"), "validation_unavailable")
+        outbox.enqueue("k6", _run("slug6"), "skipped_empty")
+
+        assert [key for key, _ in outbox.pending(limit=3)] == ["k0", "k1", "k2"]
+        assert [key for key, _ in outbox.pending()] == ["k0", "k1", "k2", "k3", "k4", "k5"]
+
+    def test_single_flusher_lease(self, tmp_path):
+        first = SyncOutbox(tmp_path / "outbox.sqlite3")
+        second = SyncOutbox(tmp_path / "outbox.sqlite3")
+
+        assert first.acquire_flush_lease() is True
+        assert second.acquire_flush_lease() is False
+
+        first.release_flush_lease()
+        assert second.acquire_flush_lease() is True
+
+    def test_expired_lease_can_be_taken_over(self, tmp_path):
+        first = SyncOutbox(tmp_path / "outbox.sqlite3")
+        second = SyncOutbox(tmp_path / "outbox.sqlite3")
+
+        assert first.acquire_flush_lease(seconds=-1) is True
+        assert second.acquire_flush_lease() is True
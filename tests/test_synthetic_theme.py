@@ -0,0 +1,62 @@
+"""
+Tests for the synthetic theme generator and the SCSS benchmark runner.
+"""
+
+import pytest
+
+from sbm.utils.path import PLATFORM_DIR_ENV_VAR, get_dealer_theme_dir, get_platform_dir
+from scripts import benchmark_scss
+from scripts.synthetic_theme import PROFILES, generate_scss, write_synthetic_theme
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_generator_is_deterministic_and_sized(profile):
+    scss = generate_scss(2_000, profile)
+
+    assert scss == generate_scss(2_000, profile)
+    assert scss != generate_scss(2_000, profile, seed=1)
+    assert 2_000 <= len(scss.splitlines()) < 2_050
+    assert scss.count("{") == scss.count("}")
+
+
+def test_profiles_stress_their_feature():
+    mixed = generate_scss(2_000)
+
+    assert generate_scss(2_000, "mixins").count("@include") > 2 * mixed.count("@include")
+    assert generate_scss(2_000, "variables").count("$") > 2 * mixed.count("$")
+    nested = generate_scss(2_000, "nested")
+    assert max(len(line) - len(line.lstrip()) for line in nested.splitlines()) >= 16
+    with pytest.raises(ValueError):
+        generate_scss(10, "bogus")
+
+
+def test_synthetic_theme_is_found_through_platform_override(tmp_path, monkeypatch):
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    write_synthetic_theme(tmp_path, "synthetic", 1_000)
+
+    assert get_platform_dir() == str(tmp_path)
+    css_dir = tmp_path / "dealer-themes" / "synthetic" / "css"
+    assert get_dealer_theme_dir("synthetic") == str(css_dir.parent)
+    assert sorted(p.name for p in css_dir.iterdir()) == [
+        "inside.scss",
+        "lvdp.scss",
+        "lvrp.scss",
+        "style.scss",
+    ]
+
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path / "missing"))
+    with pytest.raises(ValueError):
+        get_platform_dir()
+
+
+def test_benchmark_runs_and_flags_regressions(monkeypatch):
+    monkeypatch.setitem(benchmark_scss.SCENARIOS, "tiny", (50, "mixed"))
+
+    results = benchmark_scss.run(["tiny"], ["transform", "formatter"], repeat=1)
+
+    assert set(results) == {"tiny/transform", "tiny/formatter"}
+    baseline = {name: seconds * 2 for name, seconds in results.items()}
+    assert benchmark_scss.compare(results, baseline, tolerance=0.25) == []
+    baseline["tiny/transform"] = results["tiny/transform"] / 2
+    (regression,) = benchmark_scss.compare(results, baseline, tolerance=0.25)
+    assert regression[0] == "tiny/transform"
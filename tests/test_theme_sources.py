@@ -0,0 +1,118 @@
+"""
+Tests for the per-run theme source set.
+"""
+
+from collections import Counter
+from pathlib import Path
+
+from sbm.core import maps, migration
+from sbm.oem.landrover import LandRoverHandler
+from sbm.scss import processor as processor_module
+from sbm.scss.processor import SCSSProcessor
+from sbm.utils.path import PLATFORM_DIR_ENV_VAR
+
+
+def _write(path: Path, content) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding="utf-8")
+
+
+def test_source_is_loaded_once_with_stripped_text_and_imports(tmp_path):
+    theme_dir = tmp_path / "dealer-theme"
+    _write(
+        theme_dir / "css/style.scss",
+        "/* @import 'ignored'; */\n"
+        "// @import 'also-ignored';\n"
+        "@import '../../DealerInspireCommonTheme/css/mapsection';\n"
+        ".a { color: red; }",
+    )
+    _write(theme_dir / "css/lvdp.scss", b".a { content: '\xff'; }\n")
+    sources = maps.ThemeSourceSet(theme_dir)
+
+    style = sources.css("style.scss")
+
+    assert sources.get("css/style.scss") is style
+    assert sources.get(theme_dir / "css" / "style.scss") is style
+    assert style.path == theme_dir / "css/style.scss"
+    assert style.line_count == 4
+    assert "ignored" not in style.stripped
+    assert style.imports == (
+        (
+            "@import '../../DealerInspireCommonTheme/css/mapsection'",
+            "../../DealerInspireCommonTheme/css/mapsection",
+        ),
+    )
+    assert style.valid_utf8
+    lvdp = sources.css("lvdp.scss")
+    assert lvdp.text == ".a { content: ''; }\n"
+    assert not lvdp.valid_utf8
+    assert sources.css("missing.scss") is None
+
+
+def test_one_run_reads_each_source_once(tmp_path, monkeypatch):
+    slug = "landroverreno"
+    theme_dir = tmp_path / "dealer-themes" / slug
+    common = tmp_path / "common-theme"
+    _write(
+        common / "css/dealer-inspire-plugins/_national-offers.scss",
+        ".national-incentive-offers { color: blue; }\n",
+    )
+    map_scss = common / "css/map.scss"
+    _write(map_scss, ".map { height: 300px; }\n")
+    _write(
+        theme_dir / "css/style.scss",
+        '@import "map";\n'
+        "// @import '../../DealerInspireCommonTheme/css/dealer-inspire-plugins/"
+        "_national-offers.scss';\n"
+        ".a { color: red; }\n",
+    )
+    _write(theme_dir / "css/inside.scss", ".b { color: blue; }\n")
+    _write(theme_dir / "css/lvdp.scss", ".c { color: green; }\n")
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    monkeypatch.setattr(migration, "get_common_theme_path", lambda: str(common))
+
+    reads = Counter()
+    real_read_text = maps.read_text
+
+    def counting_read_text(path, errors="ignore"):
+        reads[Path(path).name] += 1
+        return real_read_text(path, errors)
+
+    def unexpected_read(path, errors="ignore"):
+        raise AssertionError(f"{path} read outside the source set")
+
+    monkeypatch.setattr(maps, "read_text", counting_read_text)
+    monkeypatch.setattr(processor_module, "read_text", unexpected_read)
+
+    sources = maps.ThemeSourceSet(theme_dir)
+    processor = SCSSProcessor(slug, exclude_nav_styles=False)
+
+    success, _, files, source_lines = migration.migrate_styles(
+        slug, processor=processor, streaming=False, sources=sources
+    )
+    assert (success, files, source_lines) == (True, 2, 5)
+
+    assert migration.add_predetermined_styles(slug, LandRoverHandler(slug), sources=sources)
+    assert ".national-incentive-offers" in (theme_dir / "sb-inside.scss").read_text()
+
+    map_imports = [{"filename": "map.scss", "commontheme_absolute": str(map_scss)}]
+    assert maps.migrate_map_scss_content(slug, map_imports, sources=sources) == (True, [])
+    maps.find_commontheme_map_imports(theme_dir / "css/style.scss", sources=sources)
+
+    assert reads == {"style.scss": 1, "inside.scss": 1, "lvdp.scss": 1}
+
+
+def test_style_transform_still_fails_on_invalid_utf8(tmp_path, monkeypatch):
+    slug = "brokendealer"
+    theme_dir = tmp_path / "dealer-themes" / slug
+    _write(theme_dir / "css/style.scss", ".a { color: red; }\n")
+    _write(theme_dir / "css/lvdp.scss", b".b { content: '\xff'; }\n")
+    monkeypatch.setenv(PLATFORM_DIR_ENV_VAR, str(tmp_path))
+    sources = maps.ThemeSourceSet(theme_dir)
+
+    assert "content: ''" in sources.css("lvdp.scss").text
+    assert migration.migrate_styles(slug, streaming=False, sources=sources)[0] is False
+    assert not (theme_dir / "sb-vdp.scss").exists()
@@ -0,0 +1,122 @@
+"""
+Tests for Chrome-trace spans in ``sbm.utils.tracing``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sbm.scss.processor import SCSSProcessor
+from sbm.utils import tracing
+from sbm.utils.timer import timer_segment
+from sbm.utils.tracing import annotate, finish_trace, span, start_trace, trace_run, traced
+
+
+@pytest.fixture(autouse=True)
+def no_leftover_trace(monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_ENV_VAR, raising=False)
+    yield
+    finish_trace()
+
+
+def _spans(path):
+    data = json.loads(path.read_text())
+    return [event for event in data["traceEvents"] if event["ph"] == "X"]
+
+
+@traced("demo.work", category="demo")
+def _work(value):
+    annotate(value=value)
+    return value * 2
+
+
+def test_nested_spans_are_written_as_chrome_trace(tmp_path):
+    start_trace("dealer-a")
+    with span("outer", category="demo", slug="dealer-a") as outer:
+        assert _work(21) == 42
+        outer.set(files=3)
+    path = finish_trace(tmp_path)
+
+    assert path.parent == tmp_path and path.name.startswith("dealer-a-")
+    events = {event["name"]: event for event in _spans(path)}
+    outer_event, inner_event = events["outer"], events["demo.work"]
+    assert outer_event["args"] == {"slug": "dealer-a", "files": 3}
+    assert inner_event["args"] == {"value": 21}
+    assert inner_event["cat"] == "demo"
+    # Chrome derives nesting from containment on the same thread
+    assert inner_event["tid"] == outer_event["tid"]
+    assert outer_event["ts"] <= inner_event["ts"]
+    assert inner_event["ts"] + inner_event["dur"] <= outer_event["ts"] + outer_event["dur"]
+
+
+def test_spans_are_noops_without_a_trace():
+    with span("ignored") as ignored:
+        ignored.set(anything=1)
+    assert _work(1) == 2
+    assert tracing.get_active_trace() is None
+    assert finish_trace() is None
+
+
+def test_failed_span_records_error(tmp_path):
+    start_trace("dealer-b")
+    with pytest.raises(ValueError), span("boom"):
+        raise ValueError("bad")
+    (event,) = _spans(finish_trace(tmp_path))
+
+    assert event["args"] == {"error": "ValueError"}
+
+
+def test_subprocesses_are_traced_only_while_running(tmp_path):
+    original_popen = subprocess.Popen
+    start_trace("dealer-c")
+    with timer_segment("Git Operations"):
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        subprocess.run(f"{sys.executable} -c pass", shell=True, check=True)
+    path = finish_trace(tmp_path)
+
+    assert subprocess.Popen is original_popen
+    spans = _spans(path)
+    events = {event["name"]: event for event in spans}
+    procs = [event for event in spans if event["cat"] == "subprocess"]
+    # Shell strings are named after their program, not the last path component
+    assert {event["name"] for event in procs} == {f"subprocess {os.path.basename(sys.executable)}"}
+    proc = procs[0]
+    assert proc["args"]["returncode"] == 0
+    assert sys.executable in proc["args"]["cmd"]
+    assert events["Git Operations"]["cat"] == "segment"
+
+
+def test_trace_run_respects_flag_and_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "TRACE_DIR", tmp_path)
+
+    with trace_run("off") as trace:
+        assert trace is None
+    monkeypatch.setenv(tracing.TRACE_ENV_VAR, "1")
+    with trace_run("on") as trace:
+        assert trace is not None
+
+    (path,) = tmp_path.iterdir()
+    assert [event["name"] for event in _spans(path)] == ["on"]
+
+
+def test_scss_transformation_steps_are_spans(tmp_path, monkeypatch):
+    monkeypatch.setattr("sbm.scss.processor.get_dealer_theme_dir", lambda slug: str(tmp_path))
+    monkeypatch.setattr("sbm.scss.processor.get_common_theme_path", lambda: str(tmp_path))
+    processor = SCSSProcessor("test-slug", exclude_nav_styles=False)
+    source = tmp_path / "style.scss"
+    source.write_text("$primary: #fff;\n.a { color: $primary; @include clearfix; }\n")
+
+    start_trace("test-slug")
+    processor.process_scss_file(str(source))
+    events = {event["name"]: event for event in _spans(finish_trace(tmp_path))}
+
+    assert events["scss.file"]["args"]["file"] == str(source)
+    assert events["scss.transform"]["args"] == {
+        "slug": "test-slug",
+        "bytes": len(source.read_text()),
+    }
+    assert "unconverted_mixins" in events["scss.mixins"]["args"]
+    assert {"scss.variables", "scss.image_paths", "scss.trim_whitespace"} <= set(events)
@@ -1,3 +1,4 @@
+import sqlite3
 from unittest.mock import MagicMock
 
 import pytest
@@ -53,6 +54,25 @@ def test_record_run_offline_sets_pending(mocker, mock_tracker_file):
     assert runs[0]["slug"] == "test-offline-slug"
 
 
+def test_record_run_survives_outbox_errors(mocker, mock_tracker_file):
+    """A failing outbox write must not break record_run after a successful migration."""
+    mocker.patch("sbm.utils.tracker.TRACKER_FILE", mock_tracker_file)
+    mocker.patch("sbm.utils.tracker._get_github_login", return_value="test-user")
+    mocker.patch("sbm.utils.tracker.is_firebase_available", return_value=False)
+    outbox = MagicMock()
+    outbox.enqueue.side_effect = sqlite3.OperationalError("database is locked")
+    mocker.patch("sbm.utils.tracker._get_outbox", return_value=outbox)
+    trigger = mocker.patch("sbm.utils.tracker.trigger_background_stats_update")
+
+    record_run(
+        slug="locked-slug", command="migrate", status="success", duration=1.0, automation_time=1.0
+    )
+
+    outbox.enqueue.assert_called_once()
+    trigger.assert_called_once()
+    assert _read_tracker()["runs"][0]["slug"] == "locked-slug"
+
+
 def test_process_pending_syncs_success(mocker, mock_tracker_file, mock_firebase):
     """Test that process_pending_syncs uploads pending items and updates status."""
     mocker.patch("sbm.utils.tracker.TRACKER_FILE", mock_tracker_file)
@@ -72,39 +92,99 @@ def test_process_pending_syncs_success(mocker, mock_tracker_file, mock_firebase)
     }
     _write_tracker(initial_data)
 
-    # Verify mock firebase setup
-    ref_mock = mock_firebase.reference.return_value
-
     # Run process
     process_pending_syncs()
 
-    # Verify set was called on a child ref
-    ref_mock.child.assert_called_once()
-    ref_mock.child.return_value.set.assert_called_once()
-    call_args = ref_mock.child.return_value.set.call_args[0][0]
-    assert call_args["slug"] == "pending-slug"
-    assert "sync_status" not in call_args  # Should not push sync_status field
+    # Verify the run was written whole in one multi-location update on the root
+    mock_firebase.reference.assert_any_call("/")
+    update_mock = mock_firebase.reference.return_value.update
+    update_mock.assert_called_once()
+    payload = update_mock.call_args[0][0]
+    assert list(payload) == ["users/test-user/runs/pending-slug_2024-01-01_00-00-00"]
+    pushed = payload["users/test-user/runs/pending-slug_2024-01-01_00-00-00"]
+    assert pushed["slug"] == "pending-slug"
+    assert "sync_status" not in pushed  # Should not push sync_status field
 
     # Verify local file updated
     data = _read_tracker()
     assert data["runs"][0]["sync_status"] == "synced"
 
 
+def test_process_pending_syncs_skips_already_synced_key(mocker, mock_tracker_file, mock_firebase):
+    """A run key that was already synced is not pushed again (idempotent outbox)."""
+    mocker.patch("sbm.utils.tracker.TRACKER_FILE", mock_tracker_file)
+    run = {
+        "slug": "pending-slug",
+        "status": "success",
+        "sync_status": "pending_sync",
+        "lines_migrated": 100,
+        "timestamp": "2024-01-01T00:00:00Z",
+    }
+    _write_tracker({"runs": [run]})
+    process_pending_syncs()
+
+    # Simulate a stale tracker copy that still says pending
+    _write_tracker({"runs": [run]})
+    process_pending_syncs()
+
+    assert mock_firebase.reference.return_value.update.call_count == 1
+
+
 def test_process_pending_syncs_failure_remains_pending(mocker, mock_tracker_file, mock_firebase):
     """Test that if upload fails, status remains pending."""
     mocker.patch("sbm.utils.tracker.TRACKER_FILE", mock_tracker_file)
     mocker.patch("sbm.utils.tracker._get_github_login", return_value="test-user")
 
     initial_data = {
-        "runs": [{"slug": "fail-slug", "status": "success", "sync_status": "pending_sync"}]
+        "runs": [
+            {
+                "slug": "fail-slug",
+                "status": "success",
+                "sync_status": "pending_sync",
+                "lines_migrated": 100,
+                "timestamp": "2024-01-01T00:00:00Z",
+            }
+        ]
     }
     _write_tracker(initial_data)
 
-    # Mock set raising exception
+    # Mock both the batched write and the per-run fallback raising
     ref_mock = mock_firebase.reference.return_value
+    ref_mock.update.side_effect = Exception("Connection error")
     ref_mock.child.return_value.set.side_effect = Exception("Connection error")
 
     process_pending_syncs()
 
     data = _read_tracker()
     assert data["runs"][0]["sync_status"] == "pending_sync"
+
+
+def test_process_pending_syncs_never_pushes_runs_without_stable_key(
+    mocker, mock_tracker_file, mock_firebase
+):
+    """Runs without a parseable timestamp have no idempotency key and are not uploaded."""
+    mocker.patch("sbm.utils.tracker.TRACKER_FILE", mock_tracker_file)
+    mocker.patch("sbm.utils.tracker._get_github_login", return_value="test-user")
+    no_timestamp = {
+        "slug": "bare-slug",
+        "status": "success",
+        "sync_status": "pending_sync",
+        "lines_migrated": 100,
+    }
+    good = {**no_timestamp, "slug": "good-slug", "timestamp": "2024-01-01T00:00:00Z"}
+    bad_timestamp = {**no_timestamp, "slug": "odd-slug", "timestamp": "yesterday"}
+    _write_tracker({"runs": [no_timestamp, good, bad_timestamp]})
+
+    process_pending_syncs()
+    process_pending_syncs()
+
+    update_mock = mock_firebase.reference.return_value.update
+    update_mock.assert_called_once()
+    assert list(update_mock.call_args[0][0]) == [
+        "users/test-user/runs/good-slug_2024-01-01_00-00-00"
+    ]
+    assert [run["sync_status"] for run in _read_tracker()["runs"]] == [
+        "pending_sync",
+        "synced",
+        "pending_sync",
+    ]
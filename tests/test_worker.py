@@ -0,0 +1,72 @@
+"""
+Tests for the lightweight background worker entry point.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from sbm import worker
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Modules that make `sbm.cli` slow to start; the worker must never load them.
+HEAVY_MODULES = [
+    "rich_click",
+    "git",
+    "sbm.cli",
+    "sbm.core.migration",
+    "sbm.scss.processor",
+    "sbm.oem.factory",
+]
+
+
+def _modules_loaded_after(statement: str) -> set[str]:
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestWorkerImportGraph:
+    def test_worker_module_imports_only_stdlib(self):
+        loaded = _modules_loaded_after("import sbm.worker")
+
+        assert not [m for m in loaded if m.startswith("sbm.") and m != "sbm.worker"]
+        assert not loaded.intersection(HEAVY_MODULES)
+
+    def test_task_imports_stay_off_the_cli_graph(self):
+        loaded = _modules_loaded_after(
+            "import sbm.utils.tracker, sbm.utils.firebase_sync, sbm.utils.github_pr"
+        )
+
+        assert not loaded.intersection(HEAVY_MODULES)
+
+
+class TestWorkerMain:
+    def test_refresh_stats_command(self):
+        with patch.object(worker, "refresh_stats") as mock_refresh:
+            assert worker.main(["refresh-stats", "--max-prs", "5"]) == 0
+
+        mock_refresh.assert_called_once_with(max_prs=5)
+
+    def test_zero_max_prs_means_unlimited(self):
+        with patch.object(worker, "refresh_stats") as mock_refresh:
+            worker.main(["refresh-stats", "--max-prs", "0"])
+
+        mock_refresh.assert_called_once_with(max_prs=None)
+
+    @patch("sbm.utils.tracker.process_pending_syncs", side_effect=RuntimeError("offline"))
+    def test_refresh_stats_is_silent_on_failure(self, _mock_process):
+        worker.refresh_stats()